@@ -0,0 +1,167 @@
+# spds/compaction.py
+
+import logging
+import re
+import weakref
+from typing import Dict, List
+
+from . import config
+from .history import HistoryView
+from .message import ConversationMessage
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_SENDER = "Summary"
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+
+def first_sentence(text: str, limit: int = 120) -> str:
+    """Return the opening sentence of ``text`` on one line, cut to ``limit`` characters."""
+    flat = " ".join(str(text).split())
+    sentence = _SENTENCE_END.split(flat, 1)[0]
+    if len(sentence) > limit:
+        sentence = sentence[: limit - 3].rstrip() + "..."
+    return sentence
+
+
+def summarize_messages(messages: List[ConversationMessage], first_number: int) -> str:
+    """Build a one-line extractive summary of a stretch of messages.
+
+    Lists who spoke (with message counts) and the opening sentence of each
+    speaker's longest message. No LLM call is made, so summaries are cheap
+    enough to build on the turn path.
+    """
+    counts: Dict[str, int] = {}
+    longest: Dict[str, str] = {}
+    for msg in messages:
+        sender = msg.sender
+        counts[sender] = counts.get(sender, 0) + 1
+        content = str(msg.content)
+        if len(content) > len(longest.get(sender, "")):
+            longest[sender] = content
+
+    last_number = first_number + len(messages) - 1
+    speakers = ", ".join(f"{name} ({count})" for name, count in counts.items())
+    points = " | ".join(
+        f"{name}: {first_sentence(text)}" for name, text in longest.items()
+    )
+    return f"[messages {first_number}-{last_number}] {speakers}. {points}"
+
+
+class HistoryCompactor:
+    """
+    Delivers long catch-up deltas as cached stretch summaries plus a raw tail.
+
+    The history is cut into fixed stretches of ``chunk_size`` messages. When an
+    agent's unseen delta is longer than ``threshold`` messages, every complete
+    stretch that ends before the last ``keep_recent`` messages is replaced by its
+    one-line summary; the remainder is delivered verbatim. Each stretch is
+    summarised once and cached until the history is rewritten (its
+    ``generation`` changes), and the full history itself is never modified
+    (exports and the secretary still see every message).
+
+    ``compact`` wraps such a delta in a :class:`CompactedView`, so the same
+    compacted text reaches both the assessment and the speak payloads.
+    """
+
+    def __init__(
+        self,
+        threshold: int | None = None,
+        chunk_size: int | None = None,
+        keep_recent: int | None = None,
+    ):
+        self.threshold = max(
+            0, config.get_compaction_threshold() if threshold is None else threshold
+        )
+        self.chunk_size = max(
+            1, config.get_compaction_chunk_size() if chunk_size is None else chunk_size
+        )
+        self.keep_recent = max(
+            0, config.get_compaction_keep_recent() if keep_recent is None else keep_recent
+        )
+        # chunk index -> summary line, valid for one store at one generation
+        self._summaries: Dict[int, str] = {}
+        self._store_ref = None
+        self._generation = None
+        self.summaries_built = 0
+
+    def should_compact(self, view: HistoryView) -> bool:
+        return config.get_compaction_enabled() and len(view) > self.threshold
+
+    def compact(self, view: HistoryView) -> HistoryView:
+        """Return ``view`` itself, or a CompactedView of it when it is long enough to compact."""
+        if isinstance(view, CompactedView) or not self.should_compact(view):
+            return view
+        return CompactedView(view, self)
+
+    def _chunk_summary(self, store, chunk: int) -> str:
+        # A different store, or one that was rewritten rather than appended
+        # to, invalidates every cached summary.
+        if (
+            self._store_ref is None
+            or self._store_ref() is not store
+            or self._generation != store.generation
+        ):
+            self._summaries.clear()
+            self._store_ref = weakref.ref(store)
+            self._generation = store.generation
+        cached = self._summaries.get(chunk)
+        if cached is not None:
+            return cached
+        start = chunk * self.chunk_size
+        summary = summarize_messages(
+            store._messages(start, start + self.chunk_size), first_number=start + 1
+        )
+        self._summaries[chunk] = summary
+        self.summaries_built += 1
+        return summary
+
+    def render(self, view: HistoryView) -> str:
+        """Return the flat catch-up text for ``view``: summaries, then the raw tail."""
+        store, start, stop = view.store, view.start, view.stop
+        tail_start = max(start, stop - self.keep_recent)
+        size = self.chunk_size
+
+        lines = []
+        chunk = start // size
+        raw_start = start
+        # Summarise complete stretches that end before the recent tail. The
+        # stretch containing ``start`` is included whole; the agent has seen its
+        # head already, which is harmless in a summary.
+        while (chunk + 1) * size <= tail_start:
+            lines.append(f"{SUMMARY_SENDER}: {self._chunk_summary(store, chunk)}")
+            chunk += 1
+            raw_start = chunk * size
+
+        raw = store.flat_range(raw_start, stop)
+        if not lines:
+            return raw
+        logger.debug(
+            "Compacted %d-message delta into %d summaries + %d raw messages",
+            stop - start,
+            len(lines),
+            stop - raw_start,
+        )
+        if raw:
+            lines.append(raw)
+        return "\n".join(lines)
+
+
+class CompactedView(HistoryView):
+    """
+    A HistoryView whose flat form is the compactor's rendering.
+
+    Iteration, indexing and length still give the raw messages; only
+    ``flat()`` (and so ``messages_to_flat_format``) returns the stretch
+    summaries plus the recent tail.
+    """
+
+    __slots__ = ("_compactor",)
+
+    def __init__(self, view: HistoryView, compactor: HistoryCompactor):
+        super().__init__(view.store, view.start, view.stop)
+        self._compactor = compactor
+
+    def flat(self) -> str:
+        return self._compactor.render(self)
@@ -343,6 +343,508 @@ def get_sessions_dir() -> Path:
     return Path(os.getenv("SESSIONS_DIR", "exports/sessions"))
 
 
+# Token budgeting for conversation payloads sent to agents
+def get_token_budget_enabled() -> bool:
+    """
+    Whether conversation payloads are trimmed to fit each agent's context window.
+
+    Default is True. Set SPDS_TOKEN_BUDGET_ENABLED=false to always send the
+    full history and rely on reactive token-limit recovery instead.
+    """
+    return os.getenv("SPDS_TOKEN_BUDGET_ENABLED", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+
+def get_context_budget_ratio() -> float:
+    """
+    Share of an agent's context window a single conversation payload may use.
+
+    Returns:
+        float: Ratio between 0 and 1 (default: 0.5, via SPDS_CONTEXT_BUDGET_RATIO)
+    """
+    try:
+        ratio = float(os.getenv("SPDS_CONTEXT_BUDGET_RATIO", "0.5"))
+    except ValueError:
+        return 0.5
+    return min(max(ratio, 0.05), 1.0)
+
+
+def get_default_context_window() -> int:
+    """
+    Context window assumed when an agent's llm_config does not report one.
+
+    Returns:
+        int: Tokens (default: 8192, via SPDS_DEFAULT_CONTEXT_WINDOW)
+    """
+    try:
+        return int(os.getenv("SPDS_DEFAULT_CONTEXT_WINDOW", "8192"))
+    except ValueError:
+        return 8192
+
+
+def get_chars_per_token() -> float:
+    """
+    Average characters per token used for prompt size estimates.
+
+    Returns:
+        float: Characters per token (default: 4.0, via SPDS_CHARS_PER_TOKEN)
+    """
+    try:
+        value = float(os.getenv("SPDS_CHARS_PER_TOKEN", "4.0"))
+    except ValueError:
+        return 4.0
+    return value if value > 0 else 4.0
+
+
+# Rolling compaction of long catch-up deltas
+def get_compaction_enabled() -> bool:
+    """
+    Whether agents catching up on a long backlog get stretch summaries instead of raw messages.
+
+    Default is True; disable with SPDS_HISTORY_COMPACTION=false.
+    """
+    return os.getenv("SPDS_HISTORY_COMPACTION", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+
+def get_compaction_threshold() -> int:
+    """
+    Number of unseen messages above which an agent's delta is compacted.
+
+    Returns:
+        int: Message count (default: 80, via SPDS_COMPACTION_THRESHOLD)
+    """
+    try:
+        return max(0, int(os.getenv("SPDS_COMPACTION_THRESHOLD", "80")))
+    except ValueError:
+        return 80
+
+
+def get_compaction_chunk_size() -> int:
+    """
+    Number of messages summarised together into one compact entry.
+
+    Returns:
+        int: Message count (default: 40, via SPDS_COMPACTION_CHUNK_SIZE)
+    """
+    try:
+        return int(os.getenv("SPDS_COMPACTION_CHUNK_SIZE", "40"))
+    except ValueError:
+        return 40
+
+
+def get_compaction_keep_recent() -> int:
+    """
+    Number of most recent messages always delivered verbatim after compaction.
+
+    Returns:
+        int: Message count (default: 20, via SPDS_COMPACTION_KEEP_RECENT)
+    """
+    try:
+        return int(os.getenv("SPDS_COMPACTION_KEEP_RECENT", "20"))
+    except ValueError:
+        return 20
+
+
+# Disk-backed session history
+def get_history_segment_size() -> int:
+    """
+    Messages per segment file in a session's on-disk history log.
+
+    Only used when a log is first created; existing logs keep their size.
+
+    Returns:
+        int: Message count (default: 1000, via SPDS_HISTORY_SEGMENT_SIZE)
+    """
+    try:
+        return max(1, int(os.getenv("SPDS_HISTORY_SEGMENT_SIZE", "1000")))
+    except ValueError:
+        return 1000
+
+
+def get_history_resident_messages() -> int:
+    """
+    Most recent messages kept in memory for a disk-backed history; older ones are paged from disk.
+
+    Returns:
+        int: Message count (default: 2000, via SPDS_HISTORY_RESIDENT_MESSAGES)
+    """
+    try:
+        return int(os.getenv("SPDS_HISTORY_RESIDENT_MESSAGES", "2000"))
+    except ValueError:
+        return 2000
+
+
+def get_topic_window() -> int:
+    """
+    Number of recent messages whose terms define the swarm's current focus.
+
+    Returns:
+        int: Message count (default: 30, via SPDS_TOPIC_WINDOW)
+    """
+    try:
+        return int(os.getenv("SPDS_TOPIC_WINDOW", "30"))
+    except ValueError:
+        return 30
+
+
+def get_topic_terms() -> int:
+    """
+    Number of focus terms appended to the topic given to agent assessments.
+
+    Returns:
+        int: Term count (default: 4, via SPDS_TOPIC_TERMS)
+    """
+    try:
+        return int(os.getenv("SPDS_TOPIC_TERMS", "4"))
+    except ValueError:
+        return 4
+
+
+def get_secretary_async_observe() -> bool:
+    """
+    Whether observed messages are queued and sent to the secretary in background batches.
+
+    Default is True; disable with SPDS_SECRETARY_ASYNC_OBSERVE=false to send each message inline.
+    """
+    return os.getenv("SPDS_SECRETARY_ASYNC_OBSERVE", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+
+def get_secretary_batch_size() -> int:
+    """
+    Queued observations that trigger an immediate batch send to the secretary.
+
+    Returns:
+        int: Message count (default: 10, via SPDS_SECRETARY_BATCH_SIZE)
+    """
+    try:
+        return int(os.getenv("SPDS_SECRETARY_BATCH_SIZE", "10"))
+    except ValueError:
+        return 10
+
+
+def get_secretary_flush_interval() -> float:
+    """
+    Longest an observation waits in the queue before it is sent.
+
+    Returns:
+        float: Seconds (default: 5.0, via SPDS_SECRETARY_FLUSH_SECONDS)
+    """
+    try:
+        return float(os.getenv("SPDS_SECRETARY_FLUSH_SECONDS", "5.0"))
+    except ValueError:
+        return 5.0
+
+
+def get_secretary_flush_timeout() -> float:
+    """
+    How long minutes, stats and exports wait for queued observations to be delivered.
+
+    Returns:
+        float: Seconds (default: 120.0, via SPDS_SECRETARY_FLUSH_TIMEOUT)
+    """
+    try:
+        return float(os.getenv("SPDS_SECRETARY_FLUSH_TIMEOUT", "120.0"))
+    except ValueError:
+        return 120.0
+
+
+def get_secretary_pool_size() -> int:
+    """
+    Idle secretary agents kept ready per mode (formal/casual/adaptive); 0 disables the pool.
+
+    Returns:
+        int: Agents per mode (default: 1, via SPDS_SECRETARY_POOL_SIZE)
+    """
+    try:
+        return int(os.getenv("SPDS_SECRETARY_POOL_SIZE", "1"))
+    except ValueError:
+        return 1
+
+
+def get_secretary_pool_wait() -> float:
+    """
+    How long a session start waits for pool discovery before creating its own secretary.
+
+    Returns:
+        float: Seconds (default: 3.0, via SPDS_SECRETARY_POOL_WAIT)
+    """
+    try:
+        return float(os.getenv("SPDS_SECRETARY_POOL_WAIT", "3.0"))
+    except ValueError:
+        return 3.0
+
+
+def get_web_session_grace_seconds() -> float:
+    """
+    How long a web session may have no connected clients before its pooled secretary is returned.
+
+    Returns:
+        float: Seconds (default: 300.0, via SPDS_WEB_SESSION_GRACE_SECONDS)
+    """
+    try:
+        return max(float(os.getenv("SPDS_WEB_SESSION_GRACE_SECONDS", "300")), 0.0)
+    except ValueError:
+        return 300.0
+
+
+def get_minutes_polish_enabled() -> bool:
+    """
+    Whether /minutes asks the secretary LLM (in the background) to polish outline sections that are new since the last call.
+
+    Default is True; with SPDS_MINUTES_POLISH=false minutes are rendered purely locally.
+    """
+    return os.getenv("SPDS_MINUTES_POLISH", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+
+def get_minutes_section_size() -> int:
+    """
+    Maximum messages in one section of the incremental minutes outline.
+
+    Returns:
+        int: Message count (default: 40, via SPDS_MINUTES_SECTION_SIZE)
+    """
+    try:
+        return int(os.getenv("SPDS_MINUTES_SECTION_SIZE", "40"))
+    except ValueError:
+        return 40
+
+
+def get_page_size() -> int:
+    """
+    Items requested per page when walking Letta conversations and messages.
+
+    Returns:
+        int: Page size (default: 100, via SPDS_PAGE_SIZE)
+    """
+    try:
+        return max(1, int(os.getenv("SPDS_PAGE_SIZE", "100")))
+    except ValueError:
+        return 100
+
+
+def get_export_page_size() -> int:
+    """
+    Messages fetched per request when streaming a session export from the server.
+
+    Returns:
+        int: Page size (default: 100, via SPDS_EXPORT_PAGE_SIZE)
+    """
+    try:
+        return max(1, int(os.getenv("SPDS_EXPORT_PAGE_SIZE", "100")))
+    except ValueError:
+        return 100
+
+
+def get_export_workers() -> int:
+    """
+    Threads used to render and write the formats of a complete export package.
+
+    Returns:
+        int: Worker count, 1 renders serially (default: 4, via SPDS_EXPORT_WORKERS)
+    """
+    try:
+        return max(1, int(os.getenv("SPDS_EXPORT_WORKERS", "4")))
+    except ValueError:
+        return 4
+
+
+def get_export_archive_enabled() -> bool:
+    """
+    Whether complete export packages are written as one compressed, deduplicated bundle per export.
+
+    Default is False (loose files); enable with SPDS_EXPORT_ARCHIVE=true.
+    """
+    return os.getenv("SPDS_EXPORT_ARCHIVE", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+
+def get_export_index_path() -> Path:
+    """
+    Location of the SQLite manifest index of export files.
+
+    Returns:
+        Path: Index file (default: EXPORT_DIRECTORY/export_index.sqlite3, via SPDS_EXPORT_INDEX_PATH)
+    """
+    path = os.getenv("SPDS_EXPORT_INDEX_PATH")
+    if path:
+        return Path(path)
+    return Path(DEFAULT_EXPORT_DIRECTORY) / "export_index.sqlite3"
+
+
+def get_export_job_workers() -> int:
+    """
+    Background export jobs the web UI runs at the same time; further jobs wait in a queue.
+
+    Returns:
+        int: Worker count (default: 2, via SPDS_EXPORT_JOB_WORKERS)
+    """
+    try:
+        return max(1, int(os.getenv("SPDS_EXPORT_JOB_WORKERS", "2")))
+    except ValueError:
+        return 2
+
+
+def get_live_export_interval() -> int:
+    """
+    Messages between automatic appends to the live transcript during a meeting.
+
+    Returns:
+        int: Message count, 0 disables auto-export (default: 0, via SPDS_LIVE_EXPORT_EVERY)
+    """
+    try:
+        return max(0, int(os.getenv("SPDS_LIVE_EXPORT_EVERY", "0")))
+    except ValueError:
+        return 0
+
+
+def get_search_index_enabled() -> bool:
+    """
+    Whether messages are added to the full-text transcript search index as they are appended.
+
+    Default is True; disable with SPDS_SEARCH_INDEX=false.
+    """
+    return os.getenv("SPDS_SEARCH_INDEX", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+
+def get_search_index_path() -> Path:
+    """
+    Location of the SQLite full-text index shared by all sessions.
+
+    Returns:
+        Path: Index file (default: SESSIONS_DIR/search_index.sqlite3, via SPDS_SEARCH_INDEX_PATH)
+    """
+    path = os.getenv("SPDS_SEARCH_INDEX_PATH")
+    if path:
+        return Path(path)
+    return get_sessions_dir() / "search_index.sqlite3"
+
+
+def get_session_index_path() -> Path:
+    """
+    Location of the SQLite index mapping SPDS session ids to agent conversations.
+
+    Returns:
+        Path: Index file (default: SESSIONS_DIR/spds_sessions.sqlite3, via SPDS_SESSION_INDEX_PATH)
+    """
+    path = os.getenv("SPDS_SESSION_INDEX_PATH")
+    if path:
+        return Path(path)
+    return get_sessions_dir() / "spds_sessions.sqlite3"
+
+
+def get_warm_start_path() -> Path:
+    """
+    Location of the warm-start cache of swarm setup state (tools, blocks, MCP).
+
+    Returns:
+        Path: Cache file (default: SESSIONS_DIR/warm_start.json, via SPDS_WARM_START_PATH)
+    """
+    path = os.getenv("SPDS_WARM_START_PATH")
+    if path:
+        return Path(path)
+    return get_sessions_dir() / "warm_start.json"
+
+
+def get_warm_start_ttl() -> float:
+    """
+    Seconds cached swarm setup state is reused for the same agents and config.
+
+    Returns:
+        float: TTL in seconds, 0 disables the warm-start cache (default: 86400, via SPDS_WARM_START_TTL)
+    """
+    try:
+        return max(0.0, float(os.getenv("SPDS_WARM_START_TTL", "86400")))
+    except ValueError:
+        return 86400.0
+
+
+def get_agent_update_workers() -> int:
+    """
+    Agents tagged (at session start) or untagged (at the end) concurrently.
+
+    Returns:
+        int: Worker count, 1 updates them one after another (default: 8, via SPDS_AGENT_UPDATE_WORKERS)
+    """
+    try:
+        return max(1, int(os.getenv("SPDS_AGENT_UPDATE_WORKERS", "8")))
+    except ValueError:
+        return 8
+
+
+def get_swarm_context_verify_every() -> int:
+    """
+    How many swarm_context writes may trust the cached block value before it is read again.
+
+    Returns:
+        int: Writes, 1 re-reads before every write (default: 5, via SPDS_SWARM_CONTEXT_VERIFY_EVERY)
+    """
+    try:
+        return max(1, int(os.getenv("SPDS_SWARM_CONTEXT_VERIFY_EVERY", "5")))
+    except ValueError:
+        return 5
+
+
+def get_conversation_workers() -> int:
+    """
+    Per-agent conversations created (at meeting start) or finalized (at the end) concurrently.
+
+    Returns:
+        int: Worker count, 1 runs them one after another (default: 8, via SPDS_CONVERSATION_WORKERS)
+    """
+    try:
+        return max(1, int(os.getenv("SPDS_CONVERSATION_WORKERS", "8")))
+    except ValueError:
+        return 8
+
+
+def get_session_list_workers() -> int:
+    """
+    Agents listed concurrently by ``sessions list --all`` (and summaries fetched for --json).
+
+    Returns:
+        int: Worker count (default: 8, via SPDS_SESSION_LIST_WORKERS)
+    """
+    try:
+        return max(1, int(os.getenv("SPDS_SESSION_LIST_WORKERS", "8")))
+    except ValueError:
+        return 8
+
+
+def get_session_list_cache_ttl() -> float:
+    """
+    Seconds a ``sessions list --all`` result is reused from SESSIONS_DIR before listing again.
+
+    Returns:
+        float: TTL in seconds, 0 disables the cache (default: 60, via SPDS_SESSION_LIST_CACHE_TTL)
+    """
+    try:
+        return max(0.0, float(os.getenv("SPDS_SESSION_LIST_CACHE_TTL", "60")))
+    except ValueError:
+        return 60.0
+
+
 # Tool schema/export behavior
 def get_tools_use_pydantic_schemas() -> bool:
     """
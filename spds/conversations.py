@@ -2,11 +2,22 @@
 
 import json
 import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 from letta_client import Letta
 
+from . import config
+from .session_index import (
+    SessionEntry,
+    SessionIndex,
+    entry_from_conversation,
+    get_session_index,
+    parse_spds_summary,
+)
+
 logger = logging.getLogger(__name__)
 
 # Message types to skip when consuming conversation streams.
@@ -19,6 +30,78 @@ _STREAM_SKIP_TYPES = frozenset({
 })
 
 
+def _page_items(page: Any) -> List:
+    """Items of one server page, without triggering SyncArrayPage auto-pagination."""
+    if hasattr(page, "conversations"):
+        return list(page.conversations)
+    items = getattr(page, "items", None)
+    return items if isinstance(items, list) else list(page)
+
+
+def _item_id(item: Any) -> Optional[str]:
+    return item.get("id") if isinstance(item, dict) else getattr(item, "id", None)
+
+
+def _paginate(
+    fetch: Callable[[Optional[str], int], List],
+    page_size: int,
+    limit: Optional[int] = None,
+    prefetch: bool = True,
+) -> Iterator[Any]:
+    """Yield items from cursor-paged ``fetch(cursor, size)`` calls.
+
+    A page shorter than requested, or one whose last item has no id or the
+    same id as the current cursor, ends the walk. With ``prefetch`` the
+    next page is requested on a background thread as soon as the consumer
+    moves past the first item of the current one, so at most two pages are
+    held and a caller that only peeks at the first item costs one request.
+    """
+    page_size = max(1, page_size)
+    remaining = limit
+    cursor = None
+    pending = None
+    executor = None
+
+    def size() -> int:
+        return page_size if remaining is None else min(page_size, remaining)
+
+    if remaining is not None and remaining <= 0:
+        return
+    requested = size()
+    items = fetch(None, requested)
+    try:
+        while True:
+            next_cursor = None
+            if len(items) >= requested:
+                last_id = _item_id(items[-1]) if items else None
+                if last_id and last_id != cursor:
+                    next_cursor = last_id
+            if remaining is not None:
+                items = items[:remaining]
+                remaining -= len(items)
+                if remaining <= 0:
+                    next_cursor = None
+            next_size = size() if next_cursor else 0
+            for position, item in enumerate(items):
+                yield item
+                if position == 0 and prefetch and next_cursor:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="letta-page")
+                    pending = executor.submit(fetch, next_cursor, next_size)
+            if not next_cursor:
+                return
+            if pending is not None:
+                items, pending = pending.result(), None
+            else:
+                items = fetch(next_cursor, next_size)
+            cursor, requested = next_cursor, next_size
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
 class ConversationManager:
     """Wraps the Letta Conversations API for session management.
 
@@ -26,8 +109,24 @@ class ConversationManager:
     via Letta's Conversations API.
     """
 
-    def __init__(self, client: Letta):
+    def __init__(self, client: Letta, session_index: Optional[SessionIndex] = None):
         self.client = client
+        self._session_index = session_index
+
+    @property
+    def session_index(self) -> SessionIndex:
+        """Local SPDS session id -> conversations index (see ``SessionIndex``)."""
+        if self._session_index is None:
+            self._session_index = get_session_index()
+        return self._session_index
+
+    def _index_call(self, op: str, *args) -> Any:
+        """Run a session index operation; index problems never fail an API call."""
+        try:
+            return getattr(self.session_index, op)(*args)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("SPDS session index %s failed: %s", op, e)
+            return None
 
     def create_session(
         self, agent_id: str, summary: str = ""
@@ -69,45 +168,107 @@ class ConversationManager:
     def list_messages(
         self,
         conversation_id: str,
-        limit: Optional[int] = 100,
+        limit: Optional[int] = None,
         order: str = "asc",
+        page_size: Optional[int] = None,
     ) -> List:
-        """List messages in a conversation.
+        """List messages in a conversation, following cursors across pages.
 
         Args:
             conversation_id: The conversation ID.
-            limit: Max number of messages to return.
+            limit: Max number of messages to return (None for all).
             order: Sort order ('asc' or 'desc').
+            page_size: Messages requested per page (default: SPDS_PAGE_SIZE).
 
         Returns:
             List of messages.
         """
-        page = self.client.conversations.messages.list(
-            conversation_id=conversation_id,
-            limit=limit,
-            order=order,
+        return list(
+            self.iter_messages(conversation_id, page_size=page_size, order=order, limit=limit)
         )
-        return list(page)
 
-    def list_sessions(self, agent_id: str, limit: int = 50) -> List:
-        """List conversations (sessions) for an agent.
+    def iter_messages(
+        self,
+        conversation_id: str,
+        page_size: Optional[int] = None,
+        order: str = "asc",
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[Any]:
+        """Yield every message in a conversation, one server page at a time.
+
+        Each request is cursored on the last message id of the previous page
+        (``after`` for ascending order, ``before`` for descending) and the
+        next page is prefetched in the background while this one is
+        consumed, so no more than two pages are held at once.
+
+        Args:
+            conversation_id: The conversation ID.
+            page_size: Messages requested per page (default: SPDS_PAGE_SIZE).
+            order: Sort order ('asc' or 'desc').
+            limit: Stop after this many messages (None for all).
+            prefetch: Fetch the next page on a background thread.
+
+        Yields:
+            Messages in the requested order.
+        """
+        cursor_param = "after" if order == "asc" else "before"
+
+        def fetch(cursor: Optional[str], size: int) -> List:
+            params = {"limit": size, "order": order}
+            if cursor:
+                params[cursor_param] = cursor
+            return _page_items(
+                self.client.conversations.messages.list(
+                    conversation_id=conversation_id, **params
+                )
+            )
+
+        return _paginate(fetch, page_size or config.get_page_size(), limit, prefetch)
+
+    def iter_sessions(
+        self,
+        agent_id: Optional[str] = None,
+        page_size: Optional[int] = None,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[Any]:
+        """Yield conversations (for one agent, or all agents), following ``after`` cursors.
+
+        Args:
+            agent_id: The Letta agent ID, or None for every agent.
+            page_size: Conversations requested per page (default: SPDS_PAGE_SIZE).
+            limit: Stop after this many conversations (None for all).
+            prefetch: Fetch the next page on a background thread.
+
+        Yields:
+            Conversation objects.
+        """
+
+        def fetch(cursor: Optional[str], size: int) -> List:
+            params = {"limit": size}
+            if agent_id:
+                params["agent_id"] = agent_id
+            if cursor:
+                params["after"] = cursor
+            return _page_items(self.client.conversations.list(**params))
+
+        return _paginate(fetch, page_size or config.get_page_size(), limit, prefetch)
+
+    def list_sessions(
+        self, agent_id: str, limit: Optional[int] = None, page_size: Optional[int] = None
+    ) -> List:
+        """List conversations (sessions) for an agent, across all pages.
 
         Args:
             agent_id: The Letta agent ID.
-            limit: Max number of conversations to return.
+            limit: Max number of conversations to return (None for all).
+            page_size: Conversations requested per page (default: SPDS_PAGE_SIZE).
 
         Returns:
             List of Conversation objects.
         """
-        result = self.client.conversations.list(
-            agent_id=agent_id,
-            limit=limit,
-        )
-        # ConversationListResponse has a .conversations attribute
-        if hasattr(result, "conversations"):
-            return result.conversations
-        # Fallback if the API returns a list-like object
-        return list(result)
+        return list(self.iter_sessions(agent_id, page_size=page_size, limit=limit))
 
     def get_session(self, conversation_id: str) -> Any:
         """Retrieve a single conversation by ID.
@@ -130,10 +291,12 @@ class ConversationManager:
         Returns:
             The updated Conversation object.
         """
-        return self.client.conversations.update(
+        updated = self.client.conversations.update(
             conversation_id=conversation_id,
             summary=summary,
         )
+        self._index_call("update_summary", conversation_id, summary)
+        return updated
 
     def get_session_summary(self, conversation_id: str) -> Dict:
         """Get a summary dict for a conversation.
@@ -157,19 +320,16 @@ class ConversationManager:
     # Web-facing helpers (used by swarms-web)
     # ------------------------------------------------------------------
 
-    def list_all_sessions(self, limit: int = 50) -> List:
+    def list_all_sessions(self, limit: Optional[int] = 50) -> List:
         """List conversations across all agents (for web UI).
 
         Args:
-            limit: Max number of conversations to return.
+            limit: Max number of conversations to return (None for all).
 
         Returns:
             List of Conversation objects.
         """
-        result = self.client.conversations.list(limit=limit)
-        if hasattr(result, "conversations"):
-            return result.conversations
-        return list(result)
+        return list(self.iter_sessions(limit=limit))
 
     _WEB_CONFIG_PREFIX = "spds:web|config|"
 
@@ -209,7 +369,7 @@ class ConversationManager:
             The config dict, or None if not found.
         """
         prefix = f"{self._WEB_CONFIG_PREFIX}{session_id}|"
-        for conv in self.list_sessions(agent_id):
+        for conv in self.iter_sessions(agent_id):
             summary = getattr(conv, "summary", "") or ""
             if summary.startswith(prefix):
                 try:
@@ -276,47 +436,67 @@ class ConversationManager:
             The conversation ID.
         """
         summary = f"spds:{session_id}|{agent_name}|{topic}"
-        return self.create_session(agent_id=agent_id, summary=summary)
+        conversation_id = self.create_session(agent_id=agent_id, summary=summary)
+        self._index_call(
+            "record", SimpleNamespace(id=conversation_id, summary=summary), agent_id
+        )
+        return conversation_id
+
+    def reconcile_index(self, agent_id: str, conversations: Iterable[Any]) -> Optional[int]:
+        """Replace the agent's session index entries with its listed conversations.
+
+        Returns how many SPDS conversations were indexed, or None if the
+        index is unavailable.
+        """
+        return self._index_call("reconcile_agent", agent_id, conversations)
 
     def find_sessions_by_spds_id(
         self, agent_id: str, session_id: str
-    ) -> List:
+    ) -> List[SessionEntry]:
         """Find all conversations for an agent that belong to a given SPDS session.
 
-        Filters the agent's conversations by summaries prefixed with
-        ``spds:<session_id>``.
+        Answered from the local session index. The agent's conversations are
+        listed from the server (and the index reconciled) only the first
+        time the agent is looked up, or when the index has no match.
 
         Args:
             agent_id: The Letta agent ID.
             session_id: The SPDS session UUID to match.
 
         Returns:
-            List of matching Conversation objects.
+            List of matching conversations (``SessionEntry``: id, summary,
+            created_at, ... like a Conversation object).
         """
-        prefix = f"spds:{session_id}"
-        all_convs = self.list_sessions(agent_id)
-        return [
-            c for c in all_convs
-            if getattr(c, "summary", None) and c.summary.startswith(prefix)
-        ]
-
-    @staticmethod
-    def parse_spds_summary(summary: str) -> Optional[Dict[str, str]]:
-        """Parse an SPDS-encoded conversation summary.
-
-        Args:
-            summary: The raw summary string.
-
-        Returns:
-            Dict with ``session_id``, ``agent_name``, ``topic`` keys,
-            or None if the summary is not SPDS-encoded.
+        reconciled = self._index_call("is_reconciled", agent_id)
+        if reconciled:
+            found = self._index_call("lookup", session_id, agent_id)
+            if found:
+                return found
+        conversations = list(self.iter_sessions(agent_id))
+        if self.reconcile_index(agent_id, conversations) is None:
+            # Index unavailable: filter the server listing directly.
+            entries = (entry_from_conversation(c, agent_id) for c in conversations)
+            return [e for e in entries if e is not None and e.session_id == session_id]
+        return self._index_call("lookup", session_id, agent_id) or []
+
+    def find_session(self, session_id: str) -> List[SessionEntry]:
+        """All conversations (every agent) of an SPDS session, e.g. for resume or export.
+
+        Falls back to listing all conversations once if the index has none.
         """
-        if not summary or not summary.startswith("spds:"):
-            return None
-        payload = summary[5:]  # strip "spds:" prefix
-        parts = payload.split("|", 2)
-        return {
-            "session_id": parts[0] if len(parts) > 0 else "",
-            "agent_name": parts[1] if len(parts) > 1 else "",
-            "topic": parts[2] if len(parts) > 2 else "",
-        }
+        found = self._index_call("lookup", session_id)
+        if found:
+            return found
+        by_agent: Dict[str, List] = {}
+        for conv in self.iter_sessions():
+            owner = getattr(conv, "agent_id", None)
+            if isinstance(owner, str):
+                by_agent.setdefault(owner, []).append(conv)
+        for owner, conversations in by_agent.items():
+            self.reconcile_index(owner, conversations)
+        return self._index_call("lookup", session_id) or []
+
+    # The one SPDS summary parser, also reachable as a static method: returns
+    # ``session_id``, ``agent_name``, ``topic`` (without the finalization
+    # suffix) and ``status``, or None for non-SPDS summaries.
+    parse_spds_summary = staticmethod(parse_spds_summary)
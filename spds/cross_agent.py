@@ -11,9 +11,11 @@ Manages:
 from __future__ import annotations
 
 import logging
+import threading
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from .letta_api import letta_call
+from . import config
+from .letta_api import letta_call, parallel_map
 
 if TYPE_CHECKING:
     from letta_client import Letta
@@ -28,6 +30,17 @@ MULTI_AGENT_TOOL = "send_message_to_agent_async"
 BROADCAST_TOOL = "send_message_to_agents_matching_all_tags"
 MULTI_AGENT_TOOLS = {MULTI_AGENT_TOOL, BROADCAST_TOOL}
 
+# Built-in tools agents edit their memory blocks (swarm_context included) with
+MEMORY_EDIT_TOOLS = {
+    "core_memory_append",
+    "core_memory_replace",
+    "memory_insert",
+    "memory_replace",
+    "memory_rethink",
+    "memory_apply_patch",
+    "memory",
+}
+
 
 def make_session_tag(session_id: str) -> str:
     """Return the tag string for a swarm session."""
@@ -39,64 +52,118 @@ def make_session_tag(session_id: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+def _tagged_state(client: "Letta", agent: Any, fresh: bool = False):
+    """Return ``(agent_id, state)`` with a usable ``tags`` list, retrieving only when needed.
+
+    ``agent`` is an agent ID or an already loaded ``AgentState`` (such as
+    ``SPDSAgent.agent``); a loaded state without a tags list is re-fetched,
+    and with ``fresh=True`` the state is always retrieved from the server.
+    """
+    if isinstance(agent, str):
+        agent_id, state = agent, None
+    else:
+        agent_id, state = agent.id, agent
+    if fresh or state is None or not isinstance(getattr(state, "tags", None), (list, tuple)):
+        state = letta_call(
+            "agents.retrieve",
+            client.agents.retrieve,
+            agent_id=agent_id,
+        )
+    return agent_id, state
+
+
+def _bulk_update_tags(
+    client: "Letta",
+    agents: List[Any],
+    tag: str,
+    add: bool,
+    workers: Optional[int] = None,
+) -> int:
+    """Add or remove ``tag`` on every agent concurrently; returns agents changed.
+
+    Agents that already have (or lack) the tag are skipped without a write.
+    Each update's returned state is checked for the tag and copied back
+    onto a loaded ``AgentState`` so it stays current for the next call.
+
+    Removal always starts from the server's current tags: a loaded state can
+    be a whole session old, and writing its list back would drop tags that
+    were added meanwhile (e.g. by another session sharing the agent).
+    """
+    action = "tag" if add else "untag"
+
+    def update(agent) -> bool:
+        agent_id = agent if isinstance(agent, str) else getattr(agent, "id", agent)
+        try:
+            agent_id, state = _tagged_state(client, agent, fresh=not add)
+            tags = list(getattr(state, "tags", None) or [])
+            if (tag in tags) == add:
+                return False
+            if add:
+                tags.append(tag)
+            else:
+                tags.remove(tag)
+            updated = letta_call(
+                "agents.update",
+                client.agents.update,
+                agent_id=agent_id,
+                tags=tags,
+            )
+            returned = getattr(updated, "tags", None)
+            if isinstance(returned, (list, tuple)):
+                if (tag in returned) != add:
+                    logger.warning(
+                        "Agent %s update did not %s %s; server tags: %s",
+                        agent_id, action, tag, list(returned),
+                    )
+                tags = list(returned)
+            if not isinstance(agent, str):
+                try:
+                    agent.tags = tags
+                except (AttributeError, TypeError, ValueError):
+                    pass
+            logger.debug("%s agent %s: %s", "Tagged" if add else "Untagged", agent_id, tag)
+            return True
+        except Exception as e:
+            logger.warning("Failed to %s agent %s: %s", action, agent_id, e)
+            return False
+
+    changed = parallel_map(update, agents, workers or config.get_agent_update_workers())
+    return sum(changed)
+
+
 def tag_agents_for_session(
     client: "Letta",
-    agent_ids: List[str],
+    agents: List[Any],
     session_id: str,
+    workers: Optional[int] = None,
 ) -> str:
     """Add a session tag to each agent so they can discover each other.
 
+    ``agents`` may be agent IDs or loaded ``AgentState`` objects; loaded
+    states are used as-is instead of being retrieved again. Agents are
+    updated concurrently (at most SPDS_AGENT_UPDATE_WORKERS at a time).
+
     Returns the session tag string.
     """
     tag = make_session_tag(session_id)
-    for agent_id in agent_ids:
-        try:
-            current = letta_call(
-                "agents.retrieve",
-                client.agents.retrieve,
-                agent_id=agent_id,
-            )
-            existing_tags = list(getattr(current, "tags", None) or [])
-            if tag not in existing_tags:
-                existing_tags.append(tag)
-                letta_call(
-                    "agents.update",
-                    client.agents.update,
-                    agent_id=agent_id,
-                    tags=existing_tags,
-                )
-                logger.debug("Tagged agent %s with %s", agent_id, tag)
-        except Exception as e:
-            logger.warning("Failed to tag agent %s: %s", agent_id, e)
+    _bulk_update_tags(client, agents, tag, add=True, workers=workers)
     return tag
 
 
 def remove_session_tags(
     client: "Letta",
-    agent_ids: List[str],
+    agents: List[Any],
     session_id: str,
+    workers: Optional[int] = None,
 ) -> None:
-    """Remove the session tag from each agent after the session ends."""
-    tag = make_session_tag(session_id)
-    for agent_id in agent_ids:
-        try:
-            current = letta_call(
-                "agents.retrieve",
-                client.agents.retrieve,
-                agent_id=agent_id,
-            )
-            existing_tags = list(getattr(current, "tags", None) or [])
-            if tag in existing_tags:
-                existing_tags.remove(tag)
-                letta_call(
-                    "agents.update",
-                    client.agents.update,
-                    agent_id=agent_id,
-                    tags=existing_tags,
-                )
-                logger.debug("Removed tag %s from agent %s", tag, agent_id)
-        except Exception as e:
-            logger.warning("Failed to remove tag from agent %s: %s", agent_id, e)
+    """Remove the session tag from each agent after the session ends.
+
+    Accepts agent IDs or loaded ``AgentState`` objects, like
+    :func:`tag_agents_for_session`; either way each agent's current tags
+    are retrieved first (teardown runs in the background, so the extra
+    read is off the caller's path).
+    """
+    _bulk_update_tags(client, agents, make_session_tag(session_id), add=False, workers=workers)
 
 
 # ---------------------------------------------------------------------------
@@ -304,6 +371,28 @@ def attach_block_to_agents(
     return attached
 
 
+def _merge_context_lines(value: str, updates: Dict[str, str]) -> str:
+    """Replace or append ``Key: value`` lines of a swarm_context value."""
+    lines = (value or "").splitlines()
+
+    # Build a dict of existing key: line_index
+    existing = {}
+    for i, line in enumerate(lines):
+        if ": " in line:
+            key = line.split(": ", 1)[0]
+            existing[key] = i
+
+    for key, value in updates.items():
+        new_line = f"{key}: {value}"
+        if key in existing:
+            lines[existing[key]] = new_line
+        else:
+            existing[key] = len(lines)
+            lines.append(new_line)
+
+    return "\n".join(lines)
+
+
 def update_swarm_context(
     client: "Letta",
     block_id: str,
@@ -312,7 +401,8 @@ def update_swarm_context(
     """Update the swarm_context block with new key-value pairs.
 
     Reads the current block value, appends or replaces lines matching
-    the update keys, and writes back.
+    the update keys, and writes back. For repeated updates during a
+    session prefer :class:`SwarmContextMirror`, which batches them.
     """
     try:
         block = letta_call(
@@ -320,23 +410,7 @@ def update_swarm_context(
             client.blocks.retrieve,
             block_id=block_id,
         )
-        lines = (block.value or "").splitlines()
-
-        # Build a dict of existing key: line_index
-        existing = {}
-        for i, line in enumerate(lines):
-            if ": " in line:
-                key = line.split(": ", 1)[0]
-                existing[key] = i
-
-        for key, value in updates.items():
-            new_line = f"{key}: {value}"
-            if key in existing:
-                lines[existing[key]] = new_line
-            else:
-                lines.append(new_line)
-
-        new_value = "\n".join(lines)
+        new_value = _merge_context_lines(block.value or "", updates)
         letta_call(
             "blocks.update",
             client.blocks.update,
@@ -349,6 +423,118 @@ def update_swarm_context(
         return False
 
 
+class SwarmContextMirror:
+    """
+    Local copy of a session's ``swarm_context`` block that batches updates.
+
+    ``update`` only records ``Key: value`` pairs; ``flush`` writes everything
+    recorded since the last flush in one ``blocks.update``, and makes no
+    request when the value is unchanged. SwarmManager records the topic at
+    meeting start and the swarm's focus each turn, and flushes once per turn,
+    so all keys changed between turns reach the server together.
+
+    The block is shared with every participant, and agents can edit it with
+    their memory tools. Letta blocks carry no version or timestamp, so the
+    mirror re-reads the block before writing when it was marked stale
+    (``mark_stale``, e.g. after an agent's memory tool call), on the first
+    flush, and otherwise after ``verify_every`` writes. If the block changed
+    since the mirror last wrote it, the pending keys are merged into the
+    server's value rather than the cached one, so those edits survive.
+    Flushes are serialized, so concurrent updates cannot overwrite each other.
+    """
+
+    def __init__(self, client: "Letta", block_id: str, verify_every: Optional[int] = None):
+        self.client = client
+        self.block_id = block_id
+        self.verify_every = (
+            config.get_swarm_context_verify_every() if verify_every is None else max(1, verify_every)
+        )
+        # Writes made, and external edits found when re-reading the block
+        self.writes = 0
+        self.drifts = 0
+        self._synced: Optional[str] = None
+        self._unverified = 0
+        self._stale = False
+        self._pending: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    @property
+    def value(self) -> str:
+        """The block value as it will be after the pending updates are flushed."""
+        with self._lock:
+            return _merge_context_lines(self._synced or "", self._pending)
+
+    @property
+    def pending(self) -> bool:
+        with self._lock:
+            return bool(self._pending)
+
+    def update(self, updates: Dict[str, str]) -> None:
+        """Record ``updates`` to be written by the next ``flush``."""
+        with self._lock:
+            self._pending.update({k: str(v) for k, v in updates.items()})
+
+    def mark_stale(self) -> None:
+        """Re-read the block before the next write (its value may have been edited)."""
+        with self._lock:
+            self._stale = True
+
+    def _read(self) -> str:
+        block = letta_call(
+            "blocks.retrieve",
+            self.client.blocks.retrieve,
+            block_id=self.block_id,
+        )
+        return getattr(block, "value", None) or ""
+
+    def flush(self) -> bool:
+        """Write pending updates now; returns False if the write failed (they stay pending)."""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                stale, self._stale = self._stale, False
+            if not pending:
+                if stale:
+                    self.mark_stale()
+                return True
+            try:
+                current = self._synced
+                if current is None or stale or self._unverified >= self.verify_every:
+                    server = self._read()
+                    if current is not None and server != current:
+                        self.drifts += 1
+                        logger.info(
+                            "swarm_context block %s was edited outside SPDS; merging into it",
+                            self.block_id,
+                        )
+                    current = self._synced = server
+                    self._unverified = 0
+                new_value = _merge_context_lines(current, pending)
+                if new_value != current:
+                    letta_call(
+                        "blocks.update",
+                        self.client.blocks.update,
+                        block_id=self.block_id,
+                        value=new_value,
+                    )
+                    self.writes += 1
+                    self._unverified += 1
+                    self._synced = new_value
+                return True
+            except Exception as e:
+                logger.warning("Failed to update swarm_context block: %s", e)
+                with self._lock:
+                    for key, value in pending.items():
+                        self._pending.setdefault(key, value)
+                    self._stale = True
+                return False
+
+    def close(self) -> bool:
+        """Flush anything pending; call when the session ends."""
+        return self.flush()
+
+
 # ---------------------------------------------------------------------------
 # Side-conversation detection
 # ---------------------------------------------------------------------------
@@ -377,54 +563,12 @@ def detect_side_conversations(
     if response is None:
         return []
 
-    import json
-
-    detected: List[Dict[str, Any]] = []
-    messages = getattr(response, "messages", None) or []
-
-    for msg in messages:
-        if getattr(msg, "message_type", None) != "tool_call_message":
-            continue
+    from .response_parser import parse_response
 
-        tool_call = getattr(msg, "tool_call", None)
-        if tool_call is None:
-            continue
-
-        tool_name = getattr(tool_call, "name", None)
-        if tool_name not in MULTI_AGENT_TOOLS:
-            continue
-
-        # Parse arguments defensively
-        raw_args = getattr(tool_call, "arguments", None) or "{}"
-        try:
-            args = json.loads(raw_args) if isinstance(raw_args, str) else raw_args
-        except (json.JSONDecodeError, TypeError):
-            logger.warning(
-                "Malformed tool call arguments from %s for %s: %s",
-                sender_name,
-                tool_name,
-                raw_args,
-            )
-            continue
-
-        entry: Dict[str, Any] = {
-            "sender": sender_name,
-            "tool_name": tool_name,
-        }
-
-        if tool_name == MULTI_AGENT_TOOL:
-            entry["type"] = "async"
-            entry["recipient_id"] = args.get("agent_id") or args.get("recipient_agent_id")
-            entry["tags"] = None
-        else:
-            entry["type"] = "broadcast"
-            entry["recipient_id"] = None
-            entry["tags"] = args.get("tags")
-
-        entry["message_content"] = args.get("message", "")
-        detected.append(entry)
-
-    return detected
+    return [
+        {"sender": sender_name, **entry}
+        for entry in parse_response(response).side_conversations
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -439,29 +583,53 @@ def setup_cross_agent_messaging(
     topic: str = "",
     participant_names: Optional[List[str]] = None,
     conversation_mode: str = "hybrid",
+    agent_states: Optional[List[Any]] = None,
+    warm: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """One-call setup for cross-agent messaging in a swarm session.
 
+    ``agent_states`` (the already loaded ``AgentState`` of each agent, in
+    ``agent_ids`` order) lets tagging skip re-fetching every agent.
+
     Performs:
     1. Tags agents with the session tag
     2. Attaches ``send_message_to_agent_async`` to each agent
     3. Creates a shared ``swarm_context`` memory block
 
+    ``warm`` is the ``warm_state`` returned by an earlier setup of the same
+    agents (see :mod:`spds.warm_start`). If ``agent_states`` show every
+    agent still has the tools it lists, step 2 is skipped. The
+    ``swarm_context`` block is per session and is always created.
+
     Returns a dict with setup results::
 
         {
             "session_tag": "spds:session-...",
             "multi_agent_enabled": True/False,
             "swarm_context_block_id": "block-..." or None,
+            "warm_start": True/False,   # step 2 was skipped
+            "warm_state": {...} or None,  # what a later setup can reuse
         }
     """
+    from .warm_start import states_have
+
     names = participant_names or [f"agent-{i}" for i in range(len(agent_ids))]
 
     # 1. Tag agents
-    session_tag = tag_agents_for_session(client, agent_ids, session_id)
+    session_tag = tag_agents_for_session(client, agent_states or agent_ids, session_id)
 
-    # 2. Attach multi-agent tools
-    tool_status = attach_multi_agent_tools(client, agent_ids)
+    # 2. Attach multi-agent tools (unless every agent still has the cached ones)
+    warm_start = bool(warm and warm.get("tools")) and states_have(
+        agent_states, tools=warm["tools"]
+    )
+    if warm_start:
+        logger.info("Multi-agent tools already attached to all %d agents", len(agent_ids))
+        tool_status = {
+            "async_enabled": bool(warm.get("async_enabled")),
+            "broadcast_enabled": bool(warm.get("broadcast_enabled")),
+        }
+    else:
+        tool_status = attach_multi_agent_tools(client, agent_ids)
 
     # 3. Create shared context block
     block_id = create_swarm_context_block(
@@ -476,11 +644,16 @@ def setup_cross_agent_messaging(
     if block_id:
         attach_block_to_agents(client, block_id, agent_ids)
 
+    enabled = {MULTI_AGENT_TOOL: "async_enabled", BROADCAST_TOOL: "broadcast_enabled"}
+    attached_tools = [name for name, flag in enabled.items() if tool_status.get(flag)]
+
     return {
         "session_tag": session_tag,
         "multi_agent_enabled": tool_status.get("async_enabled", False),
         "broadcast_enabled": tool_status.get("broadcast_enabled", False),
         "swarm_context_block_id": block_id,
+        "warm_start": warm_start,
+        "warm_state": {**tool_status, "tools": attached_tools} if attached_tools else None,
     }
 
 
@@ -488,10 +661,26 @@ def teardown_cross_agent_messaging(
     client: "Letta",
     agent_ids: List[str],
     session_id: str,
-) -> None:
+    agent_states: Optional[List[Any]] = None,
+    background: bool = False,
+) -> Optional[threading.Thread]:
     """Clean up after a swarm session ends.
 
     Removes session tags from agents. Shared memory blocks are left
     in place for historical reference.
+
+    With ``background=True`` the tags are removed on a separate thread
+    so the caller does not wait for it; that thread is returned. It is
+    not a daemon thread, so an exiting interpreter still finishes it.
     """
-    remove_session_tags(client, agent_ids, session_id)
+    agents = agent_states or agent_ids
+    if not background:
+        remove_session_tags(client, agents, session_id)
+        return None
+    thread = threading.Thread(
+        target=remove_session_tags,
+        args=(client, agents, session_id),
+        name=f"spds-teardown-{session_id}",
+    )
+    thread.start()
+    return thread
@@ -0,0 +1,196 @@
+# spds/export_archive.py
+
+import hashlib
+import json
+import logging
+import re
+import tempfile
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+BUNDLE_SUFFIX = ".spdsx"
+ARCHIVE_DIRNAME = "archives"
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def session_key(session_id: Optional[str]) -> str:
+    """Directory-safe name for a session's archive directory."""
+    key = _UNSAFE.sub("_", str(session_id or "").strip()).strip("._")
+    return key or "default"
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class ExportArchive:
+    """
+    Compressed, content-addressed export bundles for one session.
+
+    Each export is a single deflate-compressed zip bundle
+    (``<name>.spdsx``) under ``<export dir>/archives/<session>/``. File
+    contents are stored as ``objects/<sha256>``; a file whose content is
+    already stored in an earlier bundle of the same session is recorded in
+    the manifest as a reference to that bundle instead of being stored again.
+
+    ``manifest.json`` in every bundle maps each exported file name to its
+    hash, size and holding bundle, so ``read`` fetches one file without
+    unpacking anything else. ``prune`` never deletes a bundle that a
+    retained bundle still references.
+    """
+
+    def __init__(self, export_directory, session_id: Optional[str]):
+        self.session_id = session_id
+        self.directory = Path(export_directory) / ARCHIVE_DIRNAME / session_key(session_id)
+
+    # -- writing -------------------------------------------------------------
+
+    def write_bundle(
+        self, name: str, files: Dict[str, str], metadata: Optional[Dict] = None
+    ) -> Path:
+        """Write ``files`` (file name -> text) as bundle ``name``; returns its path."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        bundle_name = f"{name}{BUNDLE_SUFFIX}"
+        counter = 1
+        while (self.directory / bundle_name).exists():
+            # Never replace a bundle: later bundles may reference its objects.
+            counter += 1
+            bundle_name = f"{name}_{counter}{BUNDLE_SUFFIX}"
+        bundle_path = self.directory / bundle_name
+        known = self._stored_objects()
+
+        entries = {}
+        stored_here = set()
+        temp_file = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=self.directory, delete=False, suffix=".tmp"
+            ) as raw:
+                temp_file = Path(raw.name)
+                with zipfile.ZipFile(raw, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+                    for file_name, text in files.items():
+                        data = text.encode("utf-8")
+                        digest = content_hash(data)
+                        holder = known.get(digest)
+                        if holder is None:
+                            holder = bundle_name
+                            if digest not in stored_here:
+                                bundle.writestr(f"objects/{digest}", data)
+                                stored_here.add(digest)
+                        entries[file_name] = {
+                            "sha256": digest,
+                            "size": len(data),
+                            "bundle": holder,
+                        }
+                    manifest = {
+                        "session_id": self.session_id,
+                        "created_at": datetime.now().isoformat(),
+                        "metadata": metadata or {},
+                        "files": entries,
+                    }
+                    bundle.writestr(
+                        MANIFEST_NAME, json.dumps(manifest, indent=2, ensure_ascii=False, default=str)
+                    )
+            temp_file.replace(bundle_path)
+        except Exception as e:
+            if temp_file and temp_file.exists():
+                temp_file.unlink(missing_ok=True)
+            raise e
+
+        logger.info(
+            "Wrote export bundle %s: %d files, %d new objects, %d deduplicated",
+            bundle_path,
+            len(entries),
+            len(stored_here),
+            len(entries) - sum(1 for e in entries.values() if e["bundle"] == bundle_name),
+        )
+        return bundle_path
+
+    def _stored_objects(self) -> Dict[str, str]:
+        """Hash -> name of the bundle that physically stores it."""
+        stored: Dict[str, str] = {}
+        for bundle_path in self.bundles():
+            try:
+                manifest = self.manifest(bundle_path)
+            except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+                logger.warning("Skipping unreadable export bundle %s: %s", bundle_path, e)
+                continue
+            for entry in manifest.get("files", {}).values():
+                if entry.get("bundle") == bundle_path.name:
+                    stored.setdefault(entry["sha256"], bundle_path.name)
+        return stored
+
+    # -- reading -------------------------------------------------------------
+
+    def bundles(self) -> List[Path]:
+        """This session's bundles, oldest first."""
+        if not self.directory.exists():
+            return []
+        return sorted(self.directory.glob(f"*{BUNDLE_SUFFIX}"))
+
+    def manifest(self, bundle) -> Dict:
+        bundle_path = self._resolve(bundle)
+        with zipfile.ZipFile(bundle_path) as zf:
+            return json.loads(zf.read(MANIFEST_NAME).decode("utf-8"))
+
+    def read(self, bundle, file_name: str) -> bytes:
+        """Return one exported file's content, following deduplicated references."""
+        entry = self.manifest(bundle)["files"][file_name]
+        holder = self._resolve(entry["bundle"])
+        with zipfile.ZipFile(holder) as zf:
+            data = zf.read(f"objects/{entry['sha256']}")
+        if content_hash(data) != entry["sha256"]:
+            raise ValueError(f"Corrupt export object {entry['sha256']} in {holder}")
+        return data
+
+    def _resolve(self, bundle) -> Path:
+        path = Path(bundle)
+        return path if path.is_absolute() or path.parent != Path(".") else self.directory / path
+
+    # -- cleanup -------------------------------------------------------------
+
+    def prune(self, cutoff_timestamp: float) -> int:
+        """Delete bundles last modified before ``cutoff_timestamp`` that no retained bundle references."""
+        bundles = self.bundles()
+        old = {p.name for p in bundles if p.stat().st_mtime < cutoff_timestamp}
+        if not old:
+            return 0
+        references = {}
+        for bundle_path in bundles:
+            try:
+                files = self.manifest(bundle_path).get("files", {})
+            except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+                files = {}
+            references[bundle_path.name] = {entry.get("bundle") for entry in files.values()}
+        # Keep every bundle reachable from a retained one.
+        keep = {p.name for p in bundles} - old
+        pending = list(keep)
+        while pending:
+            for name in references.get(pending.pop(), ()):
+                if name in old and name not in keep:
+                    keep.add(name)
+                    pending.append(name)
+        removed = 0
+        for name in sorted(old - keep):
+            (self.directory / name).unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+
+def prune_archives(export_directory, cutoff_timestamp: float) -> int:
+    """Prune every session's archive under ``export_directory``; returns bundles removed."""
+    root = Path(export_directory) / ARCHIVE_DIRNAME
+    if not root.exists():
+        return 0
+    removed = 0
+    for session_dir in root.iterdir():
+        if session_dir.is_dir():
+            archive = ExportArchive(export_directory, session_dir.name)
+            removed += archive.prune(cutoff_timestamp)
+    return removed
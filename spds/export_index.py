@@ -0,0 +1,366 @@
+# spds/export_index.py
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+from . import config
+from .export_archive import ARCHIVE_DIRNAME, BUNDLE_SUFFIX
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS exports (
+    path TEXT PRIMARY KEY,
+    directory TEXT NOT NULL,
+    session_id TEXT,
+    format TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS exports_directory ON exports (directory, created_at);
+CREATE INDEX IF NOT EXISTS exports_session ON exports (session_id, created_at);
+CREATE INDEX IF NOT EXISTS exports_created ON exports (created_at);
+CREATE TABLE IF NOT EXISTS scanned (
+    directory TEXT PRIMARY KEY,
+    scanned_at REAL NOT NULL,
+    mtime_ns INTEGER
+);
+"""
+
+# Filename prefix -> format for files written by ExportManager.
+_PREFIX_FORMATS = (
+    ("board_minutes_", "minutes"),
+    ("meeting_notes_", "minutes"),
+    ("transcript_", "transcript"),
+    ("meeting_data_", "data"),
+    ("action_items_", "actions"),
+    ("formatted_conversation_", "formatted"),
+    ("executive_summary_", "summary"),
+)
+_PACKAGE_PATTERN = re.compile(r"^meeting_package_\d{8}_\d{6}_([a-z]+)\.")
+# A directory modified this recently may change again without its mtime
+# moving (coarse filesystem timestamps), so its scan is not trusted.
+_RACY_MTIME_NS = 2_000_000_000
+
+
+def _is_bookkeeping(name: str) -> bool:
+    """Index databases and in-progress temp files are not exports."""
+    return name.startswith(("export_index.", "search_index.")) or name.endswith(".tmp")
+
+
+def classify_export(path: Path) -> Tuple[str, Optional[str]]:
+    """Return ``(format, session_id)`` for an export file, judged by its name and location."""
+    name = path.name
+    if name.endswith(BUNDLE_SUFFIX):
+        return "archive", path.parent.name
+    if name.startswith("summary_") and name.endswith(".json"):
+        return "session_json", path.parent.name
+    if name.startswith("minutes_") and name.endswith(".md"):
+        return "session_markdown", path.parent.name
+    match = _PACKAGE_PATTERN.match(name)
+    if match:
+        return match.group(1), None
+    for prefix, fmt in _PREFIX_FORMATS:
+        if name.startswith(prefix):
+            return fmt, None
+    return "other", None
+
+
+def _file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _directory_key(directory) -> str:
+    return str(Path(directory).resolve())
+
+
+@dataclass
+class ExportRecord:
+    path: str
+    directory: str
+    session_id: Optional[str]
+    format: str
+    size: int
+    sha256: Optional[str]
+    created_at: datetime
+
+    @property
+    def filename(self) -> str:
+        return Path(self.path).name
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "filename": self.filename,
+            "session_id": self.session_id,
+            "format": self.format,
+            "size_bytes": self.size,
+            "sha256": self.sha256,
+            "created_at": self.created_at.isoformat(),
+        }
+
+
+class ExportIndex:
+    """
+    SQLite manifest of export files: path, session id, format, size, hash and time.
+
+    ExportManager and the session exporters record every file they write, so
+    listing, per-session lookup and age-based cleanup are indexed queries
+    rather than directory scans. The index is a cache of what is on disk:
+    ``ensure_scanned`` (run before each query) compares the directory's
+    mtime with the one seen at its last scan, and when files were added,
+    removed or renamed since, rescans it. That rescan only stats entries and
+    hashes new or changed files. ``rebuild`` rescans and rehashes everything
+    under an export root.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else config.get_export_index_path()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(scanned)")}
+            if "mtime_ns" not in columns:
+                # Index files from before directory mtimes were tracked
+                conn.execute("ALTER TABLE scanned ADD COLUMN mtime_ns INTEGER")
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # -- writing -------------------------------------------------------------
+
+    def record(
+        self,
+        path,
+        format: Optional[str] = None,
+        session_id: Optional[str] = None,
+        content: Union[str, bytes, None] = None,
+    ) -> None:
+        """Add or refresh one export file; hashes ``content`` if given, else reads the file."""
+        path = Path(path)
+        stat = path.stat()
+        if content is None:
+            sha256 = _file_hash(path)
+        else:
+            data = content.encode("utf-8") if isinstance(content, str) else content
+            sha256 = hashlib.sha256(data).hexdigest()
+        guessed_format, guessed_session = classify_export(path)
+        row = (
+            str(path.resolve()),
+            _directory_key(path.parent),
+            session_id if session_id is not None else guessed_session,
+            format or guessed_format,
+            stat.st_size,
+            sha256,
+            stat.st_mtime,
+        )
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO exports VALUES (?, ?, ?, ?, ?, ?, ?)", row)
+
+    def forget(self, paths: Iterable) -> None:
+        rows = [(str(Path(p).resolve()),) for p in paths]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany("DELETE FROM exports WHERE path = ?", rows)
+
+    # -- rebuilding ----------------------------------------------------------
+
+    def rebuild_directory(
+        self, directory, session_id: Optional[str] = None, rehash: bool = True
+    ) -> int:
+        """Re-index the export files directly inside ``directory``; returns how many were found.
+
+        With ``rehash=False`` files whose size and mtime match their indexed
+        row keep that row, so only new or changed files are read.
+        """
+        directory = Path(directory)
+        key = _directory_key(directory)
+        known = {}
+        if not rehash:
+            with self._lock:
+                known = {
+                    row[0]: row
+                    for row in self._connect().execute(
+                        "SELECT path, directory, session_id, format, size, sha256, created_at "
+                        "FROM exports WHERE directory = ?",
+                        (key,),
+                    )
+                }
+        rows = []
+        mtime_ns = None
+        if directory.is_dir():
+            mtime_ns = directory.stat().st_mtime_ns
+            if time.time_ns() - mtime_ns < _RACY_MTIME_NS:
+                mtime_ns = None
+            for path in directory.iterdir():
+                if not path.is_file() or _is_bookkeeping(path.name):
+                    continue
+                try:
+                    stat = path.stat()
+                    resolved = str(path.resolve())
+                    row = known.get(resolved)
+                    if row is not None and (row[4], row[6]) == (stat.st_size, stat.st_mtime):
+                        rows.append(row)
+                        continue
+                    sha256 = _file_hash(path)
+                except OSError:
+                    continue
+                fmt, guessed_session = classify_export(path)
+                rows.append(
+                    (
+                        resolved,
+                        key,
+                        session_id if session_id is not None else guessed_session,
+                        fmt,
+                        stat.st_size,
+                        sha256,
+                        stat.st_mtime,
+                    )
+                )
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM exports WHERE directory = ?", (key,))
+                conn.executemany("INSERT OR REPLACE INTO exports VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+                conn.execute(
+                    "INSERT OR REPLACE INTO scanned (directory, scanned_at, mtime_ns) "
+                    "VALUES (?, ?, ?)",
+                    (key, time.time(), mtime_ns),
+                )
+        return len(rows)
+
+    def ensure_scanned(self, directory, session_id: Optional[str] = None) -> None:
+        """Rescan ``directory`` if entries were added or removed since its last scan (by its mtime)."""
+        directory = Path(directory)
+        key = _directory_key(directory)
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        with self._lock:
+            seen = self._connect().execute(
+                "SELECT mtime_ns FROM scanned WHERE directory = ?", (key,)
+            ).fetchone()
+        if seen is None or seen[0] is None or seen[0] != mtime_ns:
+            self.rebuild_directory(directory, session_id, rehash=False)
+
+    def rebuild(self, export_directory=None) -> int:
+        """Rescan an export root: its files, per-session export folders and archives.
+
+        Without ``export_directory`` the default export directory and the
+        web UI's SESSIONS_DIR are rescanned.
+        """
+        root = Path(export_directory or config.DEFAULT_EXPORT_DIRECTORY)
+        directories = [root]
+        parents = [root / "sessions", root / ARCHIVE_DIRNAME]
+        if export_directory is None:
+            parents.append(config.get_sessions_dir())
+        for parent in parents:
+            if parent.is_dir():
+                directories.extend(p for p in parent.iterdir() if p.is_dir())
+        seen = set()
+        total = 0
+        for directory in directories:
+            key = _directory_key(directory)
+            if key not in seen:
+                seen.add(key)
+                total += self.rebuild_directory(directory)
+        logger.info("Rebuilt export index from %s: %d files", root, total)
+        return total
+
+    # -- queries -------------------------------------------------------------
+
+    def list(
+        self,
+        directory=None,
+        session_id: Optional[str] = None,
+        formats: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[ExportRecord]:
+        """Exports matching the filters, newest first."""
+        where, params = [], []
+        if directory is not None:
+            where.append("directory = ?")
+            params.append(_directory_key(directory))
+        if session_id is not None:
+            where.append("session_id = ?")
+            params.append(session_id)
+        if formats:
+            formats = list(formats)
+            where.append(f"format IN ({', '.join('?' for _ in formats)})")
+            params.extend(formats)
+        return self._select(where, params, "created_at DESC, path DESC", limit)
+
+    def older_than(self, cutoff_timestamp: float, directory=None) -> List[ExportRecord]:
+        where, params = ["created_at < ?"], [cutoff_timestamp]
+        if directory is not None:
+            where.append("directory = ?")
+            params.append(_directory_key(directory))
+        return self._select(where, params, "created_at", None)
+
+    def _select(self, where, params, order: str, limit: Optional[int]) -> List[ExportRecord]:
+        sql = "SELECT path, directory, session_id, format, size, sha256, created_at FROM exports"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order}"
+        if limit and limit > 0:
+            sql += " LIMIT ?"
+            params = [*params, int(limit)]
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [
+            ExportRecord(path, directory, session_id, fmt, size, sha256, datetime.fromtimestamp(ts))
+            for path, directory, session_id, fmt, size, sha256, ts in rows
+        ]
+
+
+_default_index: Optional[ExportIndex] = None
+_default_lock = threading.Lock()
+
+
+def get_export_index() -> ExportIndex:
+    """Return the process-wide export index."""
+    global _default_index
+    with _default_lock:
+        path = config.get_export_index_path()
+        if _default_index is None or _default_index.path != path:
+            _default_index = ExportIndex(path)
+        return _default_index
+
+
+def record_export(path, format: Optional[str] = None, session_id: Optional[str] = None, content=None) -> None:
+    """Record ``path`` in the default index; indexing problems never fail an export."""
+    try:
+        get_export_index().record(path, format, session_id, content)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Could not index export %s: %s", path, e)
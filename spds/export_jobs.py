@@ -0,0 +1,174 @@
+# spds/export_jobs.py
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import config
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# progress(fraction 0..1, message) as handed to a job function
+ProgressFn = Callable[[float, str], None]
+
+
+@dataclass
+class ExportJob:
+    id: str
+    session_id: str
+    format: str
+    status: str = QUEUED
+    progress: float = 0.0
+    message: str = "Queued"
+    result: Any = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "session_id": self.session_id,
+            "format": self.format,
+            "status": self.status,
+            "progress": round(self.progress, 3),
+            "message": self.message,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class ExportJobQueue:
+    """
+    Runs exports on a small worker pool so request and socket handlers return at once.
+
+    ``submit`` hands back a job whose id can be polled with ``get``; every
+    state change (queued, progress, done, failed) is also passed to
+    ``on_update`` so the web UI can forward it as a socket event. At most
+    ``max_workers`` jobs run at a time and the rest wait in order.
+
+    A job for a session and format that is still queued absorbs identical
+    submissions: the queued job has not read the session yet, so its result
+    is as fresh as a new one would be. Running jobs are not reused for the
+    same reason in reverse. Finished jobs are kept for polling until
+    ``keep_finished`` newer ones have finished.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        keep_finished: int = 100,
+        on_update: Optional[Callable[[ExportJob], None]] = None,
+    ):
+        self.max_workers = max_workers or config.get_export_job_workers()
+        self.keep_finished = keep_finished
+        self.on_update = on_update
+        self._jobs: "OrderedDict[str, ExportJob]" = OrderedDict()
+        self._queued: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="export-job"
+        )
+
+    def submit(
+        self, session_id: str, format: str, fn: Callable[[ProgressFn], Any]
+    ) -> Tuple[ExportJob, bool]:
+        """Queue ``fn(progress)``; returns ``(job, deduplicated)``."""
+        key = (session_id, format)
+        with self._lock:
+            existing = self._jobs.get(self._queued.get(key, ""))
+            if existing is not None and existing.status == QUEUED:
+                return existing, True
+            job = ExportJob(id=uuid.uuid4().hex, session_id=session_id, format=format)
+            self._jobs[job.id] = job
+            self._queued[key] = job.id
+        self._notify(job)
+        self._executor.submit(self._run, job, fn)
+        return job, False
+
+    def _run(self, job: ExportJob, fn: Callable[[ProgressFn], Any]) -> None:
+        with self._lock:
+            if self._queued.get((job.session_id, job.format)) == job.id:
+                del self._queued[(job.session_id, job.format)]
+            job.status = RUNNING
+            job.started_at = time.time()
+            job.message = "Running"
+        self._notify(job)
+
+        def progress(fraction: float, message: str) -> None:
+            with self._lock:
+                job.progress = max(0.0, min(1.0, float(fraction)))
+                job.message = message
+            self._notify(job)
+
+        try:
+            result = fn(progress)
+        except Exception as e:
+            logger.error("Export job %s (%s/%s) failed: %s", job.id, job.session_id, job.format, e)
+            with self._lock:
+                job.status = FAILED
+                job.error = str(e)
+                job.message = f"Export failed: {e}"
+                job.finished_at = time.time()
+        else:
+            with self._lock:
+                job.status = DONE
+                job.result = result
+                job.progress = 1.0
+                job.message = "Export complete"
+                job.finished_at = time.time()
+        self._trim()
+        self._notify(job)
+
+    def _notify(self, job: ExportJob) -> None:
+        if self.on_update is None:
+            return
+        try:
+            self.on_update(job)
+        except Exception as e:
+            logger.debug("Export job update listener failed: %s", e)
+
+    def _trim(self) -> None:
+        with self._lock:
+            finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+            for job_id in finished[: max(0, len(finished) - self.keep_finished)]:
+                del self._jobs[job_id]
+
+    # -- queries -------------------------------------------------------------
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self, session_id: Optional[str] = None) -> List[ExportJob]:
+        """Known jobs, oldest first."""
+        with self._lock:
+            return [
+                job for job in self._jobs.values()
+                if session_id is None or job.session_id == session_id
+            ]
+
+    def active_count(self) -> int:
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if not job.finished)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
@@ -3,15 +3,68 @@
 import json
 import logging
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple, Union
 
 from . import config
 from .conversations import ConversationManager
+from .export_archive import ARCHIVE_DIRNAME, ExportArchive, prune_archives, session_key
+from .export_index import get_export_index, record_export
 
 logger = logging.getLogger(__name__)
 
+# (timestamp, speaker, message) for one conversation_log entry
+LogEntry = Tuple[datetime, str, str]
+
+
+def _log_entry(entry: Any, now: datetime) -> LogEntry:
+    """One conversation_log dict or ConversationMessage as a ``LogEntry``."""
+    if hasattr(entry, "sender"):
+        timestamp, speaker, message = entry.timestamp, entry.sender, entry.content
+    else:
+        timestamp = entry.get("timestamp", now)
+        speaker, message = entry.get("speaker", "Unknown"), entry.get("message", "")
+    if isinstance(timestamp, str):
+        try:
+            timestamp = datetime.fromisoformat(timestamp)
+        except ValueError:
+            timestamp = now
+    elif not isinstance(timestamp, datetime):
+        timestamp = now
+    return timestamp, speaker, message
+
+
+def _normalize_log(conversation_log: List[Dict[str, Any]]) -> List[LogEntry]:
+    """Flatten a secretary conversation log once for the transcript renderers.
+
+    Missing timestamps become "now" and ISO strings are parsed, so renderers
+    can format every timestamp without re-checking it.
+    """
+    now = datetime.now()
+    return [_log_entry(entry, now) for entry in conversation_log]
+
+
+def _transcript_line(entry: LogEntry) -> str:
+    timestamp, speaker, message = entry
+    return f"[{timestamp.strftime('%H:%M:%S')}] {speaker}: {message}\n"
+
+
+# Bump when the live transcript layout changes; existing live files are then
+# re-rendered from the start instead of appended to.
+LIVE_TRANSCRIPT_FORMAT = 1
+LIVE_DIRNAME = "live"
+
+
+def _message_range(messages, start: int, stop: int) -> Iterator[Any]:
+    """Messages ``start..stop`` without copying a ConversationHistory's evicted prefix."""
+    if hasattr(messages, "_iter_range"):
+        return messages._iter_range(start, stop)
+    return iter(messages[start:stop])
+
 
 class ExportManager:
     """
@@ -24,6 +77,10 @@ class ExportManager:
             export_directory or config.DEFAULT_EXPORT_DIRECTORY
         )
         self.export_directory.mkdir(exist_ok=True)
+        # Seconds per format from the most recent export_complete_package call
+        self.last_package_timings: Dict[str, float] = {}
+        # What the most recent export_live_transcript call wrote
+        self.last_live_export: Dict[str, Any] = {}
 
     def export_meeting_minutes(
         self,
@@ -39,7 +96,12 @@ class ExportManager:
 
         filename = filename or default_name
         filepath = self.export_directory / f"{filename}.md"
+        self._write(filepath, self._render_meeting_minutes(meeting_data, format_type), "minutes")
 
+        print(f"Meeting minutes exported: {filepath}")
+        return str(filepath)
+
+    def _render_meeting_minutes(self, meeting_data: Dict[str, Any], format_type: str) -> str:
         # Secretary agent generates the actual minutes content via AI.
         # meeting_data may contain pre-formatted content or structured data.
         content = meeting_data.get("content", "")
@@ -52,12 +114,7 @@ class ExportManager:
             for key, value in meeting_data.items():
                 if key != "metadata":
                     content += f"## {key.replace('_', ' ').title()}\n\n{value}\n\n"
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        print(f"Meeting minutes exported: {filepath}")
-        return str(filepath)
+        return content
 
     def export_raw_transcript(
         self,
@@ -78,29 +135,119 @@ class ExportManager:
         """
         filename = filename or self._generate_filename("transcript")
         filepath = self.export_directory / f"{filename}.txt"
+        entries = _normalize_log(conversation_log)
+        self._write(filepath, self._render_raw_transcript(entries, metadata), "transcript")
 
-        content = f"Conversation Transcript\n"
-        content += f"Topic: {metadata.get('topic', 'Unknown')}\n"
-        content += f"Date: {datetime.now().strftime('%B %d, %Y %I:%M %p')}\n"
-        content += f"Participants: {', '.join(metadata.get('participants', []))}\n"
-        content += f"{'=' * 50}\n\n"
+        print(f"📝 Raw transcript exported: {filepath}")
+        return str(filepath)
 
-        for entry in conversation_log:
-            timestamp = entry.get("timestamp", datetime.now())
-            speaker = entry.get("speaker", "Unknown")
-            message = entry.get("message", "")
+    def _render_raw_transcript(self, entries: List[LogEntry], metadata: Dict[str, Any]) -> str:
+        parts = [
+            f"Conversation Transcript\n",
+            f"Topic: {metadata.get('topic', 'Unknown')}\n",
+            f"Date: {datetime.now().strftime('%B %d, %Y %I:%M %p')}\n",
+            f"Participants: {', '.join(metadata.get('participants', []))}\n",
+            f"{'=' * 50}\n\n",
+        ]
+        parts.extend(_transcript_line(entry) for entry in entries)
+        parts.append(f"\n{'=' * 50}\n")
+        parts.append(f"End of transcript - {len(entries)} messages total\n")
+        return "".join(parts)
+
+    def export_live_transcript(
+        self,
+        messages,
+        metadata: Dict[str, Any],
+        session_id: Optional[str] = None,
+    ) -> str:
+        """
+        Bring a session's live transcript up to date with ``messages``.
 
-            content += f"[{timestamp.strftime('%H:%M:%S')}] {speaker}: {message}\n"
+        The live transcript (``live/transcript_<session>.txt``) uses the raw
+        transcript line format and is only ever appended to: a sidecar state
+        file records how many messages and bytes it holds, and each call
+        writes just the messages after that watermark. The file is rendered
+        again from the start only when the layout version changed, the
+        history was rewritten (shorter, or a new ConversationHistory
+        generation) or the file no longer matches its recorded size.
 
-        content += f"\n{'=' * 50}\n"
-        content += f"End of transcript - {len(conversation_log)} messages total\n"
+        Args:
+            messages: ConversationMessage list/ConversationHistory or conversation_log dicts
+            metadata: Meeting metadata for the header
+            session_id: Session the transcript belongs to
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
+        Returns:
+            Path to the live transcript
+        """
+        directory = self.export_directory / LIVE_DIRNAME
+        directory.mkdir(parents=True, exist_ok=True)
+        key = session_key(session_id)
+        filepath = directory / f"transcript_{key}.txt"
+        state_path = directory / f"transcript_{key}.state.json"
 
-        print(f"📝 Raw transcript exported: {filepath}")
+        try:
+            state = json.loads(state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            state = {}
+        total = len(messages)
+        generation = getattr(messages, "generation", None)
+        watermark = state.get("messages", 0)
+        try:
+            size = filepath.stat().st_size
+        except OSError:
+            size = None
+        full_render = (
+            state.get("format") != LIVE_TRANSCRIPT_FORMAT
+            or state.get("generation") != generation
+            or size is None
+            or size != state.get("bytes")
+            or watermark > total
+        )
+        start = 0 if full_render else watermark
+        now = datetime.now()
+        lines = (_transcript_line(_log_entry(m, now)) for m in _message_range(messages, start, total))
+
+        if full_render:
+            header = self._render_live_header(metadata)
+
+            def write(f: TextIO) -> None:
+                f.write(header)
+                f.writelines(lines)
+
+            atomic_write(filepath, write)
+        elif start < total:
+            with open(filepath, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+
+        state = {
+            "format": LIVE_TRANSCRIPT_FORMAT,
+            "generation": generation,
+            "messages": total,
+            "bytes": filepath.stat().st_size,
+        }
+        atomic_write(state_path, lambda f: json.dump(state, f))
+        self.last_live_export = {
+            "path": str(filepath),
+            "appended": total - start,
+            "full_render": full_render,
+        }
+        logger.debug(
+            "Live transcript %s: %d messages written (%s)",
+            filepath,
+            total - start,
+            "full render" if full_render else "appended",
+        )
         return str(filepath)
 
+    def _render_live_header(self, metadata: Dict[str, Any]) -> str:
+        return (
+            f"Live Conversation Transcript\n"
+            f"Topic: {metadata.get('topic', 'Unknown')}\n"
+            f"Started: {datetime.now().strftime('%B %d, %Y %I:%M %p')}\n"
+            f"Participants: {', '.join(metadata.get('participants', []))}\n"
+            f"{'=' * 50}\n\n"
+        )
+
     def export_structured_data(
         self, meeting_data: Dict[str, Any], filename: Optional[str] = None
     ) -> str:
@@ -116,16 +263,16 @@ class ExportManager:
         """
         filename = filename or self._generate_filename("meeting_data")
         filepath = self.export_directory / f"{filename}.json"
-
-        # Prepare data for JSON serialization
-        exportable_data = self._prepare_for_json(meeting_data)
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(exportable_data, f, indent=2, ensure_ascii=False)
+        self._write(filepath, self._render_structured_data(meeting_data), "data")
 
         print(f"📊 Structured data exported: {filepath}")
         return str(filepath)
 
+    def _render_structured_data(self, meeting_data: Dict[str, Any]) -> str:
+        # Prepare data for JSON serialization
+        exportable_data = self._prepare_for_json(meeting_data)
+        return json.dumps(exportable_data, indent=2, ensure_ascii=False)
+
     def export_action_items(
         self,
         action_items: List[Dict[str, Any]],
@@ -145,7 +292,14 @@ class ExportManager:
         """
         filename = filename or self._generate_filename("action_items")
         filepath = self.export_directory / f"{filename}.md"
+        self._write(filepath, self._render_action_items(action_items, metadata), "actions")
+
+        print(f"✅ Action items exported: {filepath}")
+        return str(filepath)
 
+    def _render_action_items(
+        self, action_items: List[Dict[str, Any]], metadata: Dict[str, Any]
+    ) -> str:
         content = f"# Action Items\n\n"
         content += f"**Meeting**: {metadata.get('topic', 'Unknown')}\n"
         content += f"**Date**: {datetime.now().strftime('%B %d, %Y')}\n"
@@ -181,12 +335,7 @@ class ExportManager:
             content += f"- ✅ Completed: {completed}\n"
             content += f"- ⏳ Pending: {pending}\n"
             content += f"- 📊 Progress: {(completed/len(action_items)*100):.0f}%\n"
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        print(f"✅ Action items exported: {filepath}")
-        return str(filepath)
+        return content
 
     def export_formatted_conversation(
         self,
@@ -207,48 +356,45 @@ class ExportManager:
         """
         filename = filename or self._generate_filename("formatted_conversation")
         filepath = self.export_directory / f"{filename}.md"
+        entries = _normalize_log(conversation_log)
+        self._write(filepath, self._render_formatted_conversation(entries, metadata), "formatted")
+
+        print(f"🎨 Formatted conversation exported: {filepath}")
+        return str(filepath)
 
-        content = f"# 💬 Conversation: {metadata.get('topic', 'Group Discussion')}\n\n"
+    def _render_formatted_conversation(
+        self, entries: List[LogEntry], metadata: Dict[str, Any]
+    ) -> str:
+        parts = [f"# 💬 Conversation: {metadata.get('topic', 'Group Discussion')}\n\n"]
 
         # Header info
         start_time = metadata.get("start_time", datetime.now())
-        content += f"**Date**: {start_time.strftime('%B %d, %Y')}\n"
-        content += f"**Time**: {start_time.strftime('%I:%M %p')}\n"
-        content += f"**Mode**: {metadata.get('conversation_mode', 'Unknown').title()}\n"
-        content += (
-            f"**Participants**: {', '.join(metadata.get('participants', []))}\n\n"
-        )
+        parts.append(f"**Date**: {start_time.strftime('%B %d, %Y')}\n")
+        parts.append(f"**Time**: {start_time.strftime('%I:%M %p')}\n")
+        parts.append(f"**Mode**: {metadata.get('conversation_mode', 'Unknown').title()}\n")
+        parts.append(f"**Participants**: {', '.join(metadata.get('participants', []))}\n\n")
 
-        content += "---\n\n"
+        parts.append("---\n\n")
 
         # Format conversation with agent styling
         current_speaker = None
-        for entry in conversation_log:
-            speaker = entry.get("speaker", "Unknown")
-            message = entry.get("message", "")
-            timestamp = entry.get("timestamp", datetime.now())
-
+        for timestamp, speaker, message in entries:
             # Add speaker header if it's a new speaker
             if speaker != current_speaker:
                 if current_speaker is not None:
-                    content += "\n"
-                content += f"## 🤖 {speaker}\n"
-                content += f"*{timestamp.strftime('%I:%M %p')}*\n\n"
+                    parts.append("\n")
+                parts.append(f"## 🤖 {speaker}\n")
+                parts.append(f"*{timestamp.strftime('%I:%M %p')}*\n\n")
                 current_speaker = speaker
 
             # Format the message
-            content += f"{message}\n\n"
+            parts.append(f"{message}\n\n")
 
         # Add footer with stats
-        content += "---\n\n"
-        content += f"**Conversation ended**: {datetime.now().strftime('%I:%M %p')}\n"
-        content += f"**Total messages**: {len(conversation_log)}\n"
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        print(f"🎨 Formatted conversation exported: {filepath}")
-        return str(filepath)
+        parts.append("---\n\n")
+        parts.append(f"**Conversation ended**: {datetime.now().strftime('%I:%M %p')}\n")
+        parts.append(f"**Total messages**: {len(entries)}\n")
+        return "".join(parts)
 
     def export_executive_summary(
         self, meeting_data: Dict[str, Any], filename: Optional[str] = None
@@ -265,7 +411,12 @@ class ExportManager:
         """
         filename = filename or self._generate_filename("executive_summary")
         filepath = self.export_directory / f"{filename}.md"
+        self._write(filepath, self._render_executive_summary(meeting_data), "summary")
 
+        print(f"📋 Executive summary exported: {filepath}")
+        return str(filepath)
+
+    def _render_executive_summary(self, meeting_data: Dict[str, Any]) -> str:
         metadata = meeting_data.get("metadata", {})
         decisions = meeting_data.get("decisions", [])
         action_items = meeting_data.get("action_items", [])
@@ -313,73 +464,128 @@ class ExportManager:
             "High" if len(decisions) > 1 or len(action_items) > 2 else "Moderate"
         )
         content += f"- **Effectiveness**: {effectiveness}\n"
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        print(f"📋 Executive summary exported: {filepath}")
-        return str(filepath)
+        return content
 
     def export_complete_package(
-        self, meeting_data: Dict[str, Any], format_type: str = "formal"
+        self,
+        meeting_data: Dict[str, Any],
+        format_type: str = "formal",
+        archive: Optional[bool] = None,
+        session_id: Optional[str] = None,
+        progress: Optional[Callable[[int, int, str], None]] = None,
     ) -> List[str]:
         """
         Export a complete package of all available formats.
 
+        The conversation log is normalized once and shared by the transcript
+        and formatted-conversation renderers; every format is then rendered
+        and written on a thread pool (``SPDS_EXPORT_WORKERS``). Seconds spent
+        per format are kept in ``last_package_timings``.
+
+        In archive mode the formats go into one compressed bundle under
+        ``archives/<session_id>/`` instead of loose files, deduplicated against
+        the session's earlier bundles (see ``ExportArchive``).
+
         Args:
             meeting_data: Complete meeting data from SecretaryAgent
             format_type: "formal" or "casual" for meeting minutes style
+            archive: Write a bundle instead of loose files (default: SPDS_EXPORT_ARCHIVE)
+            session_id: Session whose archive receives the bundle
+            progress: Called as ``progress(done, total, format)`` after each format is written
 
         Returns:
-            List of exported file paths
+            List of exported file paths (just the bundle in archive mode)
         """
+        if archive is None:
+            archive = config.get_export_archive_enabled()
+        started = time.perf_counter()
         base_filename = self._generate_filename("meeting_package")
-        exported_files = []
-
         print(f"📦 Exporting complete meeting package...")
 
-        # Meeting minutes
-        minutes_file = self.export_meeting_minutes(
-            meeting_data, format_type, f"{base_filename}_minutes"
-        )
-        exported_files.append(minutes_file)
-
-        # Raw transcript
-        conversation_log = meeting_data.get("conversation_log", [])
         metadata = meeting_data.get("metadata", {})
-
-        if conversation_log:
-            transcript_file = self.export_raw_transcript(
-                conversation_log, metadata, f"{base_filename}_transcript"
-            )
-            exported_files.append(transcript_file)
-
-            formatted_file = self.export_formatted_conversation(
-                conversation_log, metadata, f"{base_filename}_formatted"
-            )
-            exported_files.append(formatted_file)
-
-        # Action items
+        entries = _normalize_log(meeting_data.get("conversation_log", []))
         action_items = meeting_data.get("action_items", [])
+        timings = {"normalize": time.perf_counter() - started}
+
+        # (format, file suffix, extension, renderer), in the order files are returned
+        jobs = [
+            ("minutes", "minutes", "md",
+             lambda: self._render_meeting_minutes(meeting_data, format_type)),
+        ]
+        if entries:
+            jobs.append(("transcript", "transcript", "txt",
+                         lambda: self._render_raw_transcript(entries, metadata)))
+            jobs.append(("formatted", "formatted", "md",
+                         lambda: self._render_formatted_conversation(entries, metadata)))
         if action_items:
-            action_file = self.export_action_items(
-                action_items, metadata, f"{base_filename}_actions"
-            )
-            exported_files.append(action_file)
+            jobs.append(("actions", "actions", "md",
+                         lambda: self._render_action_items(action_items, metadata)))
+        jobs.append(("summary", "summary", "md",
+                     lambda: self._render_executive_summary(meeting_data)))
+        jobs.append(("data", "data", "json",
+                     lambda: self._render_structured_data(meeting_data)))
+
+        done = [0]
+        done_lock = threading.Lock()
+
+        def run(job) -> Tuple[str, float]:
+            name, suffix, extension, render = job
+            job_started = time.perf_counter()
+            content = render()
+            if archive:
+                result = content
+            else:
+                filepath = self.export_directory / f"{base_filename}_{suffix}.{extension}"
+                self._write(filepath, content, name, session_id)
+                result = str(filepath)
+            if progress is not None:
+                with done_lock:
+                    done[0] += 1
+                    progress(done[0], len(jobs), name)
+            return result, time.perf_counter() - job_started
+
+        workers = max(1, min(config.get_export_workers(), len(jobs)))
+        if workers == 1:
+            results = [run(job) for job in jobs]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="export") as pool:
+                results = list(pool.map(run, jobs))
 
-        # Executive summary
-        summary_file = self.export_executive_summary(
-            meeting_data, f"{base_filename}_summary"
+        exported_files = []
+        for (name, *_rest), (path, seconds) in zip(jobs, results):
+            exported_files.append(path)
+            timings[name] = seconds
+        if archive:
+            archive_started = time.perf_counter()
+            contents = {
+                f"{suffix}.{extension}": content
+                for (_name, suffix, extension, _render), content in zip(jobs, exported_files)
+            }
+            bundle = ExportArchive(self.export_directory, session_id).write_bundle(
+                base_filename, contents, {"format_type": format_type, "topic": metadata.get("topic")}
+            )
+            record_export(bundle, "archive", session_id)
+            exported_files = [str(bundle)]
+            timings["archive"] = time.perf_counter() - archive_started
+        timings["total"] = time.perf_counter() - started
+        self.last_package_timings = timings
+
+        logger.info(
+            "Exported meeting package (%d files) in %.3fs: %s",
+            len(exported_files),
+            timings["total"],
+            ", ".join(f"{name}={seconds:.3f}s" for name, seconds in timings.items()),
         )
-        exported_files.append(summary_file)
-
-        # Structured data
-        data_file = self.export_structured_data(meeting_data, f"{base_filename}_data")
-        exported_files.append(data_file)
-
         print(f"✅ Complete package exported: {len(exported_files)} files")
         return exported_files
 
+    def _write(
+        self, filepath: Path, content: str, format: str, session_id: Optional[str] = None
+    ) -> None:
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(content)
+        record_export(filepath, format, session_id, content)
+
     def _generate_filename(self, prefix: str) -> str:
         """Generate a timestamped filename."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -397,29 +603,54 @@ class ExportManager:
             return data
 
     def list_exports(self) -> List[str]:
-        """List all exported files in the export directory."""
+        """List all exported files in the export directory (from the export index)."""
         if not self.export_directory.exists():
             return []
 
-        files = []
-        for file_path in self.export_directory.iterdir():
-            if file_path.is_file():
-                files.append(str(file_path))
+        index = get_export_index()
+        index.ensure_scanned(self.export_directory)
+        return sorted(record.path for record in index.list(directory=self.export_directory))
 
-        return sorted(files)
+    def rebuild_index(self) -> int:
+        """Rescan this export directory (and its session and archive folders) into the index."""
+        return get_export_index().rebuild(self.export_directory)
 
     def cleanup_old_exports(self, days_old: int = 30):
-        """Remove export files older than specified days."""
+        """Remove export files older than specified days.
+
+        Candidates come from the export index. The directory is re-stat'ed
+        first (only changed files are re-read), so a file whose mtime changed
+        without adding or removing entries is still judged by its age on disk.
+        Bundles in ``archives/`` are pruned separately so that referenced
+        bundles survive.
+        """
         if not self.export_directory.exists():
             return
 
         cutoff_time = datetime.now().timestamp() - (days_old * 24 * 60 * 60)
-        removed_count = 0
-
-        for file_path in self.export_directory.iterdir():
-            if file_path.is_file() and file_path.stat().st_mtime < cutoff_time:
-                file_path.unlink()
-                removed_count += 1
+        index = get_export_index()
+        index.rebuild_directory(self.export_directory, rehash=False)
+
+        removed = []
+        for record in index.older_than(cutoff_time, directory=self.export_directory):
+            path = Path(record.path)
+            try:
+                if path.stat().st_mtime >= cutoff_time:
+                    continue  # touched since the rescan
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            removed.append(record.path)
+        index.forget(removed)
+        removed_count = len(removed)
+
+        pruned = prune_archives(self.export_directory, cutoff_time)
+        if pruned:
+            archives = self.export_directory / ARCHIVE_DIRNAME
+            for session_dir in archives.iterdir():
+                if session_dir.is_dir():
+                    index.rebuild_directory(session_dir)
+        removed_count += pruned
 
         if removed_count > 0:
             print(f"🧹 Cleaned up {removed_count} old export files")
@@ -427,6 +658,45 @@ class ExportManager:
         return removed_count
 
 
+def _extract_message(msg: Any) -> Optional[Dict[str, str]]:
+    """Readable excerpt of one Letta message object or dict, or None if it has no text."""
+    # Support both Letta message objects and plain dicts
+    if isinstance(msg, dict):
+        mtype = msg.get("message_type", msg.get("role", "unknown"))
+        actor = msg.get("role", mtype)
+        text = msg.get("content", "")
+        ts = msg.get("created_at", "")
+    else:
+        mtype = getattr(msg, "message_type", "unknown")
+        actor = getattr(msg, "role", mtype)
+        text = getattr(msg, "content", "") or ""
+        ts = getattr(msg, "created_at", "")
+
+    if not text:
+        return None
+
+    # Trim long content
+    if len(text) > 2000:
+        text = text[:2000] + "..."
+
+    if ts and hasattr(ts, "isoformat"):
+        ts = ts.isoformat()
+
+    return {"ts": str(ts), "actor": str(actor), "role": str(mtype), "content": text}
+
+
+def _session_meta(
+    conversation_manager: "ConversationManager", conversation_id: Optional[str]
+) -> Dict[str, Any]:
+    if conversation_manager and conversation_id:
+        try:
+            return conversation_manager.get_session_summary(conversation_id)
+        except Exception:
+            return {"id": conversation_id}
+    if conversation_id:
+        return {"id": conversation_id}
+    return {}
+
 
 def build_session_summary(
     conversation_manager: "ConversationManager" = None,
@@ -439,6 +709,9 @@ def build_session_summary(
     Provide either (conversation_manager + conversation_id) to fetch
     messages from the server, or pass ``messages`` directly.
 
+    The whole summary is held in memory; ``export_session_to_markdown`` and
+    ``export_session_to_json`` stream instead and suit long sessions.
+
     Returns:
         Dict containing:
             - minutes_markdown: Structured meeting minutes
@@ -455,44 +728,9 @@ def build_session_summary(
         messages = conversation_manager.list_messages(conversation_id)
 
     # Extract readable messages
-    extracted: list = []
-    for msg in messages:
-        # Support both Letta message objects and plain dicts
-        if isinstance(msg, dict):
-            mtype = msg.get("message_type", msg.get("role", "unknown"))
-            actor = msg.get("role", mtype)
-            text = msg.get("content", "")
-            ts = msg.get("created_at", "")
-        else:
-            mtype = getattr(msg, "message_type", "unknown")
-            actor = getattr(msg, "role", mtype)
-            text = getattr(msg, "content", "") or ""
-            ts = getattr(msg, "created_at", "")
-
-        if not text:
-            continue
-
-        # Trim long content
-        if len(text) > 2000:
-            text = text[:2000] + "..."
-
-        if ts and hasattr(ts, "isoformat"):
-            ts = ts.isoformat()
-
-        extracted.append(
-            {"ts": str(ts), "actor": str(actor), "role": str(mtype), "content": text}
-        )
-
-    # Build minutes markdown
-    meta_dict = {}
-    if conversation_manager and conversation_id:
-        try:
-            meta_dict = conversation_manager.get_session_summary(conversation_id)
-        except Exception:
-            meta_dict = {"id": conversation_id}
-    elif conversation_id:
-        meta_dict = {"id": conversation_id}
+    extracted = [entry for entry in map(_extract_message, messages) if entry]
 
+    meta_dict = _session_meta(conversation_manager, conversation_id)
     minutes_markdown = _build_minutes_markdown(meta_dict, extracted)
 
     return {
@@ -504,11 +742,7 @@ def build_session_summary(
     }
 
 
-def _build_minutes_markdown(
-    meta: Dict[str, Any],
-    messages: List[Dict],
-) -> str:
-    """Build formatted minutes markdown from conversation messages."""
+def _minutes_header(meta: Dict[str, Any], total: int) -> str:
     title = meta.get("summary") or meta.get("title") or "Untitled Conversation"
     content = f"# Session Minutes: {title}\n\n"
     content += f"**Conversation ID**: {meta.get('id', 'unknown')}\n"
@@ -516,24 +750,116 @@ def _build_minutes_markdown(
         content += f"**Created**: {meta['created_at']}\n"
     if meta.get("updated_at"):
         content += f"**Last Updated**: {meta['updated_at']}\n"
-    content += f"**Total Messages**: {len(messages)}\n\n"
-
+    content += f"**Total Messages**: {total}\n\n"
     content += "## Transcript\n\n"
+    return content
+
+
+def _minutes_entry(msg: Dict[str, str]) -> str:
+    ts_str = msg.get("ts", "")
+    return f"**{msg['actor']}** ({msg['role']}) *{ts_str}*: {msg['content']}\n\n"
+
+
+_MINUTES_NO_MESSAGES = "*No messages recorded.*\n\n"
+
+_MINUTES_FOOTER = (
+    "## Decisions\n\n"
+    "*Decisions are now tracked server-side via Letta Conversations.*\n"
+    "\n## Action Items\n\n"
+    "*Action items are now tracked server-side via Letta Conversations.*\n"
+)
+
 
+# Characters copied per read when moving the spooled transcript into the export.
+_COPY_CHUNK = 64 * 1024
+
+
+def _build_minutes_markdown(
+    meta: Dict[str, Any],
+    messages: List[Dict],
+) -> str:
+    """Build formatted minutes markdown from conversation messages."""
+    content = _minutes_header(meta, len(messages))
     if messages:
-        for msg in messages:
-            ts_str = msg.get("ts", "")
-            content += f"**{msg['actor']}** ({msg['role']}) *{ts_str}*: {msg['content']}\n\n"
+        content += "".join(_minutes_entry(msg) for msg in messages)
     else:
-        content += "*No messages recorded.*\n\n"
+        content += _MINUTES_NO_MESSAGES
+    return content + _MINUTES_FOOTER
 
-    content += "## Decisions\n\n"
-    content += "*Decisions are now tracked server-side via Letta Conversations.*\n"
 
-    content += "\n## Action Items\n\n"
-    content += "*Action items are now tracked server-side via Letta Conversations.*\n"
+def _iter_session_entries(
+    conversation_id: str,
+    conversation_manager: "ConversationManager" = None,
+    messages: list = None,
+) -> Iterator[Dict[str, str]]:
+    """Yield message excerpts, paging through the conversation when no list is given."""
+    if messages is None:
+        if conversation_manager is None:
+            raise ValueError(
+                "Provide either (conversation_manager + conversation_id) or messages"
+            )
+        messages = conversation_manager.iter_messages(
+            conversation_id, page_size=config.get_export_page_size()
+        )
+    for msg in messages:
+        entry = _extract_message(msg)
+        if entry:
+            yield entry
 
-    return content
+
+def _session_export_dir(conversation_id: str, dest_dir) -> Path:
+    if dest_dir is None:
+        dest_dir = Path(config.DEFAULT_EXPORT_DIRECTORY) / "sessions" / conversation_id
+    else:
+        dest_dir = Path(dest_dir)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    return dest_dir
+
+
+def atomic_write(filepath: Path, write: Callable[[TextIO], None]) -> None:
+    """Write ``filepath`` through a temp file in the same directory, then rename it into place."""
+    temp_file = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w", dir=filepath.parent, delete=False, suffix=".tmp", encoding="utf-8"
+        ) as f:
+            temp_file = Path(f.name)
+            write(f)
+        temp_file.replace(filepath)
+    except Exception as e:
+        if temp_file and temp_file.exists():
+            temp_file.unlink(missing_ok=True)
+        raise e
+
+
+def _spool_transcript(entries: Iterator[Dict[str, str]], spool: TextIO, on_entry=None) -> int:
+    """Write transcript markdown for ``entries`` to ``spool``; returns the message count."""
+    total = 0
+    for entry in entries:
+        spool.write(_minutes_entry(entry))
+        if on_entry is not None:
+            on_entry(entry, total)
+        total += 1
+    return total
+
+
+def _write_minutes(out: TextIO, meta: Dict[str, Any], total: int, spool: TextIO, emit=None) -> None:
+    """Write the minutes document around an already spooled transcript.
+
+    ``emit`` transforms each chunk before writing (used to JSON-escape).
+    """
+    emit = emit or (lambda text: text)
+    out.write(emit(_minutes_header(meta, total)))
+    if total:
+        spool.seek(0)
+        while True:
+            chunk = spool.read(_COPY_CHUNK)
+            if not chunk:
+                break
+            out.write(emit(chunk))
+    else:
+        out.write(emit(_MINUTES_NO_MESSAGES))
+    out.write(emit(_MINUTES_FOOTER))
 
 
 def export_session_to_markdown(
@@ -545,6 +871,11 @@ def export_session_to_markdown(
     """
     Export conversation to markdown file.
 
+    Messages are paged from the server (``SPDS_EXPORT_PAGE_SIZE`` at a time)
+    and their transcript lines spooled to a temporary file, so memory stays
+    bounded however long the session is. The header, which carries the
+    message count, is written once the transcript is complete.
+
     Args:
         conversation_id: Conversation ID to export
         conversation_manager: ConversationManager instance
@@ -554,41 +885,27 @@ def export_session_to_markdown(
     Returns:
         Path to the exported markdown file
     """
-    if dest_dir is None:
-        dest_dir = Path(config.DEFAULT_EXPORT_DIRECTORY) / "sessions" / conversation_id
-    else:
-        dest_dir = Path(dest_dir)
-
-    dest_dir.mkdir(parents=True, exist_ok=True)
-
-    summary = build_session_summary(
-        conversation_manager=conversation_manager,
-        conversation_id=conversation_id,
-        messages=messages,
-    )
+    dest_dir = _session_export_dir(conversation_id, dest_dir)
+    entries = _iter_session_entries(conversation_id, conversation_manager, messages)
+    meta = _session_meta(conversation_manager, conversation_id)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"minutes_{conversation_id}_{timestamp}.md"
-    filepath = dest_dir / filename
+    filepath = dest_dir / f"minutes_{conversation_id}_{timestamp}.md"
 
-    temp_file = None
-    try:
-        with tempfile.NamedTemporaryFile(
-            mode="w", dir=dest_dir, delete=False, suffix=".tmp"
-        ) as f:
-            temp_file = Path(f.name)
-            f.write(summary["minutes_markdown"])
-
-        temp_file.replace(filepath)
-        logger.info(f"Exported conversation {conversation_id} to markdown: {filepath}")
-    except Exception as e:
-        if temp_file and temp_file.exists():
-            temp_file.unlink(missing_ok=True)
-        raise e
+    with tempfile.TemporaryFile(mode="w+", dir=dest_dir, encoding="utf-8") as spool:
+        total = _spool_transcript(entries, spool)
+        atomic_write(filepath, lambda f: _write_minutes(f, meta, total, spool))
 
+    record_export(filepath, "session_markdown", conversation_id)
+    logger.info(f"Exported conversation {conversation_id} to markdown: {filepath}")
     return filepath
 
 
+def _json_fragment(text: str) -> str:
+    """``text`` JSON-escaped without the surrounding quotes."""
+    return json.dumps(text, ensure_ascii=False)[1:-1]
+
+
 def export_session_to_json(
     conversation_id: str,
     conversation_manager: "ConversationManager" = None,
@@ -598,6 +915,10 @@ def export_session_to_json(
     """
     Export conversation summary to JSON file.
 
+    Produces the same keys as ``build_session_summary`` but streams them:
+    message excerpts are written one at a time as pages arrive, and
+    ``minutes_markdown`` is written last from a spooled transcript.
+
     Args:
         conversation_id: Conversation ID to export
         conversation_manager: ConversationManager instance
@@ -606,38 +927,32 @@ def export_session_to_json(
     Returns:
         Path to the exported JSON file
     """
-    if dest_dir is None:
-        dest_dir = Path(config.DEFAULT_EXPORT_DIRECTORY) / "sessions" / conversation_id
-    else:
-        dest_dir = Path(dest_dir)
-
-    dest_dir.mkdir(parents=True, exist_ok=True)
-
-    summary = build_session_summary(
-        conversation_manager=conversation_manager,
-        conversation_id=conversation_id,
-        messages=messages,
-    )
+    dest_dir = _session_export_dir(conversation_id, dest_dir)
+    entries = _iter_session_entries(conversation_id, conversation_manager, messages)
+    meta = _session_meta(conversation_manager, conversation_id)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"summary_{conversation_id}_{timestamp}.json"
-    filepath = dest_dir / filename
-
-    temp_file = None
-    try:
-        with tempfile.NamedTemporaryFile(
-            mode="w", dir=dest_dir, delete=False, suffix=".tmp"
-        ) as f:
-            temp_file = Path(f.name)
-            json.dump(summary, f, indent=2, ensure_ascii=False, default=str)
-
-        temp_file.replace(filepath)
-        logger.info(f"Exported conversation {conversation_id} to JSON: {filepath}")
-    except Exception as e:
-        if temp_file and temp_file.exists():
-            temp_file.unlink(missing_ok=True)
-        raise e
-
+    filepath = dest_dir / f"summary_{conversation_id}_{timestamp}.json"
+
+    def write(f: TextIO) -> None:
+        f.write('{\n  "meta": ')
+        f.write(json.dumps(meta, ensure_ascii=False, default=str))
+        f.write(',\n  "actions": [],\n  "decisions": [],\n  "messages": [')
+
+        def write_message(entry, index):
+            f.write(",\n    " if index else "\n    ")
+            f.write(json.dumps(entry, ensure_ascii=False, default=str))
+
+        with tempfile.TemporaryFile(mode="w+", dir=dest_dir, encoding="utf-8") as spool:
+            total = _spool_transcript(entries, spool, on_entry=write_message)
+            f.write("\n  ],\n" if total else "],\n")
+            f.write('  "minutes_markdown": "')
+            _write_minutes(f, meta, total, spool, emit=_json_fragment)
+            f.write('"\n}\n')
+
+    atomic_write(filepath, write)
+    record_export(filepath, "session_json", conversation_id)
+    logger.info(f"Exported conversation {conversation_id} to JSON: {filepath}")
     return filepath
 
 
@@ -0,0 +1,411 @@
+# spds/history.py
+
+import io
+import logging
+from typing import Dict, Iterable, Iterator, List
+
+from . import config
+from .message import ConversationMessage
+
+logger = logging.getLogger(__name__)
+
+
+class ConversationHistory(list):
+    """
+    The swarm's message list with an incrementally maintained flat rendering.
+
+    ``SwarmManager.conversation_history`` and the per-agent incremental views
+    need the legacy ``"sender: content"`` string. Re-rendering every message on
+    each read makes long sessions O(n) per read and O(n²) per turn, so this
+    list keeps the rendered lines instead:
+
+    - each message is rendered once, when the flat view is first read after it
+      was appended, and kept as one line per message;
+    - any window (``flat_range``/``flat_since``, and so every ``HistoryView``)
+      joins only its own lines, so its cost does not grow with the session;
+    - the whole-history text lives in an append-only buffer that ``flat()``
+      extends with just the lines appended since its last call, so no read
+      re-renders or re-joins earlier messages; the string is taken from the
+      buffer once per batch of appends and cached until the next append.
+
+    Appends (``append``/``extend``/``+=``) keep the buffer valid. Any other
+    mutation (assignment, deletion, insert, sort, ...) discards it and the next
+    read rebuilds from scratch. Messages are treated as immutable once they are
+    in the history; editing a message's content in place is not tracked.
+
+    The history also owns each agent's read cursor: ``record_turn`` marks the
+    point an agent last spoke and ``since_last_turn`` hands back a
+    ``HistoryView`` over everything after it. Cursors are keyed by agent
+    identity; an agent the history has not seen yet starts from its
+    ``last_message_index`` attribute if it has one, else from the beginning.
+    ``record_turn`` keeps that attribute in step on agents that define it.
+
+    With a ``HistoryLog`` attached (``attach_log``/``from_log``) every append is
+    also written to disk and only the most recent ``resident`` messages stay in
+    memory; older slots hold ``None`` and are read back from the log on access.
+    Such a history keeps no per-message lines: ``flat_range``/``flat_since``
+    render just their window. Its whole-history buffer is only built by the
+    first ``flat()`` call (one pass over the log) and then extended like an
+    in-memory one, so sessions that only use windowed reads never hold the
+    full text. A log-backed history is append-only: any other mutation loads
+    everything back into memory and detaches the log.
+    """
+
+    __slots__ = (
+        "_lines",
+        "_flat",
+        "_buffer",
+        "_buffered",
+        "_generation",
+        "_log",
+        "_resident",
+        "_evicted",
+        "_cursors",
+        "__weakref__",
+    )
+
+    def __init__(self, messages: Iterable[ConversationMessage] = ()):
+        super().__init__(messages)
+        self._generation = 0
+        self._log = None
+        self._resident = 0
+        self._evicted = 0
+        # id(agent) -> index of the last message the agent had seen when it spoke
+        self._cursors: Dict[int, int] = {}
+        self._reset_flat()
+
+    def _reset_flat(self) -> None:
+        self._drop_flat()
+        self._generation += 1
+
+    def _drop_flat(self) -> None:
+        # One rendered line per message (in-memory histories only), the
+        # append-only whole-history buffer with how many messages it holds
+        # (created by the first flat()), and its value cached until the next
+        # append.
+        self._lines: List[str] = []
+        self._buffer: io.StringIO | None = None
+        self._buffered = 0
+        self._flat = ""
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever the history is rewritten rather than appended to."""
+        return self._generation
+
+    # -- disk-backed paging ----------------------------------------------------
+
+    @classmethod
+    def from_log(cls, log, resident: int | None = None) -> "ConversationHistory":
+        """Restore a history from ``log``, loading only the most recent messages."""
+        history = cls()
+        resident = config.get_history_resident_messages() if resident is None else resident
+        total = len(log)
+        first_resident = max(total - resident, 0)
+        list.extend(history, [None] * first_resident)
+        list.extend(history, log.read_range(first_resident, total))
+        history._log = log
+        history._resident = resident
+        history._evicted = first_resident
+        return history
+
+    def attach_log(self, log, resident: int | None = None) -> None:
+        """Write through to ``log`` from now on; messages already held are appended to it."""
+        for index in range(len(log), len(self)):
+            log.append(list.__getitem__(self, index))
+        self._log = log
+        self._resident = config.get_history_resident_messages() if resident is None else resident
+        self._evict()
+        self._drop_flat()
+
+    @property
+    def log(self):
+        return self._log
+
+    def _evict(self) -> None:
+        if self._log is None or self._resident <= 0:
+            return
+        # Evict in batches so the slice assignment runs rarely, not per append.
+        limit = len(self) - self._resident
+        if limit - self._evicted < max(self._resident // 4, 1):
+            return
+        list.__setitem__(self, slice(self._evicted, limit), [None] * (limit - self._evicted))
+        self._evicted = limit
+
+    def _detach_log(self) -> None:
+        if self._log is None:
+            return
+        logger.warning("Rewriting a disk-backed history; loading it fully and detaching the log")
+        if self._evicted:
+            list.__setitem__(self, slice(0, self._evicted), self._log.read_range(0, self._evicted))
+        self._log = None
+        self._evicted = 0
+
+    def _message_at(self, index: int) -> ConversationMessage:
+        msg = list.__getitem__(self, index)
+        if msg is None and self._log is not None:
+            if index < 0:
+                index += len(self)
+            return self._log.read(index)
+        return msg
+
+    def _messages(self, start: int, stop: int) -> List[ConversationMessage]:
+        """Return messages ``start..stop`` (exclusive), reading evicted ones from the log."""
+        if start < self._evicted and self._log is not None:
+            loaded = self._log.read_range(start, min(stop, self._evicted))
+            if stop <= self._evicted:
+                return loaded
+            return loaded + list.__getitem__(self, slice(self._evicted, stop))
+        return list.__getitem__(self, slice(start, stop))
+
+    def _iter_range(self, start: int, stop: int) -> Iterator[ConversationMessage]:
+        """Iterate messages ``start..stop`` without copying the resident part."""
+        evicted = self._evicted if self._log is not None else 0
+        if start < evicted:
+            batch = max(getattr(self._log, "segment_size", 1000), 1)
+            end = min(stop, evicted)
+            for chunk_start in range(start, end, batch):
+                yield from self._log.read_range(chunk_start, min(chunk_start + batch, end))
+            start = end
+        for index in range(start, stop):
+            yield list.__getitem__(self, index)
+
+    def __getitem__(self, index):
+        if not self._evicted:
+            return list.__getitem__(self, index)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self._messages(start, max(stop, start))
+            return [self._message_at(i) for i in range(start, stop, step)]
+        return self._message_at(index)
+
+    def __iter__(self) -> Iterator[ConversationMessage]:
+        if not self._evicted:
+            return list.__iter__(self)
+        return self._iter_range(0, len(self))
+
+    # -- appends ---------------------------------------------------------------
+
+    def append(self, message) -> None:
+        super().append(message)
+        if self._log is not None:
+            self._log.append(message)
+            self._evict()
+
+    def extend(self, messages) -> None:
+        if self._log is None:
+            super().extend(messages)
+            return
+        for message in messages:
+            self.append(message)
+
+    def __iadd__(self, messages):
+        self.extend(messages)
+        return self
+
+    # -- flat rendering --------------------------------------------------------
+
+    def _sync(self) -> None:
+        """Render any messages appended since the last read."""
+        rendered = len(self._lines)
+        if rendered > len(self):
+            # Shrunk without going through an invalidating method; start over.
+            self._reset_flat()
+            rendered = 0
+        if rendered < len(self):
+            self._lines.extend(
+                msg.to_flat_format() for msg in self._iter_range(rendered, len(self))
+            )
+
+    def _render(self, start: int, stop: int) -> str:
+        return "\n".join(msg.to_flat_format() for msg in self._iter_range(start, stop))
+
+    def flat(self) -> str:
+        """Return the whole history as newline-separated ``sender: content`` lines."""
+        count = len(self)
+        if self._buffered > count:
+            # Shrunk without going through an invalidating method; start over.
+            self._reset_flat()
+        if self._buffer is None:
+            self._buffer = io.StringIO()
+        if self._buffered < count:
+            if self._log is None:
+                self._sync()
+                new = self._lines[self._buffered:count]
+            else:
+                new = (msg.to_flat_format() for msg in self._iter_range(self._buffered, count))
+            for line in new:
+                if self._buffered:
+                    self._buffer.write("\n")
+                self._buffer.write(line)
+                self._buffered += 1
+            self._flat = self._buffer.getvalue()
+        return self._flat
+
+    def flat_since(self, index: int) -> str:
+        """Return the flat rendering of messages from ``index`` onwards."""
+        return self.flat_range(index, len(self))
+
+    def flat_range(self, start: int, stop: int) -> str:
+        """Return the flat rendering of messages ``start`` up to (excluding) ``stop``."""
+        count = len(self)
+        start = max(start, 0)
+        stop = min(stop, count)
+        if start >= stop:
+            return ""
+        if self._log is not None:
+            return self._render(start, stop)
+        if start == 0 and stop == count:
+            return self.flat()
+        self._sync()
+        return "\n".join(self._lines[start:stop])
+
+    # -- per-agent cursors -----------------------------------------------------
+
+    def since(self, last_index: int) -> "HistoryView":
+        """Return a view of the messages after ``last_index`` (-1 for all of them)."""
+        if last_index is None or last_index < 0:
+            return HistoryView(self, 0, len(self))
+        return HistoryView(self, last_index + 1, len(self))
+
+    def cursor(self, agent) -> int:
+        """Index of the last message ``agent`` had seen when it spoke (-1 if never)."""
+        last_index = self._cursors.get(id(agent))
+        if last_index is None:
+            last_index = getattr(agent, "last_message_index", -1)
+        return last_index if isinstance(last_index, int) else -1
+
+    def since_last_turn(self, agent) -> "HistoryView":
+        """Return a view of the messages the agent has not seen since it last spoke."""
+        return self.since(self.cursor(agent))
+
+    def record_turn(self, agent) -> None:
+        """Move the agent's cursor to the most recent message."""
+        last_index = len(self) - 1
+        self._cursors[id(agent)] = last_index
+        if hasattr(agent, "last_message_index"):
+            agent.last_message_index = last_index
+
+    # -- mutations that invalidate the flat buffer ---------------------------
+
+    def __setitem__(self, index, value):
+        self._detach_log()
+        super().__setitem__(index, value)
+        self._reset_flat()
+
+    def __delitem__(self, index):
+        self._detach_log()
+        super().__delitem__(index)
+        self._reset_flat()
+
+    def __imul__(self, count):
+        self._detach_log()
+        result = super().__imul__(count)
+        self._reset_flat()
+        return result
+
+    def insert(self, index, value):
+        self._detach_log()
+        super().insert(index, value)
+        self._reset_flat()
+
+    def pop(self, index=-1):
+        self._detach_log()
+        value = super().pop(index)
+        self._reset_flat()
+        return value
+
+    def remove(self, value):
+        self._detach_log()
+        super().remove(value)
+        self._reset_flat()
+
+    def clear(self):
+        self._detach_log()
+        super().clear()
+        self._reset_flat()
+
+    def sort(self, *args, **kwargs):
+        self._detach_log()
+        super().sort(*args, **kwargs)
+        self._reset_flat()
+
+    def reverse(self):
+        self._detach_log()
+        super().reverse()
+        self._reset_flat()
+
+    def __reduce__(self):
+        return (self.__class__, (list(iter(self)),))
+
+
+class HistoryView:
+    """
+    A read-only window ``[start, stop)`` over a ConversationHistory.
+
+    Views are what agents receive as "messages since your last turn". They do
+    not copy the underlying list: length is arithmetic, iteration and indexing
+    go straight to the store, and ``flat()`` joins the store's rendered lines
+    for the window. ``stop`` is fixed when the view is created, so messages appended
+    afterwards are not included.
+    """
+
+    __slots__ = ("_store", "_start", "_stop")
+
+    def __init__(self, store: ConversationHistory, start: int, stop: int):
+        self._store = store
+        self._start = max(start, 0)
+        self._stop = max(stop, self._start)
+
+    def _bounds(self):
+        stop = min(self._stop, len(self._store))
+        return self._start, max(stop, self._start)
+
+    @property
+    def store(self) -> ConversationHistory:
+        return self._store
+
+    @property
+    def start(self) -> int:
+        return self._bounds()[0]
+
+    @property
+    def stop(self) -> int:
+        return self._bounds()[1]
+
+    def __len__(self) -> int:
+        start, stop = self._bounds()
+        return stop - start
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self) -> Iterator[ConversationMessage]:
+        start, stop = self._bounds()
+        return self._store._iter_range(start, stop)
+
+    def __getitem__(self, index):
+        start, stop = self._bounds()
+        if isinstance(index, slice):
+            indices = range(start, stop)[index]
+            if indices.step == 1:
+                return self._store._messages(indices.start, max(indices.stop, indices.start))
+            return [self._store._message_at(i) for i in indices]
+        return self._store._message_at(range(start, stop)[index])
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (HistoryView, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        start, stop = self._bounds()
+        return f"HistoryView(start={start}, stop={stop})"
+
+    def flat(self) -> str:
+        """Return the window as newline-separated ``sender: content`` lines."""
+        start, stop = self._bounds()
+        return self._store.flat_range(start, stop)
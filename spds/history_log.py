@@ -0,0 +1,210 @@
+# spds/history_log.py
+
+import json
+import logging
+import mmap
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import List
+
+from . import config
+from .message import ConversationMessage
+
+logger = logging.getLogger(__name__)
+
+LOG_FORMAT_VERSION = 1
+_OFFSET_TYPECODE = "Q"  # unsigned 64-bit byte offsets
+_OFFSET_SIZE = array(_OFFSET_TYPECODE).itemsize
+
+
+class HistoryLog:
+    """
+    Append-only, segmented on-disk log of a session's ConversationMessages.
+
+    Layout under ``directory``::
+
+        meta.json            format version and segment size (fixed at creation)
+        seg-000000.jsonl     one JSON object per line (ConversationMessage.to_dict)
+        seg-000000.idx       byte offset of each line, as packed uint64 values
+
+    Message ``i`` lives in segment ``i // segment_size``, so locating it needs
+    no scan: read the segment's offset index, then decode one line. Sealed
+    (full) segments are memory-mapped on demand and a few stay cached; the
+    segment being written is read with plain file reads. Opening a log only
+    stats the index files, so restoring a long session is near-instant.
+
+    A crash between writing a line and its index entry leaves an unindexed
+    tail; it is truncated on the next open.
+
+    Appends, reads and ``close`` are serialized by a lock, so one log can be
+    shared by the turn loop, socket handlers and export threads.
+    """
+
+    def __init__(self, directory, segment_size: int | None = None, cache_segments: int = 4):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_size = self._load_or_create_meta(
+            segment_size or config.get_history_segment_size()
+        )
+        self._cache_segments = max(1, cache_segments)
+        self._lock = threading.RLock()
+        self._mapped: "OrderedDict[int, tuple]" = OrderedDict()
+        self._data_fh = None
+        self._index_fh = None
+        self._open_segment = None
+        self._count = self._recover()
+
+    # -- layout ----------------------------------------------------------------
+
+    def _load_or_create_meta(self, segment_size: int) -> int:
+        meta_path = self.directory / "meta.json"
+        if meta_path.exists():
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            return int(meta["segment_size"])
+        tmp_path = meta_path.with_suffix(".json.tmp")
+        tmp_path.write_text(
+            json.dumps({"version": LOG_FORMAT_VERSION, "segment_size": segment_size}),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, meta_path)
+        return segment_size
+
+    def _segment_paths(self, segment: int):
+        stem = f"seg-{segment:06d}"
+        return self.directory / f"{stem}.jsonl", self.directory / f"{stem}.idx"
+
+    def _recover(self) -> int:
+        """Count indexed messages and trim any partially written tail."""
+        segment = 0
+        count = 0
+        while True:
+            data_path, index_path = self._segment_paths(segment)
+            if not index_path.exists():
+                break
+            index_size = index_path.stat().st_size
+            entries = index_size // _OFFSET_SIZE
+            if entries < self.segment_size or not self._segment_paths(segment + 1)[1].exists():
+                self._trim_segment(data_path, index_path, entries, index_size)
+                count += entries
+                break
+            count += entries
+            segment += 1
+        return count
+
+    def _trim_segment(self, data_path: Path, index_path: Path, entries: int, index_size: int):
+        if index_size != entries * _OFFSET_SIZE:
+            with open(index_path, "r+b") as fh:
+                fh.truncate(entries * _OFFSET_SIZE)
+        if not data_path.exists():
+            return
+        end = 0
+        if entries:
+            offsets = self._read_offsets(index_path)
+            with open(data_path, "rb") as fh:
+                fh.seek(offsets[-1])
+                end = offsets[-1] + len(fh.readline())
+        if data_path.stat().st_size != end:
+            logger.warning("Truncating unindexed tail of %s", data_path)
+            with open(data_path, "r+b") as fh:
+                fh.truncate(end)
+
+    @staticmethod
+    def _read_offsets(index_path: Path) -> array:
+        offsets = array(_OFFSET_TYPECODE)
+        with open(index_path, "rb") as fh:
+            offsets.frombytes(fh.read())
+        return offsets
+
+    # -- writing ---------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, message: ConversationMessage) -> None:
+        line = json.dumps(message.to_dict(), ensure_ascii=False).encode("utf-8") + b"\n"
+        with self._lock:
+            segment = self._count // self.segment_size
+            if segment != self._open_segment:
+                self._close_writers()
+                data_path, index_path = self._segment_paths(segment)
+                self._data_fh = open(data_path, "ab")
+                self._index_fh = open(index_path, "ab")
+                self._open_segment = segment
+            offset = self._data_fh.tell()
+            self._data_fh.write(line)
+            self._data_fh.flush()
+            self._index_fh.write(array(_OFFSET_TYPECODE, [offset]).tobytes())
+            self._index_fh.flush()
+            self._count += 1
+
+    def _close_writers(self) -> None:
+        for fh in (self._data_fh, self._index_fh):
+            if fh is not None:
+                fh.close()
+        self._data_fh = self._index_fh = None
+        self._open_segment = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_writers()
+            for mapped, _offsets in self._mapped.values():
+                mapped.close()
+            self._mapped.clear()
+
+    # -- reading ---------------------------------------------------------------
+
+    def _sealed_segment(self, segment: int):
+        cached = self._mapped.get(segment)
+        if cached is not None:
+            self._mapped.move_to_end(segment)
+            return cached
+        data_path, index_path = self._segment_paths(segment)
+        with open(data_path, "rb") as fh:
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        cached = (mapped, self._read_offsets(index_path))
+        self._mapped[segment] = cached
+        if len(self._mapped) > self._cache_segments:
+            _segment, (old_map, _offsets) = self._mapped.popitem(last=False)
+            old_map.close()
+        return cached
+
+    def _read_segment(self, segment: int, first: int, last: int) -> List[ConversationMessage]:
+        """Decode messages ``first..last`` (exclusive) of one segment."""
+        full = (segment + 1) * self.segment_size <= self._count
+        if full:
+            data, offsets = self._sealed_segment(segment)
+            chunks = [data[offsets[i]:data.find(b"\n", offsets[i])] for i in range(first, last)]
+        else:
+            data_path, index_path = self._segment_paths(segment)
+            offsets = self._read_offsets(index_path)
+            with open(data_path, "rb") as fh:
+                fh.seek(offsets[first])
+                chunks = [fh.readline() for _ in range(first, last)]
+        return [ConversationMessage.from_dict(json.loads(chunk)) for chunk in chunks]
+
+    def read_range(self, start: int, stop: int) -> List[ConversationMessage]:
+        """Return messages ``start`` up to (excluding) ``stop``."""
+        messages: List[ConversationMessage] = []
+        size = self.segment_size
+        # Held across the whole read: a cached mmap may otherwise be closed
+        # by another reader's eviction while it is being sliced.
+        with self._lock:
+            start = max(start, 0)
+            stop = min(stop, self._count)
+            while start < stop:
+                segment = start // size
+                seg_stop = min(stop, (segment + 1) * size)
+                messages.extend(
+                    self._read_segment(segment, start - segment * size, seg_stop - segment * size)
+                )
+                start = seg_stop
+        return messages
+
+    def read(self, index: int) -> ConversationMessage:
+        with self._lock:
+            if not 0 <= index < self._count:
+                raise IndexError("history log index out of range")
+            return self.read_range(index, index + 1)[0]
@@ -4,7 +4,8 @@ import logging
 import random
 import socket
 import time
-from typing import Any, Callable, Optional, Tuple, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Type
 
 try:
     from letta_client import APIError as ApiError
@@ -181,6 +182,22 @@ def with_letta_resilience(operation_name: str):
     return decorator
 
 
+def parallel_map(fn: Callable[[Any], Any], items: Iterable[Any], workers: int) -> List:
+    """
+    ``[fn(item) for item in items]`` with at most ``workers`` Letta calls in flight.
+
+    Results keep the order of ``items``; ``fn`` should handle its own
+    per-item failures, since the first exception it raises propagates.
+    One worker (or a single item) runs inline without a thread pool.
+    """
+    items = list(items)
+    workers = max(1, min(workers, len(items) or 1))
+    if workers == 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="letta") as pool:
+        return list(pool.map(fn, items))
+
+
 def _function_accepts_timeout(fn: Callable) -> bool:
     """
     Check if a function accepts a 'timeout' parameter.
@@ -11,6 +11,9 @@ from letta_client import Letta
 
 from . import config
 from .conversations import ConversationManager
+from .letta_api import parallel_map
+from .secretary_pool import POOL_TAG, get_secretary_pool
+from .session_catalog import list_all_sessions
 from .swarm_manager import SwarmManager
 
 logger = logging.getLogger(__name__)
@@ -33,7 +36,8 @@ def list_available_agents(client: Letta):
     """Fetches all available agents from the Letta server."""
     try:
         agents = list(client.agents.list())
-        return agents
+        # Pooled secretaries are infrastructure, not swarm participants.
+        return [a for a in agents if POOL_TAG not in (getattr(a, "tags", None) or [])]
     except Exception as e:
         print(f"Error fetching agents from Letta server: {e}")
         return []
@@ -118,6 +122,10 @@ def interactive_agent_selection(client: Letta):
     meeting_type = "discussion"
 
     if enable_secretary:
+        # Warm secretary agents while the remaining prompts are answered.
+        if config.get_secretary_pool_size() > 0:
+            get_secretary_pool(client).start_warming()
+
         # Get meeting type
         meeting_type_choice = questionary.select(
             "📋 What type of meeting is this?",
@@ -190,7 +198,7 @@ def format_session_table(sessions: list) -> str:
         if parsed:
             agent_name = parsed["agent_name"][:14] or "—"
             topic = parsed["topic"][:22] or "—"
-            status = "completed" if "completed" in summary else "active"
+            status = parsed["status"]
         else:
             agent_name = "—"
             topic = summary[:22] or "—"
@@ -203,20 +211,52 @@ def format_session_table(sessions: list) -> str:
     return "\n".join(lines)
 
 
+def format_spds_session_table(sessions: list) -> str:
+    """Format aggregated SPDS sessions (from ``sessions list --all``) as a table."""
+    if not sessions:
+        return "No sessions found."
+
+    lines = [
+        f"{'Session':<12} {'Topic':<24} {'Agents':<24} {'Created':<17} {'Convs':>5} {'Status':<10}",
+        "-" * 97,
+    ]
+    for session in sessions:
+        sid = session["session_id"]
+        display_id = sid[:8] + "..." if len(sid) > 8 else sid
+        agents = ", ".join(session["agents"])
+        agents = agents[:21] + "..." if len(agents) > 24 else agents
+        created = (session.get("created_at") or "")[:16].replace("T", " ")
+        lines.append(
+            f"{display_id:<12} {(session['topic'] or '—')[:22]:<24} {agents or '—':<24} "
+            f"{created:<17} {len(session['conversations']):>5} {session['status']:<10}"
+        )
+    return "\n".join(lines)
+
+
 def list_sessions_command(args, client=None):
     """Handle the 'sessions list' command.
 
     Requires ``--agent-id`` to specify which agent's conversations to list,
     since conversations are per-agent in the Letta Conversations API.
     Optionally filter to a specific SPDS session with ``--spds-session``.
+    ``--all`` instead lists every agent concurrently and groups the
+    conversations into SPDS sessions (cached briefly; ``--refresh`` skips it).
     """
     if client is None:
         print("Error: Letta client required for session listing", file=sys.stderr)
         return 1
 
+    if getattr(args, "all", False):
+        sessions = list_all_sessions(client, refresh=getattr(args, "refresh", False))
+        if getattr(args, "json", False):
+            print(json.dumps(sessions, indent=2))
+        else:
+            print(format_spds_session_table(sessions))
+        return 0
+
     agent_id = getattr(args, "agent_id", None)
     if not agent_id:
-        print("Error: --agent-id is required for listing sessions", file=sys.stderr)
+        print("Error: --agent-id is required for listing sessions (or use --all)", file=sys.stderr)
         return 1
 
     cm = ConversationManager(client)
@@ -228,12 +268,12 @@ def list_sessions_command(args, client=None):
         sessions = cm.list_sessions(agent_id)
 
     if getattr(args, "json", False):
-        import json as json_lib
-
-        sessions_data = [
-            cm.get_session_summary(conv.id) for conv in sessions
-        ]
-        print(json_lib.dumps(sessions_data, indent=2))
+        sessions_data = parallel_map(
+            lambda conv: cm.get_session_summary(conv.id),
+            sessions,
+            config.get_session_list_workers(),
+        )
+        print(json.dumps(sessions_data, indent=2))
     else:
         print(format_session_table(sessions))
 
@@ -244,7 +284,9 @@ def resume_session_command(args, client=None):
     """Handle the 'sessions resume' command.
 
     Loads a conversation by ID, parses SPDS session metadata from its
-    summary, and displays recent messages for read-only inspection.
+    summary, and displays recent messages for read-only inspection. An
+    SPDS session ID instead lists that session's conversations (one per
+    agent) so one of them can be resumed.
     """
     if client is None:
         print("Error: Letta client required for session resume", file=sys.stderr)
@@ -256,8 +298,23 @@ def resume_session_command(args, client=None):
     try:
         conv = cm.get_session(conversation_id)
     except Exception:
-        print(f"Error: Conversation '{conversation_id}' not found", file=sys.stderr)
-        return 2
+        try:
+            entries = cm.find_session(conversation_id)
+        except Exception as e:
+            logger.debug("SPDS session lookup for %s failed: %s", conversation_id, e)
+            entries = []
+        if not entries:
+            print(f"Error: Conversation '{conversation_id}' not found", file=sys.stderr)
+            return 2
+        completed = all(entry.status == "completed" for entry in entries)
+        print(f"Session:  {conversation_id}")
+        print(f"Topic:    {entries[0].topic or '—'}")
+        print(f"Status:   {'completed' if completed else 'active'}")
+        print()
+        print(format_session_table(entries))
+        print()
+        print("Resume one agent's conversation with: python -m spds.main sessions resume <conversation id>")
+        return 0
 
     # Parse SPDS metadata from summary
     summary = getattr(conv, "summary", None) or ""
@@ -267,16 +324,15 @@ def resume_session_command(args, client=None):
         print(f"Session:  {parsed['session_id']}")
         print(f"Agent:    {parsed['agent_name'] or '—'}")
         print(f"Topic:    {parsed['topic'] or '—'}")
-        status = "completed" if "completed" in summary else "active"
-        print(f"Status:   {status}")
+        print(f"Status:   {parsed['status']}")
     else:
         print(f"Conversation: {conversation_id}")
         print(f"Summary:  {summary or '(none)'}")
 
     print()
 
-    # Load and display recent messages
-    messages = cm.list_messages(conversation_id, limit=50)
+    # Load and display the most recent messages, oldest first
+    messages = list(reversed(cm.list_messages(conversation_id, limit=50, order="desc")))
     if messages:
         print(f"--- Recent messages ({len(messages)}) ---")
         for msg in messages:
@@ -299,6 +355,47 @@ def resume_session_command(args, client=None):
     return 0
 
 
+def search_sessions_command(args):
+    """Handle the 'sessions search' command.
+
+    Queries the local full-text transcript index; no Letta connection is
+    needed. Query text may mix words, "quoted phrases" and inline
+    ``sender:``/``since:``/``until:`` filters; the flags override them.
+    """
+    from .search_index import TranscriptIndex, format_hits, parse_query
+
+    index_path = config.get_search_index_path()
+    if not index_path.exists():
+        print(f"Error: No search index found at '{index_path}'", file=sys.stderr)
+        return 1
+
+    try:
+        query = parse_query(" ".join(args.query))
+        if getattr(args, "sender", None):
+            query.sender = args.sender
+        if getattr(args, "since", None):
+            query.since = parse_query(f"since:{args.since}").since
+        if getattr(args, "until", None):
+            query.until = parse_query(f"until:{args.until}").until
+        if getattr(args, "session", None):
+            query.session_id = args.session
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+
+    index = TranscriptIndex(index_path)
+    try:
+        hits = index.search(query, limit=getattr(args, "limit", 20) or 20)
+    finally:
+        index.close()
+
+    if getattr(args, "json", False):
+        print(json.dumps([hit.to_dict() for hit in hits], indent=2))
+    else:
+        print(format_hits(hits))
+    return 0
+
+
 def main(argv=None):
     """Initializes the Letta client and starts the swarm chat."""
 
@@ -359,13 +456,23 @@ def main(argv=None):
 
     # sessions list
     list_parser = sessions_subparsers.add_parser("list", help="List all sessions")
-    list_parser.add_argument(
+    list_scope = list_parser.add_mutually_exclusive_group(required=True)
+    list_scope.add_argument(
         "--agent-id",
         type=str,
         metavar="AGENT_ID",
-        required=True,
         help="Agent ID whose sessions to list",
     )
+    list_scope.add_argument(
+        "--all",
+        action="store_true",
+        help="List SPDS sessions across all agents (queried concurrently, cached briefly)",
+    )
+    list_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="With --all, ignore the cached listing",
+    )
     list_parser.add_argument(
         "--json",
         action="store_true",
@@ -382,12 +489,44 @@ def main(argv=None):
     resume_parser = sessions_subparsers.add_parser("resume", help="Resume a session")
     resume_parser.add_argument(
         "session_id",
-        help="The ID of the session to resume",
+        help="The conversation ID to resume, or an SPDS session ID to list its conversations",
+    )
+
+    # sessions search
+    search_parser = sessions_subparsers.add_parser(
+        "search", help="Full-text search across session transcripts"
+    )
+    search_parser.add_argument(
+        "query",
+        nargs="+",
+        help='Words or "quoted phrases" to match (all must appear)',
+    )
+    search_parser.add_argument("--sender", type=str, help="Only messages from this speaker")
+    search_parser.add_argument(
+        "--since", type=str, metavar="DATE", help="Only messages at or after this ISO date/time"
+    )
+    search_parser.add_argument(
+        "--until", type=str, metavar="DATE", help="Only messages at or before this ISO date/time"
+    )
+    search_parser.add_argument(
+        "--session", type=str, metavar="SESSION_ID", help="Only messages from this session"
+    )
+    search_parser.add_argument(
+        "--limit", type=int, default=20, help="Maximum number of results (default: 20)"
+    )
+    search_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output results as JSON instead of text",
     )
 
     # Allow passing argv for testing; default to sys.argv[1:]
     args = parser.parse_args(argv)
 
+    # Transcript search reads the local index and needs no Letta client
+    if args.command == "sessions" and args.sessions_command == "search":
+        return search_sessions_command(args)
+
     agent_profiles = None
     agent_ids = None
     agent_names = None
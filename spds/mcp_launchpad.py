@@ -15,6 +15,7 @@ The :class:`MCPLaunchpad` manages the full lifecycle:
 
 import json
 import logging
+from types import SimpleNamespace
 from typing import Any, Dict, List, Optional
 
 from .letta_api import letta_call
@@ -57,6 +58,65 @@ class MCPLaunchpad:
         self.ensure_use_mcp_tool(agent_ids)
         logger.info("MCPLaunchpad setup complete for %d agents", len(agent_ids))
 
+    def _agent_tool_ids(self) -> List[str]:
+        """Tool ids ``setup`` attaches to every agent (Tier 1 tools and use_mcp_tool)."""
+        from . import config as spds_config
+
+        ids = []
+        if spds_config.get_mcp_tier1_enabled():
+            for entry in self._config_entries:
+                if entry.tier == 1:
+                    ids += [t["id"] for t in self._catalog.get(entry.name, []) if t.get("id")]
+        if self._use_mcp_tool_id:
+            ids.append(self._use_mcp_tool_id)
+        return ids
+
+    def snapshot(self) -> Dict[str, Any]:
+        """State left by ``setup``, for :meth:`restore` in a later session."""
+        return {
+            "servers": {
+                name: getattr(server, "id", None)
+                for name, server in self._registered_servers.items()
+            },
+            "catalog": self._catalog,
+            "ecosystem_block_id": self._ecosystem_block_id,
+            "attached_tools": self._attached_tools,
+            "use_mcp_tool_id": self._use_mcp_tool_id,
+        }
+
+    def restore(self, state: Dict[str, Any], agent_states: List[Any]) -> bool:
+        """Adopt a :meth:`snapshot` instead of running ``setup``.
+
+        Only done if every loaded ``AgentState`` still has the snapshot's
+        ecosystem block and agent-wide tools attached and the snapshot
+        covers the configured servers; returns False otherwise.
+        """
+        from .warm_start import states_have
+
+        servers = state.get("servers") or {}
+        if any(e.name not in servers for e in self._config_entries):
+            return False
+
+        previous = (self._catalog, self._use_mcp_tool_id)
+        self._catalog = state.get("catalog") or {}
+        self._use_mcp_tool_id = state.get("use_mcp_tool_id")
+        block_id = state.get("ecosystem_block_id")
+        if not states_have(
+            agent_states,
+            tools=self._agent_tool_ids(),
+            block_ids=[block_id] if block_id else [],
+        ):
+            self._catalog, self._use_mcp_tool_id = previous
+            return False
+
+        self._registered_servers = {
+            name: SimpleNamespace(id=server_id) for name, server_id in servers.items()
+        }
+        self._ecosystem_block_id = block_id
+        self._attached_tools = state.get("attached_tools") or {}
+        logger.info("MCPLaunchpad restored cached setup for %d agents", len(agent_states))
+        return True
+
     # ------------------------------------------------------------------
     # Server registration
     # ------------------------------------------------------------------
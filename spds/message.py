@@ -1,36 +1,76 @@
 # spds/message.py
 
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+import sys
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional
 
+# Reference points for the compact timestamp encoding. Naive datetimes are
+# stored relative to a naive epoch and aware datetimes relative to UTC, so the
+# round trip never consults the local timezone.
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _intern_sender(sender):
+    """Intern sender names so every message from the same speaker shares one string."""
+    if type(sender) is str:
+        return sys.intern(sender)
+    return sender
+
 
-@dataclass
 class ConversationMessage:
     """
     A structured representation of a single message in an SPDS conversation.
     
     This class replaces the flat tuple format (speaker, message) with a structured
     approach that enables efficient incremental delivery and better conversation context.
+
+    Long sessions keep every message in memory (in the swarm history and in the
+    secretary's log), so instances are slotted, sender names are interned and the
+    timestamp is held as an integer microsecond offset instead of a ``datetime``
+    object. The ``timestamp`` attribute still reads and writes ``datetime`` values.
     
     Attributes:
         sender: Name of the message sender ("You" for human, agent name for agents)
         content: The actual message text content
         timestamp: When the message was sent (for ordering and context)
     """
-    sender: str
-    content: str  
-    timestamp: datetime
-    
-    def __post_init__(self):
-        """Validate message data after initialization."""
+
+    __slots__ = ("sender", "content", "_ts_us", "_tz")
+    __hash__ = None  # Mutable value object; equality is field-based
+
+    def __init__(self, sender: str, content: str, timestamp: datetime):
+        self.sender = _intern_sender(sender)
+        self.content = content
+        self._validate()
+        self.timestamp = timestamp
+
+    def _validate(self):
+        """Validate sender and content; the timestamp setter validates its own type."""
         if not self.sender:
             raise ValueError("Message sender cannot be empty")
         # Reject empty or whitespace-only content
         if not self.content or not str(self.content).strip():
             raise ValueError("Message content cannot be empty")
-        if not isinstance(self.timestamp, datetime):
+
+    @property
+    def timestamp(self) -> datetime:
+        """When the message was sent, rebuilt from the compact representation."""
+        if self._tz is None:
+            return _EPOCH + timedelta(microseconds=self._ts_us)
+        return (_EPOCH_UTC + timedelta(microseconds=self._ts_us)).astimezone(self._tz)
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        if not isinstance(value, datetime):
             raise TypeError("Message timestamp must be a datetime object")
+        if value.tzinfo is None or value.utcoffset() is None:
+            self._ts_us = (value.replace(tzinfo=None) - _EPOCH) // _ONE_MICROSECOND
+            self._tz = None
+        else:
+            self._ts_us = (value - _EPOCH_UTC) // _ONE_MICROSECOND
+            self._tz = value.tzinfo
     
     def to_flat_format(self) -> str:
         """
@@ -148,9 +188,11 @@ class ConversationMessage:
         """Equality comparison based on sender, content, and timestamp."""
         if not isinstance(other, ConversationMessage):
             return False
+        # Naive and aware timestamps never compare equal, mirroring datetime.__eq__
         return (self.sender == other.sender and 
                 self.content == other.content and 
-                self.timestamp == other.timestamp)
+                self._ts_us == other._ts_us and
+                (self._tz is None) == (other._tz is None))
     
     def __lt__(self, other) -> bool:
         """Less-than comparison for sorting by timestamp."""
@@ -158,6 +200,10 @@ class ConversationMessage:
             return NotImplemented
         return self.timestamp < other.timestamp
 
+    def __reduce__(self):
+        """Pickle through the constructor so unpickled senders are interned again."""
+        return (self.__class__, (self.sender, self.content, self.timestamp))
+
 
 def convert_history_to_messages(flat_history: list, base_timestamp: Optional[datetime] = None) -> list["ConversationMessage"]:
     """
@@ -192,6 +238,11 @@ def messages_to_flat_format(messages: list["ConversationMessage"]) -> str:
     Returns:
         Newline-separated string in "sender: content" format
     """
+    from .history import ConversationHistory, HistoryView
+
+    if isinstance(messages, (ConversationHistory, HistoryView)):
+        # Served from the history's incrementally maintained flat buffer.
+        return messages.flat()
     return "\n".join(msg.to_flat_format() for msg in messages)
 
 
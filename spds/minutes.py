@@ -0,0 +1,207 @@
+# spds/minutes.py
+
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from . import config
+from .compaction import first_sentence
+from .message import ConversationMessage
+from .topic_tracker import TopicTracker
+
+logger = logging.getLogger(__name__)
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+DECISION_PATTERN = re.compile(
+    r"\b(?:we(?: have|'ve)? decided|decision(?: is|:)|(?:we(?:'ll| will)|let's) go with|"
+    r"(?:we )?agreed to|we agree to|resolved(?: that|:)|final answer is)\b",
+    re.I,
+)
+ACTION_PATTERN = re.compile(
+    r"\b(?:action item|to-?do|next step(?:s)? (?:is|are)|"
+    r"i(?:'ll| will) (?:take|handle|draft|prepare|send|follow up|write|set up|review|look into|own)|"
+    r"(?:can|could) you (?:please )?(?:take|handle|draft|prepare|send|follow up|review)|"
+    r"assigned to|(?:due|by) (?:monday|tuesday|wednesday|thursday|friday|tomorrow|next week|eod|end of (?:day|week)))\b",
+    re.I,
+)
+
+# Speakers whose messages are bookkeeping rather than discussion.
+_SYSTEM_SPEAKERS = frozenset({"system"})
+
+
+def _matching_sentence(text: str, pattern: re.Pattern) -> Optional[str]:
+    for sentence in _SENTENCE_SPLIT.split(" ".join(str(text).split())):
+        if pattern.search(sentence):
+            return sentence if len(sentence) <= 200 else sentence[:197].rstrip() + "..."
+    return None
+
+
+@dataclass
+class MinutesSection:
+    """A stretch of the meeting on one focus; ``start``/``end`` are 1-based message numbers."""
+
+    index: int
+    start: int
+    end: int
+    focus: List[str] = field(default_factory=list)
+    speakers: Counter = field(default_factory=Counter)
+    # Longest message per speaker in this section; the raw material for key points.
+    key_messages: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def heading(self) -> str:
+        title = ", ".join(self.focus) if self.focus else "General discussion"
+        return f"{title} (messages {self.start}-{self.end})"
+
+    def key_points(self) -> List[str]:
+        return [f"{name}: {first_sentence(text)}" for name, text in self.key_messages.items()]
+
+    def local_summary(self) -> str:
+        people = ", ".join(self.speakers)
+        focus = ", ".join(self.focus) if self.focus else "the agenda"
+        summary = f"{people} discussed {focus}."
+        points = self.key_points()
+        if points:
+            summary += " Key points: " + "; ".join(points)
+        return summary
+
+
+class MinutesModel:
+    """
+    Meeting minutes maintained incrementally as the secretary observes messages.
+
+    Each observation updates participants and per-speaker counts, picks out
+    decision and action-item sentences with keyword patterns, and extends the
+    topic outline. The outline is split into sections whenever the
+    TopicTracker's focus moves on (or a section reaches ``max_section``
+    messages), so rendering the minutes is immediate and needs no LLM call.
+
+    Optional LLM polishing is cached per section: ``sections_to_polish``
+    lists only the sections that are new or have grown since they were last
+    polished, and ``set_polished`` stores the result.
+    """
+
+    def __init__(self, max_section: int | None = None, min_section: int = 5):
+        self.max_section = max(
+            1, config.get_minutes_section_size() if max_section is None else max_section
+        )
+        self.min_section = max(1, min(min_section, self.max_section))
+        self.participants: Counter = Counter()
+        # (speaker or None for manually recorded entries, sentence)
+        self.decisions: List[Tuple[Optional[str], str]] = []
+        self.action_items: List[Tuple[Optional[str], str]] = []
+        self.sections: List[MinutesSection] = []
+        self.message_count = 0
+        # A short window so section breaks follow the discussion closely.
+        self._tracker = TopicTracker(window=self.min_section * 2)
+        # section index -> (section end when polished, polished text)
+        self._polished: Dict[int, Tuple[int, str]] = {}
+
+    # -- updates -------------------------------------------------------------
+
+    def observe(self, speaker: str, message: str) -> None:
+        self.message_count += 1
+        number = self.message_count
+        if speaker.lower() in _SYSTEM_SPEAKERS:
+            return
+        text = str(message)
+        self.participants[speaker] += 1
+        self._tracker.observe(ConversationMessage(speaker, text, datetime.now()))
+
+        decision = _matching_sentence(text, DECISION_PATTERN)
+        if decision:
+            self.decisions.append((speaker, decision))
+        action = _matching_sentence(text, ACTION_PATTERN)
+        if action:
+            self.action_items.append((speaker, action))
+
+        focus = list(self._tracker.focus_terms())
+        section = self.sections[-1] if self.sections else None
+        if section is None or self._starts_new_section(section, focus):
+            section = MinutesSection(index=len(self.sections), start=number, end=number)
+            self.sections.append(section)
+        section.end = number
+        if not section.focus or section.speakers.total() < self.min_section:
+            section.focus = focus
+        section.speakers[speaker] += 1
+        if len(text) > len(section.key_messages.get(speaker, "")):
+            section.key_messages[speaker] = text
+
+    def _starts_new_section(self, section: MinutesSection, focus: List[str]) -> bool:
+        size = section.end - section.start + 1
+        if size >= self.max_section:
+            return True
+        return size >= self.min_section and bool(focus) and focus != section.focus
+
+    def add_decision(self, decision: str, context: str | None = None) -> None:
+        text = f"{decision} (context: {context})" if context else decision
+        self.decisions.append((None, text))
+
+    def add_action_item(
+        self, description: str, assignee: str | None = None, due_date: str | None = None
+    ) -> None:
+        text = description
+        if assignee:
+            text += f" (assigned to: {assignee})"
+        if due_date:
+            text += f" (due: {due_date})"
+        self.action_items.append((None, text))
+
+    # -- polishing cache -----------------------------------------------------
+
+    def sections_to_polish(self) -> List[MinutesSection]:
+        """Sections that are new or have grown since they were last polished."""
+        return [
+            section
+            for section in self.sections
+            if self._polished.get(section.index, (None, ""))[0] != section.end
+        ]
+
+    def set_polished(self, section: MinutesSection, text: str) -> None:
+        self._polished[section.index] = (section.end, text.strip())
+
+    def section_text(self, section: MinutesSection) -> str:
+        """Polished text if current, otherwise the local summary."""
+        end, text = self._polished.get(section.index, (None, ""))
+        if end == section.end and text:
+            return text
+        return section.local_summary()
+
+    # -- rendering -----------------------------------------------------------
+
+    def render(self, metadata: Dict, mode: str = "adaptive") -> str:
+        topic = metadata.get("topic", "Unknown Topic")
+        meeting_type = metadata.get("meeting_type", "discussion")
+        title = "Meeting Minutes" if mode == "formal" else "Meeting Notes"
+        lines = [
+            f"# {title}: {topic}",
+            f"_{meeting_type.capitalize()} · {self.message_count} messages_",
+            "",
+            "## Participants",
+        ]
+        for name, count in self.participants.most_common():
+            lines.append(f"- {name} ({count} messages)")
+
+        lines += ["", "## Discussion Outline"]
+        if not self.sections:
+            lines.append("- No discussion recorded yet.")
+        for number, section in enumerate(self.sections, 1):
+            lines += [f"### {number}. {section.heading}", self.section_text(section), ""]
+
+        lines.append("## Decisions")
+        lines += [f"- {_attributed(who, text)}" for who, text in self.decisions] or [
+            "- None recorded."
+        ]
+        lines += ["", "## Action Items"]
+        lines += [f"- [ ] {_attributed(who, text)}" for who, text in self.action_items] or [
+            "- None recorded."
+        ]
+        return "\n".join(lines)
+
+
+def _attributed(speaker: Optional[str], text: str) -> str:
+    return f"{speaker}: {text}" if speaker else text
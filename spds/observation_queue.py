@@ -0,0 +1,152 @@
+# spds/observation_queue.py
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+Observation = Tuple[str, str]
+
+
+class ObservationQueue:
+    """
+    Background batching queue for messages the secretary should note.
+
+    ``put`` only appends to an in-memory queue, so observing never blocks a
+    turn. A single daemon worker hands pending observations to ``send_batch``
+    in arrival order, as soon as ``batch_size`` are waiting or the oldest has
+    waited ``flush_interval`` seconds. ``flush`` blocks until everything queued
+    so far has been sent, which callers use before asking the secretary for
+    minutes or exporting.
+
+    ``send_batch`` failures are logged and counted; the batch is dropped rather
+    than retried (``letta_call`` already retries transient errors).
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[List[Observation]], None],
+        batch_size: int = 10,
+        flush_interval: float = 5.0,
+    ):
+        self._send_batch = send_batch
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval)
+        self._pending: Deque[Tuple[float, Observation]] = deque()
+        self._in_flight = 0
+        self._flush_requests = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self.batches_sent = 0
+        self.messages_sent = 0
+        self.failures = 0
+
+    @property
+    def depth(self) -> int:
+        """Observations queued or currently being sent."""
+        with self._cond:
+            return len(self._pending) + self._in_flight
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "depth": len(self._pending) + self._in_flight,
+                "batches_sent": self.batches_sent,
+                "messages_sent": self.messages_sent,
+                "failures": self.failures,
+            }
+
+    def put(self, speaker: str, message: str) -> None:
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("observation queue is closed")
+            self._pending.append((time.monotonic(), (speaker, message)))
+            self._ensure_worker()
+            if len(self._pending) >= self.batch_size:
+                self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Send everything queued so far; returns False if ``timeout`` expired first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if not self._pending and not self._in_flight:
+                return True
+            self._flush_requests += 1
+            self._cond.notify_all()
+            try:
+                while self._pending or self._in_flight:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+                return True
+            finally:
+                self._flush_requests -= 1
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Flush and stop the worker; later ``put`` calls raise."""
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+        return flushed
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._run, name="secretary-observations", daemon=True
+            )
+            self._worker.start()
+
+    def _next_batch(self) -> List[Observation] | None:
+        """Wait until a batch is due and take it; None once closed and drained."""
+        with self._cond:
+            while True:
+                if self._pending:
+                    oldest = self._pending[0][0]
+                    wait = oldest + self.flush_interval - time.monotonic()
+                    if (
+                        len(self._pending) >= self.batch_size
+                        or self._flush_requests
+                        or self._closed
+                        or wait <= 0
+                    ):
+                        count = min(self.batch_size, len(self._pending))
+                        batch = [self._pending.popleft()[1] for _ in range(count)]
+                        self._in_flight = len(batch)
+                        return batch
+                    self._cond.wait(wait)
+                elif self._closed:
+                    return None
+                else:
+                    self._cond.wait()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                self._send_batch(batch)
+                sent, failed = len(batch), 0
+            except Exception as exc:
+                logger.warning("Dropped %d secretary observations: %s", len(batch), exc)
+                sent, failed = 0, 1
+            with self._cond:
+                self._in_flight = 0
+                self.batches_sent += 1 if sent else 0
+                self.messages_sent += sent
+                self.failures += failed
+                logger.debug(
+                    "Secretary observation batch of %d sent; %d still queued",
+                    len(batch),
+                    len(self._pending),
+                )
+                self._cond.notify_all()
@@ -0,0 +1,200 @@
+# spds/response_parser.py
+
+"""Single-pass normalization of Letta agent responses.
+
+A response is walked once by :func:`parse_response`, which decodes every
+tool call's JSON arguments and collects everything the turn pipeline
+needs: the reply text, ``send_message`` usage, ``use_mcp_tool`` requests
+and cross-agent side conversations. SPDSAgent, SwarmManager,
+SecretaryAgent and ``cross_agent`` all read from the resulting
+:class:`ParsedResponse` instead of re-walking the messages.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .cross_agent import MULTI_AGENT_TOOL, MULTI_AGENT_TOOLS
+
+logger = logging.getLogger(__name__)
+
+SEND_MESSAGE_TOOL = "send_message"
+MCP_TOOL = "use_mcp_tool"
+
+# Attribute a parsed result is cached under on response objects that accept it
+_CACHE_ATTR = "_spds_parsed"
+
+
+@dataclass
+class ToolCall:
+    """One tool call with its decoded arguments (None if they were not a JSON object)."""
+
+    name: Optional[str]
+    arguments: Optional[Dict[str, Any]]
+    raw_arguments: Any = None
+
+
+@dataclass
+class ParsedResponse:
+    """Everything the turn pipeline reads from one Letta response.
+
+    ``text`` is the first text found in any non-user message (a
+    ``send_message`` argument, assistant content, or other content);
+    ``reply_text`` only considers ``send_message`` and assistant messages.
+    ``error`` is set if the response could not be walked completely.
+    """
+
+    text: str = ""
+    reply_text: str = ""
+    has_send_message: bool = False
+    tool_calls: List[ToolCall] = field(default_factory=list)
+    mcp_requests: List[Dict[str, Any]] = field(default_factory=list)
+    side_conversations: List[Dict[str, Any]] = field(default_factory=list)
+    message_types: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def _decode_arguments(raw: Any) -> Optional[Dict[str, Any]]:
+    if raw is None:
+        return {}
+    if isinstance(raw, dict):
+        return raw
+    try:
+        decoded = json.loads(raw)
+    except (TypeError, ValueError):
+        return None
+    return decoded if isinstance(decoded, dict) else None
+
+
+def _tool_call(call: Any) -> ToolCall:
+    # Letta's ToolCall carries name/arguments directly; older (OpenAI-style)
+    # shapes nest them under ``function``.
+    name = getattr(call, "name", None)
+    source = call
+    if not isinstance(name, str):
+        source = getattr(call, "function", None)
+        name = getattr(source, "name", None)
+        if not isinstance(name, str):
+            return ToolCall(None, None)
+    raw = getattr(source, "arguments", None)
+    return ToolCall(name, _decode_arguments(raw), raw)
+
+
+def _message_tool_calls(msg: Any, message_type: Any) -> List[Any]:
+    calls = getattr(msg, "tool_calls", None)
+    if isinstance(calls, (list, tuple)) and calls:
+        return list(calls)
+    call = getattr(msg, "tool_call", None)
+    if message_type == "tool_call_message" and call:
+        return [call]
+    return []
+
+
+def _content_text(content: Any) -> str:
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list) and content:
+        item = content[0]
+        if isinstance(item, str):
+            return item
+        text = item.get("text") if isinstance(item, dict) else getattr(item, "text", None)
+        if isinstance(text, str):
+            return text
+    return ""
+
+
+def _side_conversation(call: ToolCall) -> Dict[str, Any]:
+    args = call.arguments
+    if call.name == MULTI_AGENT_TOOL:
+        entry = {
+            "type": "async",
+            "tool_name": call.name,
+            "recipient_id": args.get("agent_id") or args.get("recipient_agent_id"),
+            "tags": None,
+        }
+    else:
+        entry = {
+            "type": "broadcast",
+            "tool_name": call.name,
+            "recipient_id": None,
+            "tags": args.get("tags"),
+        }
+    entry["message_content"] = args.get("message", "")
+    return entry
+
+
+def _mcp_request(call: ToolCall) -> Dict[str, Any]:
+    args = call.arguments
+    tool_args = _decode_arguments(args.get("arguments_json", "{}"))
+    return {
+        "server_name": args.get("server_name", ""),
+        "tool_name": args.get("tool_name", ""),
+        "tool_args": tool_args or {},
+    }
+
+
+def _parse(response: Any) -> ParsedResponse:
+    parsed = ParsedResponse()
+    try:
+        for msg in getattr(response, "messages", None) or []:
+            message_type = getattr(msg, "message_type", None)
+            role = getattr(msg, "role", None)
+            parsed.message_types.append(message_type or type(msg).__name__)
+            # User messages are the prompts we sent, not the agent's reply
+            if message_type == "user_message" or role == "user":
+                continue
+
+            text, kind = "", None
+            for raw_call in _message_tool_calls(msg, message_type):
+                call = _tool_call(raw_call)
+                parsed.tool_calls.append(call)
+                if call.name == SEND_MESSAGE_TOOL:
+                    parsed.has_send_message = True
+                    message = (call.arguments or {}).get("message")
+                    if not text and isinstance(message, str) and message.strip():
+                        text, kind = message.strip(), "send_message"
+                elif call.name in MULTI_AGENT_TOOLS or call.name == MCP_TOOL:
+                    if call.arguments is None:
+                        logger.warning(
+                            "Malformed tool call arguments for %s: %s",
+                            call.name, call.raw_arguments,
+                        )
+                    elif call.name == MCP_TOOL:
+                        parsed.mcp_requests.append(_mcp_request(call))
+                    else:
+                        parsed.side_conversations.append(_side_conversation(call))
+
+            # Tool returns carry status output, not the reply
+            if not text and not getattr(msg, "tool_return", None):
+                text = _content_text(getattr(msg, "content", None))
+                if message_type == "assistant_message" or role == "assistant":
+                    kind = "assistant"
+
+            if text and not parsed.text:
+                parsed.text = text
+            if text and kind and not parsed.reply_text:
+                parsed.reply_text = text
+    except Exception as e:
+        parsed.error = str(e)
+    return parsed
+
+
+def parse_response(response: Any) -> ParsedResponse:
+    """Normalize a Letta response (or return an already parsed one) in a single pass.
+
+    The result is cached on response objects that accept new attributes
+    (such as the ``SimpleNamespace`` responses built by SPDS), so later
+    consumers of the same response reuse it.
+    """
+    if isinstance(response, ParsedResponse):
+        return response
+    cached = getattr(response, _CACHE_ATTR, None)
+    if isinstance(cached, ParsedResponse):
+        return cached
+    parsed = _parse(response)
+    try:
+        setattr(response, _CACHE_ATTR, parsed)
+    except Exception:
+        pass
+    return parsed
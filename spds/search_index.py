@@ -0,0 +1,330 @@
+# spds/search_index.py
+
+import logging
+import re
+import sqlite3
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple
+
+from . import config
+from .message import ConversationMessage
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    sender TEXT NOT NULL,
+    ts REAL NOT NULL,
+    content TEXT NOT NULL,
+    UNIQUE (session_id, seq)
+);
+CREATE INDEX IF NOT EXISTS messages_sender ON messages (sender COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS messages_ts ON messages (ts);
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5 (
+    content, content='messages', content_rowid='id', tokenize='unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS messages_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts (rowid, content) VALUES (new.id, new.content);
+END;
+"""
+
+# Inline filters accepted in free-text queries, e.g. ``sender:Alex since:2025-01-01``.
+_FILTER_PATTERN = re.compile(r'\b(sender|from|since|until|session):("[^"]*"|\S+)', re.I)
+_TERM_PATTERN = re.compile(r'"([^"]+)"|(\S+)')
+
+
+@dataclass
+class SearchQuery:
+    """A parsed search: terms/phrases plus optional sender, time and session filters."""
+
+    terms: List[str]
+    sender: Optional[str] = None
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    session_id: Optional[str] = None
+
+    def fts_expression(self) -> str:
+        """Render the terms as an FTS5 MATCH expression (each term/phrase quoted)."""
+        quoted = []
+        for term in self.terms:
+            quoted.append('"' + term.replace('"', '""') + '"')
+        return " AND ".join(quoted)
+
+
+@dataclass
+class SearchHit:
+    session_id: str
+    seq: int
+    sender: str
+    timestamp: datetime
+    content: str
+    snippet: str
+
+    def to_dict(self) -> dict:
+        return {
+            "session_id": self.session_id,
+            "seq": self.seq,
+            "sender": self.sender,
+            "timestamp": self.timestamp.isoformat(),
+            "content": self.content,
+            "snippet": self.snippet,
+        }
+
+
+def _parse_time(value: str, end_of_day: bool = False) -> datetime:
+    """Parse an ISO date/time; a bare date means its start, or its end with ``end_of_day``."""
+    try:
+        day = date.fromisoformat(value)
+    except ValueError:
+        pass
+    else:
+        return datetime.combine(day, time.max if end_of_day else time.min)
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid date/time '{value}'; use ISO format, e.g. 2025-01-31 or 2025-01-31T14:00")
+
+
+def parse_query(text: str) -> SearchQuery:
+    """Parse ``words "exact phrase" sender:Name since:DATE until:DATE session:ID``.
+
+    ``until:`` with a bare date includes the whole of that day.
+
+    Raises:
+        ValueError: If a date filter is not ISO formatted.
+    """
+    query = SearchQuery(terms=[])
+    for key, raw in _FILTER_PATTERN.findall(text or ""):
+        value = raw.strip('"')
+        key = key.lower()
+        if key in ("sender", "from"):
+            query.sender = value
+        elif key == "since":
+            query.since = _parse_time(value)
+        elif key == "until":
+            query.until = _parse_time(value, end_of_day=True)
+        elif key == "session":
+            query.session_id = value
+    remainder = _FILTER_PATTERN.sub(" ", text or "")
+    for phrase, word in _TERM_PATTERN.findall(remainder):
+        term = phrase or word
+        if term.strip():
+            query.terms.append(term.strip())
+    return query
+
+
+def _to_epoch(value: datetime) -> float:
+    # Naive timestamps are interpreted as local time on both the write and
+    # query side, so comparisons stay consistent.
+    return value.timestamp()
+
+
+class TranscriptIndex:
+    """
+    Persistent full-text index over ConversationMessages from every session.
+
+    Backed by SQLite FTS5 (an inverted index) so term and phrase queries stay
+    fast on corpora of millions of messages; sender and time filters use plain
+    B-tree indexes. Messages are keyed by ``(session_id, seq)`` so re-adding the
+    same position is a no-op. The connection is opened lazily and shared across
+    threads behind a lock.
+
+    ``append`` is the write path for live sessions: it only queues the message,
+    and a short-lived background writer commits everything queued in one
+    transaction, numbering each session's messages from a counter seeded with
+    its highest stored ``seq``. ``search`` and ``close`` flush the queue first.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else config.get_search_index_path()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._queue: Deque[Tuple[str, ConversationMessage]] = deque()
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._writer: Optional[threading.Thread] = None
+        self._next_seq: Dict[str, int] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def add(self, session_id: str, seq: int, message: ConversationMessage) -> None:
+        """Index one message at position ``seq`` of ``session_id``."""
+        self.add_many(session_id, [(seq, message)])
+
+    def add_many(self, session_id: str, items) -> None:
+        """Index ``(seq, message)`` pairs in one transaction."""
+        rows = [
+            (session_id, seq, msg.sender, _to_epoch(msg.timestamp), str(msg.content))
+            for seq, msg in items
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._insert(self._connect(), rows)
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, rows) -> None:
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO messages (session_id, seq, sender, ts, content) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def append(self, session_id: str, message: ConversationMessage) -> None:
+        """Queue a message to be indexed after the last one of ``session_id``; never blocks on SQLite."""
+        with self._cond:
+            self._queue.append((session_id, message))
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._run_writer, name="transcript-index", daemon=True
+                )
+                self._writer.start()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every appended message is committed; False if ``timeout`` expired first."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._queue and not self._in_flight, timeout
+            )
+
+    def _run_writer(self) -> None:
+        while True:
+            with self._cond:
+                if not self._queue:
+                    self._writer = None
+                    self._cond.notify_all()
+                    return
+                batch = list(self._queue)
+                self._queue.clear()
+                self._in_flight = len(batch)
+            try:
+                self._write_batch(batch)
+            except Exception as exc:
+                logger.warning("Dropped %d messages from the search index: %s", len(batch), exc)
+            with self._cond:
+                self._in_flight = 0
+                self._cond.notify_all()
+
+    def _write_batch(self, batch) -> None:
+        with self._lock:
+            conn = self._connect()
+            rows = []
+            for session_id, msg in batch:
+                seq = self._next_seq.get(session_id)
+                if seq is None:
+                    row = conn.execute(
+                        "SELECT MAX(seq) FROM messages WHERE session_id = ?", (session_id,)
+                    ).fetchone()
+                    seq = -1 if row[0] is None else row[0]
+                seq += 1
+                self._next_seq[session_id] = seq
+                rows.append(
+                    (session_id, seq, msg.sender, _to_epoch(msg.timestamp), str(msg.content))
+                )
+            self._insert(conn, rows)
+
+    def search(self, query, limit: int = 20) -> List[SearchHit]:
+        """Run a query (a SearchQuery or raw query text); most recently indexed matches first."""
+        if isinstance(query, str):
+            query = parse_query(query)
+        self.flush()
+        where = []
+        params: list = []
+        if query.terms:
+            where.append("messages_fts MATCH ?")
+            params.append(query.fts_expression())
+        if query.sender:
+            where.append("m.sender = ? COLLATE NOCASE")
+            params.append(query.sender)
+        if query.since:
+            where.append("m.ts >= ?")
+            params.append(_to_epoch(query.since))
+        if query.until:
+            where.append("m.ts <= ?")
+            params.append(_to_epoch(query.until))
+        if query.session_id:
+            where.append("m.session_id = ?")
+            params.append(query.session_id)
+        if not where:
+            return []
+
+        if query.terms:
+            sql = (
+                "SELECT m.session_id, m.seq, m.sender, m.ts, m.content, "
+                "snippet(messages_fts, 0, '**', '**', '...', 12) "
+                "FROM messages_fts JOIN messages m ON m.id = messages_fts.rowid "
+            )
+        else:
+            sql = "SELECT m.session_id, m.seq, m.sender, m.ts, m.content, NULL FROM messages m "
+        # Rows are inserted as messages are spoken, so rowid order is
+        # chronological; walking it backwards lets SQLite stop after ``limit``
+        # matches instead of sorting every hit for common terms.
+        order = "messages_fts.rowid" if query.terms else "m.id"
+        sql += "WHERE " + " AND ".join(where) + f" ORDER BY {order} DESC LIMIT ?"
+        params.append(int(limit))
+
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        hits = []
+        for session_id, seq, sender, ts, content, snippet in rows:
+            hits.append(
+                SearchHit(
+                    session_id=session_id,
+                    seq=seq,
+                    sender=sender,
+                    timestamp=datetime.fromtimestamp(ts),
+                    content=content,
+                    snippet=snippet if snippet is not None else content[:160],
+                )
+            )
+        return hits
+
+
+def format_hits(hits: List[SearchHit]) -> str:
+    """Render search hits as plain text lines for the CLI and slash command."""
+    if not hits:
+        return "No matches found."
+    lines = []
+    for hit in hits:
+        when = hit.timestamp.strftime("%Y-%m-%d %H:%M")
+        lines.append(f"[{when}] {hit.sender} (session {hit.session_id[:8]}, #{hit.seq}): {hit.snippet}")
+    return "\n".join(lines)
+
+
+_default_index: Optional[TranscriptIndex] = None
+_default_lock = threading.Lock()
+
+
+def get_default_index() -> Optional[TranscriptIndex]:
+    """Return the process-wide transcript index, or None when indexing is disabled."""
+    global _default_index
+    if not config.get_search_index_enabled():
+        return None
+    with _default_lock:
+        path = config.get_search_index_path()
+        if _default_index is None or _default_index.path != path:
+            _default_index = TranscriptIndex(path)
+        return _default_index
@@ -1,5 +1,6 @@
-import json
+import logging
 import re
+import threading
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -7,9 +8,83 @@ from letta_client import Letta
 from letta_client.types import AgentState, CreateBlockParam, MessageCreateParam
 
 from . import config
+from .conversations import ConversationManager
 from .letta_api import letta_call
+from .minutes import MinutesModel
+from .observation_queue import ObservationQueue
+from .response_parser import parse_response
+from .secretary_pool import IDLE_MEETING_CONTEXT, POOL_TAG, get_secretary_pool, lease_tag, mode_tag
 # spds/secretary_agent.py
 
+logger = logging.getLogger(__name__)
+
+# Guards lazy creation of the per-secretary send lock
+_SEND_LOCK_INIT = threading.Lock()
+
+# mode -> (agent name prefix, persona)
+_SECRETARY_PERSONAS = {
+    "formal": (
+        "Cyan Secretary",
+        "I am the Recording Secretary for Cyan Society. I maintain professional "
+        "board meeting minutes following nonprofit governance standards. I use "
+        "formal language and ensure proper documentation of motions, decisions, "
+        "and action items. I store meeting information in my memory and can generate "
+        "comprehensive meeting minutes when requested.",
+    ),
+    "casual": (
+        "Meeting Buddy",
+        "I'm a friendly meeting facilitator who takes great notes! I capture "
+        "the energy and key insights from group discussions in a conversational, "
+        "approachable style. I help teams remember what they decided and what "
+        "comes next. I store conversation highlights in my memory.",
+    ),
+    "adaptive": (
+        "Adaptive Secretary",
+        "I am an adaptive meeting secretary who adjusts my documentation style "
+        "to match the conversation. I can switch between formal board meeting "
+        "minutes and casual group discussion notes based on the context and tone. "
+        "I actively listen to conversations, store key information in my memory, "
+        "and generate appropriate meeting documentation when requested.",
+    ),
+}
+
+
+def secretary_create_kwargs(
+    mode: str, name: str, pooled: bool = False, leased: bool = False
+) -> Dict[str, Any]:
+    """Build ``agents.create`` arguments for a secretary agent in ``mode``.
+
+    ``pooled`` tags it as a pool agent; ``leased`` also marks it as in use.
+    """
+    persona = _SECRETARY_PERSONAS.get(mode, _SECRETARY_PERSONAS["adaptive"])[1]
+    kwargs: Dict[str, Any] = dict(
+        name=name,
+        memory_blocks=[
+            CreateBlockParam(
+                label="human",
+                value="I am working with a team of AI agents in group conversations and meetings.",
+            ),
+            CreateBlockParam(label="persona", value=persona),
+            CreateBlockParam(
+                label="meeting_context",
+                value=IDLE_MEETING_CONTEXT,
+                description="Stores current meeting information, participants, topic, and ongoing notes",
+            ),
+            CreateBlockParam(
+                label="notes_style",
+                value=f"Documentation style: {mode}",
+                description="Preferred style for meeting documentation (formal, casual, or adaptive)",
+            ),
+        ],
+        model=config.DEFAULT_AGENT_MODEL,
+        embedding=config.DEFAULT_EMBEDDING_MODEL,
+        include_base_tools=True,
+    )
+    if pooled:
+        kwargs["tags"] = [POOL_TAG, mode_tag(mode)]
+        if leased:
+            kwargs["tags"].append(lease_tag())
+    return kwargs
 
 
 class SecretaryAgent:
@@ -31,6 +106,17 @@ class SecretaryAgent:
         self.conversation_id: str | None = None
         self._conversation_manager = None
 
+        # Background batching of observed messages (created on first use)
+        self._observations: ObservationQueue | None = None
+        # Locally maintained minutes, updated on every observation
+        self.minutes_model = MinutesModel()
+        # Set when the agent came from (or should return to) the SecretaryPool
+        self._pool = None
+        # Set while a pooled agent is returned but the meeting goes on
+        self._suspended = False
+        # One exchange with the agent at a time (observation sender vs. callers)
+        self._send_lock = threading.RLock()
+
         # Create the secretary agent
         self._create_secretary_agent()
 
@@ -47,40 +133,24 @@ class SecretaryAgent:
         instance.decisions = []
         instance.conversation_id = None
         instance._conversation_manager = None
+        instance._observations = None
+        instance.minutes_model = MinutesModel()
+        instance._pool = None
+        instance._suspended = False
+        instance._send_lock = threading.RLock()
         return instance
 
     def _create_secretary_agent(self):
-        """Creates or retrieves a specialized secretary agent using reuse-first policy."""
+        """Creates or retrieves a specialized secretary agent using reuse-first policy.
+
+        Order: configured ID, configured name, an idle agent leased from the
+        warm SecretaryPool, and only then a newly created agent.
+        """
 
         # Generate unique name with timestamp to avoid conflicts
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        if self.mode == "formal":
-            persona = (
-                "I am the Recording Secretary for Cyan Society. I maintain professional "
-                "board meeting minutes following nonprofit governance standards. I use "
-                "formal language and ensure proper documentation of motions, decisions, "
-                "and action items. I store meeting information in my memory and can generate "
-                "comprehensive meeting minutes when requested."
-            )
-            name = f"Cyan Secretary {timestamp}"
-        elif self.mode == "casual":
-            persona = (
-                "I'm a friendly meeting facilitator who takes great notes! I capture "
-                "the energy and key insights from group discussions in a conversational, "
-                "approachable style. I help teams remember what they decided and what "
-                "comes next. I store conversation highlights in my memory."
-            )
-            name = f"Meeting Buddy {timestamp}"
-        else:  # adaptive
-            persona = (
-                "I am an adaptive meeting secretary who adjusts my documentation style "
-                "to match the conversation. I can switch between formal board meeting "
-                "minutes and casual group discussion notes based on the context and tone. "
-                "I actively listen to conversations, store key information in my memory, "
-                "and generate appropriate meeting documentation when requested."
-            )
-            name = f"Adaptive Secretary {timestamp}"
+        prefix = _SECRETARY_PERSONAS.get(self.mode, _SECRETARY_PERSONAS["adaptive"])[0]
+        name = f"{prefix} {timestamp}"
 
         # Reuse-first policy: check configured ID or name before creating a new agent
         sec_id = config.get_secretary_agent_id()
@@ -111,39 +181,36 @@ class SecretaryAgent:
             except Exception as e:
                 print(f"⚠️ Failed to find secretary by name {sec_name}: {e}")
 
+        pool = get_secretary_pool(self.client) if config.get_secretary_pool_size() > 0 else None
+        if pool is not None:
+            leased = pool.lease(self.mode)
+            if leased is not None:
+                self.agent = leased.agent
+                self.conversation_id = leased.conversation_id
+                if leased.conversation_id:
+                    self._conversation_manager = ConversationManager(self.client)
+                self._pool = pool
+                print(f"✅ Leased pooled secretary agent: {getattr(leased.agent, 'name', leased.agent.id)}")
+                return
+
         # If ephemeral creation is disabled by policy, do not create a new secretary
         if not config.get_allow_ephemeral_agents():
             raise RuntimeError(
                 "Ephemeral creation disabled (SPDS_ALLOW_EPHEMERAL_AGENTS=false); set SECRETARY_AGENT_ID or SECRETARY_AGENT_NAME to reuse an existing secretary agent."
             )
 
-        # Create new agent using proper Letta memory blocks pattern
+        # Create new agent using proper Letta memory blocks pattern. With an
+        # active pool it is tagged so it joins the pool when released instead
+        # of being left behind.
+        pooled = pool is not None and pool.is_active
         try:
             self.agent = letta_call(
                 "secretary.agent.create",
                 self.client.agents.create,
-                name=name,
-                memory_blocks=[
-                    CreateBlockParam(
-                        label="human",
-                        value="I am working with a team of AI agents in group conversations and meetings.",
-                    ),
-                    CreateBlockParam(label="persona", value=persona),
-                    CreateBlockParam(
-                        label="meeting_context",
-                        value="No active meeting. Ready to take notes when a meeting begins.",
-                        description="Stores current meeting information, participants, topic, and ongoing notes",
-                    ),
-                    CreateBlockParam(
-                        label="notes_style",
-                        value=f"Documentation style: {self.mode}",
-                        description="Preferred style for meeting documentation (formal, casual, or adaptive)",
-                    ),
-                ],
-                model=config.DEFAULT_AGENT_MODEL,
-                embedding=config.DEFAULT_EMBEDDING_MODEL,
-                include_base_tools=True,
+                **secretary_create_kwargs(self.mode, name, pooled=pooled, leased=pooled),
             )
+            if pooled:
+                self._pool = pool
             print(f"✅ Created new secretary agent: {name}")
         except Exception as e:
             print(f"❌ Failed to create secretary agent: {e}")
@@ -158,7 +225,24 @@ class SecretaryAgent:
 
         Returns:
             The response (or response-like object from send_and_collect).
+
+        Sends are serialized: the observation queue's worker thread and
+        callers such as minutes generation share one agent conversation,
+        and each reply must be read from its own exchange.
         """
+        with self._agent_lock():
+            return self._send_unlocked(operation_name, messages)
+
+    def _agent_lock(self) -> threading.RLock:
+        lock = getattr(self, "_send_lock", None)
+        if lock is None:
+            with _SEND_LOCK_INIT:
+                lock = getattr(self, "_send_lock", None)
+                if lock is None:
+                    lock = self._send_lock = threading.RLock()
+        return lock
+
+    def _send_unlocked(self, operation_name: str, messages):
         if self.conversation_id and self._conversation_manager:
             # MessageCreateParam is a TypedDict, so messages are dicts
             dict_msgs = []
@@ -232,88 +316,160 @@ class SecretaryAgent:
 
     def _extract_agent_response(self, response) -> str:
         """Extract the main response from agent messages, handling tool calls properly."""
-        message_text = ""
-        try:
-            for msg in response.messages:
-                # Check for tool calls first (send_message)
-                if hasattr(msg, "tool_calls") and msg.tool_calls:
-                    for tool_call in msg.tool_calls:
-                        if (
-                            hasattr(tool_call, "function")
-                            and tool_call.function.name == "send_message"
-                        ):
-                            try:
-                                import json
-
-                                args = json.loads(tool_call.function.arguments)
-                                message_text = args.get("message", "")
-                                break
-                            except Exception:
-                                pass
-
-                # Check for tool return messages (when agent uses send_message)
-                if not message_text and hasattr(msg, "tool_return") and msg.tool_return:
-                    # Tool returns often contain status messages we can ignore
-                    continue
-
-                # Check assistant messages (direct responses without tools)
-                if (
-                    not message_text
-                    and hasattr(msg, "message_type")
-                    and msg.message_type == "assistant_message"
-                ):
-                    if hasattr(msg, "content") and msg.content:
-                        message_text = msg.content
-
-                # If no tool call, try regular content extraction
-                if not message_text and hasattr(msg, "content"):
-                    if isinstance(msg.content, str):
-                        message_text = msg.content
-                    elif isinstance(msg.content, list) and msg.content:
-                        content_item = msg.content[0]
-                        if hasattr(content_item, "text"):
-                            message_text = content_item.text
-                        elif isinstance(content_item, str):
-                            message_text = content_item
-
-                if message_text:
-                    break
-
-            if not message_text:
-                message_text = "Secretary is ready to take notes."
-
-        except Exception as e:
-            message_text = "Secretary is ready to take notes."
-            print(f"[Debug: Error extracting secretary response - {e}]")
-
-        return message_text
+        parsed = parse_response(response)
+        if parsed.error:
+            print(f"[Debug: Error extracting secretary response - {parsed.error}]")
+        return parsed.text or "Secretary is ready to take notes."
 
     def observe_message(
         self, speaker: str, message: str, metadata: Optional[Dict] = None
     ):
-        """Send conversation message to the secretary agent for active processing."""
+        """Queue a conversation message for the secretary agent to note.
+
+        With SPDS_SECRETARY_ASYNC_OBSERVE enabled (the default) the message is
+        handed to a background queue that sends batches, so the caller's turn
+        does not wait on an LLM round trip. Otherwise it is sent immediately.
+        """
         if not self.agent:
+            if getattr(self, "_suspended", False):
+                # Keep the local notes; the next agent is briefed on resume.
+                self.conversation_log.append((speaker, message))
+                self._minutes_model().observe(speaker, message)
             return
 
         # For backward compatibility, log the message
         self.conversation_log.append((speaker, message))
+        self._minutes_model().observe(speaker, message)
 
-        # Format message for the secretary
-        formatted_message = f"{speaker}: {message}"
+        if config.get_secretary_async_observe():
+            try:
+                self._observation_queue().put(speaker, message)
+                return
+            except RuntimeError:
+                # Queue closed (meeting over); fall back to a direct send.
+                pass
 
-        # Send to secretary agent for processing and note-taking
         try:
-            self._send_to_agent(
-                "secretary.message.observe",
-                [MessageCreateParam(
-                    role="user",
-                    content=f"Please note this in the meeting: {formatted_message}",
-                )],
+            self._send_observations([(speaker, message)])
+        except Exception as e:
+            # Don't print for every message - too noisy
+            logger.debug("Secretary observe failed: %s", e)
+
+    def _send_observations(self, observations):
+        """Send one or more ``(speaker, message)`` pairs in a single request."""
+        if len(observations) == 1:
+            speaker, message = observations[0]
+            content = f"Please note this in the meeting: {speaker}: {message}"
+        else:
+            lines = "\n".join(f"{speaker}: {message}" for speaker, message in observations)
+            content = (
+                f"Please note these {len(observations)} messages in the meeting, "
+                f"in order:\n{lines}"
+            )
+        self._send_to_agent(
+            "secretary.message.observe",
+            [MessageCreateParam(role="user", content=content)],
+        )
+
+    def _observation_queue(self) -> ObservationQueue:
+        queue = getattr(self, "_observations", None)
+        if queue is None:
+            queue = ObservationQueue(
+                self._send_observations,
+                batch_size=config.get_secretary_batch_size(),
+                flush_interval=config.get_secretary_flush_interval(),
+            )
+            self._observations = queue
+        return queue
+
+    @property
+    def pending_observations(self) -> int:
+        """Number of observed messages not yet delivered to the secretary agent."""
+        queue = getattr(self, "_observations", None)
+        return queue.depth if queue else 0
+
+    def observation_stats(self) -> Dict[str, Any]:
+        """Queue depth and delivery counters for observed messages."""
+        queue = getattr(self, "_observations", None)
+        if queue is None:
+            return {"depth": 0, "batches_sent": 0, "messages_sent": 0, "failures": 0}
+        return queue.stats()
+
+    def flush_observations(self, timeout: float | None = None) -> bool:
+        """Deliver every queued observation before returning (False on timeout)."""
+        queue = getattr(self, "_observations", None)
+        if queue is None:
+            return True
+        if timeout is None:
+            timeout = config.get_secretary_flush_timeout()
+        flushed = queue.flush(timeout)
+        if not flushed:
+            logger.warning(
+                "Secretary still has %d observations queued after %.0fs", queue.depth, timeout
             )
+        return flushed
+
+    def close(self) -> None:
+        """Flush outstanding observations, stop the sender and return a pooled agent."""
+        queue = getattr(self, "_observations", None)
+        if queue is not None:
+            queue.close(config.get_secretary_flush_timeout())
+        # A polish still talking to the agent must finish before it is returned.
+        if not self.flush_minutes_polish(config.get_secretary_flush_timeout()):
+            logger.warning("Minutes polish still running while the secretary closes")
+        pool = getattr(self, "_pool", None)
+        if pool is not None and self.agent is not None:
+            self._pool = None
+            pool.release(self.agent, self.mode)
+
+    @property
+    def suspended(self) -> bool:
+        """Whether the pooled agent was returned by ``suspend`` and not yet replaced."""
+        return getattr(self, "_suspended", False)
+
+    def suspend(self) -> bool:
+        """Return a pooled agent while keeping the meeting's notes; False if not pooled.
+
+        Messages observed while suspended are kept in the local minutes.
+        ``resume`` takes another agent.
+        """
+        if getattr(self, "_pool", None) is None or self.agent is None:
+            return False
+        self.close()
+        self._observations = None
+        self.agent = None
+        self.conversation_id = None
+        self._conversation_manager = None
+        self._suspended = True
+        return True
+
+    def resume(self) -> None:
+        """Take a secretary agent again after ``suspend``; ``continue_meeting`` briefs it."""
+        if not self.suspended:
+            return
+        self._create_secretary_agent()
+        self._suspended = False
 
+    def continue_meeting(self) -> None:
+        """Brief a newly taken agent on the meeting in progress and its minutes so far."""
+        topic = self.meeting_metadata.get("topic")
+        if not topic:
+            return
+        participants = ", ".join(self.meeting_metadata.get("participants") or [])
+        briefing = (
+            f"You are taking over the notes of a meeting already in progress.\n"
+            f"Topic: {topic}\n"
+            f"Participants: {participants}\n"
+            f"Minutes so far:\n{self._minutes_model().render(self.meeting_metadata, self.mode)}\n"
+            f"Continue taking notes in {self.mode} style."
+        )
+        try:
+            self._send_to_agent(
+                "secretary.meeting.resume",
+                [MessageCreateParam(role="user", content=briefing)],
+            )
         except Exception as e:
-            # Don't print for every message - too noisy
-            pass
+            logger.warning("Could not brief resumed secretary: %s", e)
 
     # Removed old static implementations - now using AI agent for everything
 
@@ -323,10 +479,12 @@ class SecretaryAgent:
         """Manually add an action item through the secretary agent."""
         # For backward compatibility
         self.action_items.append(description)
+        self._minutes_model().add_action_item(description, assignee, due_date)
         if not self.agent:
             print(f"⚠️ Secretary agent not available")
             return
 
+        self.flush_observations()
         action_message = f"Please record this action item: {description}"
         if assignee:
             action_message += f" (assigned to: {assignee})"
@@ -347,10 +505,12 @@ class SecretaryAgent:
         """Manually record a decision through the secretary agent."""
         # For backward compatibility
         self.decisions.append({"decision": decision, "context": context})
+        self._minutes_model().add_decision(decision, context)
         if not self.agent:
             print(f"⚠️ Secretary agent not available")
             return
 
+        self.flush_observations()
         decision_message = f"Please record this decision: {decision}"
         if context:
             decision_message += f" (context: {context})"
@@ -370,6 +530,8 @@ class SecretaryAgent:
         if not self.agent:
             return {}
 
+        # Exports gather stats first, so this also flushes before exporting.
+        self.flush_observations()
         try:
             response = self._send_to_agent(
                 "secretary.stats.get",
@@ -382,6 +544,10 @@ class SecretaryAgent:
             stats_text = self._extract_agent_response(response)
 
             # Parse basic stats from the meeting metadata
+            queue_stats = {}
+            if getattr(self, "_observations", None) is not None:
+                queue_stats["observation_queue"] = self.observation_stats()
+
             if self.meeting_metadata:
                 duration = (
                     datetime.now() - self.meeting_metadata["start_time"]
@@ -394,22 +560,127 @@ class SecretaryAgent:
                         "meeting_type", "discussion"
                     ),
                     "summary": stats_text,
+                    **queue_stats,
                 }
 
-            return {"summary": stats_text}
+            return {"summary": stats_text, **queue_stats}
 
         except Exception as e:
             print(f"❌ Failed to get conversation stats: {e}")
             return {}
 
     def generate_minutes(self) -> str:
-        """Generate meeting minutes using the secretary agent's AI capabilities."""
+        """Return meeting minutes, built locally from the observed conversation.
+
+        The incremental MinutesModel renders immediately. When polishing is
+        enabled the secretary LLM is asked, on a background thread, to rewrite
+        only the outline sections that are new or have grown since the last
+        call; its wording is cached and shows up in later renders. If nothing
+        has been observed locally (e.g. a reused secretary that only has the
+        meeting in its own memory), the secretary agent is asked to write the
+        full minutes instead.
+        """
         if not self.agent:
             return "Secretary agent not available."
 
         if not self.meeting_metadata:
             return "No meeting in progress."
 
+        model = self._minutes_model()
+        if not model.message_count:
+            return self._generate_minutes_with_agent()
+
+        if config.get_minutes_polish_enabled() and model.sections_to_polish():
+            self._start_minutes_polish()
+        return model.render(self.meeting_metadata, self.mode)
+
+    def _polish_cond(self) -> threading.Condition:
+        cond = getattr(self, "_polish", None)
+        if cond is None:
+            with _SEND_LOCK_INIT:
+                cond = getattr(self, "_polish", None)
+                if cond is None:
+                    self._polish_pending = False
+                    self._polish_thread = None
+                    cond = self._polish = threading.Condition()
+        return cond
+
+    def _start_minutes_polish(self) -> None:
+        """Polish new sections on a "minutes-polish" thread; requests made meanwhile rerun it once."""
+        cond = self._polish_cond()
+        with cond:
+            self._polish_pending = True
+            if self._polish_thread is None:
+                self._polish_thread = threading.Thread(
+                    target=self._run_minutes_polish, name="minutes-polish", daemon=True
+                )
+                self._polish_thread.start()
+
+    def _run_minutes_polish(self) -> None:
+        cond = self._polish_cond()
+        while True:
+            with cond:
+                if not self._polish_pending or self.agent is None:
+                    self._polish_pending = False
+                    self._polish_thread = None
+                    cond.notify_all()
+                    return
+                self._polish_pending = False
+            try:
+                self._polish_minutes_sections(self._minutes_model())
+            except Exception as e:
+                logger.warning("Minutes polishing failed: %s", e)
+
+    def flush_minutes_polish(self, timeout: float | None = None) -> bool:
+        """Wait for a background minutes polish; False if ``timeout`` expired first."""
+        cond = self._polish_cond()
+        with cond:
+            return cond.wait_for(lambda: self._polish_thread is None, timeout)
+
+    def _minutes_model(self) -> MinutesModel:
+        model = getattr(self, "minutes_model", None)
+        if model is None:
+            model = self.minutes_model = MinutesModel()
+        return model
+
+    def _polish_minutes_sections(self, model: MinutesModel) -> None:
+        """Ask the secretary LLM to reword new outline sections; keeps local text on failure."""
+        sections = model.sections_to_polish()
+        if not sections:
+            return
+        # Deliver queued observations first so they cannot land between this
+        # request and its reply.
+        self.flush_observations()
+        blocks = []
+        for section in sections:
+            points = "\n".join(f"- {point}" for point in section.key_points())
+            blocks.append(f"### Section {section.index + 1}: {section.heading}\n{points}")
+        request = (
+            f"Please write {self.mode}-style meeting minute paragraphs for the following "
+            f"sections of our meeting about '{self.meeting_metadata.get('topic', 'Unknown Topic')}'. "
+            f"Keep each section's '### Section N' header line exactly as given and put one "
+            f"short paragraph under it. Please use the send_message tool to provide your response.\n\n"
+            + "\n\n".join(blocks)
+        )
+        try:
+            response = self._send_to_agent(
+                "secretary.minutes.polish",
+                [MessageCreateParam(role="user", content=request)],
+            )
+            polished = _split_polished_sections(self._extract_agent_response(response))
+        except Exception as e:
+            logger.warning("Minutes polishing failed; using local outline: %s", e)
+            return
+        for section in sections:
+            text = polished.get(section.index + 1)
+            if text:
+                model.set_polished(section, text)
+
+    def _generate_minutes_with_agent(self) -> str:
+        """Have the secretary agent write the full minutes from its own memory."""
+        # Minutes must cover everything observed so far.
+        self.flush_observations()
+
         # Ask the secretary agent to generate meeting minutes
         minutes_request = (
             f"Please generate meeting minutes for our {self.meeting_metadata.get('meeting_type', 'discussion')} "
@@ -438,3 +709,18 @@ class SecretaryAgent:
         except Exception as e:
             print(f"❌ Failed to generate minutes: {e}")
             return f"Error generating minutes: {str(e)[:100]}..."
+
+
+_POLISHED_HEADER = re.compile(r"^#+\s*Section\s+(\d+)\b[^\n]*$", re.M | re.I)
+
+
+def _split_polished_sections(text: str) -> Dict[int, str]:
+    """Map section numbers to the paragraphs under their ``### Section N`` headers."""
+    parts: Dict[int, str] = {}
+    matches = list(_POLISHED_HEADER.finditer(text or ""))
+    for position, match in enumerate(matches):
+        end = matches[position + 1].start() if position + 1 < len(matches) else len(text)
+        body = text[match.end():end].strip()
+        if body:
+            parts[int(match.group(1))] = body
+    return parts
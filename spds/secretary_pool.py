@@ -0,0 +1,336 @@
+# spds/secretary_pool.py
+
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, Optional
+
+from letta_client import Letta
+
+from . import config
+from .conversations import ConversationManager
+from .letta_api import letta_call
+
+logger = logging.getLogger(__name__)
+
+SECRETARY_MODES = ("formal", "casual", "adaptive")
+POOL_TAG = "spds:secretary-pool"
+IDLE_MEETING_CONTEXT = "No active meeting. Ready to take notes when a meeting begins."
+LEASE_TAG_PREFIX = "spds:secretary-leased:"
+# A lease tag older than this is assumed to come from a process that died
+STALE_LEASE_SECONDS = 12 * 3600
+
+
+def mode_tag(mode: str) -> str:
+    return f"spds:secretary-mode:{mode}"
+
+
+def lease_tag(now: float | None = None, token: str | None = None) -> str:
+    """Server-side marker of a leased pool agent, stamped with the lease time.
+
+    ``token`` makes the tag unique to one lease so its holder can tell its own
+    tag from a competing one.
+    """
+    tag = f"{LEASE_TAG_PREFIX}{int(time.time() if now is None else now)}"
+    return f"{tag}:{token}" if token else tag
+
+
+def is_leased(tags: Iterable[str] | None, now: float | None = None) -> bool:
+    """Whether ``tags`` carry a lease tag that is not yet stale."""
+    now = time.time() if now is None else now
+    for tag in tags or []:
+        if isinstance(tag, str) and tag.startswith(LEASE_TAG_PREFIX):
+            try:
+                started = float(tag[len(LEASE_TAG_PREFIX):].partition(":")[0])
+            except ValueError:
+                continue
+            if now - started < STALE_LEASE_SECONDS:
+                return True
+    return False
+
+
+def _without_lease_tags(tags) -> list:
+    return [t for t in tags if not (isinstance(t, str) and t.startswith(LEASE_TAG_PREFIX))]
+
+
+def _tag_list(agent) -> list:
+    tags = getattr(agent, "tags", None)
+    return list(tags) if isinstance(tags, (list, tuple)) else []
+
+
+@dataclass
+class PooledSecretary:
+    """An idle pool agent, optionally with a fresh conversation already opened for it."""
+
+    agent: object
+    mode: str
+    conversation_id: Optional[str] = None
+
+
+class SecretaryPool:
+    """
+    Process-wide pool of pre-created secretary agents, kept per documentation mode.
+
+    Pool agents are ordinary Letta agents tagged ``spds:secretary-pool`` and
+    ``spds:secretary-mode:<mode>``, so a restarted process rediscovers them
+    instead of creating more. ``start_warming`` runs discovery and tops each
+    mode up to ``size`` idle agents on a background thread; ``lease`` only
+    pops an idle agent, so no agent is created while a session starts.
+
+    An agent becomes leasable only after its ``meeting_context`` block is
+    reset and a fresh conversation is opened for the next lessee, both when
+    it is returned (``release``) and when it is discovered, so no meeting
+    leaks into the next one. A leased agent carries a
+    ``spds:secretary-leased:<time>`` tag, so other processes sharing the
+    server skip it; a lease older than ``STALE_LEASE_SECONDS`` is treated
+    as left behind by a crashed process and reclaimed.
+
+    The pool is inactive until ``start_warming`` is called: ``lease`` then
+    returns None and callers create an agent the old way.
+    """
+
+    def __init__(self, client: Letta, size: int | None = None):
+        self.client = client
+        self.size = max(0, config.get_secretary_pool_size() if size is None else size)
+        self._idle: Dict[str, Deque[PooledSecretary]] = {m: deque() for m in SECRETARY_MODES}
+        self._leased: Dict[str, str] = {}
+        self._cond = threading.Condition()
+        self._active = False
+        self._discovered = threading.Event()
+        self._worker: threading.Thread | None = None
+        self.created = 0
+        self.leases = 0
+        self.misses = 0
+
+    # -- warming -------------------------------------------------------------
+
+    def start_warming(self) -> None:
+        """Discover and top up idle agents in the background (idempotent)."""
+        if self.size <= 0:
+            return
+        with self._cond:
+            self._active = True
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(
+                target=self.warm, name="secretary-pool", daemon=True
+            )
+            self._worker.start()
+
+    def warm(self) -> None:
+        """Synchronously discover existing pool agents and create any that are missing."""
+        if not self._discovered.is_set():
+            try:
+                self._discover()
+            finally:
+                self._discovered.set()
+        for mode in SECRETARY_MODES:
+            while self.idle_count(mode) < self.size:
+                try:
+                    agent = self.create_agent(mode)
+                except Exception as e:
+                    logger.warning("Secretary pool could not create a %s agent: %s", mode, e)
+                    break
+                self._add_idle(PooledSecretary(agent, mode))
+
+    def _discover(self) -> None:
+        try:
+            found = letta_call(
+                "secretary.pool.list",
+                self.client.agents.list,
+                tags=[POOL_TAG],
+                include=["agent.tags"],
+                limit=100,
+            )
+            agents = list(found)
+        except Exception as e:
+            logger.warning("Secretary pool discovery failed: %s", e)
+            return
+        now = time.time()
+        in_use = 0
+        for agent in agents:
+            tags = set(_tag_list(agent))
+            mode = next((m for m in SECRETARY_MODES if mode_tag(m) in tags), None)
+            if mode is None or agent.id in self._leased:
+                continue
+            if is_leased(tags, now):
+                in_use += 1
+                continue
+            # Possibly left mid-meeting by a crashed process: reset it first.
+            self._add_idle(self._reset(agent, mode))
+        logger.info(
+            "Secretary pool discovered %d existing agents (%d leased elsewhere)",
+            len(agents), in_use,
+        )
+
+    def create_agent(self, mode: str):
+        """Create one pool-tagged secretary agent for ``mode``."""
+        from .secretary_agent import secretary_create_kwargs
+
+        name = f"SPDS Pool Secretary ({mode}) {uuid.uuid4().hex[:8]}"
+        agent = letta_call(
+            "secretary.pool.create",
+            self.client.agents.create,
+            **secretary_create_kwargs(mode, name, pooled=True),
+        )
+        with self._cond:
+            self.created += 1
+        return agent
+
+    def _add_idle(self, entry: PooledSecretary) -> None:
+        with self._cond:
+            if any(e.agent.id == entry.agent.id for e in self._idle[entry.mode]):
+                return
+            self._idle[entry.mode].append(entry)
+            self._cond.notify_all()
+
+    # -- leasing -------------------------------------------------------------
+
+    @property
+    def is_active(self) -> bool:
+        with self._cond:
+            return self._active
+
+    def idle_count(self, mode: str) -> int:
+        with self._cond:
+            return len(self._idle[mode])
+
+    def lease(self, mode: str, wait: float | None = None) -> Optional[PooledSecretary]:
+        """Take an idle agent for ``mode``, or None if the pool has none ready.
+
+        Waits at most ``wait`` seconds for discovery (a single list call), never
+        for agent creation.
+        """
+        if mode not in self._idle:
+            return None
+        if not self.is_active:
+            return None
+        if wait is None:
+            wait = config.get_secretary_pool_wait()
+        self._discovered.wait(wait)
+        entry = None
+        while entry is None:
+            with self._cond:
+                if not self._idle[mode]:
+                    break
+                candidate = self._idle[mode].popleft()
+            if self._mark_leased(candidate.agent):
+                entry = candidate
+        with self._cond:
+            if entry is None:
+                self.misses += 1
+            else:
+                self._leased[entry.agent.id] = mode
+                self.leases += 1
+        # Replace what was taken (or missing) off the session's critical path.
+        self.start_warming()
+        return entry
+
+    def _set_tags(self, agent, tags: list) -> None:
+        letta_call(
+            "secretary.pool.tag",
+            self.client.agents.update,
+            agent_id=agent.id,
+            tags=tags,
+        )
+        try:
+            agent.tags = tags
+        except Exception:
+            pass
+
+    def _server_tags(self, agent, op: str) -> Optional[list]:
+        try:
+            current = letta_call(op, self.client.agents.retrieve, agent_id=agent.id)
+        except Exception as e:
+            logger.warning("Secretary pool agent %s is unavailable: %s", agent.id, e)
+            return None
+        return _tag_list(current)
+
+    def _mark_leased(self, agent) -> bool:
+        """Tag ``agent`` as leased on the server; False if another process holds it.
+
+        Tag updates replace the whole list, so two processes can both pass the
+        check and write. Each lease therefore writes a tag unique to it and
+        reads the tags back: only the process whose tag is the one left on
+        the agent keeps it.
+        """
+        tags = self._server_tags(agent, "secretary.pool.check")
+        if tags is None:
+            return False
+        tags = tags or _tag_list(agent)
+        if is_leased(tags):
+            logger.info("Secretary %s was leased by another process; skipping it", agent.id)
+            return False
+        mine = lease_tag(token=uuid.uuid4().hex[:12])
+        try:
+            self._set_tags(agent, _without_lease_tags(tags) + [mine])
+        except Exception as e:
+            logger.warning("Could not mark secretary %s as leased: %s", agent.id, e)
+            return False
+        confirmed = self._server_tags(agent, "secretary.pool.confirm")
+        if confirmed is None:
+            return False
+        leases = [t for t in confirmed if isinstance(t, str) and t.startswith(LEASE_TAG_PREFIX)]
+        if leases != [mine]:
+            logger.info("Secretary %s was leased by another process at the same time; skipping it", agent.id)
+            return False
+        return True
+
+    def release(self, agent, mode: str) -> None:
+        """Reset ``agent`` and return it to the idle pool."""
+        with self._cond:
+            self._leased.pop(agent.id, None)
+        self._add_idle(self._reset(agent, mode))
+
+    def _reset(self, agent, mode: str) -> PooledSecretary:
+        """Clear the last meeting from ``agent``, drop its lease tag and open a fresh conversation."""
+        try:
+            letta_call(
+                "secretary.pool.reset",
+                self.client.agents.blocks.update,
+                "meeting_context",
+                agent_id=agent.id,
+                value=IDLE_MEETING_CONTEXT,
+            )
+        except Exception as e:
+            logger.warning("Could not reset secretary %s memory: %s", agent.id, e)
+        tags = _tag_list(agent)
+        if _without_lease_tags(tags) != tags:
+            try:
+                self._set_tags(agent, _without_lease_tags(tags))
+            except Exception as e:
+                logger.warning("Could not clear lease tag of secretary %s: %s", agent.id, e)
+        conversation_id = None
+        try:
+            conversation_id = ConversationManager(self.client).create_session(
+                agent_id=agent.id, summary=f"spds:secretary-pool|{mode}"
+            )
+        except Exception as e:
+            logger.debug("Could not open a fresh conversation for %s: %s", agent.id, e)
+        return PooledSecretary(agent, mode, conversation_id)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "idle": {mode: len(entries) for mode, entries in self._idle.items()},
+                "leased": len(self._leased),
+                "created": self.created,
+                "leases": self.leases,
+                "misses": self.misses,
+            }
+
+
+_pool: Optional[SecretaryPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_secretary_pool(client: Letta) -> SecretaryPool:
+    """Return the process-wide pool, creating it around ``client`` on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SecretaryPool(client)
+        return _pool
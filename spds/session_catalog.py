@@ -0,0 +1,146 @@
+# spds/session_catalog.py
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from . import config
+from .conversations import ConversationManager
+from .export_manager import atomic_write
+from .letta_api import parallel_map
+from .secretary_pool import POOL_TAG
+from .session_index import entry_from_conversation
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = "session_list_cache.json"
+CACHE_VERSION = 1
+
+
+def _cache_path() -> Path:
+    return config.get_sessions_dir() / CACHE_FILENAME
+
+
+def _read_cache(ttl: float) -> Optional[List[Dict[str, Any]]]:
+    if ttl <= 0:
+        return None
+    try:
+        data = json.loads(_cache_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    fresh = time.time() - data.get("created_at", 0) < ttl
+    if data.get("version") != CACHE_VERSION or data.get("base_url") != config.LETTA_BASE_URL or not fresh:
+        return None
+    return data.get("sessions")
+
+
+def _write_cache(sessions: List[Dict[str, Any]]) -> None:
+    path = _cache_path()
+    payload = {
+        "version": CACHE_VERSION,
+        "base_url": config.LETTA_BASE_URL,
+        "created_at": time.time(),
+        "sessions": sessions,
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, lambda f: json.dump(payload, f))
+    except OSError as e:
+        logger.warning("Could not cache session list at %s: %s", path, e)
+
+
+def aggregate_sessions(agent_conversations: Iterable[Tuple[Any, List]]) -> List[Dict[str, Any]]:
+    """Group SPDS-tagged conversations of many agents into sessions, newest first.
+
+    ``agent_conversations`` yields ``(agent, conversations)`` pairs. A
+    session is completed once every one of its conversations is.
+    """
+    sessions: Dict[str, Dict[str, Any]] = {}
+    for agent, conversations in agent_conversations:
+        agent_id = getattr(agent, "id", None)
+        for conversation in conversations:
+            entry = entry_from_conversation(conversation, agent_id)
+            if entry is None:
+                continue
+            session = sessions.setdefault(
+                entry.session_id,
+                {
+                    "session_id": entry.session_id,
+                    "topic": entry.topic,
+                    "status": "completed",
+                    "agents": [],
+                    "agent_ids": [],
+                    "conversations": [],
+                    "created_at": None,
+                    "updated_at": None,
+                },
+            )
+            session["topic"] = session["topic"] or entry.topic
+            if entry.status != "completed":
+                session["status"] = "active"
+            name = entry.agent_name or getattr(agent, "name", None) or entry.agent_id
+            if name not in session["agents"]:
+                session["agents"].append(name)
+            if entry.agent_id and entry.agent_id not in session["agent_ids"]:
+                session["agent_ids"].append(entry.agent_id)
+            session["conversations"].append(entry.id)
+            for key, value, pick in (
+                ("created_at", entry.created_at, min),
+                ("updated_at", entry.updated_at or entry.created_at, max),
+            ):
+                if value is not None:
+                    stamp = value.isoformat()
+                    session[key] = pick(session[key], stamp) if session[key] else stamp
+    return sorted(sessions.values(), key=lambda s: s["created_at"] or "", reverse=True)
+
+
+def list_all_sessions(
+    client,
+    conversation_manager: Optional[ConversationManager] = None,
+    workers: Optional[int] = None,
+    cache_ttl: Optional[float] = None,
+    refresh: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    SPDS sessions across every agent on the server.
+
+    Each agent's conversations are listed concurrently (at most ``workers``
+    at a time, default SPDS_SESSION_LIST_WORKERS), the local SPDS session
+    index is reconciled with what was found, and the result is cached in
+    SESSIONS_DIR for ``cache_ttl`` seconds (default SPDS_SESSION_LIST_CACHE_TTL)
+    unless ``refresh`` is set. An agent whose listing fails is skipped.
+    """
+    ttl = config.get_session_list_cache_ttl() if cache_ttl is None else cache_ttl
+    if not refresh:
+        cached = _read_cache(ttl)
+        if cached is not None:
+            return cached
+
+    cm = conversation_manager or ConversationManager(client)
+    agents = [
+        a for a in client.agents.list() if POOL_TAG not in (getattr(a, "tags", None) or [])
+    ]
+
+    def list_agent(agent) -> Tuple[Any, List]:
+        try:
+            conversations = list(cm.iter_sessions(agent.id))
+        except Exception as e:
+            logger.warning("Could not list sessions for agent %s: %s", agent.id, e)
+            return agent, []
+        cm.reconcile_index(agent.id, conversations)
+        return agent, conversations
+
+    started = time.perf_counter()
+    listed = parallel_map(list_agent, agents, workers or config.get_session_list_workers())
+    sessions = aggregate_sessions(listed)
+    logger.info(
+        "Listed %d SPDS sessions across %d agents in %.2fs",
+        len(sessions),
+        len(agents),
+        time.perf_counter() - started,
+    )
+    if ttl > 0:
+        _write_cache(sessions)
+    return sessions
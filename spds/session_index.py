@@ -0,0 +1,258 @@
+# spds/session_index.py
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from . import config
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversations (
+    conversation_id TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    agent_id TEXT,
+    agent_name TEXT,
+    topic TEXT,
+    status TEXT NOT NULL,
+    summary TEXT,
+    created_at REAL,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS conversations_session ON conversations (session_id, agent_id);
+CREATE INDEX IF NOT EXISTS conversations_agent ON conversations (agent_id);
+CREATE TABLE IF NOT EXISTS reconciled (
+    agent_id TEXT PRIMARY KEY,
+    reconciled_at REAL NOT NULL
+);
+"""
+
+_COMPLETED_MARKER = "|completed"
+
+
+def parse_spds_summary(summary: Optional[str]) -> Optional[Dict[str, str]]:
+    """Parse ``spds:<session>|<agent>|<topic>[|completed|msgs=N|mode=M]``.
+
+    Returns ``session_id``, ``agent_name``, ``topic`` (without the
+    finalization suffix) and ``status``, or None for non-SPDS summaries.
+    """
+    if not summary or not summary.startswith("spds:"):
+        return None
+    parts = summary[5:].split("|", 2)
+    topic = parts[2] if len(parts) > 2 else ""
+    status = "active"
+    marker = topic.find(_COMPLETED_MARKER)
+    if marker >= 0 or topic == "completed" or topic.startswith("completed|"):
+        status = "completed"
+        topic = topic[:marker] if marker >= 0 else ""
+    return {
+        "session_id": parts[0],
+        "agent_name": parts[1] if len(parts) > 1 else "",
+        "topic": topic,
+        "status": status,
+    }
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+
+@dataclass
+class SessionEntry:
+    """One agent conversation of an SPDS session, shaped like a Letta Conversation."""
+
+    id: str
+    session_id: str
+    agent_id: Optional[str]
+    agent_name: str
+    topic: str
+    status: str
+    summary: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "session_id": self.session_id,
+            "agent_id": self.agent_id,
+            "agent_name": self.agent_name,
+            "topic": self.topic,
+            "status": self.status,
+            "summary": self.summary,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+def entry_from_conversation(conversation: Any, agent_id: Optional[str] = None) -> Optional[SessionEntry]:
+    """``SessionEntry`` for a Letta conversation, or None if it is not an SPDS conversation."""
+    summary = getattr(conversation, "summary", None)
+    parsed = parse_spds_summary(summary if isinstance(summary, str) else None)
+    conversation_id = getattr(conversation, "id", None)
+    if parsed is None or not isinstance(conversation_id, str):
+        return None
+    owner = getattr(conversation, "agent_id", None)
+    created_at = getattr(conversation, "created_at", None)
+    updated_at = getattr(conversation, "updated_at", None)
+    return SessionEntry(
+        conversation_id,
+        parsed["session_id"],
+        owner if isinstance(owner, str) else agent_id,
+        parsed["agent_name"],
+        parsed["topic"],
+        parsed["status"],
+        summary,
+        created_at if isinstance(created_at, datetime) else None,
+        updated_at if isinstance(updated_at, datetime) else None,
+    )
+
+
+class SessionIndex:
+    """
+    SQLite map from SPDS session id to its per-agent conversations.
+
+    ConversationManager records each conversation it creates and every SPDS
+    summary update (status, topic), so finding a session's conversations is
+    an indexed lookup instead of listing every conversation of every agent.
+    The server stays the source of truth: an agent's conversations are
+    listed once and written here (``reconcile_agent``) the first time the
+    agent is queried, and again whenever a lookup misses.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else config.get_session_index_path()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # -- writing -------------------------------------------------------------
+
+    def record(self, conversation: Any, agent_id: Optional[str] = None) -> bool:
+        """Add or refresh one conversation; returns False if its summary is not SPDS-encoded."""
+        row = self._row(conversation, agent_id)
+        if row is None:
+            return False
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO conversations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", row
+                )
+        return True
+
+    def update_summary(self, conversation_id: str, summary: str) -> None:
+        """Refresh status/topic of a known conversation after its summary changed."""
+        parsed = parse_spds_summary(summary)
+        if parsed is None:
+            return
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "UPDATE conversations SET status = ?, topic = ?, summary = ?, updated_at = ?"
+                    " WHERE conversation_id = ?",
+                    (parsed["status"], parsed["topic"], summary, time.time(), conversation_id),
+                )
+
+    def reconcile_agent(self, agent_id: str, conversations: Iterable[Any]) -> int:
+        """Replace an agent's entries with its server-side conversations; returns SPDS ones kept."""
+        rows = [r for r in (self._row(c, agent_id) for c in conversations) if r is not None]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM conversations WHERE agent_id = ?", (agent_id,))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO conversations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO reconciled (agent_id, reconciled_at) VALUES (?, ?)",
+                    (agent_id, time.time()),
+                )
+        return len(rows)
+
+    def is_reconciled(self, agent_id: str) -> bool:
+        with self._lock:
+            return self._connect().execute(
+                "SELECT 1 FROM reconciled WHERE agent_id = ?", (agent_id,)
+            ).fetchone() is not None
+
+    @staticmethod
+    def _row(conversation: Any, agent_id: Optional[str]):
+        entry = entry_from_conversation(conversation, agent_id)
+        if entry is None:
+            return None
+        return (
+            entry.id,
+            entry.session_id,
+            entry.agent_id,
+            entry.agent_name,
+            entry.topic,
+            entry.status,
+            entry.summary,
+            _timestamp(entry.created_at) or time.time(),
+            _timestamp(entry.updated_at),
+        )
+
+    # -- queries -------------------------------------------------------------
+
+    def lookup(self, session_id: str, agent_id: Optional[str] = None) -> List[SessionEntry]:
+        """Conversations of ``session_id`` (optionally one agent's), in creation order."""
+        sql = (
+            "SELECT conversation_id, session_id, agent_id, agent_name, topic, status, summary,"
+            " created_at, updated_at FROM conversations WHERE session_id = ?"
+        )
+        params: list = [session_id]
+        if agent_id is not None:
+            sql += " AND agent_id = ?"
+            params.append(agent_id)
+        sql += " ORDER BY created_at, rowid"
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [
+            SessionEntry(
+                cid, sid, aid, name or "", topic or "", status, summary,
+                datetime.fromtimestamp(created) if created is not None else None,
+                datetime.fromtimestamp(updated) if updated is not None else None,
+            )
+            for cid, sid, aid, name, topic, status, summary, created, updated in rows
+        ]
+
+
+_default_index: Optional[SessionIndex] = None
+_default_lock = threading.Lock()
+
+
+def get_session_index() -> SessionIndex:
+    """Return the process-wide SPDS session index."""
+    global _default_index
+    with _default_lock:
+        path = config.get_session_index_path()
+        if _default_index is None or _default_index.path != path:
+            _default_index = SessionIndex(path)
+        return _default_index
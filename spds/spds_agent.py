@@ -11,6 +11,8 @@ from pydantic import BaseModel
 from . import config, tools
 from .letta_api import letta_call
 from .message import ConversationMessage, messages_to_flat_format
+from .response_parser import parse_response
+from .token_budget import TokenBudget, get_context_window
 try:
     from letta_client import APIError as ApiError
 except ImportError:  # pragma: no cover
@@ -19,6 +21,11 @@ except ImportError:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+# Approximate size of the fixed prompt text wrapped around the conversation
+# history, used when fitting payloads to the agent's context window.
+ASSESSMENT_PROMPT_OVERHEAD_TOKENS = 1000
+SPEAK_PROMPT_OVERHEAD_TOKENS = 100
+
 
 def format_group_message(conversation_history: str, current_speaker: str = None) -> str:
     """Format group conversation history for system messages with clear speaker indication.
@@ -64,6 +71,9 @@ class SPDSAgent:
         self.conversation_id: str | None = None
         self._conversation_manager = None
 
+        # Proactive context budgeting for speak/assessment payloads
+        self.token_budget = TokenBudget.for_agent(agent_state)
+
     @classmethod
     def create_new(
         cls,
@@ -282,12 +292,25 @@ class SPDSAgent:
         tools_result = list(tools_list)
         return tools_result[0] if tools_result else None
 
+    def _fit_to_context(self, conversation_history: str, overhead_tokens: int) -> str:
+        """Trim a conversation payload to this agent's context budget before sending."""
+        budget = getattr(self, "token_budget", None)
+        if budget is None:
+            budget = self.token_budget = TokenBudget.for_agent(self.agent)
+        else:
+            # The agent state may have been refreshed with a different model.
+            budget.context_window = get_context_window(self.agent)
+        return budget.fit(conversation_history, overhead_tokens=overhead_tokens)
+
     def _get_full_assessment(self, conversation_history: str = "", topic: str = ""):
         """Calls the agent's LLM to perform subjective assessment.
         If conversation_history is provided, include it in the prompt to reduce reliance on server-side memory.
         """
 
         self.last_error = None
+        conversation_history = self._fit_to_context(
+            conversation_history, ASSESSMENT_PROMPT_OVERHEAD_TOKENS
+        )
         max_attempts = 2
         attempt = 0
         
@@ -644,21 +667,7 @@ IMPORTANCE_TO_GROUP: X
 
     @staticmethod
     def _response_contains_send_message(response) -> bool:
-        messages = getattr(response, "messages", []) or []
-        for msg in messages:
-            # Check for tool_call_message type with send_message tool
-            if hasattr(msg, "message_type") and msg.message_type == "tool_call_message":
-                if hasattr(msg, "tool_call") and msg.tool_call:
-                    function = getattr(msg.tool_call, "function", None)
-                    if function and getattr(function, "name", None) == "send_message":
-                        return True
-            # Also check legacy format for backward compatibility
-            elif hasattr(msg, "tool_calls") and msg.tool_calls:
-                for tool_call in msg.tool_calls:
-                    function = getattr(tool_call, "function", None)
-                    if function and getattr(function, "name", None) == "send_message":
-                        return True
-        return False
+        return parse_response(response).has_send_message
 
     @staticmethod
     def _wrap_response_with_send_message(message_text: str) -> SimpleNamespace:
@@ -736,10 +745,10 @@ IMPORTANCE_TO_GROUP: X
             ]
         )
 
-    def _ensure_send_message_response(self, response, message_text: str):
+    def _ensure_send_message_response(self, response, message_text: str, parsed=None):
         if not message_text:
             return response
-        if self._response_contains_send_message(response):
+        if (parsed or parse_response(response)).has_send_message:
             return response
         wrapped = self._wrap_response_with_send_message(message_text)
         setattr(wrapped, "original_response", response)
@@ -747,74 +756,10 @@ IMPORTANCE_TO_GROUP: X
 
     def _extract_response_text(self, response) -> str:
         """Extract response text from agent messages, handling tool calls properly."""
-        response_text = ""
-        try:
-            for msg in response.messages:
-                # Skip user messages - these are the prompts we sent to the agent, not responses
-                if (hasattr(msg, "message_type") and msg.message_type == "user_message") or \
-                   (hasattr(msg, "role") and msg.role == "user"):
-                    continue
-
-                # Check for tool_call_message type with send_message tool (new format)
-                if hasattr(msg, "message_type") and msg.message_type == "tool_call_message":
-                    if hasattr(msg, "tool_call") and msg.tool_call:
-                        if hasattr(msg.tool_call, "function") and msg.tool_call.function.name == "send_message":
-                            try:
-                                import json
-                                args = json.loads(msg.tool_call.function.arguments)
-                                response_text = args.get("message", "")
-                                break
-                            except:
-                                pass
-                
-                # Check for tool calls (send_message) - legacy format
-                if not response_text and hasattr(msg, "tool_calls") and msg.tool_calls:
-                    for tool_call in msg.tool_calls:
-                        if (
-                            hasattr(tool_call, "function")
-                            and tool_call.function.name == "send_message"
-                        ):
-                            try:
-                                import json
-                                args = json.loads(tool_call.function.arguments)
-                                response_text = args.get("message", "")
-                                break
-                            except:
-                                pass
-
-                # Check for tool return messages
-                if (
-                    not response_text
-                    and hasattr(msg, "tool_return")
-                    and msg.tool_return
-                ):
-                    continue
-
-                # Check assistant messages (direct responses)
-                if (
-                    not response_text
-                    and (
-                        (hasattr(msg, "message_type") and msg.message_type == "assistant_message")
-                        or (hasattr(msg, "role") and msg.role == "assistant")
-                    )
-                ):
-                    if hasattr(msg, "content") and msg.content:
-                        content_val = msg.content
-                        if isinstance(content_val, str):
-                            response_text = content_val
-                        elif isinstance(content_val, list) and content_val:
-                            item0 = content_val[0]
-                            if hasattr(item0, "text"):
-                                response_text = item0.text
-                            elif isinstance(item0, dict) and "text" in item0:
-                                response_text = item0["text"]
-                            elif isinstance(item0, str):
-                                response_text = item0
-        except Exception as e:
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Failed to extract response text: {e}")
-
-        return response_text
+        parsed = parse_response(response)
+        if parsed.error:
+            logger.warning(f"Failed to extract response text: {parsed.error}")
+        return parsed.reply_text
 
     def assess_motivation_and_priority(self, recent_messages: list[ConversationMessage], original_topic: str):
         """Performs the full assessment and calculates motivation and priority scores.
@@ -879,6 +824,10 @@ IMPORTANCE_TO_GROUP: X
         attachments: list = None,
     ):
         """Generates a response from the agent with conversation context."""
+        conversation_history = self._fit_to_context(
+            conversation_history, SPEAK_PROMPT_OVERHEAD_TOKENS
+        )
+
         # Select processing mode based on attachments
         selected_mode = self._select_mode_for_message(conversation_history, attachments)
 
@@ -951,18 +900,16 @@ IMPORTANCE_TO_GROUP: X
                         messages=messages,
                     )
 
-                response_text = self._extract_response_text(response)
+                parsed = parse_response(response)
+                response_text = self._extract_response_text(parsed)
 
                 # Log response structure for debugging
                 logger.debug(
                     f"[{self.name}] Response received",
                     extra={
                         "response_type": type(response).__name__,
-                        "message_count": len(getattr(response, "messages", [])),
-                        "message_types": [
-                            getattr(m, "message_type", type(m).__name__)
-                            for m in getattr(response, "messages", [])
-                        ],
+                        "message_count": len(parsed.message_types),
+                        "message_types": parsed.message_types,
                     }
                 )
 
@@ -970,9 +917,9 @@ IMPORTANCE_TO_GROUP: X
                 diagnostic_ctx = self._get_diagnostic_context()
 
                 # Check if we got a valid response with send_message OR a direct response with text
-                if self._response_contains_send_message(response):
+                if parsed.has_send_message:
                     logger.debug(f"[{self.name}] Response contains send_message tool call")
-                    response = self._ensure_send_message_response(response, response_text)
+                    response = self._ensure_send_message_response(response, response_text, parsed)
                     return response
                 elif response_text and len(response_text.strip()) > 10:  # Accept direct responses with substantial content
                     # Agent responded directly without using send_message tool - this is acceptable
@@ -980,7 +927,7 @@ IMPORTANCE_TO_GROUP: X
                         f"[{self.name}] Direct response accepted",
                         extra={"response_length": len(response_text)}
                     )
-                    response = self._ensure_send_message_response(response, response_text)
+                    response = self._ensure_send_message_response(response, response_text, parsed)
                     return response
                 else:
                     # No valid response content found - log detailed validation failure
@@ -1034,17 +981,18 @@ IMPORTANCE_TO_GROUP: X
                             ],
                         )
 
-                        direct_response_text = self._extract_response_text(response)
-                        
+                        direct_parsed = parse_response(response)
+                        direct_response_text = self._extract_response_text(direct_parsed)
+
                         # Check if the direct response uses send_message OR has valid content
-                        if self._response_contains_send_message(response):
+                        if direct_parsed.has_send_message:
                             response = self._ensure_send_message_response(
-                                response, direct_response_text
+                                response, direct_response_text, direct_parsed
                             )
                             return response
                         elif direct_response_text and len(direct_response_text.strip()) > 10:  # Accept direct responses
                             response = self._ensure_send_message_response(
-                                response, direct_response_text
+                                response, direct_response_text, direct_parsed
                             )
                             return response
                         else:
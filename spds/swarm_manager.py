@@ -1,8 +1,10 @@
 # spds/swarm_manager.py
 
+import threading
 import time
 import uuid
 from datetime import datetime
+from pathlib import Path
 from typing import List, Optional
 
 from letta_client import Letta
@@ -12,16 +14,28 @@ from . import config
 from .config import logger
 from .conversations import ConversationManager
 from .cross_agent import (
+    MEMORY_EDIT_TOOLS,
+    MULTI_AGENT_TOOLS,
+    SwarmContextMirror,
     detect_side_conversations,
     setup_cross_agent_messaging,
     teardown_cross_agent_messaging,
 )
+from .compaction import HistoryCompactor
+from .export_archive import BUNDLE_SUFFIX
 from .export_manager import ExportManager
-from .letta_api import letta_call
+from .history import ConversationHistory, HistoryView
+from .history_log import HistoryLog
+from .letta_api import letta_call, parallel_map
 from .memory_awareness import create_memory_awareness_for_agent
 from .message import ConversationMessage, convert_history_to_messages, messages_to_flat_format, get_new_messages_since_index
+from .response_parser import parse_response
+from .search_index import format_hits, get_default_index, parse_query
 from .secretary_agent import SecretaryAgent
 from .spds_agent import SPDSAgent, format_group_message
+from .token_budget import TokenBudgetStats
+from .topic_tracker import TopicTracker
+from .warm_start import get_warm_start_cache, warm_start_key
 
 
 class SwarmManager:
@@ -66,7 +80,7 @@ class SwarmManager:
         from . import config
         from .config import logger
         from .export_manager import ExportManager
-        from .letta_api import letta_call
+        from .letta_api import letta_call, parallel_map
         from .memory_awareness import create_memory_awareness_for_agent
         from .message import ConversationMessage, convert_history_to_messages, messages_to_flat_format, get_new_messages_since_index
         # NOTE: Do NOT re-import SecretaryAgent here; use the module-level import so tests
@@ -83,14 +97,20 @@ class SwarmManager:
         self.secretary_mode = secretary_mode
         self.meeting_type = meeting_type
         self.export_manager = ExportManager()
+        self._init_live_export()
         # Track whether the Letta client supports the optional otid parameter; lazily detected.
         self._agent_messages_supports_otid = None
-        self._history: List[ConversationMessage] = []
+        self._history: List[ConversationMessage] = ConversationHistory()
+        self._compactor = HistoryCompactor()
+        self._topic_tracker = TopicTracker()
         # Role management state
         self.secretary_agent_id: str | None = None
         self.pending_nomination: dict | None = None
         # Cross-agent messaging state (populated by _setup_cross_agent)
         self.session_id: str = str(uuid.uuid4())
+        # Id the transcript is stored and indexed under; the web GUI points it
+        # at its own session id via attach_history_log.
+        self.transcript_id: str = self.session_id
         self._cross_agent_info: dict | None = None
         # Conversations API manager for session-specific routing
         self._conversation_manager = ConversationManager(client)
@@ -135,17 +155,6 @@ class SwarmManager:
                 f"Invalid conversation mode: {conversation_mode}. Valid modes: {valid_modes}"
             )
 
-        # Ensure agents created/loaded by tests (often SimpleNamespace/Mock) have the
-        # last_message_index attribute used by filtering logic. Default to -1 meaning
-        # the agent hasn't spoken yet.
-        for agent in self.agents:
-            if not hasattr(agent, "last_message_index"):
-                try:
-                    setattr(agent, "last_message_index", -1)
-                except Exception:
-                    # Best-effort: some test doubles may be strict; ignore if we can't set.
-                    pass
-
         # Initialize MCP Launchpad (gracefully degrades if config not found)
         self._mcp_launchpad = None
         if config.get_mcp_enabled():
@@ -156,7 +165,13 @@ class SwarmManager:
                 entries = load_mcp_config(config.get_mcp_config_path())
                 self._mcp_launchpad = MCPLaunchpad(client, entries)
                 agent_ids = [a.agent.id for a in self.agents]
-                self._mcp_launchpad.setup(agent_ids)
+                cache, key = get_warm_start_cache(), self._warm_start_key()
+                warm = cache.get(key, "mcp") if key else None
+                agent_states = [a.agent for a in self.agents]
+                if not (warm and self._mcp_launchpad.restore(warm, agent_states)):
+                    self._mcp_launchpad.setup(agent_ids)
+                    if key:
+                        cache.put(key, "mcp", self._mcp_launchpad.snapshot())
                 logger.info("MCPLaunchpad initialized with %d servers", len(entries))
             except FileNotFoundError:
                 logger.info("MCP config file not found; MCP tools disabled")
@@ -166,6 +181,15 @@ class SwarmManager:
         # Set up cross-agent messaging (tagging, shared memory, multi-agent tools)
         self._setup_cross_agent()
 
+    def _warm_start_key(self) -> Optional[str]:
+        """Warm-start cache key for this session's agents, or None if the cache is off."""
+        agent_ids = [getattr(a.agent, "id", None) for a in self.agents]
+        if not agent_ids or not all(isinstance(i, str) for i in agent_ids):
+            return None
+        if not get_warm_start_cache().enabled:
+            return None
+        return warm_start_key(agent_ids)
+
     def _setup_cross_agent(self) -> None:
         """Enable cross-agent messaging for all agents in this session."""
         if not self.agents:
@@ -173,29 +197,83 @@ class SwarmManager:
         try:
             agent_ids = [a.agent.id for a in self.agents]
             participant_names = [a.name for a in self.agents]
+            cache, key = get_warm_start_cache(), self._warm_start_key()
+            warm = cache.get(key, "cross_agent") if key else None
             self._cross_agent_info = setup_cross_agent_messaging(
                 client=self.client,
                 agent_ids=agent_ids,
                 session_id=self.session_id,
                 participant_names=participant_names,
                 conversation_mode=self.conversation_mode,
+                agent_states=[a.agent for a in self.agents],
+                warm=warm,
             )
+            if key and not self._cross_agent_info.get("warm_start"):
+                if self._cross_agent_info.get("warm_state"):
+                    cache.put(key, "cross_agent", self._cross_agent_info["warm_state"])
+                elif warm:
+                    cache.discard(key, "cross_agent")
             if self._cross_agent_info.get("multi_agent_enabled"):
                 logger.info("Cross-agent messaging enabled for session %s", self.session_id)
         except Exception as e:
             logger.warning("Cross-agent messaging setup failed: %s", e)
             self._cross_agent_info = None
 
-    def _teardown_cross_agent(self) -> None:
-        """Remove session tags after the session ends."""
+    def _swarm_context_mirror(self) -> Optional[SwarmContextMirror]:
+        """Write-behind mirror of this session's swarm_context block, if there is one."""
+        mirror = getattr(self, "_swarm_context", None)
+        if mirror is None:
+            cross_info = getattr(self, "_cross_agent_info", None)
+            block_id = cross_info.get("swarm_context_block_id") if cross_info else None
+            if not block_id:
+                return None
+            mirror = self._swarm_context = SwarmContextMirror(self.client, block_id)
+        return mirror
+
+    def _note_memory_edits(self, parsed) -> None:
+        """Have the swarm_context mirror re-read the block after an agent may have edited it.
+
+        That is after a memory tool call, or after a cross-agent message, whose
+        recipient runs a turn of its own that SPDS never sees.
+        """
+        swarm_context = getattr(self, "_swarm_context", None)
+        if swarm_context is None:
+            return
+        if any(
+            call.name in MEMORY_EDIT_TOOLS or call.name in MULTI_AGENT_TOOLS
+            for call in parsed.tool_calls
+        ):
+            swarm_context.mark_stale()
+
+    def _sync_swarm_context(self, topic: str) -> None:
+        """Record the swarm's current focus and write pending swarm_context keys.
+
+        Called once per turn before agents speak; the write is skipped when
+        nothing changed since the last turn.
+        """
+        swarm_context = self._swarm_context_mirror()
+        if swarm_context is None:
+            return
+        terms = self._get_topic_tracker().focus_terms()
+        swarm_context.update({"Current focus": ", ".join(terms) if terms else topic})
+        swarm_context.flush()
+
+    def _teardown_cross_agent(self, background: bool = True) -> None:
+        """Remove session tags after the session ends.
+
+        By default the tags are removed on a background thread (kept in
+        ``_teardown_thread``) so ending the meeting doesn't wait on it.
+        """
         if not self.agents or not getattr(self, "_cross_agent_info", None):
             return
         try:
             agent_ids = [a.agent.id for a in self.agents]
-            teardown_cross_agent_messaging(
+            self._teardown_thread = teardown_cross_agent_messaging(
                 client=self.client,
                 agent_ids=agent_ids,
                 session_id=self.session_id,
+                agent_states=[a.agent for a in self.agents],
+                background=background,
             )
         except Exception as e:
             logger.warning("Cross-agent messaging teardown failed: %s", e)
@@ -207,13 +285,17 @@ class SwarmManager:
         on each SPDSAgent so that ``speak()`` routes through the session-
         specific conversation instead of the agent's default context window.
 
-        Failures are non-fatal: if conversation creation fails for an agent,
-        that agent falls back to ``agents.messages.create`` (default behaviour).
+        Conversations are created concurrently (at most
+        SPDS_CONVERSATION_WORKERS at a time). Failures are non-fatal and
+        per agent: if conversation creation fails for an agent, that agent
+        falls back to ``agents.messages.create`` (default behaviour) while
+        the others keep their conversations.
         """
         cm = getattr(self, "_conversation_manager", None)
         if cm is None:
             return
-        for agent in self.agents:
+
+        def create(agent) -> None:
             try:
                 conv_id = cm.create_agent_conversation(
                     agent_id=agent.agent.id,
@@ -234,20 +316,25 @@ class SwarmManager:
                 agent.conversation_id = None
                 agent._conversation_manager = None
 
+        started = time.perf_counter()
+        parallel_map(create, self.agents, config.get_conversation_workers())
+        logger.debug(
+            "Created conversations for %d agents in %.2fs",
+            len(self.agents), time.perf_counter() - started,
+        )
+
     def _finalize_conversations(self) -> None:
         """Update conversation summaries with final metadata at meeting end.
 
         Adds message count, mode, and ``completed`` status to each
-        agent's conversation summary. Failures are logged but don't
+        agent's conversation summary, concurrently like
+        ``_create_agent_conversations``. Failures are logged but don't
         block meeting teardown.
         """
         cm = getattr(self, "_conversation_manager", None)
         if cm is None:
             return
 
-        msg_count = len(getattr(self, "_history", []))
-        mode = getattr(self, "conversation_mode", "unknown")
-
         # Collect all conversation IDs (agents + secretary)
         targets = []
         for agent in self.agents:
@@ -259,16 +346,25 @@ class SwarmManager:
         if sec and getattr(sec, "conversation_id", None):
             targets.append(("Secretary", sec.conversation_id))
 
-        for name, conv_id in targets:
-            try:
-                current = cm.get_session(conv_id)
-                old_summary = getattr(current, "summary", "") or ""
-                new_summary = f"{old_summary}|completed|msgs={msg_count}|mode={mode}"
-                cm.update_summary(conv_id, new_summary)
-            except Exception as e:
-                logger.warning(
-                    "Failed to finalize conversation %s for %s: %s", conv_id, name, e
-                )
+        parallel_map(
+            lambda target: self._finalize_conversation(cm, *target),
+            targets,
+            config.get_conversation_workers(),
+        )
+
+    def _finalize_conversation(self, cm, name: str, conv_id: str) -> None:
+        """Mark one conversation's summary ``completed`` with message count and mode."""
+        msg_count = len(getattr(self, "_history", []))
+        mode = getattr(self, "conversation_mode", "unknown")
+        try:
+            current = cm.get_session(conv_id)
+            old_summary = getattr(current, "summary", "") or ""
+            new_summary = f"{old_summary}|completed|msgs={msg_count}|mode={mode}"
+            cm.update_summary(conv_id, new_summary)
+        except Exception as e:
+            logger.warning(
+                "Failed to finalize conversation %s for %s: %s", conv_id, name, e
+            )
 
     def _emit(self, message: str, *, level: str = "info") -> None:
         """Print a user-facing message and log it at the requested level."""
@@ -292,8 +388,15 @@ class SwarmManager:
         Returns a flattened newline-separated string of 'Speaker: message' lines.
         Tests and UI code expect a string, so convert ConversationMessage objects
         to the legacy string format.
+
+        ConversationHistory keeps it in an append-only buffer: a read after
+        new messages renders only those messages, and repeated reads without
+        appends return the cached string.
         """
-        return messages_to_flat_format(self._history)
+        history = self._history
+        if isinstance(history, ConversationHistory):
+            return history.flat()
+        return messages_to_flat_format(history)
 
     @conversation_history.setter
     def conversation_history(self, value):
@@ -301,7 +404,7 @@ class SwarmManager:
         if isinstance(value, str):
             # Convert empty string to empty list; otherwise parse lines into tuples then ConversationMessage
             if not value:
-                self._history = []
+                self._history = ConversationHistory()
             else:
                 lines = [l for l in value.splitlines() if l.strip()]
                 tuples = []
@@ -312,24 +415,24 @@ class SwarmManager:
                         s, m = "System", ln
                     tuples.append((s, m))
                 # Convert tuples to ConversationMessage objects
-                self._history = convert_history_to_messages(tuples)
+                self._history = ConversationHistory(convert_history_to_messages(tuples))
         elif isinstance(value, list):
             # Check if it's already ConversationMessage objects or legacy tuples
             if value and isinstance(value[0], ConversationMessage):
-                self._history = value
+                self._history = ConversationHistory(value)
             else:
                 # Legacy tuple format, convert to ConversationMessage objects
-                self._history = convert_history_to_messages(value)
+                self._history = ConversationHistory(convert_history_to_messages(value))
         else:
             # Best-effort: try to coerce to list then convert
             try:
                 list_value = list(value)
                 if list_value and isinstance(list_value[0], ConversationMessage):
-                    self._history = list_value
+                    self._history = ConversationHistory(list_value)
                 else:
-                    self._history = convert_history_to_messages(list_value)
+                    self._history = ConversationHistory(convert_history_to_messages(list_value))
             except Exception:
-                self._history = []
+                self._history = ConversationHistory()
 
     @property
     def secretary(self):
@@ -358,16 +461,53 @@ class SwarmManager:
         old string-based filtering approach with structured ConversationMessage objects.
         
         Args:
-            agent: SPDSAgent with last_message_index attribute
+            agent: Participating agent; its cursor is kept by the history store
             
         Returns:
-            List of ConversationMessage objects since agent's last turn
+            Messages since the agent's last turn. With a ConversationHistory this
+            is a HistoryView over the store rather than a copied list.
         """
+        history = self._history
+        if isinstance(history, ConversationHistory):
+            return history.since_last_turn(agent)
+
         # Defensive: some test doubles may not have last_message_index set.
         last_idx = getattr(agent, "last_message_index", -1)
         
         # Use helper function to get new messages since the last index
-        return get_new_messages_since_index(self._history, last_idx)
+        return get_new_messages_since_index(history, last_idx)
+
+    def _record_turn(self, agent) -> None:
+        """Mark that ``agent`` has seen everything up to the latest message."""
+        history = self._history
+        if isinstance(history, ConversationHistory):
+            history.record_turn(agent)
+        else:
+            agent.last_message_index = len(history) - 1
+
+    def attach_history_log(self, session_id: str | None = None, directory=None) -> int:
+        """Persist history to an append-only on-disk log, restoring it if one exists.
+
+        The log lives in ``<sessions dir>/<session_id>/history`` unless
+        ``directory`` is given. An existing log replaces the in-memory history
+        (only its tail is loaded); otherwise the current messages are written to
+        a new log. Returns the number of messages restored from disk.
+        """
+        if directory is None:
+            directory = config.get_sessions_dir() / (session_id or self.session_id) / "history"
+        if session_id:
+            self.transcript_id = session_id
+        log = HistoryLog(Path(directory))
+        restored = len(log)
+        if restored:
+            self._history = ConversationHistory.from_log(log)
+        else:
+            history = self._history
+            if not isinstance(history, ConversationHistory):
+                history = ConversationHistory(history)
+            history.attach_log(log)
+            self._history = history
+        return restored
 
     def _normalize_agent_message(self, message_text: str, agent=None) -> str:
         """Normalize agent output for downstream display.
@@ -409,65 +549,44 @@ class SwarmManager:
         launchpad executes the requested MCP tool and sends the result back to
         the agent as a follow-up message. The agent's follow-up reply is
         extracted and returned so callers can use it as the agent's actual
-        response.
+        response. ``response`` may be raw or already parsed.
 
         Returns:
             The agent's follow-up response text after receiving the tool result,
             or *None* if no MCP request was found.
         """
-        if not getattr(self, "_mcp_launchpad", None) or not hasattr(response, "messages"):
+        if not getattr(self, "_mcp_launchpad", None):
+            return None
+        requests = parse_response(response).mcp_requests
+        if not requests:
             return None
 
-        import json as _json
-
-        for msg in response.messages:
-            if not (hasattr(msg, "message_type") and msg.message_type == "tool_call_message"):
-                continue
-            if not (hasattr(msg, "tool_call") and msg.tool_call):
-                continue
-            func = getattr(msg.tool_call, "function", None)
-            if not func or getattr(func, "name", None) != "use_mcp_tool":
-                continue
-
-            # Parse arguments
-            try:
-                args = _json.loads(func.arguments)
-            except (TypeError, _json.JSONDecodeError):
-                continue
-
-            server_name = args.get("server_name", "")
-            tool_name = args.get("tool_name", "")
-            arguments_json = args.get("arguments_json", "{}")
+        request = requests[0]
+        server_name = request["server_name"]
+        tool_name = request["tool_name"]
 
-            try:
-                tool_args = _json.loads(arguments_json)
-            except (TypeError, _json.JSONDecodeError):
-                tool_args = {}
+        logger.info("Fulfilling MCP request: %s/%s for agent %s", server_name, tool_name, agent.name)
 
-            logger.info("Fulfilling MCP request: %s/%s for agent %s", server_name, tool_name, agent.name)
+        # Execute the tool
+        result = self._mcp_launchpad.fulfill_and_execute(
+            agent.agent.id, server_name, tool_name, request["tool_args"]
+        )
 
-            # Execute the tool
-            result = self._mcp_launchpad.fulfill_and_execute(
-                agent.agent.id, server_name, tool_name, tool_args
+        # Send result back to agent for seamless UX
+        try:
+            followup = self._call_agent_message_create(
+                "agents.messages.create.mcp_result",
+                agent_id=agent.agent.id,
+                messages=[{"role": "user", "content": f"MCP tool result: {result}"}],
             )
+            followup_text = self._extract_agent_response(followup)
+            if followup_text and len(followup_text.strip()) > 5:
+                return followup_text
+        except Exception as exc:
+            logger.warning("Failed to send MCP result to agent %s: %s", agent.name, exc)
 
-            # Send result back to agent for seamless UX
-            try:
-                followup = self._call_agent_message_create(
-                    "agents.messages.create.mcp_result",
-                    agent_id=agent.agent.id,
-                    messages=[{"role": "user", "content": f"MCP tool result: {result}"}],
-                )
-                followup_text = self._extract_agent_response(followup)
-                if followup_text and len(followup_text.strip()) > 5:
-                    return followup_text
-            except Exception as exc:
-                logger.warning("Failed to send MCP result to agent %s: %s", agent.name, exc)
-
-            # Return the raw result if agent follow-up failed
-            return f"[MCP result from {server_name}/{tool_name}]: {result}"
-
-        return None
+        # Return the raw result if agent follow-up failed
+        return f"[MCP result from {server_name}/{tool_name}]: {result}"
 
     # ------------------------------------------------------------------
     # Side-conversation awareness
@@ -520,6 +639,109 @@ class SwarmManager:
             timestamp=datetime.now()
         )
         self._history.append(conversation_message)
+        self._index_message(conversation_message)
+        self._get_topic_tracker().sync(self._history)
+        self._maybe_export_live()
+
+    def _init_live_export(self) -> None:
+        # Guards the pending flag and worker; the write lock serializes the
+        # worker with explicit "/export live" calls.
+        self._live_export_cond = threading.Condition()
+        self._live_export_write_lock = threading.Lock()
+        self._live_export_pending = False
+        self._live_export_thread: threading.Thread | None = None
+
+    def _maybe_export_live(self) -> None:
+        """Queue a live transcript append every SPDS_LIVE_EXPORT_EVERY messages.
+
+        The file is written by a background "live-export" thread so the turn
+        never waits on disk; requests made while it is busy are coalesced
+        into one append.
+        """
+        interval = config.get_live_export_interval()
+        if not interval or len(self._history) % interval:
+            return
+        if getattr(self, "_live_export_cond", None) is None:
+            self._init_live_export()
+        with self._live_export_cond:
+            self._live_export_pending = True
+            if self._live_export_thread is None:
+                self._live_export_thread = threading.Thread(
+                    target=self._run_live_export, name="live-export", daemon=True
+                )
+                self._live_export_thread.start()
+
+    def _run_live_export(self) -> None:
+        cond = self._live_export_cond
+        while True:
+            with cond:
+                if not self._live_export_pending:
+                    self._live_export_thread = None
+                    cond.notify_all()
+                    return
+                self._live_export_pending = False
+            try:
+                self._export_live_transcript()
+            except Exception as exc:
+                logger.debug("Live transcript export failed: %s", exc)
+
+    def flush_live_export(self, timeout: float | None = None) -> bool:
+        """Wait for queued live transcript appends; False if ``timeout`` expired first."""
+        cond = getattr(self, "_live_export_cond", None)
+        if cond is None:
+            return True
+        with cond:
+            return cond.wait_for(lambda: self._live_export_thread is None, timeout)
+
+    def _export_live_transcript(self) -> str:
+        """Append messages added since the last live export to this session's live transcript."""
+        if getattr(self, "_live_export_write_lock", None) is None:
+            self._init_live_export()
+        secretary = getattr(self, "_secretary", None)
+        metadata = getattr(secretary, "meeting_metadata", None)
+        if not isinstance(metadata, dict):
+            metadata = {
+                "topic": getattr(self, "meeting_topic", "Unknown"),
+                "participants": [agent.name for agent in getattr(self, "agents", [])],
+            }
+        with self._live_export_write_lock:
+            return self.export_manager.export_live_transcript(
+                self._history,
+                metadata,
+                session_id=getattr(self, "transcript_id", None) or getattr(self, "session_id", None),
+            )
+
+    def _index_message(self, message: ConversationMessage) -> None:
+        """Queue a message for the full-text transcript index; failures never block the turn.
+
+        The index numbers messages per transcript itself, so positions keep
+        increasing across history resets instead of colliding with earlier rows.
+        """
+        try:
+            index = get_default_index()
+            if index is None:
+                return
+            transcript_id = getattr(self, "transcript_id", None) or getattr(
+                self, "session_id", None
+            )
+            if transcript_id:
+                index.append(transcript_id, message)
+        except Exception as exc:
+            logger.debug("Search indexing failed: %s", exc)
+
+    def search_transcripts(self, query: str, limit: int = 20, all_sessions: bool = False):
+        """Search indexed messages; limited to this session unless ``all_sessions``.
+
+        ``query`` accepts words, "quoted phrases" and ``sender:``/``since:``/
+        ``until:``/``session:`` filters (see ``search_index.parse_query``).
+        """
+        index = get_default_index()
+        if index is None:
+            return []
+        parsed = parse_query(query)
+        if not all_sessions and parsed.session_id is None:
+            parsed.session_id = getattr(self, "transcript_id", None) or self.session_id
+        return index.search(parsed, limit=limit)
 
     def _call_agent_message_create(
         self,
@@ -1018,16 +1240,30 @@ class SwarmManager:
         Returns:
             str: Flattened conversation history string format compatible with agent.speak()
         """
-        # Get new messages since agent's last turn for dynamic assessment
-        recent_messages = self.get_new_messages_since_last_turn(agent)
-        
+        recent_messages = self._get_catch_up_messages(agent)
+
         # Convert ConversationMessage objects to flat format for agent compatibility
         if recent_messages:
-            from .message import messages_to_flat_format
             return messages_to_flat_format(recent_messages)
         else:
             return ""
 
+    def _get_catch_up_messages(self, agent):
+        """Messages the agent hasn't seen, compacted when the backlog is long.
+
+        With a ConversationHistory this is a view over the store. Agents that
+        have been quiet for a long stretch get a CompactedView, whose flat form
+        is cached summaries of the older part of their backlog plus the recent
+        tail; it is used for both their assessment and their speak payload.
+        """
+        recent_messages = self.get_new_messages_since_last_turn(agent)
+        if isinstance(recent_messages, HistoryView):
+            compactor = getattr(self, "_compactor", None)
+            if compactor is None:
+                compactor = self._compactor = HistoryCompactor()
+            return compactor.compact(recent_messages)
+        return recent_messages
+
     def _generate_dynamic_topic(
         self,
         recent_messages: list,
@@ -1036,9 +1272,11 @@ class SwarmManager:
         """
         Generate dynamic topic summary from recent messages.
 
-        Uses simple heuristics to extract current conversation focus
-        without requiring additional LLM calls. This replaces static
-        "test topic" with contextual current focus.
+        Annotates the original topic with the swarm's current focus terms from
+        the incremental TopicTracker (sliding-window TF-IDF, no LLM calls). The
+        tracker is brought up to date with the shared history first, which is
+        O(new messages); the returned string stays the same while the
+        discussion keeps to the same terms.
 
         Args:
             recent_messages: List of ConversationMessage objects from recent turns
@@ -1050,25 +1288,21 @@ class SwarmManager:
         if not recent_messages:
             return original_topic
 
-        # Strategy: Use last 3 messages to determine current topic
-        last_messages = recent_messages[-3:] if len(recent_messages) >= 3 else recent_messages
-
-        # Extract keywords or use last message snippets
-        topic_parts = []
-        for msg in last_messages:
-            # Take first 50 chars of each message
-            snippet = msg.content[:50].strip()
-            if snippet:
-                topic_parts.append(snippet)
-
-        if topic_parts:
-            # Join with ellipsis, max 150 chars total
-            dynamic_topic = "...".join(topic_parts)
-            if len(dynamic_topic) > 150:
-                dynamic_topic = dynamic_topic[:147] + "..."
-            return dynamic_topic
+        tracker = self._get_topic_tracker()
+        history = getattr(self, "_history", None)
+        if history:
+            tracker.sync(history)
+        else:
+            tracker.reset()
+            for msg in recent_messages:
+                tracker.observe(msg)
+        return tracker.topic(original_topic)
 
-        return original_topic
+    def _get_topic_tracker(self) -> TopicTracker:
+        tracker = getattr(self, "_topic_tracker", None)
+        if tracker is None:
+            tracker = self._topic_tracker = TopicTracker()
+        return tracker
 
     def _process_agent_response_for_role_change(self, agent, message_text: str) -> bool:
         """Parses agent messages for nomination/acceptance and handles role changes.
@@ -1115,7 +1349,7 @@ class SwarmManager:
             None
         """
         if not hasattr(self, "_history"):
-            self._history = []
+            self._history = ConversationHistory()
         self._emit(
             f"--- Assessing agent motivations ({self.conversation_mode.upper()} mode) ---"
         )
@@ -1125,7 +1359,7 @@ class SwarmManager:
             if "secretary" in agent.roles:
                 continue
             # Get recent messages since agent's last turn for dynamic assessment
-            recent_messages = self.get_new_messages_since_last_turn(agent)
+            recent_messages = self._get_catch_up_messages(agent)
 
             # Generate dynamic topic from recent messages
             dynamic_topic = self._generate_dynamic_topic(recent_messages, topic)
@@ -1170,6 +1404,8 @@ class SwarmManager:
                 level="warning",
             )
 
+        self._sync_swarm_context(topic)
+
         motivated_agents = sorted(
             [agent for agent in self.agents if agent.priority_score > 0 and "secretary" not in agent.roles],
             key=lambda x: x.priority_score,
@@ -1201,145 +1437,24 @@ class SwarmManager:
         """
         Extract a human-readable message string from an agent response object.
 
-        This helper inspects the response.messages sequence and attempts multiple robust extraction strategies:
-        - Prefer text passed via a tool call named "send_message" (JSON-decoded arguments -> "message").
-        - Ignore tool_return entries (typically non-content/status).
-        - Fall back to assistant/assistant_message content, handling content represented as a plain string, a list of content blocks, objects with a `.text` attribute, or dicts with a "text" key.
-        If no usable text is found or an error occurs, returns a short fallback sentence.
-
-        Parameters:
-            response: An object with a `messages` iterable where each message may expose
-                attributes like `tool_calls`, `tool_return`, `message_type`, `role`, and `content`.
-                The function does not require a specific concrete type, but the object must match
-                the above shape.
+        Reads the text of the response's normalized form (see
+        ``response_parser.parse_response``): the first non-empty ``send_message``
+        argument, assistant content, or other message content, skipping user
+        messages and tool returns. ``response`` may also be an already parsed
+        ``ParsedResponse``.
 
         Returns:
             str: The extracted message text, or a generic fallback string if extraction fails.
         """
-        message_text = ""
-        extraction_successful = False
-
-        try:
-            for msg in response.messages:
-                # Skip user messages - these are the prompts we sent to the agent, not responses
-                if (hasattr(msg, "message_type") and msg.message_type == "user_message") or \
-                   (hasattr(msg, "role") and msg.role == "user"):
-                    continue
-
-                # Check for tool_call_message type with send_message tool (new format)
-                if (
-                    hasattr(msg, "message_type")
-                    and msg.message_type == "tool_call_message"
-                ):
-                    if hasattr(msg, "tool_call") and msg.tool_call:
-                        if (
-                            hasattr(msg.tool_call, "function")
-                            and msg.tool_call.function.name == "send_message"
-                        ):
-                            try:
-                                import json
-
-                                try:
-                                    args = json.loads(msg.tool_call.function.arguments)
-                                except json.JSONDecodeError:
-                                    args = None
-
-                                candidate = args.get("message", "").strip()
-                                # Accept any non-empty message from tool call
-                                if candidate:
-                                    message_text = candidate
-                                    extraction_successful = True
-                                    break
-                            except json.JSONDecodeError:
-                                continue
-
-                # Check for tool calls first (send_message) - legacy format
-                if (
-                    not message_text
-                    and hasattr(msg, "tool_calls")
-                    and msg.tool_calls
-                ):
-                    for tool_call in msg.tool_calls:
-                        if (
-                            hasattr(tool_call, "function")
-                            and tool_call.function.name == "send_message"
-                        ):
-                            try:
-                                import json
-
-                                try:
-                                    args = json.loads(tool_call.function.arguments)
-                                except json.JSONDecodeError:
-                                    args = None
-
-                                candidate = (
-                                    args.get("message", "").strip()
-                                    if args and args.get("message")
-                                    else ""
-                                )
-                                # Accept any non-empty message from tool call
-                                if candidate:
-                                    message_text = candidate
-                                    extraction_successful = True
-                                    break
-                            except Exception:
-                                continue
-
-                # Only proceed if we haven't successfully extracted a message yet
-                if extraction_successful:
-                    break
-
-                # Check for tool return messages (when agent uses send_message)
-                if not message_text and hasattr(msg, "tool_return") and msg.tool_return:
-                    # Tool returns often contain status messages we can ignore in SwarmManager
-                    continue
-
-                # Accept either legacy message_type or modern role='assistant'
-                if not message_text and (
-                    (
-                        hasattr(msg, "message_type")
-                        and getattr(msg, "message_type") == "assistant_message"
-                    )
-                    or (hasattr(msg, "role") and getattr(msg, "role") == "assistant")
-                ):
-                    if hasattr(msg, "content") and getattr(msg, "content"):
-                        content_val = getattr(msg, "content")
-                        if isinstance(content_val, str):
-                            message_text = content_val
-                        elif isinstance(content_val, list) and content_val:
-                            item0 = content_val[0]
-                            if hasattr(item0, "text"):
-                                message_text = item0.text
-                            elif isinstance(item0, dict) and "text" in item0:
-                                message_text = item0["text"]
-                            elif isinstance(item0, str):
-                                message_text = item0
-
-                # If no tool call, try regular content extraction
-                if not message_text and hasattr(msg, "content"):
-                    content_val = getattr(msg, "content")
-                    if isinstance(content_val, str):
-                        message_text = content_val
-                    elif isinstance(content_val, list) and content_val:
-                        content_item = content_val[0]
-                        if hasattr(content_item, "text"):
-                            message_text = content_item.text
-                        elif isinstance(content_item, dict) and "text" in content_item:
-                            message_text = content_item["text"]
-                        elif isinstance(content_item, str):
-                            message_text = content_item
-
-                if message_text:
-                    break
-
-            if not message_text:
-                message_text = "[No response extracted from agent]"
-
-        except Exception as e:
-            message_text = f"[Agent response error: {e}]"
-            logger.error(f"Error extracting response - {e}")
-
-        return message_text
+        parsed = parse_response(response)
+        # Every turn's responses pass through here, CLI and web alike.
+        self._note_memory_edits(parsed)
+        if parsed.text:
+            return parsed.text
+        if parsed.error:
+            logger.error(f"Error extracting response - {parsed.error}")
+            return f"[Agent response error: {parsed.error}]"
+        return "[No response extracted from agent]"
 
     def _hybrid_turn(self, motivated_agents: list, topic: str):
         """
@@ -1394,13 +1509,14 @@ class SwarmManager:
                             f"Slow LLM response from {agent.name}: {duration:.2f} seconds",
                             level="warning",
                         )
-                    message_text = self._normalize_agent_message(self._extract_agent_response(response), agent)
+                    parsed = parse_response(response)
+                    message_text = self._normalize_agent_message(self._extract_agent_response(parsed), agent)
 
                     # Check for MCP tool requests and fulfill them
-                    mcp_text = self._check_and_fulfill_mcp_requests(agent, response)
+                    mcp_text = self._check_and_fulfill_mcp_requests(agent, parsed)
                     if mcp_text:
                         message_text = self._normalize_agent_message(mcp_text, agent)
-                    self._check_side_conversations(agent, response)
+                    self._check_side_conversations(agent, parsed)
 
                     # Validate response quality
                     if (
@@ -1444,7 +1560,7 @@ class SwarmManager:
                 # Add to conversation history for secretary
                 self._append_history(agent.name, message_text)
                 # Update agent's last message index
-                agent.last_message_index = len(self._history) - 1
+                self._record_turn(agent)
                 # Notify secretary
                 self._notify_secretary_agent_response(agent.name, message_text)
             else:
@@ -1454,7 +1570,7 @@ class SwarmManager:
                 self._emit(f"{agent.name}: {fallback}")
                 self._append_history(agent.name, fallback)
                 # Update agent's last message index
-                agent.last_message_index = len(self._history) - 1
+                self._record_turn(agent)
 
         # Phase 2: Response round - agents react to each other's ideas
         self._emit("\n=== 💬 RESPONSE ROUND ===")
@@ -1503,13 +1619,14 @@ class SwarmManager:
                         f"Slow LLM response from {agent.name}: {duration:.2f} seconds",
                         level="warning",
                     )
-                message_text = self._normalize_agent_message(self._extract_agent_response(response), agent)
+                parsed = parse_response(response)
+                message_text = self._normalize_agent_message(self._extract_agent_response(parsed), agent)
 
                 # Check for MCP tool requests and fulfill them
-                mcp_text = self._check_and_fulfill_mcp_requests(agent, response)
+                mcp_text = self._check_and_fulfill_mcp_requests(agent, parsed)
                 if mcp_text:
                     message_text = self._normalize_agent_message(mcp_text, agent)
-                self._check_side_conversations(agent, response)
+                self._check_side_conversations(agent, parsed)
 
                 # Check for role change actions before displaying message
                 role_changed = self._process_agent_response_for_role_change(agent, message_text)
@@ -1522,14 +1639,14 @@ class SwarmManager:
                 # Add responses to conversation history
                 self._append_history(agent.name, message_text)
                 # Update agent's last message index
-                agent.last_message_index = len(self._history) - 1
+                self._record_turn(agent)
                 # Notify secretary
                 self._notify_secretary_agent_response(agent.name, message_text)
             except Exception as e:
                 fallback = f"[Agent error: {e}]"
                 self._emit(f"{agent.name}: {fallback}")
                 self._append_history(agent.name, fallback)
-                agent.last_message_index = len(self._history) - 1
+                self._record_turn(agent)
                 self._emit(f"[Debug: Error in response round - {e}]", level="error")
 
         # Log overall turn timing
@@ -1575,13 +1692,14 @@ class SwarmManager:
                         f"Slow LLM response from {agent.name}: {duration:.2f} seconds.",
                         level="warning",
                     )
-                message_text = self._normalize_agent_message(self._extract_agent_response(response), agent)
+                parsed = parse_response(response)
+                message_text = self._normalize_agent_message(self._extract_agent_response(parsed), agent)
 
                 # Check for MCP tool requests and fulfill them
-                mcp_text = self._check_and_fulfill_mcp_requests(agent, response)
+                mcp_text = self._check_and_fulfill_mcp_requests(agent, parsed)
                 if mcp_text:
                     message_text = self._normalize_agent_message(mcp_text, agent)
-                self._check_side_conversations(agent, response)
+                self._check_side_conversations(agent, parsed)
 
                 # Check for role change actions before displaying message
                 role_changed = self._process_agent_response_for_role_change(agent, message_text)
@@ -1596,14 +1714,14 @@ class SwarmManager:
                 # Add each response to history so subsequent agents can see it
                 self._append_history(agent.name, message_text)
                 # Update agent's last message index
-                agent.last_message_index = len(self._history) - 1
+                self._record_turn(agent)
                 # Notify secretary
                 self._notify_secretary_agent_response(agent.name, message_text)
             except Exception as e:
                 fallback = f"[Agent error: {e}]"
                 self._emit(f"{agent.name}: {fallback}")
                 self._append_history(agent.name, fallback)
-                agent.last_message_index = len(self._history) - 1
+                self._record_turn(agent)
                 self._emit(
                     f"Error in all-speak response - {e}",
                     level="error",
@@ -1647,13 +1765,14 @@ class SwarmManager:
                     f"Slow LLM response from {speaker.name}: {duration:.2f} seconds.",
                     level="warning",
                 )
-            message_text = self._normalize_agent_message(self._extract_agent_response(response), speaker)
+            parsed = parse_response(response)
+            message_text = self._normalize_agent_message(self._extract_agent_response(parsed), speaker)
 
             # Check for MCP tool requests and fulfill them
-            mcp_text = self._check_and_fulfill_mcp_requests(speaker, response)
+            mcp_text = self._check_and_fulfill_mcp_requests(speaker, parsed)
             if mcp_text:
                 message_text = self._normalize_agent_message(mcp_text, speaker)
-            self._check_side_conversations(speaker, response)
+            self._check_side_conversations(speaker, parsed)
 
             # Check for role change actions before displaying message
             role_changed = self._process_agent_response_for_role_change(speaker, message_text)
@@ -1665,14 +1784,14 @@ class SwarmManager:
             self._emit(f"{speaker.name}: {message_text}")
             self._append_history(speaker.name, message_text)
             # Update agent's last message index
-            speaker.last_message_index = len(self._history) - 1
+            self._record_turn(speaker)
             # Notify secretary
             self._notify_secretary_agent_response(speaker.name, message_text)
         except Exception as e:
             fallback = f"[Agent error: {e}]"
             self._emit(f"{speaker.name}: {fallback}")
             self._append_history(speaker.name, fallback)
-            speaker.last_message_index = len(self._history) - 1
+            self._record_turn(speaker)
             self._notify_secretary_agent_response(speaker.name, fallback)
             self._emit(
                 f"[Debug: Error in sequential response - {e}]",
@@ -1714,13 +1833,14 @@ class SwarmManager:
                     f"Slow LLM response from {speaker.name}: {duration:.2f} seconds.",
                     level="warning",
                 )
-            message_text = self._normalize_agent_message(self._extract_agent_response(response), speaker)
+            parsed = parse_response(response)
+            message_text = self._normalize_agent_message(self._extract_agent_response(parsed), speaker)
 
             # Check for MCP tool requests and fulfill them
-            mcp_text = self._check_and_fulfill_mcp_requests(speaker, response)
+            mcp_text = self._check_and_fulfill_mcp_requests(speaker, parsed)
             if mcp_text:
                 message_text = self._normalize_agent_message(mcp_text, speaker)
-            self._check_side_conversations(speaker, response)
+            self._check_side_conversations(speaker, parsed)
 
             # Check for role change actions before displaying message
             role_changed = self._process_agent_response_for_role_change(speaker, message_text)
@@ -1732,14 +1852,14 @@ class SwarmManager:
             self._emit(f"{speaker.name}: {message_text}")
             self._append_history(speaker.name, message_text)
             # Update agent's last message index
-            speaker.last_message_index = len(self._history) - 1
+            self._record_turn(speaker)
             # Notify secretary
             self._notify_secretary_agent_response(speaker.name, message_text)
         except Exception as e:
             fallback = f"[Agent error: {e}]"
             self._emit(f"{speaker.name}: {fallback}")
             self._append_history(speaker.name, fallback)
-            speaker.last_message_index = len(self._history) - 1
+            self._record_turn(speaker)
             self._notify_secretary_agent_response(speaker.name, fallback)
             self._emit(
                 f"Error in pure priority response - {e}",
@@ -1758,37 +1878,19 @@ class SwarmManager:
         Parameters:
             topic (str): Human-readable meeting topic to add to conversation history and pass to the secretary.
         """
+        self.meeting_topic = topic
         self._append_history("System", f"The topic is '{topic}'.")
 
-        # Update shared swarm_context block with topic
-        cross_info = getattr(self, "_cross_agent_info", None)
-        if cross_info and cross_info.get("swarm_context_block_id"):
-            from .cross_agent import update_swarm_context
-            update_swarm_context(
-                self.client,
-                self._cross_agent_info["swarm_context_block_id"],
-                {"Topic": topic},
-            )
+        # Record the topic; it is written with the first turn's swarm_context update
+        swarm_context = self._swarm_context_mirror()
+        if swarm_context is not None:
+            swarm_context.update({"Topic": topic})
 
         # Create session-specific conversations per agent
         self._create_agent_conversations(topic)
 
         if self.secretary:
-            # Create a session-specific conversation for the secretary
-            cm = getattr(self, "_conversation_manager", None)
-            if cm and getattr(self.secretary, "agent", None):
-                try:
-                    sec_conv_id = cm.create_agent_conversation(
-                        agent_id=self.secretary.agent.id,
-                        session_id=self.session_id,
-                        agent_name="Secretary",
-                        topic=topic,
-                    )
-                    self.secretary.conversation_id = sec_conv_id
-                    self.secretary._conversation_manager = cm
-                    logger.info("Created conversation %s for secretary", sec_conv_id)
-                except Exception as e:
-                    logger.warning("Failed to create secretary conversation: %s", e)
+            self._open_secretary_conversation(topic)
 
             # Get participant names
             participant_names = [agent.name for agent in self.agents]
@@ -1805,24 +1907,94 @@ class SwarmManager:
                 self.conversation_mode
             )
 
-    def _end_meeting(self):
+    def _open_secretary_conversation(self, topic: str) -> None:
+        """Create a session-specific conversation for the secretary agent."""
+        cm = getattr(self, "_conversation_manager", None)
+        if not cm or not getattr(self.secretary, "agent", None):
+            return
+        try:
+            sec_conv_id = cm.create_agent_conversation(
+                agent_id=self.secretary.agent.id,
+                session_id=self.session_id,
+                agent_name="Secretary",
+                topic=topic,
+            )
+            self.secretary.conversation_id = sec_conv_id
+            self.secretary._conversation_manager = cm
+            logger.info("Created conversation %s for secretary", sec_conv_id)
+        except Exception as e:
+            logger.warning("Failed to create secretary conversation: %s", e)
+
+    def suspend_secretary(self) -> bool:
+        """Return a pooled secretary agent while the meeting stays open.
+
+        Used when nobody has been connected to a web session for a while.
+        The secretary's session conversation is finalized and its notes keep
+        growing locally; ``resume_secretary`` hands them to the next agent.
+        Returns False if the secretary is not a pooled agent.
+        """
+        secretary = getattr(self, "_secretary", None)
+        if secretary is None:
+            return False
+        conversation_id = getattr(secretary, "conversation_id", None)
+        if not secretary.suspend():
+            return False
+        cm = getattr(self, "_conversation_manager", None)
+        if cm is not None and conversation_id:
+            self._finalize_conversation(cm, "Secretary", conversation_id)
+        return True
+
+    def resume_secretary(self) -> None:
+        """Take a secretary agent again after ``suspend_secretary`` and brief it."""
+        secretary = getattr(self, "_secretary", None)
+        if secretary is None or not secretary.suspended:
+            return
+        secretary.resume()
+        topic = getattr(self, "meeting_topic", None)
+        if topic:
+            self._open_secretary_conversation(topic)
+        secretary.continue_meeting()
+
+    def _end_meeting(self, offer_exports: bool = True):
         """
         Mark the meeting as finished and, if a secretary is present, present export options.
 
         If a SecretaryAgent is enabled, logs a meeting-end separator/message and invokes
-        _self._offer_export_options()_ to present export/export-command choices to the user.
-        If no secretary is configured, this method is a no-op.
+        _self._offer_export_options()_ to present export/export-command choices to the user
+        (skipped with ``offer_exports=False``, e.g. for web sessions), then closes the
+        secretary, returning a pooled secretary agent to the pool.
         """
         # Finalize conversation summaries
         self._finalize_conversations()
 
+        # Write out any batched swarm_context updates
+        swarm_context = getattr(self, "_swarm_context", None)
+        if swarm_context is not None:
+            swarm_context.close()
+
+        # Commit messages still queued for the transcript index
+        index = get_default_index()
+        if index is not None:
+            index.flush()
+
+        # Finish any live transcript append still running in the background
+        self.flush_live_export()
+
         # Clean up cross-agent session tags
         self._teardown_cross_agent()
 
         if self.secretary:
-            self._emit("\n" + "=" * 50)
-            self._emit("🏁 Meeting ended! Export options available.")
-            self._offer_export_options()
+            if offer_exports:
+                self._emit("\n" + "=" * 50)
+                self._emit("🏁 Meeting ended! Export options available.")
+                self._offer_export_options()
+            # Deliver any observations still queued and stop the sender thread.
+            close = getattr(self.secretary, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as exc:
+                    logger.debug("Secretary close failed: %s", exc)
 
     def _handle_secretary_commands(self, user_input: str) -> bool:
         """
@@ -1867,6 +2039,12 @@ class SwarmManager:
                     print(
                         f"  - {agent_status['name']}: {agent_status['recall_memory']} messages, {agent_status['archival_memory']} archived items"
                     )
+            budget = summary.get("token_budget")
+            if budget:
+                print(
+                    f"\nContext budgeting: {budget['trimmed']} of {budget['payloads']} payloads trimmed, "
+                    f"~{budget['tokens_saved']} tokens saved, {budget['resets_avoided']} resets avoided"
+                )
             print(
                 "\nNote: This information is provided for awareness only. Agents have autonomy over memory decisions."
             )
@@ -1877,6 +2055,23 @@ class SwarmManager:
             self.check_memory_awareness_status(silent=False)
             return True
 
+        elif command == "search":
+            if not args.strip():
+                print(
+                    'Usage: /search <words or "phrase"> [sender:NAME] [since:DATE] [until:DATE] [--all]'
+                )
+                return True
+            all_sessions = "--all" in args.split()
+            query = " ".join(part for part in args.split(" ") if part != "--all")
+            try:
+                hits = self.search_transcripts(query, all_sessions=all_sessions)
+            except ValueError as exc:
+                self._emit(f"❌ {exc}", level="warning")
+                return True
+            print(f"\n🔎 Search results for: {query}")
+            print(format_hits(hits))
+            return True
+
         elif command == "tools":
             if self._mcp_launchpad:
                 print(self._mcp_launchpad.get_catalog_summary())
@@ -1949,12 +2144,27 @@ class SwarmManager:
         - "actions": export action items
         - "summary": export an executive summary
         - "all": export a complete package (multiple files)
+        - "archive": export the complete package as one compressed bundle
+        - "live": append new messages to the session's live transcript (no secretary needed)
 
         If no secretary is available the call is ignored and a warning is logged. Errors during export are caught and logged; the function does not raise.
 
         Parameters:
             args (str): Optional format specifier (e.g., "minutes", "transcript"); defaults to "minutes" when falsy.
         """
+        format_type = args.strip().lower() if args else "minutes"
+
+        if format_type == "live":
+            # Built from the swarm's own history, so no secretary is needed.
+            try:
+                file_path = self._export_live_transcript()
+                written = self.export_manager.last_live_export
+                how = "rewritten" if written.get("full_render") else "appended"
+                self._emit(f"✅ Live transcript {how} ({written.get('appended', 0)} new): {file_path}")
+            except Exception as e:
+                self._emit(f"❌ Export failed: {e}", level="error")
+            return
+
         if not self.secretary:
             self._emit("❌ Secretary not available", level="warning")
             return
@@ -1968,8 +2178,6 @@ class SwarmManager:
             "stats": self.secretary.get_conversation_stats(),
         }
 
-        format_type = args.strip().lower() if args else "minutes"
-
         try:
             if format_type in ["minutes", "formal"]:
                 file_path = self.export_manager.export_meeting_minutes(
@@ -1989,11 +2197,20 @@ class SwarmManager:
                 )
             elif format_type == "summary":
                 file_path = self.export_manager.export_executive_summary(meeting_data)
-            elif format_type == "all":
+            elif format_type in ("all", "archive"):
                 files = self.export_manager.export_complete_package(
-                    meeting_data, self.secretary.mode
+                    meeting_data,
+                    self.secretary.mode,
+                    archive=True if format_type == "archive" else None,
+                    session_id=getattr(self, "session_id", None),
                 )
-                self._emit(f"✅ Complete package exported: {len(files)} files")
+                timings = getattr(self.export_manager, "last_package_timings", None)
+                total = timings.get("total") if isinstance(timings, dict) else None
+                took = f" in {total:.2f}s" if isinstance(total, float) else ""
+                if len(files) == 1 and files[0].endswith(BUNDLE_SUFFIX):
+                    self._emit(f"✅ Complete package archived: {files[0]}{took}")
+                else:
+                    self._emit(f"✅ Complete package exported: {len(files)} files{took}")
                 return
             else:
                 self._emit(
@@ -2001,7 +2218,7 @@ class SwarmManager:
                     level="error",
                 )
                 print(
-                    "Available formats: minutes, casual, transcript, actions, summary, all"
+                    "Available formats: minutes, casual, transcript, actions, summary, all, archive, live"
                 )
                 return
 
@@ -2028,6 +2245,8 @@ class SwarmManager:
         print("  ✅ /export actions - Action items list")
         print("  📊 /export summary - Executive summary")
         print("  📦 /export all - Complete package")
+        print("  🗜️  /export archive - Complete package as one compressed bundle")
+        print("  📡 /export live - Append new messages to the live transcript")
         print("\nOr type any command, or just press Enter to finish.")
 
         try:
@@ -2053,9 +2272,12 @@ Memory Awareness (Available Always):
   /memory-status     - Show objective memory statistics for all agents
   /memory-awareness  - Display neutral memory awareness information if criteria are met
 
+Transcript Search (Available Always):
+  /search <query>    - Search this session (words, "phrases", sender:, since:, until:; --all for every session)
+
 Secretary Commands (When Secretary Enabled):
   /minutes           - Generate current meeting minutes
-  /export [type]     - Export meeting (minutes/casual/transcript/actions/summary/all)
+  /export [type]     - Export meeting (minutes/casual/transcript/actions/summary/all/archive/live)
   /formal            - Switch to formal board minutes mode
   /casual            - Switch to casual meeting notes mode
   /action-item       - Add an action item
@@ -2155,4 +2377,14 @@ Note: Memory awareness information respects agent autonomy and provides neutral
             except Exception as e:
                 summary["agents_status"].append({"name": agent.name, "error": str(e)})
 
+        summary["token_budget"] = self.get_token_budget_report()
         return summary
+
+    def get_token_budget_report(self) -> dict:
+        """Aggregate context-budgeting counters (payloads trimmed, tokens saved, resets avoided)."""
+        totals = TokenBudgetStats()
+        for agent in self.agents:
+            stats = getattr(getattr(agent, "token_budget", None), "stats", None)
+            if isinstance(stats, TokenBudgetStats):
+                totals.add(stats)
+        return totals.to_dict()
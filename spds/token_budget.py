@@ -0,0 +1,152 @@
+# spds/token_budget.py
+
+import logging
+import math
+from dataclasses import asdict, dataclass
+
+from . import config
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate for ``text`` based on an average characters-per-token ratio.
+
+    No tokenizer is bundled for the many models agents can run on, so this is a
+    deliberately conservative heuristic (see ``SPDS_CHARS_PER_TOKEN``).
+    """
+    if not text:
+        return 0
+    return math.ceil(len(text) / config.get_chars_per_token())
+
+
+def get_context_window(agent_state) -> int:
+    """Return the agent model's context window, or the configured default if unknown."""
+    llm_config = getattr(agent_state, "llm_config", None)
+    window = getattr(llm_config, "context_window", None)
+    if isinstance(window, int) and not isinstance(window, bool) and window > 0:
+        return window
+    return config.get_default_context_window()
+
+
+@dataclass
+class TokenBudgetStats:
+    """Counters describing how often conversation payloads had to be fitted."""
+
+    payloads: int = 0
+    trimmed: int = 0
+    tokens_saved: int = 0
+    # Payloads whose untrimmed estimate exceeded the model's entire context
+    # window; sending them would have overflowed and forced a message reset.
+    resets_avoided: int = 0
+
+    def add(self, other: "TokenBudgetStats") -> None:
+        self.payloads += other.payloads
+        self.trimmed += other.trimmed
+        self.tokens_saved += other.tokens_saved
+        self.resets_avoided += other.resets_avoided
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class TokenBudget:
+    """
+    Fits conversation payloads into a share of an agent's context window.
+
+    The budget is ``context_window * SPDS_CONTEXT_BUDGET_RATIO`` tokens; the rest
+    is left for the agent's system prompt, memory blocks, in-context messages and
+    the reply. Oversized histories keep their most recent lines and replace the
+    older ones with a one-line note naming who spoke. The trimmed lines were
+    never sent to the agent, so the note says they were skipped rather than
+    pointing it at its recall memory.
+    """
+
+    def __init__(self, context_window: int, ratio: float | None = None):
+        self.context_window = context_window
+        self.ratio = config.get_context_budget_ratio() if ratio is None else ratio
+        self.stats = TokenBudgetStats()
+
+    @classmethod
+    def for_agent(cls, agent_state) -> "TokenBudget":
+        return cls(get_context_window(agent_state))
+
+    @property
+    def budget_tokens(self) -> int:
+        return int(self.context_window * self.ratio)
+
+    def fit(self, conversation_history: str, overhead_tokens: int = 0) -> str:
+        """Return ``conversation_history`` trimmed so it plus the prompt overhead fits the budget.
+
+        Args:
+            conversation_history: Flat ``"sender: content"`` lines, oldest first.
+            overhead_tokens: Estimated size of the fixed prompt text wrapped around it.
+        """
+        if not conversation_history or not config.get_token_budget_enabled():
+            return conversation_history
+
+        self.stats.payloads += 1
+        original_tokens = estimate_tokens(conversation_history)
+        available = self.budget_tokens - overhead_tokens
+        if original_tokens <= available:
+            return conversation_history
+
+        fitted = _keep_recent_lines(conversation_history, max(available, 0))
+        saved = original_tokens - estimate_tokens(fitted)
+        self.stats.trimmed += 1
+        self.stats.tokens_saved += saved
+        if original_tokens + overhead_tokens > self.context_window:
+            self.stats.resets_avoided += 1
+        logger.info(
+            "Trimmed conversation payload from ~%d to ~%d tokens (budget %d of %d)",
+            original_tokens,
+            original_tokens - saved,
+            self.budget_tokens,
+            self.context_window,
+        )
+        return fitted
+
+
+def _keep_recent_lines(text: str, max_tokens: int) -> str:
+    """Keep the newest lines of ``text`` within ``max_tokens`` and summarise the rest."""
+    lines = text.split("\n")
+    max_chars = int(max_tokens * config.get_chars_per_token())
+    # Reserve room for the omission note; speaker names are short.
+    note_reserve = 120
+    remaining = max_chars - note_reserve
+
+    kept = 0
+    for line in reversed(lines):
+        cost = len(line) + 1
+        if cost > remaining:
+            break
+        remaining -= cost
+        kept += 1
+
+    if kept == 0:
+        # Even the newest line is too long: keep its tail.
+        tail_chars = max(max_chars - note_reserve, 0)
+        last = lines[-1]
+        recent = [f"...{last[-tail_chars:]}" if tail_chars else ""]
+        omitted = lines[:-1]
+    else:
+        recent = lines[-kept:]
+        omitted = lines[:-kept]
+
+    if not omitted:
+        return "\n".join(recent)
+
+    speakers = []
+    for line in omitted:
+        speaker, sep, _ = line.partition(": ")
+        # Continuation lines of multi-line messages have no short speaker prefix.
+        if sep and len(speaker) <= 40 and speaker not in speakers:
+            speakers.append(speaker)
+    who = f" from {', '.join(speakers[:5])}" if speakers else ""
+    if len(speakers) > 5:
+        who += f" and {len(speakers) - 5} others"
+    note = (
+        f"[{len(omitted)} earlier messages{who} skipped to fit your context window; "
+        "you have not seen them.]"
+    )
+    return "\n".join([note, *recent])
@@ -0,0 +1,166 @@
+# spds/topic_tracker.py
+
+import logging
+import math
+import re
+from collections import Counter, deque
+from typing import Deque, Iterable, List
+
+from . import config
+from .message import ConversationMessage
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"[a-z][a-z0-9'-]{2,}")
+
+# Function words and conversational filler that say nothing about the subject.
+STOPWORDS = frozenset(
+    """
+    about above after again against all also although always among and another any
+    anyone anything are aren't around because been before being below between both
+    but can can't cannot could couldn't did didn't does doesn't doing don't down
+    during each either else enough even ever every few first for from further get
+    gets getting give given going good got great had hadn't has hasn't have haven't
+    having her here hers herself him himself his how however i'd i'll i'm i've into
+    isn't it's its itself just keep know let let's like likely lot make makes making
+    many may maybe might more most much must need needs new not now off once one
+    only other others our ours ourselves out over own perhaps point put quite rather
+    really right said same say says see seem seems should shouldn't since some
+    something still such sure take than thank thanks that that's the their theirs
+    them themselves then there there's these they they'd they'll they're they've
+    thing things think this those though through too toward under until upon use
+    used using very want was wasn't way we'd we'll we're we've well were weren't
+    what what's when where whether which while who whom whose why will with within
+    without won't would wouldn't yes yet you you'd you'll you're you've your yours
+    yourself yourselves agree agreed believe feel idea ideas important okay
+    perspective suggest thoughts
+    """.split()
+)
+
+
+def extract_terms(text: str) -> List[str]:
+    """Lower-case content words of ``text`` (stopwords and short tokens removed)."""
+    terms = []
+    for word in _WORD.findall(str(text).lower()):
+        word = word.strip("'-")
+        if word.endswith("'s"):
+            word = word[:-2]
+        if len(word) > 2 and word not in STOPWORDS:
+            terms.append(word)
+    return terms
+
+
+class TopicTracker:
+    """
+    Tracks the swarm's current focus from sliding-window term statistics.
+
+    Each observed message contributes its term counts to a window of the last
+    ``window`` messages; document frequencies are kept over the whole session.
+    A term's weight is its window frequency times its inverse document
+    frequency, so words that recur in every message (the meeting's standing
+    vocabulary, speaker names) rank below words the discussion has just turned
+    to. Observing is O(terms in the message) and the ranking is cached until
+    the next observation, so reading the topic needs no LLM call.
+
+    To keep assessments stable, the reported topic only changes once fewer than
+    half of its terms are still among the top ``top_terms + 1`` candidates.
+    """
+
+    def __init__(self, window: int | None = None, top_terms: int | None = None):
+        self.window = max(1, config.get_topic_window() if window is None else window)
+        self.top_terms = max(1, config.get_topic_terms() if top_terms is None else top_terms)
+        self.reset()
+
+    def reset(self) -> None:
+        self._recent: Deque[Counter] = deque()
+        self._window_tf: Counter = Counter()
+        self._doc_freq: Counter = Counter()
+        self._documents = 0
+        self._names: set = set()
+        self._observed = 0
+        self._source_generation = None
+        self._version = 0
+        self._ranked_version = -1
+        self._ranked: List[str] = []
+        self._focus: List[str] = []
+
+    @property
+    def observed(self) -> int:
+        """Number of history messages folded into the statistics so far."""
+        return self._observed
+
+    def observe(self, message: ConversationMessage) -> None:
+        """Fold one message into the window and document statistics."""
+        self._observed += 1
+        self._names.update(extract_terms(message.sender))
+        counts = Counter(extract_terms(message.content))
+        if not counts:
+            return
+        self._recent.append(counts)
+        self._window_tf.update(counts)
+        self._doc_freq.update(counts.keys())
+        self._documents += 1
+        if len(self._recent) > self.window:
+            expired = self._recent.popleft()
+            self._window_tf.subtract(expired)
+            for term in expired:
+                if self._window_tf[term] <= 0:
+                    del self._window_tf[term]
+        self._version += 1
+
+    def sync(self, history: Iterable[ConversationMessage]) -> None:
+        """Observe whatever ``history`` gained since the last call.
+
+        Rebuilds from scratch when the history was rewritten (shorter, or a
+        ConversationHistory whose generation changed).
+        """
+        generation = getattr(history, "generation", None)
+        total = len(history)
+        if total < self._observed or generation != self._source_generation:
+            if self._observed:
+                self.reset()
+            self._source_generation = generation
+        if total == self._observed:
+            return
+        start = self._observed
+        if hasattr(history, "_iter_range"):
+            new_messages = history._iter_range(start, total)
+        else:
+            new_messages = history[start:total]
+        for message in new_messages:
+            self.observe(message)
+
+    def _rank(self) -> List[str]:
+        if self._ranked_version != self._version:
+            documents = self._documents
+            scored = []
+            for term, tf in self._window_tf.items():
+                if tf <= 0 or term in self._names:
+                    continue
+                idf = 1.0 + math.log((documents + 1) / (self._doc_freq[term] + 1))
+                scored.append((tf * idf, term))
+            scored.sort(key=lambda item: (-item[0], item[1]))
+            self._ranked = [term for _score, term in scored[: self.top_terms + 1]]
+            self._ranked_version = self._version
+        return self._ranked
+
+    def focus_terms(self) -> List[str]:
+        """Return the current focus terms, holding the previous set while it still ranks."""
+        ranked = self._rank()
+        if not ranked:
+            return self._focus
+        if self._focus:
+            # One spare slot absorbs terms trading places at the boundary.
+            candidates = ranked[: self.top_terms + 1]
+            still_ranked = sum(1 for term in self._focus if term in candidates)
+            if still_ranked * 2 >= len(self._focus):
+                return self._focus
+        self._focus = ranked[: self.top_terms]
+        return self._focus
+
+    def topic(self, original_topic: str) -> str:
+        """Return the original topic annotated with the current focus terms."""
+        terms = self.focus_terms()
+        if not terms:
+            return original_topic
+        return f"{original_topic} (current focus: {', '.join(terms)})"
@@ -0,0 +1,195 @@
+# spds/warm_start.py
+
+"""Persistent warm-start cache for swarm setup.
+
+Setting up a swarm attaches multi-agent tools and (with MCP enabled)
+registers servers, builds the tool catalog and attaches tools. For the
+same agents and configuration the result is the same every time, so
+:class:`WarmStartCache` remembers it per section ("cross_agent", "mcp")
+under a key built from the agent id set and :func:`config_fingerprint`.
+Per-session state such as the ``swarm_context`` block is never cached,
+so concurrent sessions with the same agents stay independent.
+
+A cached section is only reused after it has been verified against the
+``AgentState`` objects SPDS already loaded for the session (their
+``tools`` and memory blocks), so verification costs no extra requests.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set
+
+from . import config
+from .export_manager import atomic_write
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+# Oldest entries are dropped beyond this many agent sets
+MAX_ENTRIES = 64
+
+
+def _file_digest(path: str) -> Optional[str]:
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def config_fingerprint() -> str:
+    """Hash of the configuration that shapes swarm setup (server, MCP config and tiers)."""
+    parts = {
+        "version": CACHE_VERSION,
+        "base_url": config.LETTA_BASE_URL,
+        "mcp_enabled": config.get_mcp_enabled(),
+        "mcp_config": _file_digest(config.get_mcp_config_path()),
+        "mcp_tier1": config.get_mcp_tier1_enabled(),
+        "mcp_tier2": config.get_mcp_tier2_enabled(),
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def warm_start_key(agent_ids: Iterable[str]) -> str:
+    """Cache key for a set of agents under the current configuration."""
+    ids = "\n".join(sorted(agent_ids))
+    return hashlib.sha256(f"{ids}\n{config_fingerprint()}".encode("utf-8")).hexdigest()
+
+
+def attached_tools(state: Any) -> Optional[Set[str]]:
+    """Ids and names of the tools on a loaded AgentState, or None if it doesn't list them."""
+    tools = getattr(state, "tools", None)
+    if not isinstance(tools, (list, tuple)):
+        return None
+    found = set()
+    for tool in tools:
+        for attr in ("id", "name"):
+            value = getattr(tool, attr, None)
+            if isinstance(value, str):
+                found.add(value)
+    return found
+
+
+def attached_block_ids(state: Any) -> Optional[Set[str]]:
+    """Ids of the memory blocks on a loaded AgentState, or None if it doesn't list them."""
+    blocks = getattr(state, "blocks", None)
+    if not isinstance(blocks, (list, tuple)):
+        blocks = getattr(getattr(state, "memory", None), "blocks", None)
+    if not isinstance(blocks, (list, tuple)):
+        return None
+    return {b.id for b in blocks if isinstance(getattr(b, "id", None), str)}
+
+
+def states_have(
+    agent_states: Optional[Iterable[Any]],
+    tools: Iterable[str] = (),
+    block_ids: Iterable[str] = (),
+) -> bool:
+    """Whether every loaded AgentState has all ``tools`` (ids or names) and ``block_ids`` attached."""
+    states = list(agent_states or [])
+    if not states:
+        return False
+    tools, block_ids = set(tools), set(block_ids)
+    for state in states:
+        if tools and not tools <= (attached_tools(state) or set()):
+            return False
+        if block_ids and not block_ids <= (attached_block_ids(state) or set()):
+            return False
+    return True
+
+
+class WarmStartCache:
+    """
+    JSON file of setup state per agent set, kept in SESSIONS_DIR.
+
+    Sections older than ``ttl`` seconds (default SPDS_WARM_START_TTL) are
+    ignored; a ``ttl`` of 0 disables the cache. Values must be JSON
+    serializable, anything else is not cached.
+    """
+
+    def __init__(self, path: Optional[Path] = None, ttl: Optional[float] = None):
+        self.path = Path(path) if path else config.get_warm_start_path()
+        self.ttl = config.get_warm_start_ttl() if ttl is None else ttl
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            valid = isinstance(data, dict) and data.get("version") == CACHE_VERSION
+            entries = data.get("entries") if valid else None
+            self._entries = entries if isinstance(entries, dict) else {}
+        return self._entries
+
+    def _save(self) -> None:
+        entries = self._entries or {}
+        if len(entries) > MAX_ENTRIES:
+            oldest = sorted(entries, key=lambda k: entries[k].get("updated_at", 0))
+            for key in oldest[: len(entries) - MAX_ENTRIES]:
+                del entries[key]
+        payload = {"version": CACHE_VERSION, "entries": entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(self.path, lambda f: json.dump(payload, f))
+        except OSError as e:
+            logger.warning("Could not write warm-start cache at %s: %s", self.path, e)
+
+    def get(self, key: str, section: str) -> Optional[Dict[str, Any]]:
+        """The cached ``section`` for ``key``, or None if missing or expired."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            cached = self._load().get(key, {}).get(section)
+        if not isinstance(cached, dict) or time.time() - cached.get("created_at", 0) >= self.ttl:
+            return None
+        return cached.get("state")
+
+    def put(self, key: str, section: str, state: Dict[str, Any]) -> bool:
+        """Remember ``state`` as ``section`` for ``key``; returns False if it wasn't cached."""
+        if not self.enabled:
+            return False
+        try:
+            json.dumps(state)
+        except (TypeError, ValueError):
+            logger.debug("Not caching unserializable %s warm-start state", section)
+            return False
+        now = time.time()
+        with self._lock:
+            entry = self._load().setdefault(key, {})
+            entry[section] = {"created_at": now, "state": state}
+            entry["updated_at"] = now
+            self._save()
+        return True
+
+    def discard(self, key: str, section: str) -> None:
+        """Forget ``section`` for ``key`` (e.g. after it failed verification)."""
+        with self._lock:
+            entry = self._load().get(key)
+            if not entry or section not in entry:
+                return
+            del entry[section]
+            self._save()
+
+
+_caches: Dict[str, WarmStartCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_warm_start_cache() -> WarmStartCache:
+    """Process-wide cache for the configured path (SPDS_WARM_START_PATH)."""
+    path = config.get_warm_start_path()
+    with _caches_lock:
+        cache = _caches.get(str(path))
+        if cache is None:
+            cache = _caches[str(path)] = WarmStartCache(path)
+        return cache
@@ -42,16 +42,29 @@ from spds.export_manager import (
     export_session_to_json,
     export_session_to_markdown,
 )
+from spds.export_index import get_export_index
+from spds.export_jobs import FAILED, ExportJobQueue
 from spds.message import get_new_messages_since_index
+from spds.search_index import get_default_index, parse_query
 from spds.secretary_agent import SecretaryAgent
+from spds.secretary_pool import POOL_TAG, get_secretary_pool
 # ---------------------------------------------------------------------------
 # Session metadata registry — lightweight replacement for the old session store.
-# Uses a plain dict for in-memory tracking; ConversationManager provides
+# Uses a plain dict for in-memory tracking, mirrored to
+# <sessions dir>/<session_id>/session.json so sessions (and their on-disk
+# history logs) can be restored after a restart. ConversationManager provides
 # server-side persistence via the Letta Conversations API.
 # ---------------------------------------------------------------------------
 _session_metadata: dict = {}  # session_id → metadata dict
 
 
+def _session_meta_path(session_id: str):
+    """Path of the on-disk copy of a session's metadata, or None for unsafe ids."""
+    if not session_id or Path(session_id).name != session_id or session_id.startswith("."):
+        return None
+    return config.get_sessions_dir() / session_id / "session.json"
+
+
 def _register_session(session_id: str, title: str = None, tags: list = None,
                       config_data: dict = None) -> dict:
     """Register a new session with metadata."""
@@ -65,12 +78,31 @@ def _register_session(session_id: str, title: str = None, tags: list = None,
         "config": config_data,
     }
     _session_metadata[session_id] = meta
+    meta_path = _session_meta_path(session_id)
+    if meta_path is not None:
+        try:
+            meta_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = meta_path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(meta, default=str), encoding="utf-8")
+            os.replace(tmp_path, meta_path)
+        except OSError as e:
+            logger.warning(f"Could not persist metadata for session {session_id}: {e}")
     return meta
 
 
 def _get_session_meta(session_id: str) -> dict | None:
     """Get session metadata, or None if not found."""
-    return _session_metadata.get(session_id)
+    meta = _session_metadata.get(session_id)
+    if meta is None:
+        meta_path = _session_meta_path(session_id)
+        if meta_path is not None and meta_path.exists():
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read metadata for session {session_id}: {e}")
+                return None
+            _session_metadata[session_id] = meta
+    return meta
 from spds.swarm_manager import SwarmManager
 
 logger = logging.getLogger(__name__)
@@ -118,6 +150,21 @@ except Exception as e:
 
 # Global storage for active swarm sessions
 active_sessions = {}
+# Socket ids joined to each session (and the reverse), to notice when nobody is connected
+session_clients = {}
+client_sessions = {}
+# Sessions nobody is connected to -> token of the pending secretary release
+idle_sessions = {}
+
+
+def _emit_export_job(job):
+    """Forward every export job state change to the session's room."""
+    socketio.emit("export_progress", job.to_dict(), room=job.session_id)
+
+
+# Exports run here so request and socket handlers return immediately; poll
+# /api/export_jobs/<job_id> or listen for export_progress events.
+export_jobs = ExportJobQueue(on_update=_emit_export_job)
 
 PLAYWRIGHT_EXPORT_FIXTURES = {
     "board_minutes_formal.md",
@@ -149,12 +196,40 @@ class WebSwarmManager:
 
         # Initialize the base SwarmManager
         self.swarm = SwarmManager(client=self.client, **kwargs)
+
+        # Keep the session transcript in an append-only on-disk log so a
+        # restarted server can restore it without replaying anything.
+        self.restored_message_count = 0
+        try:
+            self.restored_message_count = self.swarm.attach_history_log(session_id)
+        except OSError as e:
+            logger.warning(f"History log unavailable for session {session_id}: {e}")
         self.export_manager = ExportManager()
         self.current_topic = None
 
         # Set up the callback to link backend event to frontend notification
         self.swarm.on_role_change_callback = self._handle_role_change
 
+    def end_session(self):
+        """Finish the meeting and return a pooled secretary to the pool (idempotent)."""
+        if getattr(self, "_ended", False):
+            return
+        self._ended = True
+        self.swarm._end_meeting(offer_exports=False)
+
+    def suspend_secretary(self):
+        """Return a pooled secretary while nobody is connected; the meeting stays open."""
+        if getattr(self, "_ended", False):
+            return False
+        return self.swarm.suspend_secretary()
+
+    def resume_secretary(self):
+        """Take a secretary again for a session whose pooled one was returned."""
+        if getattr(self, "_ended", False):
+            return
+        self.swarm.resume_secretary()
+        notify_secretary_change(self.session_id, self.swarm)
+
     def _handle_role_change(self):
         """Callback function passed to SwarmManager."""
         logger.info("Role change detected from swarm, notifying GUI.")
@@ -274,12 +349,7 @@ class WebSwarmManager:
                     "message": "📝 Generating meeting minutes...",
                 },
             )
-            minutes = self.swarm.secretary.generate_minutes()
-            self.emit_message("secretary_minutes", {"minutes": minutes})
-            self.emit_message(
-                "secretary_activity",
-                {"activity": "completed", "message": "✅ Meeting minutes generated!"},
-            )
+            export_jobs.submit(self.session_id, "draft_minutes", self._generate_minutes_job)
 
         elif cmd == "export":
             self._handle_export_command(args)
@@ -305,8 +375,22 @@ class WebSwarmManager:
             stats = self.swarm.secretary.get_conversation_stats()
             self.emit_message("secretary_stats", {"stats": stats})
 
+    def _generate_minutes_job(self, progress):
+        """Background job behind /minutes; the secretary may take a while to write them."""
+        minutes = self.swarm.secretary.generate_minutes()
+        self.emit_message("secretary_minutes", {"minutes": minutes})
+        self.emit_message(
+            "secretary_activity",
+            {"activity": "completed", "message": "✅ Meeting minutes generated!"},
+        )
+        return {"length": len(minutes or "")}
+
+    _EXPORT_FORMATS = (
+        "minutes", "formal", "casual", "transcript", "actions", "summary", "live", "all", "archive",
+    )
+
     def _handle_export_command(self, args):
-        """Handle export commands."""
+        """Handle export commands by queueing a background export job."""
         if not self.swarm.secretary:
             self.emit_message(
                 "system_message",
@@ -314,17 +398,33 @@ class WebSwarmManager:
             )
             return
 
-        meeting_data = {
-            "metadata": self.swarm.secretary.meeting_metadata,
-            "conversation_log": self.swarm.secretary.conversation_log,
-            "action_items": self.swarm.secretary.action_items,
-            "decisions": self.swarm.secretary.decisions,
-            "stats": self.swarm.secretary.get_conversation_stats(),
-        }
-
         format_type = args.strip().lower() if args else "minutes"
+        if format_type not in self._EXPORT_FORMATS:
+            self.emit_message(
+                "system_message",
+                {"message": f"Unknown export format: {format_type}"},
+            )
+            return
 
+        job, deduplicated = export_jobs.submit(
+            self.session_id, format_type, lambda progress: self._run_export(format_type, progress)
+        )
+        if deduplicated:
+            logger.info(f"Export {format_type} for {self.session_id} already queued as job {job.id}")
+
+    def _run_export(self, format_type, progress):
+        """Export job body: read the meeting data now (not when queued) and write the files."""
         try:
+            progress(0.1, "Collecting meeting data")
+            meeting_data = {
+                "metadata": self.swarm.secretary.meeting_metadata,
+                "conversation_log": self.swarm.secretary.conversation_log,
+                "action_items": self.swarm.secretary.action_items,
+                "decisions": self.swarm.secretary.decisions,
+                "stats": self.swarm.secretary.get_conversation_stats(),
+            }
+            progress(0.2, f"Exporting {format_type}")
+
             if format_type in ["minutes", "formal"]:
                 file_path = self.export_manager.export_meeting_minutes(
                     meeting_data, "formal"
@@ -347,27 +447,34 @@ class WebSwarmManager:
                 file_path = self.export_manager.export_executive_summary(
                     meeting_data
                 )
-            elif format_type == "all":
+            elif format_type == "live":
+                file_path = self.swarm._export_live_transcript()
+            else:  # "all" / "archive"
                 files = self.export_manager.export_complete_package(
-                    meeting_data, self.swarm.secretary.mode
-                )
-                self.emit_message(
-                    "export_complete", {"files": files, "count": len(files)}
-                )
-                return
-            else:
-                self.emit_message(
-                    "system_message",
-                    {"message": f"Unknown export format: {format_type}"},
+                    meeting_data,
+                    self.swarm.secretary.mode,
+                    archive=True if format_type == "archive" else None,
+                    # The web session id, which the history log and live transcript also use
+                    session_id=self.session_id,
+                    progress=lambda done, total, name: progress(
+                        0.2 + 0.8 * done / total, f"Wrote {name} ({done}/{total})"
+                    ),
                 )
-                return
+                payload = {
+                    "files": files,
+                    "count": len(files),
+                    "timings": getattr(self.export_manager, "last_package_timings", {}),
+                }
+                self.emit_message("export_complete", payload)
+                return payload
 
-            self.emit_message(
-                "export_complete", {"file": file_path, "format": format_type}
-            )
+            payload = {"file": file_path, "format": format_type}
+            self.emit_message("export_complete", payload)
+            return payload
 
         except Exception as e:
             self.emit_message("system_message", {"message": f"Export failed: {str(e)}"})
+            raise
 
     def _web_agent_turn(self, topic: str):
         """Process agent turn with WebSocket notifications (follows CLI pattern)."""
@@ -377,7 +484,7 @@ class WebSwarmManager:
         try:
             for agent in self.swarm.agents:
                 # Get messages since this agent's last turn
-                recent_messages = self.swarm.get_new_messages_since_last_turn(agent)
+                recent_messages = self.swarm._get_catch_up_messages(agent)
 
                 # Use the same backward-compatible approach as SwarmManager
                 try:
@@ -404,6 +511,8 @@ class WebSwarmManager:
             })
             return
 
+        self.swarm._sync_swarm_context(topic)
+
         motivated_agents = sorted(
             [agent for agent in self.swarm.agents if agent.priority_score > 0],
             key=lambda x: x.priority_score,
@@ -442,7 +551,13 @@ class WebSwarmManager:
         """Hybrid mode with WebSocket updates."""
         self.emit_message("phase_change", {"phase": "initial_responses"})
 
-        original_history = self.swarm.conversation_history
+        # Each agent gets only what it hasn't seen (a windowed read), never the
+        # whole conversation_history, which would pull evicted messages back
+        # off disk on every turn.
+        unseen = {
+            agent.name: self.swarm._get_filtered_conversation_history(agent)
+            for agent in motivated_agents
+        }
         initial_responses = []
 
         # Phase 1: Independent responses
@@ -458,9 +573,9 @@ class WebSwarmManager:
 
             try:
                 print(
-                    f"[DEBUG] Agent {agent.name} speaking with history length: {len(original_history)}"
+                    f"[DEBUG] Agent {agent.name} speaking with history length: {len(unseen[agent.name])}"
                 )
-                response = agent.speak(conversation_history=original_history)
+                response = agent.speak(conversation_history=unseen[agent.name])
                 print(f"[DEBUG] Agent {agent.name} response type: {type(response)}")
 
                 message_text = self.swarm._extract_agent_response(response)
@@ -517,9 +632,9 @@ class WebSwarmManager:
         # Phase 2: Response round
         self.emit_message("phase_change", {"phase": "response_round"})
 
-        history_with_initials = original_history
-        for agent, response in initial_responses:
-            history_with_initials += f"{agent.name}: {response}\n"
+        initials = "".join(
+            f"{agent.name}: {response}\n" for agent, response in initial_responses
+        )
 
         response_prompt = "\n\nNow that you've heard everyone's initial thoughts, please respond to what others have said..."
 
@@ -534,8 +649,11 @@ class WebSwarmManager:
             )
 
             try:
+                history = unseen[agent.name]
+                if history and not history.endswith("\n"):
+                    history += "\n"
                 response = agent.speak(
-                    conversation_history=history_with_initials + response_prompt
+                    conversation_history=history + initials + response_prompt
                 )
                 message_text = self.swarm._extract_agent_response(response)
 
@@ -551,6 +669,7 @@ class WebSwarmManager:
 
                 # Add to conversation history
                 self.swarm._append_history(agent.name, message_text)
+                self.swarm._record_turn(agent)
 
                 # Update all agent memories with this response
                 self.swarm._update_agent_memories(message_text, agent.name)
@@ -570,8 +689,7 @@ class WebSwarmManager:
                 error_message = f"Error during response round for {agent.name}: {e}"
                 self.emit_message("error", {"message": error_message})
                 self.swarm._append_history(agent.name, f"Error: {e}")
-                if hasattr(agent, "last_message_index"):
-                    agent.last_message_index = len(self.swarm._history) - 1
+                self.swarm._record_turn(agent)
 
     def _web_all_speak_turn(self, motivated_agents):
         """All-speak mode with WebSocket updates."""
@@ -584,7 +702,8 @@ class WebSwarmManager:
             )
 
             try:
-                response = agent.speak(conversation_history=original_history)
+                filtered_history = self.swarm._get_filtered_conversation_history(agent)
+                response = agent.speak(conversation_history=filtered_history)
                 message_text = self.swarm._extract_agent_response(response)
 
                 self.emit_message(
@@ -597,6 +716,7 @@ class WebSwarmManager:
                 )
 
                 self.swarm._append_history(agent.name, message_text)
+                self.swarm._record_turn(agent)
 
                 # Update all agent memories with this response
                 self.swarm._update_agent_memories(message_text, agent.name)
@@ -618,6 +738,7 @@ class WebSwarmManager:
                 )
 
                 self.swarm._append_history(agent.name, fallback)
+                self.swarm._record_turn(agent)
 
     def _web_sequential_turn(self, motivated_agents):
         """Sequential mode with WebSocket updates."""
@@ -651,6 +772,7 @@ class WebSwarmManager:
             )
 
             self.swarm._append_history(speaker.name, message_text)
+            self.swarm._record_turn(speaker)
 
             # Update all agent memories with this response
             self.swarm._update_agent_memories(message_text, speaker.name)
@@ -672,6 +794,7 @@ class WebSwarmManager:
             )
 
             self.swarm._append_history(speaker.name, fallback)
+            self.swarm._record_turn(speaker)
 
     def _web_pure_priority_turn(self, motivated_agents):
         """Pure priority mode with WebSocket updates."""
@@ -696,6 +819,7 @@ class WebSwarmManager:
             )
 
             self.swarm._append_history(speaker.name, message_text)
+            self.swarm._record_turn(speaker)
 
             # Update all agent memories with this response
             self.swarm._update_agent_memories(message_text, speaker.name)
@@ -717,14 +841,18 @@ class WebSwarmManager:
             )
 
             self.swarm._append_history(speaker.name, fallback)
+            self.swarm._record_turn(speaker)
 
 
 def _restore_web_swarm_from_session(session_id, socketio_instance):
     """Restore a WebSwarmManager from session metadata.
 
-    Looks up the session config from the in-memory registry and creates
-    a fresh WebSwarmManager.  Conversation history is maintained on the
-    Letta server side, so there is no need to replay local events.
+    Looks up the session config from the registry (falling back to the
+    on-disk copy after a restart) and creates a fresh WebSwarmManager. The
+    local transcript is reopened from the session's on-disk history log; only
+    its tail is loaded, so restore time does not grow with session length.
+    Agents' conversation memory lives on the Letta server, so their cursors
+    start at the end of the restored transcript.
 
     Args:
         session_id: The session ID to restore
@@ -752,7 +880,12 @@ def _restore_web_swarm_from_session(session_id, socketio_instance):
         meeting_type=session_config.get("meeting_type", "discussion"),
     )
 
-    logger.info(f"Restored session {session_id} from registry")
+    restored = getattr(web_swarm, "restored_message_count", 0)
+    if restored:
+        for agent in web_swarm.swarm.agents:
+            web_swarm.swarm._record_turn(agent)
+
+    logger.info(f"Restored session {session_id} from registry ({restored} messages from disk)")
     return web_swarm
 
 
@@ -863,10 +996,17 @@ def get_agents():
         else:
             client = Letta(base_url=config.LETTA_BASE_URL)
 
+        # Pre-create idle secretaries now, while the user is still picking
+        # agents, so starting the session only has to lease one.
+        if config.get_secretary_pool_size() > 0:
+            get_secretary_pool(client).start_warming()
+
         agents = list(client.agents.list())
         agent_list = []
 
         for agent in agents:
+            if POOL_TAG in (getattr(agent, "tags", None) or []):
+                continue  # pooled secretaries are not swarm participants
             agent_list.append(
                 {
                     "id": agent.id,
@@ -1064,6 +1204,45 @@ def resume_session():
         return jsonify({"ok": False, "error": str(e)}), 500
 
 
+@app.route("/api/search", methods=["GET"])
+def search_transcripts():
+    """Full-text search over indexed session transcripts.
+
+    Query params: ``q`` (words, "quoted phrases", inline ``sender:``/``since:``/
+    ``until:`` filters), and optional ``sender``, ``since``, ``until``,
+    ``session`` and ``limit`` which override the inline filters.
+    """
+    try:
+        text = request.args.get("q", "").strip()
+        if not text:
+            return jsonify({"error": "q is required"}), 400
+
+        index = get_default_index()
+        if index is None:
+            return jsonify({"error": "Search index is disabled"}), 503
+
+        try:
+            query = parse_query(text)
+            if request.args.get("sender"):
+                query.sender = request.args["sender"]
+            for key in ("since", "until"):
+                if request.args.get(key):
+                    setattr(query, key, getattr(parse_query(f"{key}:{request.args[key]}"), key))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        if request.args.get("session"):
+            query.session_id = request.args["session"]
+
+        limit = request.args.get("limit", default=20, type=int)
+        limit = min(max(limit or 20, 1), 200)
+        hits = index.search(query, limit=limit)
+        return jsonify({"query": text, "results": [hit.to_dict() for hit in hits]})
+
+    except Exception as e:
+        logger.error(f"Error searching transcripts: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
 # Session export endpoints
 @app.route("/api/sessions/<session_id>/exports", methods=["GET"])
 def get_session_exports(session_id):
@@ -1083,36 +1262,21 @@ def get_session_exports(session_id):
         # Get limit parameter
         limit = request.args.get("limit", type=int)
 
-        # Find export files matching patterns
-        export_files = []
-        for file_path in session_exports_dir.iterdir():
-            if file_path.is_file():
-                filename = file_path.name
-                # Check for allowed patterns
-                if filename.startswith("summary_") and filename.endswith(".json"):
-                    kind = "json"
-                elif filename.startswith("minutes_") and filename.endswith(".md"):
-                    kind = "markdown"
-                else:
-                    continue
-
-                # Get file stats
-                stat = file_path.stat()
-                export_files.append(
-                    {
-                        "filename": filename,
-                        "size_bytes": stat.st_size,
-                        "created_at": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                        "kind": kind,
-                    }
-                )
-
-        # Sort by creation time (newest first)
-        export_files.sort(key=lambda x: x["created_at"], reverse=True)
-
-        # Apply limit if provided
-        if limit and limit > 0:
-            export_files = export_files[:limit]
+        # Indexed lookup; the directory is scanned only the first time.
+        index = get_export_index()
+        index.ensure_scanned(session_exports_dir, session_id)
+        kinds = {"session_json": "json", "session_markdown": "markdown"}
+        export_files = [
+            {
+                "filename": record.filename,
+                "size_bytes": record.size,
+                "created_at": record.created_at.isoformat(),
+                "kind": kinds[record.format],
+            }
+            for record in index.list(
+                directory=session_exports_dir, formats=kinds, limit=limit
+            )
+        ]
 
         logger.debug(f"Listed {len(export_files)} exports for session {session_id}")
         return jsonify(export_files)
@@ -1124,67 +1288,89 @@ def get_session_exports(session_id):
 
 @app.route("/api/sessions/<session_id>/export", methods=["POST"])
 def trigger_session_export(session_id):
-    """Trigger export for a session."""
+    """Queue a JSON + Markdown export of a session; returns the job id at once (202)."""
     try:
         # Validate session exists
         if not _get_session_meta(session_id) and session_id not in active_sessions:
             return jsonify({"ok": False, "error": "Session not found"}), 404
 
-        # Create exports directory for this session
-        sessions_dir = config.get_sessions_dir()
-        session_exports_dir = sessions_dir / session_id
-        session_exports_dir.mkdir(parents=True, exist_ok=True)
+        job, deduplicated = export_jobs.submit(
+            session_id, "session", lambda progress: _run_session_export(session_id, progress)
+        )
+        return (
+            jsonify({
+                "ok": True,
+                "job_id": job.id,
+                "status": job.status,
+                "deduplicated": deduplicated,
+                "status_url": f"/api/export_jobs/{job.id}",
+            }),
+            202,
+        )
 
-        # Export to both JSON and Markdown
-        created_files = []
+    except Exception as e:
+        logger.error(f"Error triggering session export: {e}")
+        return jsonify({"ok": False, "error": str(e)}), 500
 
-        try:
-            # Build messages from the active swarm's conversation history
-            messages_for_export = []
-            web_swarm = active_sessions.get(session_id)
-            if web_swarm:
-                history = getattr(web_swarm.swarm, "conversation_history", "")
-                for line in history.strip().split("\n"):
-                    if not line.strip():
-                        continue
-                    if ": " in line:
-                        role, content = line.split(": ", 1)
-                        messages_for_export.append({
-                            "message_type": "message",
-                            "role": role,
-                            "content": content,
-                            "created_at": datetime.now(timezone.utc).isoformat(),
-                        })
-
-            # Export to JSON
-            json_path = export_session_to_json(
-                session_id, dest_dir=session_exports_dir, messages=messages_for_export
-            )
-            json_filename = json_path.name
-            created_files.append({"filename": json_filename, "kind": "json"})
 
-            # Export to Markdown
-            md_path = export_session_to_markdown(
-                session_id, dest_dir=session_exports_dir, messages=messages_for_export
-            )
-            md_filename = md_path.name
-            created_files.append({"filename": md_filename, "kind": "markdown"})
+def _run_session_export(session_id, progress):
+    """Export job body for trigger_session_export; returns the created files."""
+    # Create exports directory for this session
+    sessions_dir = config.get_sessions_dir()
+    session_exports_dir = sessions_dir / session_id
+    session_exports_dir.mkdir(parents=True, exist_ok=True)
+
+    # Export to both JSON and Markdown
+    created_files = []
+
+    # Build messages from the active swarm's conversation history
+    progress(0.1, "Collecting messages")
+    messages_for_export = []
+    web_swarm = active_sessions.get(session_id)
+    if web_swarm:
+        # Stream the stored messages (segment by segment for a disk-backed
+        # history) instead of rendering the whole conversation_history.
+        for msg in getattr(web_swarm.swarm, "_history", None) or []:
+            if not msg.content.strip():
+                continue
+            messages_for_export.append({
+                "message_type": "message",
+                "role": msg.sender,
+                "content": msg.content,
+                "created_at": msg.timestamp.isoformat(),
+            })
 
-            logger.info(
-                f"Exported session {session_id}: {json_filename}, {md_filename}"
-            )
-            return jsonify({"ok": True, "created": created_files})
+    # Export to JSON
+    progress(0.3, "Writing JSON summary")
+    json_path = export_session_to_json(
+        session_id, dest_dir=session_exports_dir, messages=messages_for_export
+    )
+    json_filename = json_path.name
+    created_files.append({"filename": json_filename, "kind": "json"})
 
-        except Exception as export_error:
-            logger.error(f"Export failed for session {session_id}: {export_error}")
-            return (
-                jsonify({"ok": False, "error": f"Export failed: {str(export_error)}"}),
-                500,
-            )
+    # Export to Markdown
+    progress(0.65, "Writing Markdown minutes")
+    md_path = export_session_to_markdown(
+        session_id, dest_dir=session_exports_dir, messages=messages_for_export
+    )
+    md_filename = md_path.name
+    created_files.append({"filename": md_filename, "kind": "markdown"})
 
-    except Exception as e:
-        logger.error(f"Error triggering session export: {e}")
-        return jsonify({"ok": False, "error": str(e)}), 500
+    logger.info(
+        f"Exported session {session_id}: {json_filename}, {md_filename}"
+    )
+    return {"created": created_files}
+
+
+@app.route("/api/export_jobs/<job_id>", methods=["GET"])
+def get_export_job(job_id):
+    """Poll a background export job."""
+    job = export_jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Export job not found"}), 404
+    payload = job.to_dict()
+    payload["ok"] = job.status != FAILED
+    return jsonify(payload)
 
 
 @app.route("/api/sessions/<session_id>/exports/<path:filename>")
@@ -1284,8 +1470,77 @@ def on_connect():
 
 @socketio.on("disconnect")
 def on_disconnect():
-    """Handle client disconnection."""
+    """Handle client disconnection; schedule the secretary release once the last client leaves."""
     print(f"Client disconnected: {request.sid}")
+    session_id = client_sessions.pop(request.sid, None)
+    if session_id is None:
+        return
+    clients = session_clients.get(session_id, set())
+    clients.discard(request.sid)
+    if not clients:
+        session_clients.pop(session_id, None)
+        _schedule_secretary_release(session_id)
+
+
+def _schedule_secretary_release(session_id):
+    """Return the session's pooled secretary if nobody rejoins within the grace period.
+
+    A refresh, a dropped connection or moving between pages rejoins the same
+    meeting, so disconnecting never ends it; only ``end_session`` does.
+    """
+    token = object()
+    idle_sessions[session_id] = token
+    socketio.start_background_task(
+        _release_idle_secretary, session_id, token, config.get_web_session_grace_seconds()
+    )
+
+
+def _release_idle_secretary(session_id, token, grace):
+    socketio.sleep(grace)
+    if idle_sessions.get(session_id) is not token or session_clients.get(session_id):
+        return
+    idle_sessions.pop(session_id, None)
+    suspend = getattr(active_sessions.get(session_id), "suspend_secretary", None)
+    if callable(suspend):
+        try:
+            if suspend():
+                logger.info(f"Returned the pooled secretary of idle session {session_id}")
+        except Exception as e:
+            logger.warning(f"Error returning the secretary of session {session_id}: {e}")
+
+
+def _resume_secretary(session_id):
+    resume = getattr(active_sessions.get(session_id), "resume_secretary", None)
+    if callable(resume):
+        try:
+            resume()
+        except Exception as e:
+            logger.warning(f"Error resuming the secretary of session {session_id}: {e}")
+
+
+def _end_web_session(session_id):
+    """End an active web session: finalize its conversations and release its secretary.
+
+    A later join restores the session from its stored config and history log.
+    """
+    idle_sessions.pop(session_id, None)
+    web_swarm = active_sessions.pop(session_id, None)
+    end_session = getattr(web_swarm, "end_session", None)
+    if callable(end_session):
+        try:
+            end_session()
+            logger.info(f"Ended web session {session_id}")
+        except Exception as e:
+            logger.warning(f"Error ending web session {session_id}: {e}")
+
+
+@socketio.on("end_session")
+def on_end_session(data):
+    """End the meeting on the user's explicit request."""
+    session_id = data.get("session_id")
+    if session_id in active_sessions:
+        _end_web_session(session_id)
+        socketio.emit("session_ended", {"session_id": session_id}, room=session_id)
 
 
 @socketio.on("join_session")
@@ -1309,6 +1564,12 @@ def on_join_session(data):
                 return
 
         join_room(session_id)
+        client_sessions[request.sid] = session_id
+        session_clients.setdefault(session_id, set()).add(request.sid)
+        idle_sessions.pop(session_id, None)
+        secretary = getattr(getattr(active_sessions[session_id], "swarm", None), "secretary", None)
+        if getattr(secretary, "suspended", False) is True:
+            socketio.start_background_task(_resume_secretary, session_id)
         emit("joined", {"session_id": session_id})
 
 
@@ -296,3 +296,18 @@ def mock_sync_array_page():
 def set_ephemeral_agents_env(monkeypatch):
     """Set SPDS_ALLOW_EPHEMERAL_AGENTS to 'true' for all tests."""
     monkeypatch.setenv("SPDS_ALLOW_EPHEMERAL_AGENTS", "true")
+
+
+@pytest.fixture(autouse=True)
+def isolated_search_index(monkeypatch, tmp_path):
+    """Keep the transcript search, export and SPDS session indexes (and warm-start cache) out of the repo."""
+    monkeypatch.setenv("SPDS_SEARCH_INDEX_PATH", str(tmp_path / "search_index.sqlite3"))
+    monkeypatch.setenv("SPDS_EXPORT_INDEX_PATH", str(tmp_path / "export_index.sqlite3"))
+    monkeypatch.setenv("SPDS_SESSION_INDEX_PATH", str(tmp_path / "spds_sessions.sqlite3"))
+    monkeypatch.setenv("SPDS_WARM_START_PATH", str(tmp_path / "warm_start.json"))
+
+
+@pytest.fixture(autouse=True)
+def no_secretary_pool(monkeypatch):
+    """Don't warm pooled secretaries against mock clients; pool tests opt back in."""
+    monkeypatch.setenv("SPDS_SECRETARY_POOL_SIZE", "0")
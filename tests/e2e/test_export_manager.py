@@ -153,6 +153,7 @@ def test_session_summary_and_restore(tmp_path, export_dir):
     # Test export with mocked ConversationManager
     mock_cm = Mock()
     mock_cm.list_messages.return_value = messages
+    mock_cm.iter_messages.side_effect = lambda *args, **kwargs: iter(messages)
     mock_cm.get_session_summary.return_value = {
         "id": "conv-123",
         "summary": "Test conversation",
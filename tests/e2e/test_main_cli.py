@@ -108,6 +108,7 @@ def test_sessions_resume_success_and_failure(monkeypatch, capsys):
 
     # Now test failure
     mock_cm.get_session.side_effect = Exception("Not found")
+    mock_cm.find_session.return_value = []
     err_code = main_module.main(["sessions", "resume", "missing-id"])
     assert err_code == 2
     stderr = capsys.readouterr().err
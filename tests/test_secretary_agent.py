@@ -193,6 +193,7 @@ def test_observe_message_sends_formatted_prompt(fixed_datetime):
     secretary = SecretaryAgent(client)
 
     secretary.observe_message("Alice", "We should revisit the budget")
+    secretary.flush_observations()
 
     message_call = client.agents.messages.calls[-1]
     sent_message = message_call["messages"][0]["content"]
@@ -217,6 +218,7 @@ def test_observe_message_handles_api_failure(fixed_datetime):
 
     # observe_message swallows exceptions silently
     secretary.observe_message("Bob", "Status update", metadata={"importance": "high"})
+    secretary.flush_observations()
 
     message_call = client.agents.messages.calls[-1]
     sent_message = message_call["messages"][0]["content"]
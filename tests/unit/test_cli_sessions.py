@@ -226,6 +226,7 @@ class TestResumeSessionCommand:
         with patch("spds.main.ConversationManager") as MockCM:
             cm_instance = MockCM.return_value
             cm_instance.get_session.side_effect = Exception("Not found")
+            cm_instance.find_session.return_value = []
 
             args = Namespace(session_id="bad-id")
             result = resume_session_command(args, client=mock_client)
@@ -252,6 +253,36 @@ class TestResumeSessionCommand:
         assert result == 0
         output = capsys.readouterr().out
         assert "completed" in output
+        assert "Budget|completed" not in output
+
+    def test_resume_spds_session_id_lists_its_conversations(self, mock_client, capsys):
+        """An SPDS session ID lists the session's conversations from the session index."""
+        from spds.session_index import entry_from_conversation
+
+        entries = [
+            entry_from_conversation(
+                _make_conversation("conv-a1", summary="spds:sess-x|Alice|Budget|completed|msgs=4|mode=hybrid"),
+                "ag-1",
+            ),
+            entry_from_conversation(
+                _make_conversation("conv-b1", summary="spds:sess-x|Bob|Budget"), "ag-2"
+            ),
+        ]
+
+        with patch("spds.main.ConversationManager") as MockCM:
+            MockCM.parse_spds_summary = _real_parse_spds_summary
+            cm_instance = MockCM.return_value
+            cm_instance.get_session.side_effect = Exception("Not found")
+            cm_instance.find_session.return_value = entries
+
+            result = resume_session_command(Namespace(session_id="sess-x"), client=mock_client)
+
+        assert result == 0
+        cm_instance.find_session.assert_called_once_with("sess-x")
+        output = capsys.readouterr().out
+        assert "Status:   active" in output
+        assert "Alice" in output and "Bob" in output
+        assert "Budget|completed" not in output
 
 
 # ---------------------------------------------------------------------------
@@ -289,8 +320,15 @@ class TestFormatSessionTable:
         table = format_session_table(convs)
         assert "Bob" in table
         assert "Planning" in table
+        assert "Planning|" not in table
         assert "completed" in table
 
+    def test_topic_mentioning_completed_is_still_active(self):
+        """Status comes from the finalization suffix, not from words in the topic."""
+        convs = [_make_conversation("conv-g", summary="spds:sess-3|Cy|Review completed work")]
+        table = format_session_table(convs)
+        assert table.splitlines()[-1].rstrip().endswith("active")
+
     def test_with_plain_conversations(self):
         """Handles non-SPDS conversations with raw summary."""
         from datetime import datetime, timezone
@@ -369,3 +407,50 @@ class TestMainSessionIntegration:
         output = capsys.readouterr().out
         assert "list" in output
         assert "resume" in output
+
+
+# ---------------------------------------------------------------------------
+# sessions search
+# ---------------------------------------------------------------------------
+
+class TestSearchSessionsCommand:
+    def _build_index(self, tmp_path, monkeypatch):
+        from datetime import datetime
+
+        from spds.message import ConversationMessage
+        from spds.search_index import TranscriptIndex
+
+        path = tmp_path / "index.sqlite3"
+        monkeypatch.setenv("SPDS_SEARCH_INDEX_PATH", str(path))
+        index = TranscriptIndex(path)
+        index.add("sess-1", 0, ConversationMessage("Alex", "Ship the roadmap", datetime(2024, 5, 1, 9)))
+        index.add("sess-2", 0, ConversationMessage("Sam", "Roadmap review", datetime(2024, 6, 1, 9)))
+        index.close()
+
+    def test_search_does_not_need_client_and_outputs_json(self, tmp_path, monkeypatch, capsys):
+        self._build_index(tmp_path, monkeypatch)
+
+        with patch("spds.main.Letta") as letta:
+            rc = main(["sessions", "search", "roadmap", "--since", "2024-05-15", "--json"])
+
+        assert rc == 0
+        letta.assert_not_called()
+        results = json.loads(capsys.readouterr().out)
+        assert [(r["session_id"], r["sender"]) for r in results] == [("sess-2", "Sam")]
+
+    def test_search_text_output_and_sender_filter(self, tmp_path, monkeypatch, capsys):
+        self._build_index(tmp_path, monkeypatch)
+
+        rc = main(["sessions", "search", "roadmap", "--sender", "alex"])
+
+        assert rc == 0
+        out = capsys.readouterr().out
+        assert "Alex" in out and "Sam" not in out
+
+    def test_search_errors(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv("SPDS_SEARCH_INDEX_PATH", str(tmp_path / "missing.sqlite3"))
+        assert main(["sessions", "search", "x"]) == 1
+
+        self._build_index(tmp_path, monkeypatch)
+        assert main(["sessions", "search", "x", "--since", "soon"]) == 2
+        assert "Invalid date" in capsys.readouterr().err
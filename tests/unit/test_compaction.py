@@ -0,0 +1,129 @@
+"""Unit tests for rolling compaction of long catch-up deltas."""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from spds.compaction import CompactedView, HistoryCompactor, summarize_messages
+from spds.history import ConversationHistory
+from spds.message import ConversationMessage, messages_to_flat_format
+from spds.swarm_manager import SwarmManager
+
+
+def _history(count):
+    base = datetime(2024, 1, 1, 9, 0, 0)
+    return ConversationHistory(
+        ConversationMessage(
+            ["Alex", "Jordan"][i % 2],
+            f"Point {i} is important. More detail follows here.",
+            base + timedelta(seconds=i),
+        )
+        for i in range(count)
+    )
+
+
+def test_summarize_messages_lists_speakers_and_first_sentences():
+    history = _history(4)
+    summary = summarize_messages(list(history), first_number=1)
+    assert summary.startswith("[messages 1-4] Alex (2), Jordan (2).")
+    assert "Alex: Point 0 is important." in summary
+    assert "More detail" not in summary
+
+
+def test_short_delta_is_not_compacted():
+    history = _history(30)
+    compactor = HistoryCompactor(threshold=50, chunk_size=10, keep_recent=5)
+    assert not compactor.should_compact(history.since(-1))
+
+
+def test_delta_without_complete_stretch_before_tail_is_verbatim():
+    history = _history(30)
+    compactor = HistoryCompactor(threshold=5, chunk_size=10, keep_recent=25)
+    view = history.since(12)
+    assert compactor.render(view) == history.flat_since(13)
+
+
+def test_long_delta_gets_summaries_plus_recent_tail():
+    history = _history(100)
+    compactor = HistoryCompactor(threshold=20, chunk_size=10, keep_recent=15)
+    view = history.since(4)  # messages 5..99 unseen
+    assert compactor.should_compact(view)
+
+    text = compactor.render(view)
+    lines = text.split("\n")
+    # Chunks 0..7 end before the tail (starts at 85); chunk 8 (80-89) overlaps it.
+    summaries = [line for line in lines if line.startswith("Summary: ")]
+    assert len(summaries) == 8
+    assert summaries[0].startswith("Summary: [messages 1-10]")
+    assert lines[len(summaries):] == history.flat_since(80).split("\n")
+
+
+def test_each_stretch_is_summarized_once():
+    history = _history(60)
+    compactor = HistoryCompactor(threshold=5, chunk_size=10, keep_recent=5)
+    compactor.render(history.since(-1))
+    built = compactor.summaries_built
+    assert built == 5
+    history.extend(_history(10))
+    compactor.render(history.since(-1))
+    # Only the newly completed stretch is summarised.
+    assert compactor.summaries_built == built + 1
+
+
+def test_replaced_history_invalidates_cached_summaries():
+    history = _history(30)
+    compactor = HistoryCompactor(threshold=5, chunk_size=10, keep_recent=5)
+    first = compactor.render(history.since(-1))
+    history[0] = ConversationMessage("Casey", "Rewritten opener.", datetime(2024, 2, 1))
+    second = compactor.render(history.since(-1))
+    assert first != second
+    assert "Casey (1)" in second
+
+
+def test_swarm_manager_compacts_filtered_history_for_quiet_agents(monkeypatch):
+    monkeypatch.setenv("SPDS_COMPACTION_THRESHOLD", "20")
+    monkeypatch.setenv("SPDS_COMPACTION_CHUNK_SIZE", "10")
+    monkeypatch.setenv("SPDS_COMPACTION_KEEP_RECENT", "5")
+    manager = SwarmManager.__new__(SwarmManager)
+    manager._history = _history(50)
+    agent = Mock()
+    agent.last_message_index = -1
+
+    text = manager._get_filtered_conversation_history(agent)
+    assert text.startswith("Summary: [messages 1-10]")
+    assert text.endswith(manager._history[-1].to_flat_format())
+
+    monkeypatch.setenv("SPDS_HISTORY_COMPACTION", "false")
+    assert manager._get_filtered_conversation_history(agent) == manager.conversation_history
+
+
+def test_negative_threshold_is_clamped(monkeypatch):
+    assert HistoryCompactor(threshold=-5).threshold == 0
+    monkeypatch.setenv("SPDS_COMPACTION_THRESHOLD", "-1")
+    assert HistoryCompactor().threshold == 0
+
+
+def test_compacted_view_keeps_raw_messages_but_flattens_compacted():
+    history = _history(60)
+    compactor = HistoryCompactor(threshold=20, chunk_size=10, keep_recent=5)
+    view = compactor.compact(history.since(-1))
+
+    assert isinstance(view, CompactedView)
+    assert len(view) == 60 and view[0] is history[0]
+    assert messages_to_flat_format(view) == compactor.render(history.since(-1))
+    assert compactor.compact(view) is view
+    short = history.since(50)
+    assert compactor.compact(short) is short
+
+
+def test_assessment_payload_is_compacted_too(monkeypatch):
+    monkeypatch.setenv("SPDS_COMPACTION_THRESHOLD", "20")
+    monkeypatch.setenv("SPDS_COMPACTION_CHUNK_SIZE", "10")
+    monkeypatch.setenv("SPDS_COMPACTION_KEEP_RECENT", "5")
+    manager = SwarmManager.__new__(SwarmManager)
+    manager._history = _history(50)
+    agent = Mock()
+    agent.last_message_index = -1
+
+    recent = manager._get_catch_up_messages(agent)
+    assert messages_to_flat_format(recent) == manager._get_filtered_conversation_history(agent)
+    assert messages_to_flat_format(recent).startswith("Summary: [messages 1-10]")
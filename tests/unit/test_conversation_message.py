@@ -871,4 +871,47 @@ class TestConversationMessagePostInit:
     def test_post_init_none_sender_raises(self):
         """None sender raises ValueError (falsy check)."""
         with pytest.raises((ValueError, TypeError)):
-            ConversationMessage(None, "Valid content", datetime.now())
\ No newline at end of file
+            ConversationMessage(None, "Valid content", datetime.now())
+
+class TestConversationMessageCompactLayout:
+    """Test the slotted, interned storage layout."""
+
+    def test_message_has_no_instance_dict(self):
+        msg = ConversationMessage("Alice", "Hi", datetime(2024, 1, 1))
+        assert not hasattr(msg, "__dict__")
+        with pytest.raises(AttributeError):
+            msg.extra = "nope"
+
+    def test_sender_is_interned(self):
+        sender_a = "".join(["Al", "ice"])
+        sender_b = "".join(["Ali", "ce"])
+        assert sender_a is not sender_b
+        msg_a = ConversationMessage(sender_a, "one", datetime(2024, 1, 1))
+        msg_b = ConversationMessage(sender_b, "two", datetime(2024, 1, 1))
+        assert msg_a.sender is msg_b.sender
+
+    def test_naive_timestamp_round_trips_exactly(self):
+        ts = datetime(2024, 3, 5, 7, 9, 11, 123456)
+        msg = ConversationMessage("Alice", "Hi", ts)
+        assert msg.timestamp == ts
+        assert msg.timestamp.tzinfo is None
+
+    def test_aware_timestamp_keeps_timezone(self):
+        from datetime import timezone
+
+        tz = timezone(timedelta(hours=-5))
+        ts = datetime(2024, 3, 5, 7, 9, 11, 42, tzinfo=tz)
+        msg = ConversationMessage("Alice", "Hi", ts)
+        assert msg.timestamp == ts
+        assert msg.timestamp.utcoffset() == timedelta(hours=-5)
+
+    def test_pickle_round_trip_reinterns_sender(self):
+        msg = ConversationMessage("Alice", "Hi", datetime(2024, 1, 1, 12))
+        restored = pickle.loads(pickle.dumps(msg))
+        assert restored == msg
+        assert restored.sender is msg.sender
+
+    def test_messages_are_unhashable(self):
+        msg = ConversationMessage("Alice", "Hi", datetime(2024, 1, 1))
+        with pytest.raises(TypeError):
+            hash(msg)
@@ -119,6 +119,48 @@ class TestConversationMessageIntegration:
         expected = "Agent2: Response 2\nYou: Follow up\nAgent1: Final response"
         assert result == expected
 
+    def test_incremental_history_store_matches_plain_list(self):
+        """conversation_history and filtered views are identical with the incremental store."""
+        from spds.history import ConversationHistory
+
+        manager = SwarmManager.__new__(SwarmManager)
+        manager._history = ConversationHistory()
+        manager._emit = Mock()
+        manager._append_history("You", "Start")
+        manager._append_history("Agent1", "Response 1")
+        first_read = manager.conversation_history
+        manager._append_history("Agent2", "Response 2")
+
+        assert manager.conversation_history == first_read + "\nAgent2: Response 2"
+        agent = Mock()
+        agent.last_message_index = 1
+        assert manager._get_filtered_conversation_history(agent) == "Agent2: Response 2"
+        agent.last_message_index = 2
+        assert manager._get_filtered_conversation_history(agent) == ""
+
+        manager.conversation_history = "You: reset"
+        assert isinstance(manager._history, ConversationHistory)
+        assert manager.conversation_history == "You: reset"
+
+    def test_record_turn_drives_incremental_views(self):
+        """_record_turn moves the agent cursor kept by the history store."""
+        from spds.history import ConversationHistory, HistoryView
+
+        manager = SwarmManager.__new__(SwarmManager)
+        manager._history = ConversationHistory()
+        manager._emit = Mock()
+        agent = Mock()
+        agent.last_message_index = -1
+        manager._append_history("You", "Hello")
+        manager._append_history("Agent1", "Hi")
+        manager._record_turn(agent)
+        assert agent.last_message_index == 1
+
+        manager._append_history("You", "Next")
+        recent = manager.get_new_messages_since_last_turn(agent)
+        assert isinstance(recent, HistoryView)
+        assert [m.content for m in recent] == ["Next"]
+
     def test_conversation_message_timeline_consistency(self):
         """Test that ConversationMessage objects maintain proper timeline order."""
         manager = SwarmManager.__new__(SwarmManager)
@@ -55,6 +55,106 @@ class TestListMessages:
         assert result == [msg1, msg2]
 
 
+class TestIterMessages:
+    @staticmethod
+    def _paged(messages):
+        """Fake ``messages.list`` honouring ``after`` and ``limit`` like the server."""
+
+        def list_page(conversation_id, limit, order, after=None):
+            ids = [m.id for m in messages]
+            start = ids.index(after) + 1 if after else 0
+            return SimpleNamespace(items=messages[start : start + limit])
+
+        return Mock(side_effect=list_page)
+
+    def test_pages_with_after_cursor(self, cm, mock_letta_client):
+        messages = [SimpleNamespace(id=f"m{i}", content=str(i)) for i in range(7)]
+        mock_letta_client.conversations.messages.list = self._paged(messages)
+
+        result = list(cm.iter_messages("conv-1", page_size=3))
+
+        assert result == messages
+        calls = mock_letta_client.conversations.messages.list.call_args_list
+        assert [c.kwargs.get("after") for c in calls] == [None, "m2", "m5"]
+        assert all(c.kwargs["limit"] == 3 for c in calls)
+
+    def test_exact_multiple_ends_on_empty_page(self, cm, mock_letta_client):
+        messages = [SimpleNamespace(id=f"m{i}", content=str(i)) for i in range(4)]
+        mock_letta_client.conversations.messages.list = self._paged(messages)
+
+        assert len(list(cm.iter_messages("conv-1", page_size=2))) == 4
+        assert mock_letta_client.conversations.messages.list.call_count == 3
+
+    def test_stops_when_cursor_does_not_advance(self, cm, mock_letta_client):
+        page = [{"content": "no ids"}, {"content": "here"}]
+        mock_letta_client.conversations.messages.list.return_value = page
+
+        assert list(cm.iter_messages("conv-1", page_size=2)) == page
+        assert mock_letta_client.conversations.messages.list.call_count == 1
+
+    def test_is_lazy(self, cm, mock_letta_client):
+        messages = [SimpleNamespace(id=f"m{i}", content=str(i)) for i in range(10)]
+        mock_letta_client.conversations.messages.list = self._paged(messages)
+
+        iterator = cm.iter_messages("conv-1", page_size=2)
+        next(iterator)
+        assert mock_letta_client.conversations.messages.list.call_count == 1
+
+
+    def test_prefetches_next_page_while_consuming(self, cm, mock_letta_client):
+        import threading
+
+        messages = [SimpleNamespace(id=f"m{i}", content=str(i)) for i in range(6)]
+        paged = self._paged(messages)
+        fetched_second = threading.Event()
+
+        def list_page(**kwargs):
+            if kwargs.get("after") == "m2":
+                fetched_second.set()
+            return paged(**kwargs)
+
+        mock_letta_client.conversations.messages.list = Mock(side_effect=list_page)
+        iterator = cm.iter_messages("conv-1", page_size=3)
+        assert next(iterator).id == "m0"
+        assert next(iterator).id == "m1"
+        # The second page is requested before the first one is used up.
+        assert fetched_second.wait(5)
+        assert [m.id for m in iterator] == ["m2", "m3", "m4", "m5"]
+
+    def test_limit_stops_without_fetching_further(self, cm, mock_letta_client):
+        messages = [SimpleNamespace(id=f"m{i}", content=str(i)) for i in range(10)]
+        mock_letta_client.conversations.messages.list = self._paged(messages)
+
+        result = cm.list_messages("conv-1", limit=5, page_size=3)
+
+        assert [m.id for m in result] == ["m0", "m1", "m2", "m3", "m4"]
+        calls = mock_letta_client.conversations.messages.list.call_args_list
+        assert [(c.kwargs.get("after"), c.kwargs["limit"]) for c in calls] == [
+            (None, 3),
+            ("m2", 2),
+        ]
+
+
+class TestIterSessions:
+    def test_follows_after_cursor_across_pages(self, cm, mock_letta_client):
+        convs = [SimpleNamespace(id=f"c{i}") for i in range(5)]
+
+        def list_page(limit, agent_id=None, after=None):
+            start = [c.id for c in convs].index(after) + 1 if after else 0
+            return SimpleNamespace(conversations=convs[start : start + limit])
+
+        mock_letta_client.conversations.list = Mock(side_effect=list_page)
+
+        assert cm.list_sessions("ag-1", page_size=2) == convs
+        calls = mock_letta_client.conversations.list.call_args_list
+        assert [c.kwargs.get("after") for c in calls] == [None, "c1", "c3"]
+        assert all(c.kwargs["agent_id"] == "ag-1" for c in calls)
+
+        mock_letta_client.conversations.list.reset_mock()
+        assert [c.id for c in cm.list_all_sessions(limit=3)] == ["c0", "c1", "c2"]
+        assert "agent_id" not in mock_letta_client.conversations.list.call_args.kwargs
+
+
 class TestListSessions:
     def test_returns_conversations_attr(self, cm, mock_letta_client):
         convs = [SimpleNamespace(id="c1"), SimpleNamespace(id="c2")]
@@ -194,8 +294,16 @@ class TestParseSpdsummary:
             "session_id": "sess-1",
             "agent_name": "Alice",
             "topic": "Testing",
+            "status": "active",
         }
 
+    def test_is_the_session_index_parser(self):
+        from spds.session_index import parse_spds_summary
+
+        assert ConversationManager.parse_spds_summary is parse_spds_summary
+        result = ConversationManager.parse_spds_summary("spds:s1|Bob|Plan|completed|msgs=3|mode=hybrid")
+        assert (result["topic"], result["status"]) == ("Plan", "completed")
+
     def test_handles_topic_with_pipes(self):
         result = ConversationManager.parse_spds_summary("spds:s1|Bob|A|B|C")
         assert result["topic"] == "A|B|C"
@@ -211,7 +319,7 @@ class TestParseSpdsummary:
 
     def test_handles_minimal_spds_summary(self):
         result = ConversationManager.parse_spds_summary("spds:s1")
-        assert result == {"session_id": "s1", "agent_name": "", "topic": ""}
+        assert result == {"session_id": "s1", "agent_name": "", "topic": "", "status": "active"}
 
 
 # ------------------------------------------------------------------
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, call, patch
 
@@ -13,6 +14,7 @@ from spds.cross_agent import (
     MULTI_AGENT_TOOL,
     MULTI_AGENT_TOOLS,
     SESSION_TAG_PREFIX,
+    SwarmContextMirror,
     _find_multi_agent_tools,
     attach_block_to_agents,
     attach_multi_agent_tools,
@@ -112,6 +114,59 @@ class TestTagAgentsForSession:
         assert client.agents.retrieve.call_count == 3
         assert client.agents.update.call_count == 3
 
+    def test_loaded_states_are_not_retrieved(self):
+        client = _mock_client()
+        client.agents.update.side_effect = lambda agent_id, tags: _agent_state(agent_id, tags=tags)
+        states = [_agent_state("a-1", tags=["x"]), _agent_state("a-2")]
+
+        tag = tag_agents_for_session(client, states, "sess-1")
+
+        client.agents.retrieve.assert_not_called()
+        assert states[0].tags == ["x", tag]
+        assert states[1].tags == [tag]
+
+    def test_state_without_tags_is_retrieved(self):
+        client = _mock_client()
+        client.agents.retrieve.return_value = _agent_state("a-1", tags=["x"])
+        state = MagicMock()
+        state.id = "a-1"
+
+        tag_agents_for_session(client, [state], "sess-1")
+
+        client.agents.retrieve.assert_called_once_with(agent_id="a-1")
+        assert client.agents.update.call_args.kwargs["tags"] == ["x", make_session_tag("sess-1")]
+
+    def test_updates_run_concurrently(self):
+        client = _mock_client()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def update(agent_id, tags):
+            barrier.wait()  # all three must be in flight at once
+            return _agent_state(agent_id, tags=tags)
+
+        client.agents.update.side_effect = update
+        states = [_agent_state(f"a-{i}") for i in range(3)]
+
+        tag_agents_for_session(client, states, "sess-1", workers=3)
+
+        assert all(s.tags == [make_session_tag("sess-1")] for s in states)
+
+    def test_one_failure_does_not_stop_the_others(self):
+        client = _mock_client()
+
+        def update(agent_id, tags):
+            if agent_id == "a-1":
+                raise Exception("Server error")
+            return _agent_state(agent_id, tags=tags)
+
+        client.agents.update.side_effect = update
+        states = [_agent_state("a-1"), _agent_state("a-2")]
+
+        tag_agents_for_session(client, states, "sess-1")
+
+        assert states[0].tags == []
+        assert states[1].tags == [make_session_tag("sess-1")]
+
 
 # ---------------------------------------------------------------------------
 # remove_session_tags
@@ -150,6 +205,22 @@ class TestRemoveSessionTags:
         # Should not raise
         remove_session_tags(client, ["agent-1"], "sess-1")
 
+    def test_removes_tag_from_loaded_state(self):
+        client = _mock_client()
+        tag = make_session_tag("sess-1")
+        client.agents.update.side_effect = lambda agent_id, tags: _agent_state(agent_id, tags=tags)
+        # Another session tagged the agent after this state was loaded
+        client.agents.retrieve.return_value = _agent_state(
+            "agent-1", tags=[tag, "other-tag", "spds:session-2"]
+        )
+        state = _agent_state("agent-1", tags=[tag, "other-tag"])
+
+        remove_session_tags(client, [state], "sess-1")
+
+        client.agents.retrieve.assert_called_once_with(agent_id="agent-1")
+        assert client.agents.update.call_args.kwargs["tags"] == ["other-tag", "spds:session-2"]
+        assert state.tags == ["other-tag", "spds:session-2"]
+
 
 # ---------------------------------------------------------------------------
 # _find_multi_agent_tools
@@ -421,6 +492,125 @@ class TestUpdateSwarmContext:
         assert result is False
 
 
+class _FakeBlock:
+    """Server-side block that records reads and writes."""
+
+    def __init__(self, value=""):
+        self.value = value
+        self.writes = []
+
+    def client(self):
+        client = _mock_client()
+        client.blocks.retrieve.side_effect = lambda block_id: SimpleNamespace(value=self.value)
+
+        def update(block_id, value):
+            self.value = value
+            self.writes.append(value)
+
+        client.blocks.update.side_effect = update
+        return client
+
+
+class TestSwarmContextMirror:
+    def test_updates_coalesce_into_one_write(self):
+        block = _FakeBlock("Topic: Old\nParticipants: Alice")
+        client = block.client()
+        mirror = SwarmContextMirror(client, "block-1")
+
+        mirror.update({"Topic": "New"})
+        mirror.update({"Status": "active"})
+        mirror.update({"Topic": "Newer"})
+
+        client.blocks.retrieve.assert_not_called()
+        client.blocks.update.assert_not_called()
+        assert mirror.pending
+        assert mirror.flush() is True
+        assert block.writes == ["Topic: Newer\nParticipants: Alice\nStatus: active"]
+        assert mirror.writes == 1
+        assert not mirror.pending
+
+    def test_block_is_read_only_on_first_flush(self):
+        block = _FakeBlock("Topic: A")
+        client = block.client()
+        mirror = SwarmContextMirror(client, "block-1")
+
+        for focus in ("x", "y", "z"):
+            mirror.update({"Current focus": focus})
+            mirror.flush()
+
+        assert client.blocks.retrieve.call_count == 1
+        assert block.writes[-1] == "Topic: A\nCurrent focus: z"
+        assert mirror.value == block.value
+
+    def test_agent_edits_are_merged_not_overwritten(self):
+        block = _FakeBlock("Topic: A")
+        client = block.client()
+        mirror = SwarmContextMirror(client, "block-1", verify_every=3)
+
+        mirror.update({"Current focus": "x"})
+        mirror.flush()
+        # An agent edits the shared block with a memory tool
+        block.value += "\nNote: Alice owns the budget"
+
+        mirror.mark_stale()
+        mirror.update({"Current focus": "y"})
+        mirror.flush()
+        assert block.value == "Topic: A\nCurrent focus: y\nNote: Alice owns the budget"
+        assert mirror.drifts == 1
+
+        # Without a hint the block is re-read once verify_every writes trusted the cache
+        for focus in ("z1", "z2"):
+            mirror.update({"Current focus": focus})
+            mirror.flush()
+        assert client.blocks.retrieve.call_count == 2
+        block.value += "\nNote 2: ship beta"
+        mirror.update({"Current focus": "z3"})
+        mirror.flush()
+        assert client.blocks.retrieve.call_count == 3
+        assert block.value.endswith("Current focus: z3\nNote: Alice owns the budget\nNote 2: ship beta")
+        assert mirror.drifts == 2
+
+    def test_unchanged_value_is_not_written(self):
+        block = _FakeBlock("Topic: Same")
+        mirror = SwarmContextMirror(block.client(), "block-1")
+
+        mirror.update({"Topic": "Same"})
+        mirror.flush()
+
+        assert block.writes == []
+        assert mirror.writes == 0
+
+    def test_failed_flush_keeps_updates_pending(self):
+        block = _FakeBlock("Topic: A")
+        client = block.client()
+        client.blocks.update.side_effect = Exception("Server error")
+        mirror = SwarmContextMirror(client, "block-1")
+
+        mirror.update({"Topic": "B"})
+        assert mirror.flush() is False
+        assert mirror.pending
+
+        client.blocks.update.side_effect = None
+        assert mirror.close() is True
+        assert client.blocks.update.call_args.kwargs["value"] == "Topic: B"
+
+    def test_concurrent_updates_are_not_lost(self):
+        block = _FakeBlock("")
+        mirror = SwarmContextMirror(block.client(), "block-1")
+
+        def update_and_flush(i):
+            mirror.update({f"K{i}": str(i)})
+            mirror.flush()
+
+        threads = [threading.Thread(target=update_and_flush, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+
+        assert sorted(block.value.splitlines()) == sorted(f"K{i}: {i}" for i in range(8))
+
+
 # ---------------------------------------------------------------------------
 # setup_cross_agent_messaging (high-level)
 # ---------------------------------------------------------------------------
@@ -505,6 +695,19 @@ class TestTeardownCrossAgentMessaging:
 
         mock_remove.assert_called_once_with(client, ["a-1", "a-2"], "sess-1")
 
+    @patch.object(cross_agent, "remove_session_tags")
+    def test_background_returns_thread(self, mock_remove):
+        client = _mock_client()
+        states = [_agent_state("a-1")]
+
+        thread = teardown_cross_agent_messaging(
+            client, ["a-1"], "sess-1", agent_states=states, background=True
+        )
+        thread.join(5)
+
+        assert not thread.daemon
+        mock_remove.assert_called_once_with(client, states, "sess-1")
+
 
 # ---------------------------------------------------------------------------
 # SPDSAgent.create_new multi-agent support
@@ -642,8 +845,47 @@ class TestSwarmManagerCrossAgent:
             client=mgr.client,
             agent_ids=["agent-1"],
             session_id="s1",
+            agent_states=[mock_agent.agent],
+            background=True,
         )
 
+    def test_topic_update_is_written_behind_and_flushed_at_end(self):
+        """_start_meeting batches the topic; _end_meeting flushes it."""
+        from spds.swarm_manager import SwarmManager
+
+        block = _FakeBlock("Topic: \nParticipants: Alice")
+        mgr = object.__new__(SwarmManager)
+        mgr.client = block.client()
+        mgr.agents = []
+        mgr._secretary = None
+        mgr.secretary_agent_id = None
+        mgr._conversation_manager = None
+        mgr._cross_agent_info = {"swarm_context_block_id": "block-1"}
+        mgr._append_history = MagicMock()
+
+        mgr._start_meeting("Budget")
+        assert block.writes == []
+
+        mgr._end_meeting()
+        assert block.value == "Topic: Budget\nParticipants: Alice"
+
+    def test_each_turn_writes_topic_and_focus_together(self):
+        """The first turn writes the recorded topic with the focus; unchanged turns write nothing."""
+        from spds.swarm_manager import SwarmManager
+
+        block = _FakeBlock("Topic: \nParticipants: Alice")
+        client = block.client()
+        mgr = object.__new__(SwarmManager)
+        mgr.client = client
+        mgr._cross_agent_info = {"swarm_context_block_id": "block-1"}
+        mgr._swarm_context_mirror().update({"Topic": "Budget"})
+
+        mgr._sync_swarm_context("Budget")
+        mgr._sync_swarm_context("Budget")
+
+        assert block.writes == ["Topic: Budget\nParticipants: Alice\nCurrent focus: Budget"]
+        assert client.blocks.retrieve.call_count == 1
+
     def test_teardown_noop_without_cross_agent_info(self):
         """_teardown_cross_agent is a no-op when _cross_agent_info is None."""
         from spds.swarm_manager import SwarmManager
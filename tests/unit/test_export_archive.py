@@ -0,0 +1,116 @@
+"""Unit tests for compressed, content-addressed export archives."""
+
+import os
+import time
+import zipfile
+from pathlib import Path
+
+from spds.export_archive import (
+    BUNDLE_SUFFIX,
+    MANIFEST_NAME,
+    ExportArchive,
+    content_hash,
+    prune_archives,
+    session_key,
+)
+from spds.export_manager import ExportManager
+from tests.unit.test_export_manager import build_sample_meeting_data
+
+
+def _age(path: Path, days: int) -> None:
+    old = time.time() - days * 86400
+    os.utime(path, (old, old))
+
+
+def test_session_key_is_directory_safe():
+    assert session_key("a/b c") == "a_b_c"
+    assert session_key(None) == "default"
+    assert session_key("../..") == "default"
+
+
+def test_bundle_round_trip_and_manifest(tmp_path):
+    archive = ExportArchive(tmp_path, "sess-1")
+    files = {"minutes.md": "# Minutes\n" * 200, "data.json": '{"a": 1}'}
+
+    bundle = archive.write_bundle("export_1", files, {"topic": "T"})
+
+    assert bundle.suffix == BUNDLE_SUFFIX
+    assert bundle.parent == tmp_path / "archives" / "sess-1"
+    manifest = archive.manifest(bundle)
+    assert manifest["metadata"] == {"topic": "T"}
+    assert manifest["files"]["minutes.md"]["sha256"] == content_hash(files["minutes.md"].encode())
+    assert archive.read(bundle.name, "minutes.md").decode() == files["minutes.md"]
+    with zipfile.ZipFile(bundle) as zf:
+        info = zf.getinfo(f"objects/{manifest['files']['minutes.md']['sha256']}")
+        assert info.compress_type == zipfile.ZIP_DEFLATED
+        assert info.compress_size < info.file_size
+
+
+def test_identical_outputs_are_stored_once_per_session(tmp_path):
+    archive = ExportArchive(tmp_path, "sess-1")
+    first = archive.write_bundle("export_1", {"minutes.md": "same", "data.json": "v1"})
+    second = archive.write_bundle("export_2", {"minutes.md": "same", "data.json": "v2"})
+
+    entries = archive.manifest(second)["files"]
+    assert entries["minutes.md"]["bundle"] == first.name
+    assert entries["data.json"]["bundle"] == second.name
+    with zipfile.ZipFile(second) as zf:
+        assert sorted(zf.namelist()) == sorted(
+            [MANIFEST_NAME, f"objects/{content_hash(b'v2')}"]
+        )
+    assert archive.read(second, "minutes.md") == b"same"
+
+    # Other sessions never reference this one.
+    other = ExportArchive(tmp_path, "sess-2").write_bundle("export_1", {"minutes.md": "same"})
+    assert ExportArchive(tmp_path, "sess-2").manifest(other)["files"]["minutes.md"]["bundle"] == other.name
+
+
+def test_same_name_never_overwrites(tmp_path):
+    archive = ExportArchive(tmp_path, "s")
+    first = archive.write_bundle("export", {"a.md": "a"})
+    second = archive.write_bundle("export", {"a.md": "a"})
+    assert first != second and first.exists() and second.exists()
+
+
+def test_prune_keeps_referenced_bundles(tmp_path):
+    archive = ExportArchive(tmp_path, "s")
+    oldest = archive.write_bundle("b1", {"a.md": "shared", "b.md": "gone"})
+    middle = archive.write_bundle("b2", {"c.md": "only-old"})
+    newest = archive.write_bundle("b3", {"a.md": "shared", "d.md": "new"})
+    for bundle in (oldest, middle):
+        _age(bundle, 40)
+
+    removed = prune_archives(tmp_path, time.time() - 30 * 86400)
+
+    assert removed == 1
+    assert oldest.exists() and not middle.exists() and newest.exists()
+    assert archive.read(newest, "a.md") == b"shared"
+
+
+def test_complete_package_archive_mode(tmp_path):
+    manager = ExportManager(export_directory=str(tmp_path))
+    meeting_data = build_sample_meeting_data()
+
+    paths = manager.export_complete_package(meeting_data, archive=True, session_id="sess-9")
+
+    assert len(paths) == 1 and paths[0].endswith(BUNDLE_SUFFIX)
+    assert not list(tmp_path.glob("meeting_package_*"))
+    archive = ExportArchive(tmp_path, "sess-9")
+    assert set(archive.manifest(paths[0])["files"]) == {
+        "minutes.md", "transcript.txt", "formatted.md", "actions.md", "summary.md", "data.json",
+    }
+    assert b"Draft follow-up report" in archive.read(paths[0], "actions.md")
+    assert "archive" in manager.last_package_timings
+
+    again = manager.export_complete_package(meeting_data, archive=True, session_id="sess-9")
+    assert archive.manifest(again[0])["files"]["minutes.md"]["bundle"] == Path(paths[0]).name
+
+
+def test_complete_package_archive_follows_config(tmp_path, monkeypatch):
+    monkeypatch.setenv("SPDS_EXPORT_ARCHIVE", "true")
+    manager = ExportManager(export_directory=str(tmp_path))
+
+    paths = manager.export_complete_package(build_sample_meeting_data())
+
+    assert paths[0].endswith(BUNDLE_SUFFIX)
+    assert Path(paths[0]).parent.name == "default"
@@ -0,0 +1,141 @@
+"""Unit tests for the SQLite export manifest index."""
+
+import os
+import time
+from pathlib import Path
+
+from spds.export_index import ExportIndex, classify_export, get_export_index
+from spds.export_manager import ExportManager, export_session_to_json, export_session_to_markdown
+from tests.unit.test_export_manager import build_sample_meeting_data
+
+
+def _messages():
+    return [{"role": "user", "content": "hello", "message_type": "user_message"}]
+
+
+def test_classify_export_names():
+    assert classify_export(Path("x/transcript_20250101_120000.txt")) == ("transcript", None)
+    assert classify_export(Path("x/meeting_package_20250101_120000_actions.md")) == ("actions", None)
+    assert classify_export(Path("s1/summary_s1_20250101_120000.json")) == ("session_json", "s1")
+    assert classify_export(Path("archives/s1/b.spdsx")) == ("archive", "s1")
+    assert classify_export(Path("x/notes.txt")) == ("other", None)
+
+
+def test_exports_are_recorded_with_hash_and_format(tmp_path):
+    manager = ExportManager(export_directory=str(tmp_path))
+    manager.export_complete_package(build_sample_meeting_data(), session_id="sess-1")
+
+    records = get_export_index().list(directory=tmp_path)
+    assert sorted(r.format for r in records) == sorted(
+        ["minutes", "transcript", "formatted", "actions", "summary", "data"]
+    )
+    assert {r.session_id for r in records} == {"sess-1"}
+    for record in records:
+        assert record.size == Path(record.path).stat().st_size
+        assert len(record.sha256) == 64
+
+
+def test_list_exports_comes_from_the_index(tmp_path):
+    manager = ExportManager(export_directory=str(tmp_path))
+    path = manager.export_executive_summary(build_sample_meeting_data())
+    assert manager.list_exports() == [str(Path(path).resolve())]
+
+    # Files added or removed behind the index's back show up on the next list.
+    later = tmp_path / "later.txt"
+    later.write_text("x", encoding="utf-8")
+    assert len(manager.list_exports()) == 2
+    later.unlink()
+    assert manager.list_exports() == [str(Path(path).resolve())]
+    assert manager.rebuild_index() == 1
+
+
+def test_rescan_after_directory_change_only_hashes_new_files(tmp_path, monkeypatch):
+    from spds import export_index
+
+    index = ExportIndex(tmp_path / "idx.sqlite3")
+    exports = tmp_path / "exports"
+    exports.mkdir()
+    (exports / "transcript_1.txt").write_text("one", encoding="utf-8")
+    index.ensure_scanned(exports)
+
+    hashed = []
+    original = export_index._file_hash
+    monkeypatch.setattr(export_index, "_file_hash", lambda p: hashed.append(p.name) or original(p))
+    index.ensure_scanned(exports)
+    assert hashed == []
+
+    (exports / "transcript_2.txt").write_text("two", encoding="utf-8")
+    index.ensure_scanned(exports)
+    assert hashed == ["transcript_2.txt"]
+    assert sorted(r.filename for r in index.list(directory=exports)) == [
+        "transcript_1.txt",
+        "transcript_2.txt",
+    ]
+
+
+def test_index_is_rebuilt_from_disk_when_lost(tmp_path, monkeypatch):
+    manager = ExportManager(export_directory=str(tmp_path / "exports"))
+    manager.export_action_items([{"description": "x"}], {"topic": "T"})
+    export_session_to_json("sess-2", messages=_messages(), dest_dir=tmp_path / "exports" / "sessions" / "sess-2")
+
+    monkeypatch.setenv("SPDS_EXPORT_INDEX_PATH", str(tmp_path / "fresh.sqlite3"))
+    fresh = get_export_index()
+    assert fresh.list() == []
+
+    assert len(manager.list_exports()) == 1  # first query scans the directory
+    assert fresh.rebuild(tmp_path / "exports") == 2
+    (session_record,) = fresh.list(session_id="sess-2")
+    assert session_record.format == "session_json"
+
+
+def test_unchanged_directory_is_not_rescanned(tmp_path, monkeypatch):
+    index = ExportIndex(tmp_path / "idx.sqlite3")
+    exports = tmp_path / "exports"
+    exports.mkdir()
+    (exports / "transcript_1.txt").write_text("one", encoding="utf-8")
+    hour_ago = time.time() - 3600
+    os.utime(exports, (hour_ago, hour_ago))
+    index.ensure_scanned(exports)
+
+    rescans = []
+    monkeypatch.setattr(index, "rebuild_directory", lambda *a, **k: rescans.append(a))
+    index.ensure_scanned(exports)
+    assert rescans == []
+
+
+def test_cleanup_uses_recorded_times(tmp_path):
+    manager = ExportManager(export_directory=str(tmp_path))
+    old = Path(manager.export_executive_summary(build_sample_meeting_data()))
+    new = Path(manager.export_structured_data({"a": 1}))
+    index = get_export_index()
+    index.ensure_scanned(tmp_path)
+    past = time.time() - 40 * 86400
+    os.utime(old, (past, past))
+    index.record(old)
+
+    assert manager.cleanup_old_exports(days_old=30) == 1
+    assert not old.exists() and new.exists()
+    assert [r.path for r in index.list(directory=tmp_path)] == [str(new.resolve())]
+
+
+def test_session_exports_are_listed_per_session_newest_first(tmp_path):
+    index = ExportIndex(tmp_path / "idx.sqlite3")
+    session_dir = tmp_path / "sessions" / "s1"
+    session_dir.mkdir(parents=True)
+    for i, name in enumerate(["summary_s1_1.json", "minutes_s1_1.md", "notes.txt"]):
+        path = session_dir / name
+        path.write_text(name, encoding="utf-8")
+        os.utime(path, (1_000_000 + i, 1_000_000 + i))
+
+    index.ensure_scanned(session_dir, "s1")
+    records = index.list(session_id="s1", formats=["session_json", "session_markdown"])
+
+    assert [r.filename for r in records] == ["minutes_s1_1.md", "summary_s1_1.json"]
+    assert [r.filename for r in index.list(session_id="s1", limit=1)] == ["notes.txt"]
+
+
+def test_streamed_session_export_is_recorded(tmp_path):
+    path = export_session_to_markdown("s3", messages=_messages(), dest_dir=tmp_path)
+    (record,) = get_export_index().list(session_id="s3")
+    assert record.path == str(path.resolve())
+    assert record.format == "session_markdown"
@@ -0,0 +1,98 @@
+"""Unit tests for the background export job queue."""
+
+import threading
+
+import pytest
+
+from spds.export_jobs import DONE, FAILED, QUEUED, ExportJobQueue
+
+
+@pytest.fixture
+def queue():
+    updates = []
+    q = ExportJobQueue(max_workers=1, on_update=lambda job: updates.append(job.to_dict()))
+    q.updates = updates
+    yield q
+    q.shutdown()
+
+
+def _wait(job, updates=None, timeout=5):
+    """Wait until ``job`` finished (and, given ``updates``, its final update was delivered)."""
+    for _ in range(int(timeout / 0.01)):
+        delivered = updates is None or any(
+            u["job_id"] == job.id and u["status"] in (DONE, FAILED) for u in updates
+        )
+        if job.finished and delivered:
+            return job
+        threading.Event().wait(0.01)
+    raise AssertionError(f"job {job.id} did not finish")
+
+
+def test_job_reports_progress_and_result(queue):
+    def export(progress):
+        progress(0.5, "half way")
+        return {"file": "out.md"}
+
+    job, deduplicated = queue.submit("s1", "minutes", export)
+    assert not deduplicated
+    _wait(job, queue.updates)
+
+    assert queue.get(job.id).status == DONE
+    assert job.result == {"file": "out.md"}
+    statuses = [(u["status"], u["message"]) for u in queue.updates]
+    assert statuses[0] == (QUEUED, "Queued")
+    assert ("running", "half way") in statuses
+    assert statuses[-1] == (DONE, "Export complete")
+    assert queue.updates[-1]["progress"] == 1.0
+
+
+def test_failed_job_keeps_error(queue):
+    def export(progress):
+        raise RuntimeError("disk full")
+
+    job, _ = queue.submit("s1", "all", export)
+    _wait(job, queue.updates)
+    assert job.status == FAILED
+    assert job.error == "disk full"
+    assert queue.updates[-1]["status"] == FAILED
+
+
+def test_identical_queued_jobs_are_deduplicated(queue):
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocker(progress):
+        started.set()
+        release.wait(5)
+
+    calls = []
+    first, _ = queue.submit("s1", "all", blocker)
+    started.wait(5)
+    # The running job is not reused; the next one queues behind it (one worker).
+    second, dup = queue.submit("s1", "all", lambda p: calls.append("second"))
+    assert not dup and second.id != first.id
+    third, dup = queue.submit("s1", "all", lambda p: calls.append("third"))
+    assert dup and third is second
+    other, dup = queue.submit("s1", "summary", lambda p: calls.append("summary"))
+    assert not dup
+    assert queue.active_count() == 3
+
+    release.set()
+    _wait(other)
+    _wait(second)
+    assert sorted(calls) == ["second", "summary"]
+    assert [job.id for job in queue.jobs("s1")] == [first.id, second.id, other.id]
+
+
+def test_finished_jobs_are_trimmed():
+    q = ExportJobQueue(max_workers=1, keep_finished=2)
+    try:
+        jobs = []
+        for i in range(4):
+            job, _ = q.submit("s", f"fmt{i}", lambda p: None)
+            jobs.append(_wait(job))
+        assert q.get(jobs[0].id) is None
+        assert q.get(jobs[3].id) is not None
+        assert len(q.jobs()) == 2
+    finally:
+        q.shutdown()
@@ -307,6 +307,73 @@ def test_export_complete_package_skips_transcript_when_no_log(tmp_path):
     assert not any("transcript" in path for path in exported_paths)
 
 
+def test_export_complete_package_reports_timings_per_format(tmp_path):
+    manager = ExportManager(export_directory=str(tmp_path))
+
+    manager.export_complete_package(build_sample_meeting_data())
+
+    assert set(manager.last_package_timings) == {
+        "normalize", "minutes", "transcript", "formatted", "actions", "summary", "data", "total",
+    }
+    assert all(seconds >= 0 for seconds in manager.last_package_timings.values())
+
+
+def test_export_complete_package_parallel_matches_serial(tmp_path, monkeypatch):
+    meeting_data = build_sample_meeting_data()
+    monkeypatch.setenv("SPDS_EXPORT_WORKERS", "1")
+    serial = ExportManager(export_directory=str(tmp_path / "serial"))
+    serial_paths = serial.export_complete_package(meeting_data)
+    monkeypatch.setenv("SPDS_EXPORT_WORKERS", "6")
+    parallel = ExportManager(export_directory=str(tmp_path / "parallel"))
+    parallel_paths = parallel.export_complete_package(meeting_data)
+
+    assert [Path(p).name.rsplit("_", 1)[1] for p in serial_paths] == [
+        "minutes.md", "transcript.txt", "formatted.md", "actions.md", "summary.md", "data.json",
+    ]
+
+    def stable_lines(path):
+        # Lines stamped with datetime.now() may differ by a second.
+        text = Path(path).read_text(encoding="utf-8")
+        return [line for line in text.splitlines() if "Date" not in line and "ended" not in line]
+
+    for left, right in zip(serial_paths, parallel_paths):
+        assert stable_lines(left) == stable_lines(right)
+
+
+def test_export_complete_package_renders_concurrently(tmp_path, monkeypatch):
+    import threading
+
+    monkeypatch.setenv("SPDS_EXPORT_WORKERS", "4")
+    manager = ExportManager(export_directory=str(tmp_path))
+    barrier = threading.Barrier(2, timeout=5)
+    original = manager._render_raw_transcript
+
+    def rendezvous(*args):
+        barrier.wait()
+        return original(*args)
+
+    def summary_rendezvous(meeting_data):
+        barrier.wait()
+        return "summary"
+
+    monkeypatch.setattr(manager, "_render_raw_transcript", rendezvous)
+    monkeypatch.setattr(manager, "_render_executive_summary", summary_rendezvous)
+
+    # Would deadlock (BrokenBarrierError) if formats were rendered one by one.
+    paths = manager.export_complete_package(build_sample_meeting_data())
+    assert len(paths) == 6
+
+
+def test_transcript_accepts_iso_string_timestamps(tmp_path):
+    manager = ExportManager(export_directory=str(tmp_path))
+    log = [{"timestamp": "2024-01-01T09:30:00", "speaker": "Ann", "message": "hi"}, {"message": "x"}]
+
+    content = Path(manager.export_raw_transcript(log, {"topic": "T"})).read_text(encoding="utf-8")
+
+    assert "[09:30:00] Ann: hi" in content
+    assert "Unknown: x" in content
+
+
 def test_list_exports_handles_missing_directory(tmp_path):
     manager = ExportManager(export_directory=str(tmp_path / "missing"))
 
@@ -377,3 +444,82 @@ def test_prepare_for_json_handles_various_types(tmp_path):
     assert prepared["items"][0] == datetime(2024, 2, 3, 15, 45, 0).isoformat()
     assert prepared["items"][1]["nested"] == datetime(2024, 2, 4, 8, 15, 0).isoformat()
     assert prepared["value"] == "text"
+
+
+def _history(count: int, start: int = 0):
+    from spds.message import ConversationMessage
+
+    base = datetime(2024, 1, 1, 9, 0, 0)
+    return [
+        ConversationMessage(
+            sender=f"Agent{i % 2}", content=f"message {i}", timestamp=base + timedelta(seconds=i)
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def test_live_transcript_appends_only_new_messages(tmp_path):
+    manager = ExportManager(str(tmp_path))
+    metadata = {"topic": "Roadmap", "participants": ["Agent0", "Agent1"]}
+    history = _history(3)
+
+    path = Path(manager.export_live_transcript(history, metadata, session_id="s-1"))
+    assert path == tmp_path / "live" / "transcript_s-1.txt"
+    assert manager.last_live_export["full_render"] is True
+    assert manager.last_live_export["appended"] == 3
+    first = path.read_text(encoding="utf-8")
+    assert "Topic: Roadmap" in first
+    assert "[09:00:02] Agent0: message 2\n" in first
+
+    history.extend(_history(2, start=3))
+    manager.export_live_transcript(history, metadata, session_id="s-1")
+    assert manager.last_live_export == {
+        "path": str(path),
+        "appended": 2,
+        "full_render": False,
+    }
+    assert path.read_text(encoding="utf-8") == (
+        first + "[09:00:03] Agent1: message 3\n[09:00:04] Agent0: message 4\n"
+    )
+
+    manager.export_live_transcript(history, metadata, session_id="s-1")
+    assert manager.last_live_export["appended"] == 0
+    assert path.read_text(encoding="utf-8").count("message") == 5
+
+
+def test_live_transcript_rerenders_on_format_change_or_mismatch(tmp_path):
+    manager = ExportManager(str(tmp_path))
+    metadata = {"topic": "Roadmap"}
+    history = _history(4)
+    path = Path(manager.export_live_transcript(history, metadata, session_id="s-2"))
+    state_path = path.with_name("transcript_s-2.state.json")
+
+    state = json.loads(state_path.read_text(encoding="utf-8"))
+    state["format"] = 0
+    state_path.write_text(json.dumps(state), encoding="utf-8")
+    manager.export_live_transcript(history, metadata, session_id="s-2")
+    assert manager.last_live_export["full_render"] is True
+    assert path.read_text(encoding="utf-8").count("message") == 4
+
+    # A file edited behind the watermark's back is rebuilt rather than appended to.
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("stray line\n")
+    manager.export_live_transcript(history, metadata, session_id="s-2")
+    assert manager.last_live_export["full_render"] is True
+    assert "stray line" not in path.read_text(encoding="utf-8")
+
+    # A shorter history means it was rewritten.
+    manager.export_live_transcript(history[:2], metadata, session_id="s-2")
+    assert manager.last_live_export["full_render"] is True
+    assert path.read_text(encoding="utf-8").count("message") == 2
+
+
+def test_live_transcript_accepts_conversation_log_dicts(tmp_path):
+    manager = ExportManager(str(tmp_path))
+    data = build_sample_meeting_data()
+
+    path = manager.export_live_transcript(data["conversation_log"], data["metadata"])
+    content = Path(path).read_text(encoding="utf-8")
+    assert Path(path).name == "transcript_default.txt"
+    assert "Participants: Alice, Bob, Charlie" in content
+    assert "[09:25:00] Charlie: Another in-depth message" in content
@@ -43,6 +43,7 @@ def _mock_conversation_manager(messages=None, summary_dict=None):
     """Create a mock ConversationManager that returns given messages."""
     cm = MagicMock()
     cm.list_messages.return_value = messages or []
+    cm.iter_messages.side_effect = lambda *args, **kwargs: iter(messages or [])
     cm.get_session_summary.return_value = summary_dict or {"id": "conv-123"}
     return cm
 
@@ -293,3 +294,67 @@ class TestExportFunctions:
             assert "conv-default" in str(md_path)
         finally:
             spds.export_manager.config.DEFAULT_EXPORT_DIRECTORY = original
+
+
+class TestStreamingExport:
+    """Session exports page through the conversation instead of loading it whole."""
+
+    @staticmethod
+    def _paged_manager(count, page_size_seen):
+        msgs = _make_messages([f"message {i} with \"quotes\" and ünïcode" for i in range(count)])
+        for i, msg in enumerate(msgs):
+            msg["id"] = f"msg-{i}"
+
+        def iter_messages(conversation_id, page_size=100):
+            page_size_seen.append(page_size)
+            for start in range(0, len(msgs), page_size):
+                yield from msgs[start : start + page_size]
+
+        cm = _mock_conversation_manager(
+            messages=msgs, summary_dict={"id": "conv-long", "summary": "Long"}
+        )
+        cm.iter_messages.side_effect = iter_messages
+        return cm, msgs
+
+    def test_markdown_matches_in_memory_summary(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SPDS_EXPORT_PAGE_SIZE", "7")
+        seen = []
+        cm, msgs = self._paged_manager(50, seen)
+
+        path = export_session_to_markdown("conv-long", conversation_manager=cm, dest_dir=tmp_path)
+
+        expected = build_session_summary(messages=msgs, conversation_manager=cm, conversation_id="conv-long")
+        assert path.read_text(encoding="utf-8") == expected["minutes_markdown"]
+        assert "**Total Messages**: 50" in expected["minutes_markdown"]
+        assert seen == [7]
+        cm.list_messages.assert_not_called()
+
+    def test_json_matches_in_memory_summary(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SPDS_EXPORT_PAGE_SIZE", "7")
+        cm, msgs = self._paged_manager(20, [])
+
+        path = export_session_to_json("conv-long", conversation_manager=cm, dest_dir=tmp_path)
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        expected = build_session_summary(messages=msgs, conversation_manager=cm, conversation_id="conv-long")
+        assert data == json.loads(json.dumps(expected, default=str))
+
+    def test_json_with_no_messages(self, tmp_path):
+        path = export_session_to_json("conv-empty", messages=[], dest_dir=tmp_path)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["messages"] == []
+        assert "*No messages recorded.*" in data["minutes_markdown"]
+
+    def test_failure_leaves_no_partial_files(self, tmp_path):
+        def broken(conversation_id, page_size=100):
+            yield {"role": "user", "content": "first"}
+            raise RuntimeError("connection lost")
+
+        cm = _mock_conversation_manager()
+        cm.iter_messages.side_effect = broken
+
+        with pytest.raises(RuntimeError):
+            export_session_to_json("conv-x", conversation_manager=cm, dest_dir=tmp_path)
+        with pytest.raises(RuntimeError):
+            export_session_to_markdown("conv-x", conversation_manager=cm, dest_dir=tmp_path)
+        assert list(tmp_path.iterdir()) == []
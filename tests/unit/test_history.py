@@ -0,0 +1,122 @@
+"""Unit tests for the incrementally maintained ConversationHistory."""
+
+import pickle
+from datetime import datetime, timedelta
+
+from spds.history import ConversationHistory
+from spds.message import ConversationMessage, messages_to_flat_format
+
+
+def _msgs(count, start=0):
+    base = datetime(2024, 1, 1, 9, 0, 0)
+    return [
+        ConversationMessage(f"Agent{i % 3}", f"message {i}", base + timedelta(seconds=i))
+        for i in range(start, start + count)
+    ]
+
+
+def test_flat_matches_messages_to_flat_format():
+    history = ConversationHistory(_msgs(5))
+    assert history.flat() == messages_to_flat_format(list(history))
+
+
+def test_empty_history_flattens_to_empty_string():
+    history = ConversationHistory()
+    assert history.flat() == ""
+    assert history.flat_since(0) == ""
+
+
+def test_appends_after_read_are_picked_up():
+    history = ConversationHistory(_msgs(2))
+    first = history.flat()
+    history.append(_msgs(1, start=2)[0])
+    history.extend(_msgs(2, start=3))
+    history += _msgs(1, start=5)
+    assert history.flat().startswith(first + "\n")
+    assert history.flat() == messages_to_flat_format(list(history))
+
+
+def test_repeated_reads_return_cached_string():
+    history = ConversationHistory(_msgs(3))
+    assert history.flat() is history.flat()
+
+
+def test_flat_since_returns_suffix():
+    messages = _msgs(6)
+    history = ConversationHistory(messages)
+    for index in range(len(messages) + 2):
+        assert history.flat_since(index) == messages_to_flat_format(messages[index:])
+
+
+def test_window_reads_do_not_join_the_whole_history():
+    messages = _msgs(50)
+    history = ConversationHistory(messages)
+    for msg in _msgs(3, start=50):
+        history.append(msg)
+        assert history.flat_since(len(history) - 2) == messages_to_flat_format(history[-2:])
+    assert history._flat == ""
+    assert history.flat_range(10, 12) == messages_to_flat_format(messages[10:12])
+
+
+def test_non_append_mutations_invalidate_buffer():
+    history = ConversationHistory(_msgs(4))
+    history.flat()
+    history[1] = ConversationMessage("Zed", "replaced", datetime(2024, 1, 2))
+    assert "Zed: replaced" in history.flat()
+    del history[0]
+    history.insert(0, ConversationMessage("Amy", "first", datetime(2024, 1, 3)))
+    history.pop()
+    history.reverse()
+    assert history.flat() == messages_to_flat_format(list(history))
+    history.clear()
+    assert history.flat() == ""
+
+
+def test_slices_are_plain_lists_and_pickle_round_trips():
+    history = ConversationHistory(_msgs(3))
+    assert type(history[1:]) is list
+    restored = pickle.loads(pickle.dumps(history))
+    assert isinstance(restored, ConversationHistory)
+    assert restored.flat() == history.flat()
+
+
+def test_since_last_turn_view_does_not_copy():
+    history = ConversationHistory(_msgs(5))
+    agent = type("Agent", (), {"last_message_index": 1})()
+    view = history.since_last_turn(agent)
+    assert len(view) == 3
+    assert view[0] is history[2]
+    assert view[-1] is history[4]
+    assert [m.content for m in view[-2:]] == ["message 3", "message 4"]
+    assert view == list(history[2:])
+    assert view.flat() == messages_to_flat_format(history[2:])
+    assert messages_to_flat_format(view) == view.flat()
+
+
+def test_view_window_is_fixed_at_creation():
+    history = ConversationHistory(_msgs(3))
+    view = history.since(0)
+    history.append(_msgs(1, start=3)[0])
+    assert len(view) == 2
+    assert view.flat() == "Agent1: message 1\nAgent2: message 2"
+
+
+def test_record_turn_moves_cursor_to_latest_message():
+    history = ConversationHistory(_msgs(4))
+    agent = type("Agent", (), {})()
+    assert len(history.since_last_turn(agent)) == 4
+    history.record_turn(agent)
+    assert history.cursor(agent) == 3
+    assert not hasattr(agent, "last_message_index")
+    assert not history.since_last_turn(agent)
+    assert history.since_last_turn(agent).flat() == ""
+    history.append(_msgs(1, start=4)[0])
+    assert history.since_last_turn(agent).flat() == "Agent1: message 4"
+
+
+def test_cursor_past_end_yields_empty_view():
+    history = ConversationHistory(_msgs(2))
+    view = history.since(10)
+    assert len(view) == 0
+    assert list(view) == []
+    assert view.flat() == ""
@@ -0,0 +1,200 @@
+"""Unit tests for the append-only on-disk history log and paged histories."""
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from spds.history import ConversationHistory
+from spds.history_log import HistoryLog
+from spds.message import ConversationMessage, messages_to_flat_format
+
+
+def _msgs(count, start=0):
+    base = datetime(2024, 1, 1, 9, 0, 0)
+    return [
+        ConversationMessage(f"Agent{i % 3}", f"message {i}\nwith escapes", base + timedelta(seconds=i))
+        for i in range(start, start + count)
+    ]
+
+
+def test_append_and_read_across_segments(tmp_path):
+    log = HistoryLog(tmp_path, segment_size=4)
+    messages = _msgs(10)
+    for msg in messages:
+        log.append(msg)
+
+    assert len(log) == 10
+    assert log.read(0) == messages[0]
+    assert log.read(9) == messages[9]
+    assert log.read_range(3, 9) == messages[3:9]
+    assert sorted(p.name for p in tmp_path.glob("seg-*.idx")) == [
+        "seg-000000.idx",
+        "seg-000001.idx",
+        "seg-000002.idx",
+    ]
+    with pytest.raises(IndexError):
+        log.read(10)
+    log.close()
+
+
+def test_reopen_keeps_segment_size_and_contents(tmp_path):
+    log = HistoryLog(tmp_path, segment_size=3)
+    for msg in _msgs(7):
+        log.append(msg)
+    log.close()
+
+    reopened = HistoryLog(tmp_path, segment_size=50)
+    assert reopened.segment_size == 3
+    assert len(reopened) == 7
+    reopened.append(_msgs(1, start=7)[0])
+    assert [m.content for m in reopened.read_range(5, 8)] == [
+        "message 5\nwith escapes",
+        "message 6\nwith escapes",
+        "message 7\nwith escapes",
+    ]
+    reopened.close()
+
+
+def test_timezone_aware_timestamps_round_trip(tmp_path):
+    log = HistoryLog(tmp_path)
+    msg = ConversationMessage("You", "hi", datetime(2024, 5, 1, 12, tzinfo=timezone.utc))
+    log.append(msg)
+    assert log.read(0).timestamp == msg.timestamp
+    log.close()
+
+
+def test_unindexed_tail_is_truncated_on_open(tmp_path):
+    log = HistoryLog(tmp_path, segment_size=10)
+    for msg in _msgs(3):
+        log.append(msg)
+    log.close()
+    # Simulate a crash after the data line was written but before its index entry.
+    with open(tmp_path / "seg-000000.jsonl", "ab") as fh:
+        fh.write(b'{"sender": "Agent0", "content": "half')
+
+    reopened = HistoryLog(tmp_path)
+    assert len(reopened) == 3
+    reopened.append(_msgs(1, start=3)[0])
+    assert reopened.read(3).content == "message 3\nwith escapes"
+    reopened.close()
+
+
+def test_disk_backed_history_keeps_only_tail_resident(tmp_path):
+    log = HistoryLog(tmp_path, segment_size=5)
+    history = ConversationHistory()
+    history.attach_log(log, resident=8)
+    messages = _msgs(40)
+    for msg in messages:
+        history.append(msg)
+
+    resident = [m for m in list.__iter__(history) if m is not None]
+    assert len(resident) < 20
+    assert len(history) == 40
+    assert history[0] == messages[0]
+    assert history[-1] is messages[-1]
+    assert history[5:12] == messages[5:12]
+    assert list(history) == messages
+    assert history.flat() == messages_to_flat_format(messages)
+    assert history.since(9).flat() == messages_to_flat_format(messages[10:])
+    assert list(history.since(9)) == messages[10:]
+
+
+def test_restore_from_log_loads_only_the_tail(tmp_path):
+    log = HistoryLog(tmp_path, segment_size=5)
+    messages = _msgs(30)
+    for msg in messages:
+        log.append(msg)
+
+    restored = ConversationHistory.from_log(log, resident=6)
+    assert len(restored) == 30
+    assert sum(1 for m in list.__iter__(restored) if m is not None) == 6
+    assert restored.flat() == messages_to_flat_format(messages)
+
+    restored.append(_msgs(1, start=30)[0])
+    assert len(HistoryLog(tmp_path)) == 31
+
+
+def test_windowed_reads_of_a_restored_history_stay_off_disk(tmp_path):
+    log = HistoryLog(tmp_path, segment_size=5)
+    messages = _msgs(30)
+    for msg in messages:
+        log.append(msg)
+    restored = ConversationHistory.from_log(log, resident=6)
+
+    reads = []
+    original = log.read_range
+    log.read_range = lambda start, stop: reads.append((start, stop)) or original(start, stop)
+
+    assert restored.since(26).flat() == messages_to_flat_format(messages[27:])
+    assert restored.flat_range(25, 30) == messages_to_flat_format(messages[25:])
+    assert reads == []
+    assert restored.flat_range(20, 26) == messages_to_flat_format(messages[20:26])
+    assert reads == [(20, 24)]
+    # Windowed reads never build the whole-session buffer
+    assert restored._buffer is None and restored._lines == []
+
+    # flat() reads the log once; later appends only extend its buffer
+    assert restored.flat() == messages_to_flat_format(messages)
+    reads.clear()
+    extra = _msgs(2, start=30)
+    for msg in extra:
+        restored.append(msg)
+    assert restored.flat() == messages_to_flat_format(messages + extra)
+    assert reads == []
+
+
+def test_log_is_safe_to_share_between_threads(tmp_path):
+    log = HistoryLog(tmp_path, segment_size=3, cache_segments=1)
+    messages = _msgs(200)
+    errors = []
+
+    def reader():
+        try:
+            for _ in range(200):
+                count = len(log)
+                if count:
+                    assert len(log.read_range(0, count)) == count
+        except Exception as e:  # pragma: no cover - surfaced below
+            errors.append(e)
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for msg in messages:
+        log.append(msg)
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert log.read_range(0, 200) == messages
+    log.close()
+
+
+def test_rewriting_a_disk_backed_history_detaches_the_log(tmp_path):
+    log = HistoryLog(tmp_path, segment_size=5)
+    history = ConversationHistory()
+    history.attach_log(log, resident=4)
+    messages = _msgs(20)
+    history.extend(messages)
+
+    history.reverse()
+    assert history.log is None
+    assert list(history) == messages[::-1]
+
+
+def test_swarm_manager_attach_history_log_restores(tmp_path):
+    from spds.swarm_manager import SwarmManager
+
+    first = SwarmManager.__new__(SwarmManager)
+    first._history = ConversationHistory()
+    first.session_id = "s1"
+    assert first.attach_history_log(directory=tmp_path) == 0
+    first._append_history("You", "Hello")
+    first._append_history("Alex", "Hi there")
+
+    second = SwarmManager.__new__(SwarmManager)
+    second._history = ConversationHistory()
+    second.session_id = "s1"
+    assert second.attach_history_log(directory=tmp_path) == 2
+    assert second.conversation_history == "You: Hello\nAlex: Hi there"
@@ -0,0 +1,141 @@
+"""Unit tests for the incrementally maintained meeting minutes."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from spds.minutes import MinutesModel
+from spds.secretary_agent import SecretaryAgent, _split_polished_sections
+
+META = {"topic": "Launch plan", "meeting_type": "planning"}
+
+
+def _feed(model, messages):
+    for speaker, text in messages:
+        model.observe(speaker, text)
+
+
+def test_tracks_participants_decisions_and_action_items():
+    model = MinutesModel(max_section=40)
+    _feed(
+        model,
+        [
+            ("You", "Let's settle the launch date."),
+            ("Alex", "Pricing looks fine. We decided to launch on the 12th."),
+            ("System", "Alex joined a side conversation."),
+            ("Jordan", "I'll draft the announcement by Friday."),
+            ("Alex", "Sounds good."),
+        ],
+    )
+    model.add_action_item("Book the venue", assignee="Sam")
+
+    assert model.message_count == 5
+    assert model.participants == {"Alex": 2, "You": 1, "Jordan": 1}
+    assert model.decisions == [("Alex", "We decided to launch on the 12th.")]
+    assert model.action_items == [
+        ("Jordan", "I'll draft the announcement by Friday."),
+        (None, "Book the venue (assigned to: Sam)"),
+    ]
+
+    minutes = model.render(META, "formal")
+    assert minutes.startswith("# Meeting Minutes: Launch plan")
+    assert "- Alex (2 messages)" in minutes
+    assert "- Alex: We decided to launch on the 12th." in minutes
+    assert "- [ ] Book the venue (assigned to: Sam)" in minutes
+
+
+def test_outline_starts_new_section_when_focus_moves():
+    model = MinutesModel(max_section=40)
+    _feed(model, [("Alex", "database migration rollback plan")] * 6)
+    _feed(model, [("Jordan", "hiring recruiters interviews hiring budget")] * 8)
+
+    assert len(model.sections) == 2
+    first, second = model.sections
+    assert first.start == 1 and 6 <= first.end < 14
+    assert "migration" in first.focus
+    assert "hiring" in second.focus and second.end == 14
+
+
+def test_outline_caps_section_size():
+    model = MinutesModel(max_section=3)
+    _feed(model, [("Alex", "same topic every time")] * 7)
+    assert [(s.start, s.end) for s in model.sections] == [(1, 3), (4, 6), (7, 7)]
+
+
+def test_polish_cache_only_requests_new_or_grown_sections():
+    model = MinutesModel(max_section=2)
+    _feed(model, [("Alex", "first point"), ("Jordan", "second point"), ("Alex", "third point")])
+
+    assert [s.index for s in model.sections_to_polish()] == [0, 1]
+    for section in model.sections:
+        model.set_polished(section, f"Polished {section.index}")
+    assert model.sections_to_polish() == []
+    assert "Polished 0" in model.render(META)
+
+    model.observe("Jordan", "fourth point")
+    assert [s.index for s in model.sections_to_polish()] == [1]
+    assert "Polished 1" not in model.render(META)
+
+
+def test_split_polished_sections():
+    text = "Intro\n### Section 1: a\nFirst para.\n\n### Section 3\nThird para."
+    assert _split_polished_sections(text) == {1: "First para.", 3: "Third para."}
+
+
+def test_secretary_minutes_are_local_and_polish_only_new_sections(monkeypatch, mock_letta_client):
+    monkeypatch.setenv("SPDS_SECRETARY_ASYNC_OBSERVE", "false")
+    monkeypatch.setenv("SPDS_MINUTES_SECTION_SIZE", "2")
+    with patch("spds.secretary_agent.CreateBlockParam"):
+        sec = SecretaryAgent(client=mock_letta_client, mode="casual")
+    sec.meeting_metadata = dict(META)
+    create = mock_letta_client.agents.messages.create
+
+    def reply(text):
+        return SimpleNamespace(
+            messages=[SimpleNamespace(message_type="assistant_message", content=text, tool_calls=None)]
+        )
+
+    sec.observe_message("Alex", "We agreed to ship beta first.")
+    sec.observe_message("Jordan", "Beta feedback loop matters.")
+    create.reset_mock()
+    create.return_value = reply("### Section 1\nThe team chose a beta-first launch.")
+
+    local = sec.generate_minutes()
+    assert local.startswith("# Meeting Notes: Launch plan")
+    assert sec.flush_minutes_polish(timeout=5)
+    assert create.call_count == 1
+    minutes = sec.generate_minutes()
+    assert "The team chose a beta-first launch." in minutes
+    assert "The team chose a beta-first launch." not in local
+    assert "secretary.minutes" not in str(create.call_args)  # sent via letta_call
+
+    # Nothing new: no LLM call, cached wording reused.
+    create.reset_mock()
+    assert sec.generate_minutes() == minutes
+    create.assert_not_called()
+
+    # A new section only is sent for polishing.
+    sec.observe_message("Sam", "Docs need screenshots.")
+    create.reset_mock()
+    create.return_value = reply("### Section 2\nDocumentation needs screenshots.")
+    sec.generate_minutes()
+    assert sec.flush_minutes_polish(timeout=5)
+    minutes = sec.generate_minutes()
+    request = create.call_args.kwargs["messages"][0]["content"]
+    assert "### Section 2" in request and "### Section 1" not in request
+    assert "The team chose a beta-first launch." in minutes
+    assert "Documentation needs screenshots." in minutes
+
+
+def test_secretary_minutes_fall_back_to_local_text_when_polish_fails(monkeypatch, mock_letta_client):
+    monkeypatch.setenv("SPDS_SECRETARY_ASYNC_OBSERVE", "false")
+    with patch("spds.secretary_agent.CreateBlockParam"):
+        sec = SecretaryAgent(client=mock_letta_client)
+    sec.meeting_metadata = dict(META)
+    sec.observe_message("Alex", "Budget review is next week.")
+    mock_letta_client.agents.messages.create.side_effect = RuntimeError("down")
+
+    sec.generate_minutes()
+    assert sec.flush_minutes_polish(timeout=5)
+    minutes = sec.generate_minutes()
+    assert "Alex discussed" in minutes
+    assert "Alex: Budget review is next week." in minutes
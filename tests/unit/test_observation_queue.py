@@ -0,0 +1,161 @@
+"""Unit tests for the background secretary observation queue."""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from spds.observation_queue import ObservationQueue
+from spds.secretary_agent import SecretaryAgent
+
+
+def test_batches_by_size_in_order():
+    batches = []
+    queue = ObservationQueue(batches.append, batch_size=3, flush_interval=60)
+
+    for i in range(7):
+        queue.put("A", f"m{i}")
+    assert queue.flush(timeout=5)
+
+    assert [len(b) for b in batches] == [3, 3, 1]
+    assert [msg for batch in batches for _s, msg in batch] == [f"m{i}" for i in range(7)]
+    assert queue.stats() == {"depth": 0, "batches_sent": 3, "messages_sent": 7, "failures": 0}
+    queue.close(timeout=5)
+
+
+def test_interval_sends_partial_batch_without_flush():
+    sent = threading.Event()
+    queue = ObservationQueue(lambda batch: sent.set(), batch_size=100, flush_interval=0.05)
+
+    queue.put("A", "hello")
+    assert sent.wait(timeout=5)
+    queue.close(timeout=5)
+
+
+def test_put_does_not_wait_for_slow_sender_and_depth_is_reported():
+    release = threading.Event()
+    queue = ObservationQueue(lambda batch: release.wait(5), batch_size=1, flush_interval=0)
+
+    start = time.monotonic()
+    for i in range(5):
+        queue.put("A", str(i))
+    assert time.monotonic() - start < 0.5
+    assert queue.depth == 5
+    assert queue.flush(timeout=0.05) is False
+
+    release.set()
+    assert queue.flush(timeout=5)
+    assert queue.depth == 0
+    queue.close(timeout=5)
+
+
+def test_send_failures_are_counted_and_do_not_stop_the_worker():
+    calls = []
+
+    def send(batch):
+        calls.append(batch)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+
+    queue = ObservationQueue(send, batch_size=1, flush_interval=0)
+    queue.put("A", "lost")
+    queue.put("A", "kept")
+    assert queue.flush(timeout=5)
+    assert queue.stats()["failures"] == 1
+    assert queue.stats()["messages_sent"] == 1
+    queue.close(timeout=5)
+
+
+def _secretary(mock_letta_client):
+    with patch("spds.secretary_agent.CreateBlockParam"):
+        sec = SecretaryAgent(client=mock_letta_client, mode="adaptive")
+    mock_letta_client.agents.messages.create.reset_mock()
+    mock_letta_client.agents.messages.create.return_value = SimpleNamespace(messages=[])
+    return sec
+
+
+def test_secretary_sends_one_batched_note_and_flushes_before_recording(monkeypatch, mock_letta_client):
+    monkeypatch.setenv("SPDS_SECRETARY_FLUSH_SECONDS", "60")
+    sec = _secretary(mock_letta_client)
+
+    sec.observe_message("You", "Kick off")
+    sec.observe_message("Alex", "Agenda first")
+    assert sec.pending_observations == 2
+    mock_letta_client.agents.messages.create.assert_not_called()
+
+    sec.add_decision("Ship on Friday")
+
+    calls = mock_letta_client.agents.messages.create.call_args_list
+    note = calls[0].kwargs["messages"][0]["content"]
+    assert note.startswith("Please note these 2 messages in the meeting")
+    assert note.endswith("You: Kick off\nAlex: Agenda first")
+    assert "record this decision" in calls[1].kwargs["messages"][0]["content"]
+    assert sec.pending_observations == 0
+    sec.close()
+
+
+def test_secretary_stats_report_queue_and_sync_mode(monkeypatch, mock_letta_client):
+    sec = _secretary(mock_letta_client)
+    sec.observe_message("You", "hi")
+    stats = sec.get_conversation_stats()
+    assert stats["observation_queue"]["messages_sent"] == 1
+    assert stats["observation_queue"]["depth"] == 0
+    sec.close()
+
+    monkeypatch.setenv("SPDS_SECRETARY_ASYNC_OBSERVE", "false")
+    inline = _secretary(mock_letta_client)
+    inline.observe_message("You", "inline")
+    mock_letta_client.agents.messages.create.assert_called_once()
+    assert inline.pending_observations == 0
+
+
+def test_sends_to_the_secretary_are_serialized(mock_letta_client):
+    sec = _secretary(mock_letta_client)
+    entered, release = threading.Event(), threading.Event()
+    in_flight, overlaps = [], []
+
+    def create(**kwargs):
+        if in_flight:
+            overlaps.append(kwargs)
+        in_flight.append(1)
+        entered.set()
+        release.wait(5)
+        in_flight.pop()
+        return SimpleNamespace(messages=[])
+
+    mock_letta_client.agents.messages.create.side_effect = create
+    message = [{"role": "user", "content": "x"}]
+    senders = [
+        threading.Thread(target=sec._send_to_agent, args=(name, message))
+        for name in ("observe", "polish")
+    ]
+    senders[0].start()
+    assert entered.wait(5)
+    senders[1].start()
+    time.sleep(0.05)
+    assert mock_letta_client.agents.messages.create.call_count == 1
+    release.set()
+    for sender in senders:
+        sender.join(5)
+    assert mock_letta_client.agents.messages.create.call_count == 2
+    assert overlaps == []
+
+
+def test_polishing_flushes_queued_observations_first(monkeypatch, mock_letta_client):
+    monkeypatch.setenv("SPDS_SECRETARY_FLUSH_SECONDS", "60")
+    monkeypatch.setenv("SPDS_MINUTES_SECTION_SIZE", "2")
+    sec = _secretary(mock_letta_client)
+    sec.meeting_metadata = {"topic": "Launch", "meeting_type": "discussion"}
+    sec.observe_message("Alex", "Ship beta first.")
+    sec.observe_message("Jordan", "Agreed.")
+    assert sec.pending_observations == 2
+
+    sec._polish_minutes_sections(sec.minutes_model)
+
+    contents = [
+        c.kwargs["messages"][0]["content"]
+        for c in mock_letta_client.agents.messages.create.call_args_list
+    ]
+    assert contents[0].startswith("Please note these 2 messages")
+    assert "meeting minute paragraphs" in contents[1]
+    sec.close()
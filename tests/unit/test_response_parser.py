@@ -0,0 +1,106 @@
+"""Unit tests for the single-pass Letta response parser."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from spds import response_parser
+from spds.cross_agent import BROADCAST_TOOL, MULTI_AGENT_TOOL
+from spds.response_parser import ParsedResponse, parse_response
+
+
+def _call_message(name, arguments, legacy=False):
+    raw = json.dumps(arguments) if isinstance(arguments, dict) else arguments
+    if legacy:
+        call = SimpleNamespace(function=SimpleNamespace(name=name, arguments=raw))
+        return SimpleNamespace(tool_calls=[call], message_type="tool_call")
+    return SimpleNamespace(
+        message_type="tool_call_message",
+        tool_call=SimpleNamespace(name=name, arguments=raw),
+    )
+
+
+def test_collects_everything_in_one_pass():
+    response = SimpleNamespace(
+        messages=[
+            SimpleNamespace(message_type="user_message", content="prompt"),
+            SimpleNamespace(message_type="reasoning_message", reasoning="thinking"),
+            _call_message(
+                "use_mcp_tool",
+                {"server_name": "fs", "tool_name": "read", "arguments_json": '{"path": "a"}'},
+                legacy=True,
+            ),
+            _call_message(MULTI_AGENT_TOOL, {"agent_id": "ag-2", "message": "psst"}),
+            _call_message(BROADCAST_TOOL, {"tags": ["t"], "message": "all"}),
+            _call_message("send_message", {"message": "  Hello group  "}),
+            SimpleNamespace(message_type="tool_return_message", tool_return="ok"),
+        ]
+    )
+
+    parsed = parse_response(response)
+
+    assert parsed.text == parsed.reply_text == "Hello group"
+    assert parsed.has_send_message
+    assert [c.name for c in parsed.tool_calls] == [
+        "use_mcp_tool", MULTI_AGENT_TOOL, BROADCAST_TOOL, "send_message",
+    ]
+    assert parsed.mcp_requests == [
+        {"server_name": "fs", "tool_name": "read", "tool_args": {"path": "a"}}
+    ]
+    assert [(s["type"], s["recipient_id"], s["tags"]) for s in parsed.side_conversations] == [
+        ("async", "ag-2", None),
+        ("broadcast", None, ["t"]),
+    ]
+    assert parsed.message_types[0] == "user_message"
+    assert parsed.error is None
+
+
+def test_arguments_are_decoded_once_per_response():
+    response = SimpleNamespace(messages=[_call_message("send_message", {"message": "Hi"})])
+
+    with patch.object(response_parser.json, "loads", wraps=json.loads) as loads:
+        first = parse_response(response)
+        assert parse_response(response) is first
+        assert parse_response(first) is first
+
+    assert loads.call_count == 1
+
+
+def test_reply_text_ignores_non_assistant_content():
+    response = SimpleNamespace(
+        messages=[
+            SimpleNamespace(message_type="system_message", content="system note"),
+            SimpleNamespace(role="assistant", content=[{"text": "Direct answer"}]),
+        ]
+    )
+
+    parsed = parse_response(response)
+
+    assert parsed.text == "system note"
+    assert parsed.reply_text == "Direct answer"
+    assert not parsed.has_send_message
+
+
+def test_malformed_arguments_are_skipped():
+    response = SimpleNamespace(
+        messages=[
+            _call_message("send_message", "{bad json", legacy=True),
+            _call_message(MULTI_AGENT_TOOL, "not json"),
+            SimpleNamespace(message_type="assistant_message", content="Fallback"),
+        ]
+    )
+
+    parsed = parse_response(response)
+
+    assert parsed.has_send_message
+    assert parsed.tool_calls[0].arguments is None
+    assert parsed.side_conversations == []
+    assert parsed.text == "Fallback"
+
+
+def test_unwalkable_response_records_error():
+    parsed = parse_response(SimpleNamespace(messages=42))
+
+    assert isinstance(parsed, ParsedResponse)
+    assert parsed.text == ""
+    assert parsed.error
@@ -0,0 +1,150 @@
+"""Unit tests for the full-text transcript search index."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from spds.message import ConversationMessage
+from spds.search_index import TranscriptIndex, format_hits, get_default_index, parse_query
+from spds.swarm_manager import SwarmManager
+
+BASE = datetime(2024, 3, 1, 10, 0, 0)
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = TranscriptIndex(tmp_path / "index.sqlite3")
+    idx.add_many(
+        "s1",
+        [
+            (0, ConversationMessage("Alex", "We should cache the embeddings.", BASE)),
+            (1, ConversationMessage("Jordan", "Caching embeddings saves money.", BASE + timedelta(hours=1))),
+            (2, ConversationMessage("Alex", "The budget review is on Friday.", BASE + timedelta(days=2))),
+        ],
+    )
+    idx.add("s2", 0, ConversationMessage("Jordan", "Budget review moved; cache later.", BASE + timedelta(days=3)))
+    yield idx
+    idx.close()
+
+
+def test_parse_query_extracts_filters_and_phrases():
+    query = parse_query('cache "budget review" sender:Alex since:2024-03-01 until:2024-03-05T12:00 session:s1')
+
+    assert query.terms == ["cache", "budget review"]
+    assert query.sender == "Alex"
+    assert query.since == datetime(2024, 3, 1)
+    assert query.until == datetime(2024, 3, 5, 12, 0)
+    assert query.session_id == "s1"
+
+
+def test_until_date_includes_the_whole_day(index):
+    assert parse_query("until:2024-03-01").until == datetime(2024, 3, 1, 23, 59, 59, 999999)
+    assert parse_query("since:2024-03-01").since == datetime(2024, 3, 1)
+    assert [h.seq for h in index.search("session:s1 until:2024-03-01")] == [1, 0]
+
+
+def test_parse_query_rejects_bad_dates():
+    with pytest.raises(ValueError):
+        parse_query("cache since:yesterday")
+
+
+def test_term_search_spans_sessions_newest_first(index):
+    hits = index.search("cache")
+
+    assert [(h.session_id, h.seq) for h in hits] == [("s2", 0), ("s1", 0)]
+    assert "**cache**" in hits[0].snippet.lower()
+
+
+def test_phrase_search_requires_adjacent_words(index):
+    assert [h.seq for h in index.search('"budget review" session:s1')] == [2]
+    assert index.search('"review budget"') == []
+
+
+def test_sender_and_time_filters(index):
+    assert [h.seq for h in index.search("embeddings sender:jordan")] == [1]
+    hits = index.search(f"budget since:{(BASE + timedelta(days=2, hours=1)).isoformat()}")
+    assert [(h.session_id, h.seq) for h in hits] == [("s2", 0)]
+    # Filters alone list matching messages without a term query.
+    assert len(index.search(f"sender:Alex until:{(BASE + timedelta(days=1)).isoformat()}")) == 1
+
+
+def test_readding_same_position_is_ignored_and_index_persists(index, tmp_path):
+    index.add("s1", 0, ConversationMessage("Alex", "duplicate cache", BASE))
+    index.close()
+
+    reopened = TranscriptIndex(tmp_path / "index.sqlite3")
+    assert len(reopened.search("cache session:s1")) == 1
+    assert reopened.search("duplicate") == []
+    reopened.close()
+
+
+def test_appended_messages_continue_after_stored_positions(index):
+    for i in range(5):
+        index.append("s1", ConversationMessage("Sam", f"queued note {i}", BASE + timedelta(days=4)))
+    index.append("s3", ConversationMessage("Sam", "queued note elsewhere", BASE))
+
+    assert index.flush(timeout=5)
+    assert sorted(h.seq for h in index.search("queued session:s1")) == [3, 4, 5, 6, 7]
+    assert [h.seq for h in index.search("queued session:s3")] == [0]
+
+
+def test_query_syntax_characters_are_quoted(index):
+    assert index.search('cache* OR "x') == []
+    assert format_hits([]) == "No matches found."
+
+
+def test_swarm_manager_indexes_appended_messages_and_searches():
+    mgr = SwarmManager.__new__(SwarmManager)
+    mgr._history = []
+    mgr.session_id = "sess-a"
+    mgr.transcript_id = "web-1"
+
+    mgr._append_history("Alex", "Let's ship the search feature")
+    mgr._append_history("You", "Ship it")
+
+    hits = mgr.search_transcripts("ship")
+    assert {(h.session_id, h.seq) for h in hits} == {("web-1", 0), ("web-1", 1)}
+    assert [h.sender for h in mgr.search_transcripts("ship sender:You")] == ["You"]
+
+    other = SwarmManager.__new__(SwarmManager)
+    other._history = []
+    other.session_id = "sess-b"
+    other._append_history("Sam", "ship elsewhere")
+    assert len(other.search_transcripts("ship")) == 1
+    assert len(other.search_transcripts("ship", all_sessions=True)) == 3
+
+
+def test_messages_after_a_history_reset_are_still_indexed():
+    mgr = SwarmManager.__new__(SwarmManager)
+    mgr._history = []
+    mgr.session_id = "sess-r"
+
+    mgr._append_history("Alex", "before the reset")
+    mgr._history = []
+    mgr._append_history("Alex", "after the reset")
+
+    assert [h.seq for h in mgr.search_transcripts("reset")] == [1, 0]
+
+
+def test_search_slash_command_prints_results(capsys):
+    mgr = SwarmManager.__new__(SwarmManager)
+    mgr._history = []
+    mgr.session_id = "sess-c"
+    mgr.secretary = None
+    mgr._append_history("Alex", "Vector databases are great")
+
+    assert mgr._handle_secretary_commands("/search vector") is True
+    out = capsys.readouterr().out
+    assert "Alex" in out and "**Vector**" in out
+
+
+def test_indexing_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("SPDS_SEARCH_INDEX", "false")
+    assert get_default_index() is None
+
+    mgr = SwarmManager.__new__(SwarmManager)
+    mgr._history = []
+    mgr.session_id = "sess-d"
+    mgr._append_history("Alex", "not indexed")
+    assert len(mgr._history) == 1
+    assert mgr.search_transcripts("indexed") == []
@@ -271,6 +271,7 @@ def test_secretary_observe_routes_through_conversation(mock_letta_client):
     sec._conversation_manager = mock_cm
 
     sec.observe_message("Alice", "hello world")
+    sec.flush_observations()
 
     # Should route through send_and_collect, not agents.messages.create
     mock_cm.send_and_collect.assert_called_once()
@@ -286,6 +287,7 @@ def test_secretary_observe_falls_back_without_conversation(mock_letta_client):
 
     # Leave conversation_id as None
     sec.observe_message("Alice", "hello")
+    sec.flush_observations()
 
     mock_letta_client.agents.messages.create.assert_called_once()
 
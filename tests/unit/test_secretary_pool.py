@@ -0,0 +1,246 @@
+"""Unit tests for the warm secretary agent pool."""
+
+import itertools
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from spds import secretary_pool
+from spds.secretary_agent import SecretaryAgent
+from spds.secretary_pool import (
+    LEASE_TAG_PREFIX,
+    POOL_TAG,
+    STALE_LEASE_SECONDS,
+    SecretaryPool,
+    is_leased,
+    lease_tag,
+    mode_tag,
+)
+
+
+def _client(existing=()):
+    ids = itertools.count(1)
+    agents = {a.id: a for a in existing}
+    client = Mock()
+    client.agents.list = Mock(return_value=list(existing))
+
+    def create(**kwargs):
+        agent = SimpleNamespace(
+            id=f"pool-{next(ids)}", name=kwargs["name"], tags=kwargs.get("tags", [])
+        )
+        agents[agent.id] = agent
+        return agent
+
+    client.agents.create = Mock(side_effect=create)
+    client.agents.retrieve = Mock(
+        side_effect=lambda agent_id: SimpleNamespace(id=agent_id, tags=list(agents[agent_id].tags))
+    )
+    client.conversations.create = Mock(return_value=SimpleNamespace(id="conv-fresh"))
+    return client
+
+
+@pytest.fixture
+def pool_enabled(monkeypatch):
+    monkeypatch.setenv("SPDS_SECRETARY_POOL_SIZE", "1")
+    monkeypatch.setenv("SPDS_SECRETARY_POOL_WAIT", "0")
+
+
+def test_inactive_pool_does_not_lease():
+    pool = SecretaryPool(_client(), size=1)
+    assert pool.lease("adaptive") is None
+    assert not pool.is_active
+
+
+def test_warm_creates_tagged_agents_per_mode():
+    client = _client()
+    pool = SecretaryPool(client, size=2)
+    pool.warm()
+
+    assert client.agents.create.call_count == 6
+    for call in client.agents.create.call_args_list:
+        assert POOL_TAG in call.kwargs["tags"]
+    assert pool.stats()["idle"] == {"formal": 2, "casual": 2, "adaptive": 2}
+
+    pool.warm()  # already topped up
+    assert client.agents.create.call_count == 6
+
+
+def test_discovery_reuses_existing_pool_agents():
+    existing = [
+        SimpleNamespace(id="old-1", tags=[POOL_TAG, mode_tag("formal")]),
+        SimpleNamespace(id="odd", tags=[POOL_TAG]),
+    ]
+    client = _client(existing)
+    pool = SecretaryPool(client, size=1)
+    pool.warm()
+
+    client.agents.list.assert_called_once()
+    assert client.agents.list.call_args.kwargs["tags"] == [POOL_TAG]
+    created_modes = [c.kwargs["tags"][1] for c in client.agents.create.call_args_list]
+    assert created_modes == [mode_tag("casual"), mode_tag("adaptive")]
+
+
+def test_lease_and_release_cycle():
+    client = _client()
+    pool = SecretaryPool(client, size=1)
+    pool.warm()
+    with patch.object(pool, "start_warming"):
+        pool._active = True
+        entry = pool.lease("casual", wait=0)
+        assert entry is not None and entry.mode == "casual"
+        assert pool.idle_count("casual") == 0
+        assert pool.lease("casual", wait=0) is None
+        assert pool.stats()["misses"] == 1
+
+    pool.release(entry.agent, "casual")
+
+    client.agents.blocks.update.assert_called_once()
+    assert client.agents.blocks.update.call_args.args == ("meeting_context",)
+    assert client.agents.blocks.update.call_args.kwargs["agent_id"] == entry.agent.id
+    client.conversations.create.assert_called_once()
+    assert pool.idle_count("casual") == 1
+    with patch.object(pool, "start_warming"):
+        again = pool.lease("casual", wait=0)
+    assert again.agent is entry.agent
+    assert again.conversation_id == "conv-fresh"
+
+
+def test_secretary_leases_instead_of_creating(monkeypatch, pool_enabled):
+    client = _client()
+    pool = SecretaryPool(client, size=1)
+    pool.warm()
+    pool._active = True
+    monkeypatch.setattr(secretary_pool, "_pool", pool)
+    creates_after_warm = client.agents.create.call_count
+
+    with patch.object(pool, "start_warming"):
+        secretary = SecretaryAgent(client, mode="formal")
+
+    assert client.agents.create.call_count == creates_after_warm
+    assert mode_tag("formal") in secretary.agent.tags
+    assert secretary._pool is pool
+
+    secretary.close()
+    assert secretary._pool is None
+    assert pool.idle_count("formal") == 1
+
+
+def test_suspended_secretary_returns_its_agent_and_keeps_notes(monkeypatch, pool_enabled):
+    client = _client()
+    pool = SecretaryPool(client, size=1)
+    pool.warm()
+    pool._active = True
+    monkeypatch.setattr(secretary_pool, "_pool", pool)
+    monkeypatch.setenv("SPDS_SECRETARY_ASYNC_OBSERVE", "false")
+
+    with patch.object(pool, "start_warming"):
+        secretary = SecretaryAgent(client, mode="formal")
+        first = secretary.agent
+        secretary.meeting_metadata = {"topic": "Budget", "participants": ["Alice"]}
+
+        assert secretary.suspend()
+        assert secretary.suspended and secretary.agent is None
+        assert pool.idle_count("formal") == 1
+        secretary.observe_message("Alice", "We should cut travel costs")
+        assert secretary.conversation_log[-1] == ("Alice", "We should cut travel costs")
+
+        secretary.resume()
+    assert not secretary.suspended
+    assert secretary.agent is first and secretary._pool is pool
+
+    with patch.object(secretary, "_send_to_agent") as send:
+        secretary.continue_meeting()
+    briefing = send.call_args.args[1][0]["content"]
+    assert "Topic: Budget" in briefing and "already in progress" in briefing
+
+
+def test_secretary_creates_tagged_agent_when_pool_is_empty(monkeypatch, pool_enabled):
+    client = _client()
+    pool = SecretaryPool(client, size=1)
+    pool._active = True
+    pool._discovered.set()
+    monkeypatch.setattr(secretary_pool, "_pool", pool)
+
+    with patch.object(pool, "start_warming"):
+        secretary = SecretaryAgent(client, mode="adaptive")
+
+    client.agents.create.assert_called_once()
+    tags = client.agents.create.call_args.kwargs["tags"]
+    assert tags[:2] == [POOL_TAG, mode_tag("adaptive")]
+    assert is_leased(tags)  # other processes must not discover it as idle
+    assert secretary._pool is pool
+
+
+def test_pool_disabled_keeps_legacy_creation(monkeypatch):
+    client = _client()
+    monkeypatch.setattr(secretary_pool, "_pool", None)
+
+    secretary = SecretaryAgent(client, mode="casual")
+
+    assert "tags" not in client.agents.create.call_args.kwargs
+    assert secretary._pool is None
+    assert secretary_pool._pool is None
+
+
+def test_discovery_resets_agents_and_skips_live_leases():
+    now = time.time()
+    existing = [
+        SimpleNamespace(id="crashed", tags=[POOL_TAG, mode_tag("formal"), lease_tag(now - STALE_LEASE_SECONDS - 1)]),
+        SimpleNamespace(id="busy", tags=[POOL_TAG, mode_tag("casual"), lease_tag(now)]),
+    ]
+    client = _client(existing)
+    pool = SecretaryPool(client, size=0)
+    pool._discover()
+
+    assert pool.idle_count("formal") == 1 and pool.idle_count("casual") == 0
+    reset = client.agents.blocks.update.call_args
+    assert reset.args == ("meeting_context",) and reset.kwargs["agent_id"] == "crashed"
+    client.agents.update.assert_called_once_with(
+        agent_id="crashed", tags=[POOL_TAG, mode_tag("formal")]
+    )
+    assert pool._idle["formal"][0].conversation_id == "conv-fresh"
+
+
+def test_lease_marks_agent_and_skips_one_leased_elsewhere():
+    client = _client()
+    pool = SecretaryPool(client, size=2)
+    pool.warm()
+    pool._active = True
+    first, second = list(pool._idle["formal"])
+    # Another process leased the first agent after we discovered it.
+    taken = SimpleNamespace(id=first.agent.id, tags=[POOL_TAG, lease_tag()])
+    client.agents.retrieve.side_effect = lambda agent_id: (
+        taken if agent_id == first.agent.id else SimpleNamespace(id=agent_id, tags=list(second.agent.tags))
+    )
+
+    with patch.object(pool, "start_warming"):
+        entry = pool.lease("formal", wait=0)
+
+    assert entry.agent is second.agent
+    assert is_leased(second.agent.tags)
+    assert client.agents.update.call_args.kwargs["agent_id"] == second.agent.id
+
+    pool.release(entry.agent, "formal")
+    assert not any(t.startswith(LEASE_TAG_PREFIX) for t in second.agent.tags)
+
+
+def test_lease_requires_the_tag_write_to_stick():
+    client = _client()
+    pool = SecretaryPool(client, size=1)
+    pool.warm()
+    agent = pool._idle["formal"][0].agent
+
+    client.agents.update.side_effect = RuntimeError("server down")
+    assert not pool._mark_leased(agent)
+
+    # Another process wrote its own lease tag right after ours.
+    client.agents.update.side_effect = None
+    rival = lease_tag(token="rival")
+    client.agents.retrieve.side_effect = [
+        SimpleNamespace(id=agent.id, tags=[POOL_TAG]),
+        SimpleNamespace(id=agent.id, tags=[POOL_TAG, rival]),
+    ]
+    assert not pool._mark_leased(agent)
+    assert is_leased([rival])
@@ -0,0 +1,133 @@
+"""Unit tests for cross-agent SPDS session listing (sessions list --all)."""
+
+import json
+import threading
+import time
+from argparse import Namespace
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from spds.letta_api import parallel_map
+from spds.main import list_sessions_command
+from spds.secretary_pool import POOL_TAG
+from spds.session_catalog import aggregate_sessions, list_all_sessions
+
+
+@pytest.fixture(autouse=True)
+def sessions_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("SESSIONS_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _conv(cid, summary, day=1):
+    return SimpleNamespace(id=cid, summary=summary, created_at=datetime(2025, 1, day, 9, 0))
+
+
+def _client():
+    per_agent = {
+        "ag-1": [
+            _conv("c1", "spds:s1|Alice|Budget|completed|msgs=4|mode=hybrid"),
+            _conv("c3", "spds:s2|Alice|Hiring", day=3),
+            _conv("cx", "not spds"),
+        ],
+        "ag-2": [_conv("c2", "spds:s1|Bob|Budget", day=2)],
+    }
+    client = Mock()
+    client.agents.list = Mock(
+        return_value=[
+            SimpleNamespace(id="ag-1", name="Alice", tags=[]),
+            SimpleNamespace(id="ag-2", name="Bob", tags=None),
+            SimpleNamespace(id="pool", name="Secretary", tags=[POOL_TAG]),
+        ]
+    )
+    client.conversations.list = Mock(
+        side_effect=lambda **kw: SimpleNamespace(conversations=per_agent[kw["agent_id"]])
+    )
+    return client
+
+
+def test_aggregates_conversations_into_sessions():
+    sessions = list_all_sessions(_client(), cache_ttl=0)
+
+    assert [s["session_id"] for s in sessions] == ["s2", "s1"]
+    budget = sessions[1]
+    assert budget["agents"] == ["Alice", "Bob"]
+    assert budget["agent_ids"] == ["ag-1", "ag-2"]
+    assert budget["conversations"] == ["c1", "c2"]
+    assert budget["topic"] == "Budget"
+    assert budget["status"] == "active"  # Bob's conversation is not finalized
+    assert budget["created_at"].startswith("2025-01-01")
+    assert budget["updated_at"].startswith("2025-01-02")
+
+
+def test_agents_are_listed_concurrently_and_pool_agents_skipped():
+    client = _client()
+    barrier = threading.Barrier(2, timeout=5)
+    listed = []
+
+    def list_page(**kw):
+        listed.append(kw["agent_id"])
+        barrier.wait()  # both agents must be in flight at once
+        return SimpleNamespace(conversations=[])
+
+    client.conversations.list = Mock(side_effect=list_page)
+    assert list_all_sessions(client, workers=4, cache_ttl=0) == []
+    assert sorted(listed) == ["ag-1", "ag-2"]
+
+
+def test_failing_agent_is_skipped():
+    client = _client()
+    ok = client.conversations.list.side_effect
+
+    def list_page(**kw):
+        if kw["agent_id"] == "ag-2":
+            raise RuntimeError("boom")
+        return ok(**kw)
+
+    client.conversations.list.side_effect = list_page
+    sessions = list_all_sessions(client, cache_ttl=0)
+    assert {s["session_id"] for s in sessions} == {"s1", "s2"}
+    assert next(s for s in sessions if s["session_id"] == "s1")["status"] == "completed"
+
+
+def test_result_is_cached_for_ttl(sessions_dir):
+    client = _client()
+    first = list_all_sessions(client, cache_ttl=60)
+    calls = client.conversations.list.call_count
+
+    assert list_all_sessions(client, cache_ttl=60) == first
+    assert client.conversations.list.call_count == calls
+
+    list_all_sessions(client, cache_ttl=60, refresh=True)
+    assert client.conversations.list.call_count == 2 * calls
+
+    cache = json.loads((sessions_dir / "session_list_cache.json").read_text())
+    cache["created_at"] = time.time() - 120
+    (sessions_dir / "session_list_cache.json").write_text(json.dumps(cache))
+    list_all_sessions(client, cache_ttl=60)
+    assert client.conversations.list.call_count == 3 * calls
+
+
+def test_parallel_map_keeps_order():
+    assert parallel_map(lambda x: x * 2, range(20), workers=4) == list(range(0, 40, 2))
+    assert parallel_map(lambda x: x, [], workers=4) == []
+
+
+def test_cli_all_prints_session_table(capsys):
+    args = Namespace(all=True, refresh=False, json=False, agent_id=None, spds_session=None)
+    assert list_sessions_command(args, client=_client()) == 0
+    out = capsys.readouterr().out
+    assert "Budget" in out and "Alice, Bob" in out and "Hiring" in out
+
+    args.json = True
+    assert list_sessions_command(args, client=_client()) == 0
+    data = json.loads(capsys.readouterr().out)
+    assert [s["session_id"] for s in data] == ["s2", "s1"]
+
+
+def test_aggregate_ignores_non_spds_conversations():
+    agent = SimpleNamespace(id="ag-1", name="Alice")
+    assert aggregate_sessions([(agent, [_conv("c", "plain")])]) == []
@@ -0,0 +1,131 @@
+"""Unit tests for the local SPDS session index."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from spds.conversations import ConversationManager
+from spds.session_index import SessionIndex, parse_spds_summary
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = SessionIndex(tmp_path / "sessions.sqlite3")
+    yield idx
+    idx.close()
+
+
+@pytest.fixture
+def client():
+    client = Mock()
+    ids = iter(f"conv-{i}" for i in range(100))
+    client.conversations.create = Mock(side_effect=lambda **kw: SimpleNamespace(id=next(ids)))
+    client.conversations.list = Mock(return_value=SimpleNamespace(conversations=[]))
+    return client
+
+
+def test_parse_strips_finalization_suffix():
+    assert parse_spds_summary("spds:s1|Alice|Budget|completed|msgs=5|mode=hybrid") == {
+        "session_id": "s1",
+        "agent_name": "Alice",
+        "topic": "Budget",
+        "status": "completed",
+    }
+    assert parse_spds_summary("spds:s1||")["status"] == "active"
+    assert parse_spds_summary("spds:s1||completed|msgs=0|mode=x")["topic"] == ""
+    assert parse_spds_summary("plain") is None
+
+
+def test_created_conversations_are_found_without_listing(index, client):
+    cm = ConversationManager(client, session_index=index)
+    cm.create_agent_conversation("ag-1", "sess-1", "Alice", "Budget")
+    cm.create_agent_conversation("ag-2", "sess-1", "Bob", "Budget")
+    cm.create_agent_conversation("ag-1", "sess-2", "Alice", "Other")
+    index.reconcile_agent("ag-1", [])  # pretend ag-1 was reconciled earlier
+    cm.create_agent_conversation("ag-1", "sess-1", "Alice", "Budget")
+
+    found = cm.find_sessions_by_spds_id("ag-1", "sess-1")
+    assert [e.id for e in found] == ["conv-3"]
+    client.conversations.list.assert_not_called()
+
+    session = cm.find_session("sess-1")
+    assert [(e.agent_id, e.agent_name) for e in session] == [("ag-2", "Bob"), ("ag-1", "Alice")]
+    assert all(e.topic == "Budget" and e.status == "active" for e in session)
+    client.conversations.list.assert_not_called()
+
+
+def test_update_summary_marks_completed(index, client):
+    cm = ConversationManager(client, session_index=index)
+    conv_id = cm.create_agent_conversation("ag-1", "sess-1", "Alice", "Budget")
+
+    cm.update_summary(conv_id, "spds:sess-1|Alice|Budget|completed|msgs=3|mode=hybrid")
+
+    (entry,) = index.lookup("sess-1")
+    assert entry.status == "completed"
+    assert entry.topic == "Budget"
+    assert entry.summary.endswith("mode=hybrid")
+
+
+def test_unknown_agent_is_reconciled_once(index, client):
+    created = datetime(2025, 1, 1, 12, 0)
+    client.conversations.list.return_value = SimpleNamespace(
+        conversations=[
+            SimpleNamespace(id="c1", summary="spds:sess-1|Alice|T", created_at=created),
+            SimpleNamespace(id="c2", summary="unrelated"),
+            SimpleNamespace(id="c3", summary="spds:sess-10|Alice|T"),
+        ]
+    )
+    cm = ConversationManager(client, session_index=index)
+
+    first = cm.find_sessions_by_spds_id("ag-1", "sess-1")
+    second = cm.find_sessions_by_spds_id("ag-1", "sess-1")
+
+    assert [e.id for e in first] == [e.id for e in second] == ["c1"]
+    assert first[0].created_at == created
+    assert client.conversations.list.call_count == 1
+    assert index.is_reconciled("ag-1")
+
+
+def test_miss_on_reconciled_agent_rescans_server(index, client):
+    cm = ConversationManager(client, session_index=index)
+    assert cm.find_sessions_by_spds_id("ag-1", "sess-9") == []
+
+    # Created elsewhere after the first scan.
+    client.conversations.list.return_value = SimpleNamespace(
+        conversations=[SimpleNamespace(id="c9", summary="spds:sess-9|Alice|T")]
+    )
+    assert [e.id for e in cm.find_sessions_by_spds_id("ag-1", "sess-9")] == ["c9"]
+    assert client.conversations.list.call_count == 2
+
+
+def test_find_session_reconciles_all_agents_on_miss(index, client):
+    client.conversations.list.return_value = SimpleNamespace(
+        conversations=[
+            SimpleNamespace(id="c1", agent_id="ag-1", summary="spds:sess-1|Alice|T"),
+            SimpleNamespace(id="c2", agent_id="ag-2", summary="spds:sess-1|Bob|T"),
+        ]
+    )
+    cm = ConversationManager(client, session_index=index)
+
+    assert sorted(e.id for e in cm.find_session("sess-1")) == ["c1", "c2"]
+    assert "agent_id" not in client.conversations.list.call_args.kwargs
+    assert index.is_reconciled("ag-2")
+
+
+def test_reconcile_index_replaces_agent_entries(index, client):
+    cm = ConversationManager(client, session_index=index)
+    cm.create_agent_conversation("ag-1", "sess-1", "Alice", "Budget")
+    listed = [
+        SimpleNamespace(id="c9", summary="spds:sess-2|Alice|Other"),
+        SimpleNamespace(id="c10", summary="not an spds conversation"),
+    ]
+
+    assert cm.reconcile_index("ag-1", listed) == 1
+    assert index.is_reconciled("ag-1")
+    assert index.lookup("sess-1") == []
+    assert [e.id for e in index.lookup("sess-2")] == ["c9"]
+
+    broken = Mock(reconcile_agent=Mock(side_effect=OSError("disk full")))
+    assert ConversationManager(client, session_index=broken).reconcile_index("ag-1", listed) is None
@@ -48,3 +48,27 @@ def test_speak_fallback_direct_instruction():
     ]
     agent.speak("", mode="initial", topic="T")
     assert client.agents.messages.create.call_count == 2
+
+
+def test_speak_trims_history_to_context_window():
+    client = Mock()
+    state = mk_agent_state(id="ag", name="N", system="S", model="openai/gpt-4")
+    state.llm_config.context_window = 2000
+    agent = SPDSAgent(state, client)
+    client.agents.messages.create.return_value = SimpleNamespace(
+        messages=[
+            SimpleNamespace(
+                role="assistant", content=[{"type": "text", "text": "a considered reply"}]
+            )
+        ]
+    )
+    history = "\n".join(f"Alex: point number {i} " + "z" * 60 for i in range(300))
+
+    agent.speak(history, mode="response", topic="T")
+
+    sent = client.agents.messages.create.call_args.kwargs["messages"][0]["content"]
+    assert "point number 299" in sent
+    assert "point number 0 " not in sent
+    assert "earlier messages from Alex skipped" in sent
+    assert agent.token_budget.stats.trimmed == 1
+    assert agent.token_budget.stats.resets_avoided == 1
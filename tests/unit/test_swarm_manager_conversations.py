@@ -1,5 +1,6 @@
 """Tests for SwarmManager Conversations API integration (Phase 2)."""
 
+import threading
 from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
@@ -88,7 +89,10 @@ class TestCreateAgentConversations:
     def test_creates_conversations_for_each_agent(self):
         agents = [_make_agent("Alice", "ag-1"), _make_agent("Bob", "ag-2")]
         cm = Mock()
-        cm.create_agent_conversation.side_effect = ["conv-1", "conv-2"]
+        cm.create_agent_conversation.side_effect = lambda agent_id, **kw: {
+            "ag-1": "conv-1",
+            "ag-2": "conv-2",
+        }[agent_id]
         mgr = _make_mgr(agents=agents, _conversation_manager=cm)
 
         mgr._create_agent_conversations("Test Topic")
@@ -117,7 +121,13 @@ class TestCreateAgentConversations:
     def test_failure_is_nonfatal(self):
         agents = [_make_agent("Alice", "ag-1"), _make_agent("Bob", "ag-2")]
         cm = Mock()
-        cm.create_agent_conversation.side_effect = [RuntimeError("boom"), "conv-2"]
+
+        def create(agent_id, **kw):
+            if agent_id == "ag-1":
+                raise RuntimeError("boom")
+            return "conv-2"
+
+        cm.create_agent_conversation.side_effect = create
         mgr = _make_mgr(agents=agents, _conversation_manager=cm)
 
         mgr._create_agent_conversations("Topic")
@@ -128,6 +138,34 @@ class TestCreateAgentConversations:
         assert agents[1].conversation_id == "conv-2"
         assert agents[1]._conversation_manager is cm
 
+    def test_creates_conversations_concurrently(self, monkeypatch):
+        monkeypatch.setenv("SPDS_CONVERSATION_WORKERS", "4")
+        agents = [_make_agent(f"A{i}", f"ag-{i}") for i in range(3)]
+        barrier = threading.Barrier(3, timeout=5)
+        cm = Mock()
+
+        def create(agent_id, **kw):
+            barrier.wait()  # all three must be in flight at once
+            return f"conv-{agent_id}"
+
+        cm.create_agent_conversation.side_effect = create
+        mgr = _make_mgr(agents=agents, _conversation_manager=cm)
+
+        mgr._create_agent_conversations("Topic")
+
+        assert [a.conversation_id for a in agents] == ["conv-ag-0", "conv-ag-1", "conv-ag-2"]
+
+    def test_single_worker_creates_sequentially(self, monkeypatch):
+        monkeypatch.setenv("SPDS_CONVERSATION_WORKERS", "1")
+        agents = [_make_agent("Alice", "ag-1"), _make_agent("Bob", "ag-2")]
+        cm = Mock()
+        cm.create_agent_conversation.side_effect = ["conv-1", "conv-2"]
+        mgr = _make_mgr(agents=agents, _conversation_manager=cm)
+
+        mgr._create_agent_conversations("Topic")
+
+        assert [a.conversation_id for a in agents] == ["conv-1", "conv-2"]
+
     def test_no_op_without_conversation_manager(self):
         agents = [_make_agent("Alice", "ag-1")]
         mgr = _make_mgr(agents=agents, _conversation_manager=None)
@@ -298,6 +336,25 @@ class TestFinalizeConversations:
         # Should not raise
         mgr._finalize_conversations()
 
+    def test_one_failure_does_not_skip_the_others(self):
+        agents = [_make_agent(f"A{i}", f"ag-{i}") for i in range(3)]
+        for i, agent in enumerate(agents):
+            agent.conversation_id = f"conv-{i}"
+        cm = Mock()
+
+        def get_session(conv_id):
+            if conv_id == "conv-1":
+                raise RuntimeError("server error")
+            return SimpleNamespace(summary=f"spds:s1|{conv_id}|T")
+
+        cm.get_session.side_effect = get_session
+        mgr = _make_mgr(agents=agents, _conversation_manager=cm)
+
+        mgr._finalize_conversations()
+
+        updated = sorted(c.args[0] for c in cm.update_summary.call_args_list)
+        assert updated == ["conv-0", "conv-2"]
+
     def test_no_op_without_conversation_manager(self):
         agents = [_make_agent("Alice", "ag-1")]
         agents[0].conversation_id = "conv-1"
@@ -321,3 +378,68 @@ class TestFinalizeConversations:
         mgr._end_meeting()
 
         cm.update_summary.assert_called_once()
+
+    def test_end_meeting_without_export_prompt_still_releases_secretary(self):
+        mgr = _make_mgr(agents=[], _conversation_manager=None)
+        mgr._teardown_cross_agent = Mock()
+        mgr._offer_export_options = Mock()
+        mgr.secretary = Mock()
+
+        mgr._end_meeting(offer_exports=False)
+
+        mgr._offer_export_options.assert_not_called()
+        mgr.secretary.close.assert_called_once()
+
+    def test_suspended_secretary_gets_a_new_conversation_on_resume(self):
+        sec = SimpleNamespace(agent=SimpleNamespace(id="ag-sec"), conversation_id="conv-sec", suspended=False)
+
+        def suspend():
+            sec.agent, sec.conversation_id, sec.suspended = None, None, True
+            return True
+
+        def resume():
+            sec.agent, sec.suspended = SimpleNamespace(id="ag-sec-2"), False
+
+        sec.suspend, sec.resume, sec.continue_meeting = suspend, resume, Mock()
+        cm = Mock()
+        cm.get_session.return_value = SimpleNamespace(summary="spds:s1|Secretary|Topic")
+        cm.create_agent_conversation.return_value = "conv-sec-2"
+        mgr = _make_mgr(_conversation_manager=cm, _secretary=sec, meeting_topic="Topic")
+
+        assert mgr.suspend_secretary()
+        cm.update_summary.assert_called_once()
+        assert cm.update_summary.call_args.args[0] == "conv-sec"
+
+        mgr.resume_secretary()
+        assert cm.create_agent_conversation.call_args.kwargs["agent_id"] == "ag-sec-2"
+        assert sec.conversation_id == "conv-sec-2"
+        sec.continue_meeting.assert_called_once()
+
+
+class TestNoteMemoryEdits:
+    def _parsed(self, *names):
+        from spds.response_parser import ParsedResponse, ToolCall
+
+        return ParsedResponse(tool_calls=[ToolCall(name=n, arguments={}) for n in names])
+
+    def test_memory_tool_marks_swarm_context_stale(self):
+        mirror = Mock()
+        mgr = _make_mgr(_swarm_context=mirror)
+        mgr._note_memory_edits(self._parsed("send_message", "core_memory_replace"))
+        mirror.mark_stale.assert_called_once()
+
+    def test_cross_agent_message_marks_swarm_context_stale(self):
+        mirror = Mock()
+        mgr = _make_mgr(_swarm_context=mirror)
+        mgr._note_memory_edits(self._parsed("send_message_to_agent_async"))
+        mirror.mark_stale.assert_called_once()
+
+    def test_plain_reply_keeps_cache(self):
+        mirror = Mock()
+        mgr = _make_mgr(_swarm_context=mirror)
+        mgr._note_memory_edits(self._parsed("send_message"))
+        mirror.mark_stale.assert_not_called()
+
+    def test_without_mirror_is_a_no_op(self):
+        mgr = _make_mgr()
+        mgr._note_memory_edits(self._parsed("core_memory_replace"))
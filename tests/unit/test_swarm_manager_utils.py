@@ -21,6 +21,7 @@ from letta_client import NotFoundError
 from letta_client.types import AgentState, EmbeddingConfig, LlmConfig
 from letta_client.types.agent_state import Memory
 
+from spds.export_manager import ExportManager
 from spds.spds_agent import SPDSAgent
 from spds.swarm_manager import SwarmManager
 
@@ -501,9 +502,43 @@ def test_handle_export_command_variants(mock_letta_client, sample_agent_profiles
     manager.export_manager.export_complete_package.return_value = ["one", "two"]
     manager._handle_export_command("all")
     manager.export_manager.export_complete_package.assert_called_with(
-        meeting_data, "adaptive"
+        meeting_data, "adaptive", archive=None, session_id=manager.session_id
     )
 
+    manager._handle_export_command("archive")
+    manager.export_manager.export_complete_package.assert_called_with(
+        meeting_data, "adaptive", archive=True, session_id=manager.session_id
+    )
+
+
+def test_live_export_runs_every_n_messages(
+    mock_letta_client, sample_agent_profiles, monkeypatch, tmp_path
+):
+    """SPDS_LIVE_EXPORT_EVERY appends to the live transcript without a secretary."""
+    monkeypatch.setenv("SPDS_LIVE_EXPORT_EVERY", "2")
+    with patch("spds.swarm_manager.SPDSAgent.create_new") as mock_create:
+        base_agent = SimpleNamespace(name="Base", agent=SimpleNamespace(id="base"))
+        mock_create.return_value = base_agent
+        manager = SwarmManager(
+            client=mock_letta_client,
+            agent_profiles=[sample_agent_profiles[0]],
+        )
+    manager.export_manager = ExportManager(str(tmp_path))
+
+    manager._append_history("You", "first")
+    live = tmp_path / "live" / f"transcript_{manager.session_id}.txt"
+    assert not live.exists()
+    manager._append_history("Base", "second")
+    assert manager.flush_live_export(timeout=5)
+    assert "Base: second" in live.read_text(encoding="utf-8")
+    assert "Participants: Base" in live.read_text(encoding="utf-8")
+
+    manager._append_history("You", "third")
+    manager._handle_export_command("live")
+    assert manager._live_export_thread is None
+    assert manager.export_manager.last_live_export["appended"] == 1
+    assert manager.export_manager.last_live_export["full_render"] is False
+
 
 def test_handle_export_command_unknown_format(
     mock_letta_client, sample_agent_profiles, capsys
@@ -0,0 +1,88 @@
+"""Unit tests for proactive context-window budgeting."""
+
+from types import SimpleNamespace
+
+from spds.token_budget import (
+    TokenBudget,
+    TokenBudgetStats,
+    estimate_tokens,
+    get_context_window,
+)
+
+
+def _history(count, width=80):
+    return "\n".join(f"Agent{i % 3}: " + ("x" * width) for i in range(count))
+
+
+def test_estimate_tokens_uses_chars_per_token(monkeypatch):
+    monkeypatch.setenv("SPDS_CHARS_PER_TOKEN", "4")
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+
+
+def test_context_window_falls_back_to_default(monkeypatch):
+    monkeypatch.setenv("SPDS_DEFAULT_CONTEXT_WINDOW", "4096")
+    state = SimpleNamespace(llm_config=SimpleNamespace(context_window=128000))
+    assert get_context_window(state) == 128000
+    assert get_context_window(SimpleNamespace()) == 4096
+    assert get_context_window(SimpleNamespace(llm_config=object())) == 4096
+
+
+def test_small_history_is_untouched():
+    budget = TokenBudget(context_window=8192, ratio=0.5)
+    text = _history(5)
+    assert budget.fit(text, overhead_tokens=100) is text
+    assert budget.stats.payloads == 1
+    assert budget.stats.trimmed == 0
+
+
+def test_oversized_history_keeps_recent_lines_within_budget():
+    budget = TokenBudget(context_window=2000, ratio=0.5)
+    text = _history(200)
+    fitted = budget.fit(text, overhead_tokens=100)
+
+    assert estimate_tokens(fitted) <= budget.budget_tokens - 100
+    assert fitted.endswith(text.rsplit("\n", 1)[-1])
+    assert fitted.startswith("[")
+    assert "earlier messages from Agent0, Agent1, Agent2 skipped" in fitted
+    assert "you have not seen them" in fitted and "recall memory" not in fitted
+    assert budget.stats.trimmed == 1
+    assert budget.stats.tokens_saved > 0
+    # 200 * ~90 chars is far beyond a 2000-token window.
+    assert budget.stats.resets_avoided == 1
+
+
+def test_trim_within_window_does_not_count_as_reset_avoided():
+    budget = TokenBudget(context_window=2000, ratio=0.5)
+    budget.fit(_history(60), overhead_tokens=0)
+    assert budget.stats.trimmed == 1
+    assert budget.stats.resets_avoided == 0
+
+
+def test_single_huge_line_keeps_its_tail():
+    budget = TokenBudget(context_window=1000, ratio=0.5)
+    text = "Alex: " + "y" * 10000 + "END"
+    fitted = budget.fit(text)
+    assert fitted.endswith("END")
+    assert estimate_tokens(fitted) <= budget.budget_tokens
+
+
+def test_budgeting_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("SPDS_TOKEN_BUDGET_ENABLED", "false")
+    budget = TokenBudget(context_window=100, ratio=0.5)
+    text = _history(100)
+    assert budget.fit(text) is text
+    assert budget.stats.payloads == 0
+
+
+def test_stats_aggregate():
+    total = TokenBudgetStats()
+    total.add(TokenBudgetStats(payloads=2, trimmed=1, tokens_saved=50, resets_avoided=1))
+    total.add(TokenBudgetStats(payloads=3, trimmed=2, tokens_saved=25))
+    assert total.to_dict() == {
+        "payloads": 5,
+        "trimmed": 3,
+        "tokens_saved": 75,
+        "resets_avoided": 1,
+    }
@@ -0,0 +1,83 @@
+"""Unit tests for the incremental sliding-window topic tracker."""
+
+from datetime import datetime
+
+from spds.history import ConversationHistory
+from spds.message import ConversationMessage
+from spds.swarm_manager import SwarmManager
+from spds.topic_tracker import TopicTracker, extract_terms
+
+
+def _msg(sender, content):
+    return ConversationMessage(sender, content, datetime(2024, 1, 1, 9, 0))
+
+
+def test_extract_terms_drops_stopwords_and_possessives():
+    assert extract_terms("I think the API's latency budget is what we should review!") == [
+        "api",
+        "latency",
+        "budget",
+        "review",
+    ]
+
+
+def test_focus_reflects_recent_terms_and_ignores_speaker_names():
+    tracker = TopicTracker(window=5, top_terms=2)
+    for content in [
+        "Alex here: the database migration needs a rollback plan",
+        "Agreed, the migration rollback must be rehearsed",
+        "Migration rollback rehearsal on staging first",
+    ]:
+        tracker.observe(_msg("Alex", content))
+
+    assert tracker.focus_terms() == ["migration", "rollback"]
+    assert tracker.topic("Q3 planning") == "Q3 planning (current focus: migration, rollback)"
+
+
+def test_topic_is_stable_until_discussion_moves():
+    tracker = TopicTracker(window=4, top_terms=2)
+    for _ in range(3):
+        tracker.observe(_msg("Sam", "pricing tiers and pricing discounts for enterprise tiers"))
+    first = tracker.topic("Launch")
+
+    tracker.observe(_msg("Jo", "pricing tiers look fine, maybe a discount banner"))
+    assert tracker.topic("Launch") == first
+
+    for _ in range(4):
+        tracker.observe(_msg("Jo", "hiring plan: recruiters, interviews, hiring budget"))
+    moved = tracker.topic("Launch")
+    assert moved != first
+    assert "hiring" in moved
+
+
+def test_sync_is_incremental_and_rebuilds_after_rewrite():
+    history = ConversationHistory([_msg("A", "kubernetes cluster upgrade")])
+    tracker = TopicTracker(window=10, top_terms=3)
+    tracker.sync(history)
+    assert tracker.observed == 1
+
+    history.append(_msg("B", "cluster upgrade window on sunday"))
+    tracker.sync(history)
+    assert tracker.observed == 2
+    assert "cluster" in tracker.focus_terms()
+
+    history[:] = [_msg("C", "marketing newsletter copy")]
+    tracker.sync(history)
+    assert tracker.observed == 1
+    assert tracker.focus_terms() == ["copy", "marketing", "newsletter"]
+
+
+def test_generate_dynamic_topic_uses_tracker():
+    mgr = SwarmManager.__new__(SwarmManager)
+    mgr._history = []
+    mgr.session_id = "sess-topic"
+    mgr._append_history("Alex", "Vendor contract renewal terms")
+    mgr._append_history("Jordan", "Contract renewal pricing from the vendor")
+
+    recent = mgr._history[-1:]
+    topic = mgr._generate_dynamic_topic(recent, "Ops sync")
+    assert topic.startswith("Ops sync (current focus: ")
+    assert "contract" in topic and "vendor" in topic
+    assert mgr._generate_dynamic_topic([], "Ops sync") == "Ops sync"
+    # Unchanged history gives the identical string.
+    assert mgr._generate_dynamic_topic(recent, "Ops sync") == topic
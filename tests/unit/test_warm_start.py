@@ -0,0 +1,199 @@
+"""Unit tests for the warm-start cache of swarm setup state."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+from spds import config, cross_agent
+from spds.cross_agent import BROADCAST_TOOL, MULTI_AGENT_TOOL, setup_cross_agent_messaging
+from spds.mcp_config import MCPServerEntry
+from spds.mcp_launchpad import MCPLaunchpad
+from spds.warm_start import WarmStartCache, get_warm_start_cache, states_have, warm_start_key
+
+
+def _state(agent_id, tools=(), blocks=()):
+    return SimpleNamespace(
+        id=agent_id,
+        tags=[],
+        tools=[SimpleNamespace(id=f"tool-{t}", name=t) for t in tools],
+        memory=SimpleNamespace(blocks=[SimpleNamespace(id=b) for b in blocks]),
+    )
+
+
+def _patched_cold_setup():
+    return (
+        patch.object(cross_agent, "tag_agents_for_session", return_value="spds:session-s"),
+        patch.object(
+            cross_agent,
+            "attach_multi_agent_tools",
+            return_value={"async_enabled": True, "broadcast_enabled": False},
+        ),
+        patch.object(cross_agent, "create_swarm_context_block", return_value="block-ctx"),
+        patch.object(cross_agent, "attach_block_to_agents", return_value=2),
+    )
+
+
+def test_key_ignores_order_and_tracks_config(monkeypatch):
+    key = warm_start_key(["ag-2", "ag-1"])
+    assert key == warm_start_key(["ag-1", "ag-2"])
+    assert key != warm_start_key(["ag-1"])
+
+    monkeypatch.setenv("SPDS_MCP_TIER1_ENABLED", "false")
+    assert warm_start_key(["ag-1", "ag-2"]) != key
+    monkeypatch.delenv("SPDS_MCP_TIER1_ENABLED")
+    monkeypatch.setattr(config, "LETTA_BASE_URL", "http://elsewhere:8283")
+    assert warm_start_key(["ag-1", "ag-2"]) != key
+
+
+def test_cache_persists_expires_and_discards(tmp_path):
+    path = tmp_path / "warm.json"
+    WarmStartCache(path, ttl=60).put("k", "mcp", {"servers": {"fs": "srv-1"}})
+
+    cache = WarmStartCache(path, ttl=60)
+    assert cache.get("k", "mcp") == {"servers": {"fs": "srv-1"}}
+    assert cache.get("k", "cross_agent") is None
+    assert not cache.put("k", "cross_agent", {"block": Mock()})
+
+    data = json.loads(path.read_text())
+    data["entries"]["k"]["mcp"]["created_at"] -= 120
+    path.write_text(json.dumps(data))
+    assert WarmStartCache(path, ttl=60).get("k", "mcp") is None
+
+    cache.discard("k", "mcp")
+    assert WarmStartCache(path, ttl=3600).get("k", "mcp") is None
+
+    disabled = WarmStartCache(path, ttl=0)
+    assert not disabled.put("k", "mcp", {}) and disabled.get("k", "mcp") is None
+
+
+def test_states_have_requires_every_agent():
+    states = [_state("ag-1", [MULTI_AGENT_TOOL], ["b1"]), _state("ag-2", [], ["b1"])]
+    assert states_have(states, block_ids=["b1"])
+    assert not states_have(states, tools=[MULTI_AGENT_TOOL])
+    assert states_have(states[:1], tools=[f"tool-{MULTI_AGENT_TOOL}"])
+    assert not states_have([MagicMock()], block_ids=["b1"])
+    assert not states_have([], block_ids=["b1"])
+
+
+def test_cold_setup_state_is_reused_by_warm_setup():
+    client = MagicMock()
+    tag, tools, create, attach = _patched_cold_setup()
+    with tag, tools, create, attach:
+        cold = setup_cross_agent_messaging(client, ["ag-1", "ag-2"], "s1")
+    assert cold["warm_start"] is False
+    warm = cold["warm_state"]
+    assert warm["tools"] == [MULTI_AGENT_TOOL]
+    assert "swarm_context_block_id" not in warm
+
+    states = [_state(a, [MULTI_AGENT_TOOL]) for a in ("ag-1", "ag-2")]
+    tag, tools, create, attach = _patched_cold_setup()
+    with tag, tools as mock_tools, create as mock_create, attach as mock_attach:
+        result = setup_cross_agent_messaging(
+            client, ["ag-1", "ag-2"], "s2", topic="Budget",
+            participant_names=["Alice", "Bob"], agent_states=states, warm=warm,
+        )
+
+    assert result["warm_start"] is True
+    assert result["multi_agent_enabled"] is True and result["broadcast_enabled"] is False
+    mock_tools.assert_not_called()
+    # Each session still gets its own swarm_context block
+    assert mock_create.call_args.kwargs["session_id"] == "s2"
+    mock_attach.assert_called_once_with(client, "block-ctx", ["ag-1", "ag-2"])
+    client.blocks.update.assert_not_called()
+
+
+def test_warm_state_is_not_reused_when_agent_lost_a_tool():
+    warm = {
+        "async_enabled": True,
+        "broadcast_enabled": True,
+        "tools": [MULTI_AGENT_TOOL, BROADCAST_TOOL],
+    }
+    states = [_state("ag-1", [MULTI_AGENT_TOOL])]
+    tag, tools, create, attach = _patched_cold_setup()
+    with tag, tools as mock_tools, create, attach:
+        result = setup_cross_agent_messaging(
+            MagicMock(), ["ag-1"], "s1", agent_states=states, warm=warm
+        )
+
+    assert result["warm_start"] is False
+    mock_tools.assert_called_once()
+
+
+def test_no_state_is_cached_without_multi_agent_tools():
+    tag, tools, create, attach = _patched_cold_setup()
+    with tag, tools as mock_tools, create, attach:
+        mock_tools.return_value = {"async_enabled": False, "broadcast_enabled": False}
+        result = setup_cross_agent_messaging(MagicMock(), ["ag-1"], "s1")
+    assert result["warm_state"] is None
+
+
+def _launchpad(client):
+    entries = [
+        MCPServerEntry(name="fs", tier=1, server_type="stdio", command="npx"),
+        MCPServerEntry(name="web", tier=2, server_type="stdio", command="npx"),
+    ]
+    return MCPLaunchpad(client, entries)
+
+
+def test_launchpad_restores_verified_snapshot_without_requests():
+    source = _launchpad(Mock())
+    source._registered_servers = {"fs": SimpleNamespace(id="srv-fs"), "web": SimpleNamespace(id="srv-web")}
+    source._catalog = {"fs": [{"id": "t-read", "name": "read"}], "web": [{"id": "t-get", "name": "get"}]}
+    source._ecosystem_block_id = "eco-1"
+    source._attached_tools = {"fs/read": "t-read", "web/get": "t-get"}
+    source._use_mcp_tool_id = "t-use"
+    snapshot = json.loads(json.dumps(source.snapshot()))
+
+    client = Mock()
+    lp = _launchpad(client)
+    states = [
+        SimpleNamespace(
+            tools=[SimpleNamespace(id="t-read"), SimpleNamespace(id="t-use")],
+            blocks=[SimpleNamespace(id="eco-1")],
+        )
+    ]
+    assert lp.restore(snapshot, states)
+    assert client.mock_calls == []
+    assert lp._attached_tools == source._attached_tools
+    assert lp._ecosystem_block_id == "eco-1"
+    assert lp._registered_servers["web"].id == "srv-web"
+
+    stale = _launchpad(client)
+    states[0].tools = [SimpleNamespace(id="t-use")]  # tier-1 tool was detached
+    assert not stale.restore(snapshot, states)
+    assert stale._catalog == {} and stale._use_mcp_tool_id is None
+
+
+def _manager(states):
+    from spds.swarm_manager import SwarmManager
+
+    mgr = object.__new__(SwarmManager)
+    mgr.client = MagicMock()
+    mgr.agents = [SimpleNamespace(agent=s, name=s.id) for s in states]
+    mgr.session_id = "s1"
+    mgr.conversation_mode = "hybrid"
+    mgr._cross_agent_info = None
+    return mgr
+
+
+def test_swarm_manager_records_and_reuses_cross_agent_setup():
+    tag, tools, create, attach = _patched_cold_setup()
+    with tag, tools, create, attach:
+        _manager([_state("ag-1"), _state("ag-2")])._setup_cross_agent()
+
+    states = [_state(a, [MULTI_AGENT_TOOL]) for a in ("ag-2", "ag-1")]
+    mgr = _manager(states)
+    tag, tools, create, attach = _patched_cold_setup()
+    with tag, tools as mock_tools, create as mock_create, attach:
+        mgr._setup_cross_agent()
+
+    assert mgr._cross_agent_info["warm_start"] is True
+    mock_tools.assert_not_called()
+    mock_create.assert_called_once()
+    assert get_warm_start_cache().get(mgr._warm_start_key(), "cross_agent")
+
+
+def test_disabled_cache_has_no_key(monkeypatch, tmp_path):
+    monkeypatch.setenv("SPDS_WARM_START_TTL", "0")
+    monkeypatch.setenv("SPDS_WARM_START_PATH", str(tmp_path / "off.json"))
+    assert _manager([_state("ag-1")])._warm_start_key() is None
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3.11
+"""Micro-benchmarks for the in-memory conversation history.
+
+Usage: python3.11 tools/bench_history.py --messages 100000
+
+- memory: retained bytes per ConversationMessage (excluding the message text
+  itself, which is the same for every representation) compared with the
+  previous plain-dataclass layout.
+- reads: cost of reading the flat conversation_history once per append, as
+  the web turn handlers do, with the incremental ConversationHistory versus
+  re-joining the whole list each time.
+- restore: time to reopen a disk-backed session history and how many
+  messages that leaves resident in memory.
+"""
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from spds.history import ConversationHistory  # noqa: E402
+from spds.history_log import HistoryLog  # noqa: E402
+from spds.message import ConversationMessage, messages_to_flat_format  # noqa: E402
+
+SENDERS = ["You", "Alex", "Jordan", "Casey", "Morgan", "System"]
+
+
+@dataclass
+class LegacyConversationMessage:
+    """The pre-slots layout: per-instance __dict__ and a datetime per message."""
+
+    sender: str
+    content: str
+    timestamp: datetime
+
+
+def _build_inputs(count):
+    # Senders arrive as fresh strings (as they would from agent.name lookups or
+    # JSON payloads); contents are shared so only per-message overhead is measured.
+    base = datetime(2025, 1, 1, 9, 0, 0)
+    senders = ["".join(list(SENDERS[i % len(SENDERS)])) for i in range(count)]
+    contents = [f"message body {i % 50}" for i in range(50)]
+    return [
+        (senders[i], contents[i % 50], base + timedelta(seconds=i))
+        for i in range(count)
+    ]
+
+
+def measure_bytes_per_message(cls, count):
+    """Return the memory retained per message after building `count` instances.
+
+    The fresh sender strings and datetimes are created under tracing and the
+    input list is dropped before measuring, so whatever each message keeps
+    alive (its own object, sender copy, timestamp) is what gets counted.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    inputs = _build_inputs(count)
+    messages = [cls(s, c, ts) for s, c, ts in inputs]
+    del inputs
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    retained = after - before - sys.getsizeof(messages)
+    del messages
+    return retained / count
+
+
+def measure_read_per_append(count):
+    """Return (rejoin_seconds, incremental_seconds) for `count` append+read cycles."""
+    messages = [ConversationMessage(s, c, ts) for s, c, ts in _build_inputs(count)]
+
+    plain = []
+    start = time.perf_counter()
+    for msg in messages:
+        plain.append(msg)
+        messages_to_flat_format(plain)
+    rejoin = time.perf_counter() - start
+
+    history = ConversationHistory()
+    start = time.perf_counter()
+    for msg in messages:
+        history.append(msg)
+        history.flat()
+    incremental = time.perf_counter() - start
+    return rejoin, incremental
+
+
+def measure_restore(count):
+    """Return (seconds, resident_messages) for restoring a `count`-message log."""
+    with tempfile.TemporaryDirectory() as tmp:
+        log = HistoryLog(tmp)
+        for sender, content, ts in _build_inputs(count):
+            log.append(ConversationMessage(sender, content, ts))
+        log.close()
+
+        start = time.perf_counter()
+        history = ConversationHistory.from_log(HistoryLog(tmp))
+        elapsed = time.perf_counter() - start
+        resident = sum(1 for msg in list.__iter__(history) if msg is not None)
+        history.log.close()
+    return elapsed, resident
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument(
+        "--read-messages",
+        type=int,
+        default=5_000,
+        help="Session length for the append+read benchmark",
+    )
+    parser.add_argument(
+        "--restore-messages",
+        type=int,
+        default=100_000,
+        help="Session length for the disk restore benchmark",
+    )
+    args = parser.parse_args(argv)
+
+    legacy = measure_bytes_per_message(LegacyConversationMessage, args.messages)
+    compact = measure_bytes_per_message(ConversationMessage, args.messages)
+
+    print(f"Messages measured: {args.messages}")
+    print(f"Legacy dataclass:        {legacy:7.1f} bytes/message")
+    print(f"ConversationMessage:     {compact:7.1f} bytes/message")
+    print(f"Reduction:               {(1 - compact / legacy) * 100:6.1f}%")
+
+    rejoin, incremental = measure_read_per_append(args.read_messages)
+    print(f"\nAppend+read cycles:      {args.read_messages}")
+    print(f"Re-join every read:      {rejoin * 1000:9.1f} ms")
+    print(f"ConversationHistory:     {incremental * 1000:9.1f} ms")
+
+    restore_seconds, resident = measure_restore(args.restore_messages)
+    print(f"\nRestore from disk log:   {args.restore_messages} messages")
+    print(f"Restore time:            {restore_seconds * 1000:9.1f} ms")
+    print(f"Resident messages:       {resident}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())